@@ -1,10 +1,12 @@
 """
 API endpoints for Ashtakavarga calculations
 """
-from typing import Dict, Any
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field, validator
 from app.core.calculations.ashtakavarga import Ashtakavarga
+from app.core.calculations.ashtakavarga_transits import AshtakavargaTransitScorer
 
 router = APIRouter()
 
@@ -25,6 +27,43 @@ class AshtakavargaRequest(BaseModel):
                 raise ValueError(f"Invalid house position for {planet}: {position}")
         return v
 
+class TransitScoreRequest(BaseModel):
+    """Request model for Ashtakavarga transit scoring"""
+    natal_positions: Dict[str, float] = Field(
+        ...,
+        description="Sidereal natal longitudes of the seven planets and the Lagna"
+    )
+    start_time: str = Field(..., description="Period start time (UTC)")
+    end_time: str = Field(..., description="Period end time (UTC)")
+    resolution_minutes: int = Field(
+        1440,
+        ge=1,
+        le=10080,
+        description="Sampling interval of the score series"
+    )
+    ayanamsa_system: Optional[str] = Field(
+        'LAHIRI',
+        description="Ayanamsa matching the natal positions (null for tropical)"
+    )
+    
+    @validator('natal_positions')
+    def validate_natal_positions(cls, v):
+        required = {'Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Lagna'}
+        missing = required - set(v)
+        if missing:
+            raise ValueError(f"Missing natal positions: {', '.join(sorted(missing))}")
+        for point, position in v.items():
+            if not 0 <= position < 360:
+                raise ValueError(f"Invalid position for {point}: {position}")
+        return v
+    
+    @validator('start_time', 'end_time')
+    def validate_datetime(cls, v):
+        try:
+            return datetime.fromisoformat(v)
+        except ValueError:
+            raise ValueError("Invalid datetime format")
+
 @router.post("/calculate", response_model=Dict[str, Any], tags=["Ashtakavarga"])
 async def calculate_ashtakavarga(request: AshtakavargaRequest) -> Dict[str, Any]:
     """
@@ -102,3 +141,52 @@ async def analyze_planet(
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/transits", response_model=Dict[str, Any], tags=["Ashtakavarga"])
+async def score_transits(request: TransitScoreRequest) -> Dict[str, Any]:
+    """
+    Score every instant of a period by transit bindus
+    
+    Args:
+        request: TransitScoreRequest with the natal positions and period
+        
+    Returns:
+        Columnar series: instant times, and per planet the transit signs,
+        own Bhinnashtakavarga bindus and Sarvashtakavarga bindus, plus the
+        total score per instant
+        
+    Raises:
+        HTTPException: If calculation fails
+    """
+    try:
+        positions = dict(request.natal_positions)
+        scorer = AshtakavargaTransitScorer(positions, positions.pop('Lagna'))
+        resolution = timedelta(minutes=request.resolution_minutes)
+        series = scorer.score_period(
+            request.start_time,
+            request.end_time,
+            resolution,
+            request.ayanamsa_system
+        )
+        columns = series.to_columns()
+        origin = series.jds[0]
+        times = [
+            (request.start_time + timedelta(days=float(jd - origin))).isoformat()
+            for jd in series.jds
+        ]
+        return {
+            'period': {
+                'start': request.start_time.isoformat(),
+                'end': request.end_time.isoformat()
+            },
+            'resolution_minutes': request.resolution_minutes,
+            'natal_table': {
+                name: row for name, row in zip(
+                    list(columns['planets']) + ['Sarva'], scorer.table.tolist()
+                )
+            },
+            'times': times,
+            **columns
+        }
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
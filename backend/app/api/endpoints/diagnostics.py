@@ -0,0 +1,42 @@
+"""
+API endpoints for calculator instrumentation and on-demand profiling
+"""
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.core.monitoring.instrumentation import (
+    ProfilingBusyError,
+    format_collapsed,
+    instrumentation,
+    profile_window
+)
+
+router = APIRouter()
+
+@router.get("/latency", tags=["Diagnostics"])
+async def get_latency():
+    """Call counts and sampled latency percentiles of instrumented functions"""
+    return {
+        'sample_every': instrumentation.sample_every,
+        'functions': instrumentation.get_stats()
+    }
+
+@router.post("/latency/reset", tags=["Diagnostics"])
+async def reset_latency():
+    """Clear call counts and latency histograms"""
+    instrumentation.reset()
+    return {'status': 'reset'}
+
+@router.get("/profile", tags=["Diagnostics"], response_class=PlainTextResponse)
+async def profile(
+    duration: float = Query(5.0, gt=0, le=60, description="Profiling window in seconds"),
+    mode: str = Query('sample', pattern='^(sample|cprofile)$', description="'sample' or 'cprofile'"),
+    interval_ms: float = Query(5.0, ge=1, le=1000, description="Sampling interval for 'sample'"),
+    limit: int = Query(500, ge=1, le=10000, description="Maximum number of stacks")
+):
+    """Profile the service for a bounded window and return collapsed stacks"""
+    try:
+        stacks = await profile_window(duration, mode, interval_ms / 1000)
+    except ProfilingBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return "\n".join(format_collapsed(stacks, limit)) + "\n"
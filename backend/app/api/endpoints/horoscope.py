@@ -107,7 +107,7 @@ async def calculate_horoscope(request: HoroscopeRequest):
         
         # Calculate ayanamsa
         ayanamsa_value = ayanamsa_calc.calculate_precise_ayanamsa(
-            datetime_utc=birth_time,
+            date=birth_time,
             system=request.ayanamsa_system
         )
         
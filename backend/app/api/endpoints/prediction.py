@@ -1,7 +1,7 @@
 """
 API endpoints for Prediction Engine
 """
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field, validator
@@ -62,6 +62,44 @@ class NextSuitableTimeRequest(MuhurtaRequest):
         description="Maximum days to look ahead"
     )
 
+class MuhurtaGridRequest(BaseModel):
+    """Request model for multi-activity Muhurta grid"""
+    start_time: str = Field(..., description="First instant (UTC)")
+    end_time: str = Field(..., description="Last instant (UTC)")
+    interval_minutes: int = Field(
+        30,
+        ge=1,
+        le=1440,
+        description="Spacing between instants"
+    )
+    activities: Optional[List[str]] = Field(
+        None,
+        description="Activities to score (default: all)"
+    )
+    planet_strengths: Dict[str, float] = Field(
+        ...,
+        description="Current planetary strengths"
+    )
+    ayanamsa_system: Optional[str] = Field(
+        'LAHIRI',
+        description="Ayanamsa for nakshatra (null for tropical)"
+    )
+    
+    @validator('start_time', 'end_time')
+    def validate_datetime(cls, v):
+        try:
+            return datetime.fromisoformat(v)
+        except ValueError:
+            raise ValueError("Invalid datetime format")
+    
+    @validator('activities')
+    def validate_activities(cls, v):
+        valid_activities = set(PredictionEngine.muhurta_qualities)
+        for activity in v or []:
+            if activity not in valid_activities:
+                raise ValueError(f"Invalid activity type. Must be one of: {valid_activities}")
+        return v
+
 class TransitPeriodRequest(BaseModel):
     """Request model for transit period analysis"""
     start_time: str = Field(..., description="Period start time (UTC)")
@@ -73,9 +111,20 @@ class TransitPeriodRequest(BaseModel):
         lt=360, 
         description="Planet's natal position"
     )
-    transit_positions: List[Dict[str, str]] = Field(
-        ..., 
-        description="List of transit positions with times"
+    transit_positions: Optional[List[Dict[str, str]]] = Field(
+        None, 
+        description="List of transit positions with times; generated from "
+                    "the ephemeris when omitted"
+    )
+    resolution_minutes: int = Field(
+        360,
+        ge=1,
+        le=10080,
+        description="Sampling interval for generated transit series"
+    )
+    ayanamsa_system: Optional[str] = Field(
+        'LAHIRI',
+        description="Ayanamsa for generated series (null for tropical)"
     )
     
     @validator('start_time', 'end_time')
@@ -97,12 +146,62 @@ class TransitPeriodRequest(BaseModel):
     
     @validator('transit_positions')
     def validate_transit_positions(cls, v):
+        if v is None:
+            return v
         try:
             return [(datetime.fromisoformat(pos['time']), float(pos['position']))
                     for pos in v]
         except (KeyError, ValueError) as e:
             raise ValueError(f"Invalid transit position format: {e}")
 
+class TransitIntervalsRequest(BaseModel):
+    """Request model for multi-planet transit aspect intervals"""
+    start_time: str = Field(..., description="Period start time (UTC)")
+    end_time: str = Field(..., description="Period end time (UTC)")
+    natal_positions: Dict[str, float] = Field(
+        ...,
+        description="Natal longitudes keyed by planet or point name"
+    )
+    planets: Optional[List[str]] = Field(
+        None,
+        description="Transiting planets (default: all nine)"
+    )
+    resolution_minutes: int = Field(
+        360,
+        ge=1,
+        le=10080,
+        description="Sampling interval for the transit series"
+    )
+    ayanamsa_system: Optional[str] = Field(
+        'LAHIRI',
+        description="Ayanamsa matching the natal positions (null for tropical)"
+    )
+    
+    @validator('start_time', 'end_time')
+    def validate_datetime(cls, v):
+        try:
+            return datetime.fromisoformat(v)
+        except ValueError:
+            raise ValueError("Invalid datetime format")
+    
+    @validator('natal_positions')
+    def validate_natal_positions(cls, v):
+        for point, position in v.items():
+            if not 0 <= position < 360:
+                raise ValueError(f"Invalid position for {point}: {position}")
+        return v
+    
+    @validator('planets')
+    def validate_planets(cls, v):
+        valid_planets = {
+            'sun', 'moon', 'mars', 'mercury', 'jupiter',
+            'venus', 'saturn', 'rahu', 'ketu'
+        }
+        for planet in v or []:
+            if planet.lower() not in valid_planets:
+                raise ValueError(f"Invalid planet: {planet}")
+        return v
+
 @router.post("/muhurta/calculate", tags=["Prediction"])
 async def calculate_muhurta(request: MuhurtaRequest):
     """Calculate Muhurta suitability for given time and activity"""
@@ -139,6 +238,22 @@ async def find_next_suitable_time(request: NextSuitableTimeRequest):
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/muhurta/grid", tags=["Prediction"])
+async def calculate_muhurta_grid(request: MuhurtaGridRequest):
+    """Score all activities for every instant of a period"""
+    try:
+        result = PredictionEngine.calculate_muhurta_grid(
+            request.start_time,
+            request.end_time,
+            request.planet_strengths,
+            timedelta(minutes=request.interval_minutes),
+            request.activities,
+            request.ayanamsa_system
+        )
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/transit/analyze", tags=["Prediction"])
 async def analyze_transit_period(request: TransitPeriodRequest):
     """Analyze transit period effects"""
@@ -148,7 +263,25 @@ async def analyze_transit_period(request: TransitPeriodRequest):
             request.end_time,
             request.planet,
             request.natal_position,
-            request.transit_positions
+            request.transit_positions,
+            timedelta(minutes=request.resolution_minutes),
+            request.ayanamsa_system
+        )
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/transit/intervals", tags=["Prediction"])
+async def analyze_transit_intervals(request: TransitIntervalsRequest):
+    """Find transit aspect intervals of all planets to natal positions"""
+    try:
+        result = PredictionEngine.analyze_transits(
+            request.start_time,
+            request.end_time,
+            request.natal_positions,
+            request.planets,
+            timedelta(minutes=request.resolution_minutes),
+            request.ayanamsa_system
         )
         return result
     except Exception as e:
@@ -1,14 +1,22 @@
 """
 API endpoints for Shadbala calculations
 """
+from datetime import datetime
 from typing import Dict, List, Optional
+import json
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, validator
 
 from app.core.calculations.shadbala import ShadbalaSystem
+from app.core.calculations.shadbala_batch import BirthData, ShadbalaBatchCalculator
 
 router = APIRouter()
 
+shadbala_system = ShadbalaSystem()
+batch_calculator = ShadbalaBatchCalculator()
+
 class AspectData(BaseModel):
     """Model for aspect data"""
     type: str = Field(..., description="Type of aspect")
@@ -32,6 +40,7 @@ class ShadbalaRequest(BaseModel):
     planet: str = Field(..., description="Planet name")
     position: float = Field(..., description="Planet position in degrees")
     house: int = Field(..., description="House number (1-12)")
+    speed: float = Field(0.0, description="Daily motion in degrees (negative when retrograde)")
     is_day: bool = Field(..., description="Whether birth is during day")
     aspects: List[AspectData] = Field(
         ..., 
@@ -95,6 +104,60 @@ class ShadbalaAnalysisRequest(BaseModel):
         ..., 
         description="House positions of planets"
     )
+    planet_speeds: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Daily motion of each planet in degrees (0 when omitted)"
+    )
+
+class BirthDataRequest(BaseModel):
+    """Birth data of one chart"""
+    datetime_utc: datetime = Field(..., description="Birth moment in UTC (or with an offset)")
+    latitude: float = Field(..., ge=-90, le=90, description="Birth place latitude")
+    longitude: float = Field(..., ge=-180, le=180, description="Birth place longitude")
+    altitude: float = Field(0.0, description="Birth place altitude in meters")
+
+class ShadbalaBatchRequest(BaseModel):
+    """Request model for batch Shadbala"""
+    charts: List[BirthDataRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        description="Birth data of each chart"
+    )
+    ayanamsa_system: str = Field("LAHIRI", description="Ayanamsa system")
+    chunk_size: int = Field(500, ge=1, le=5000, description="Charts computed per batch")
+
+    @validator('ayanamsa_system')
+    def validate_ayanamsa_system(cls, v):
+        if not batch_calculator.sidereal.ayanamsa_manager.validate_system(v.upper()):
+            raise ValueError(f"Invalid ayanamsa system: {v}")
+        return v.upper()
+
+def _planet_shadbala(
+    planet: str,
+    house: int,
+    speed: float,
+    aspects: List[AspectData],
+    is_day: bool
+) -> Dict:
+    """Shadbala of one planet in the response format of the endpoints"""
+    name = planet.capitalize()
+    result = shadbala_system.calculate_shadbala(
+        name, house, speed, [aspect.dict() for aspect in aspects], is_day
+    )
+    return {
+        'planet': planet,
+        'total_strength': float(result['total_strength']),
+        'components': {
+            'sthana_bala': float(result['sthan_bala']),
+            'dig_bala': float(result['dig_bala']),
+            'kala_bala': float(result['kala_bala']),
+            'chesta_bala': float(result['chesta_bala']),
+            'naisargika_bala': float(shadbala_system.planet_strengths[name]),
+            'drik_bala': float(result['aspect_bala'])
+        },
+        'interpretation': ShadbalaSystem._interpret_strength(result['total_strength'])
+    }
 
 @router.post("/calculate", tags=["Shadbala"])
 async def calculate_shadbala(request: ShadbalaRequest):
@@ -108,15 +171,13 @@ async def calculate_shadbala(request: ShadbalaRequest):
         Dictionary containing Shadbala analysis
     """
     try:
-        result = ShadbalaSystem.calculate_shadbala(
+        return _planet_shadbala(
             request.planet,
-            request.position,
             request.house,
-            request.is_day,
-            [aspect.dict() for aspect in request.aspects],
-            request.planet_positions
+            request.speed,
+            request.aspects,
+            request.is_day
         )
-        return result
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -133,22 +194,20 @@ async def analyze_all_planets(request: ShadbalaAnalysisRequest):
     """
     try:
         results = {}
-        for planet, position in request.planet_positions.items():
+        for planet in request.planet_positions:
             aspects = request.aspects.get(planet, [])
             house = request.house_positions.get(planet)
             
             if house is None:
                 raise ValueError(f"Missing house position for {planet}")
                 
-            result = ShadbalaSystem.calculate_shadbala(
+            results[planet] = _planet_shadbala(
                 planet,
-                position,
                 house,
-                request.birth_time_is_day,
-                [aspect.dict() for aspect in aspects],
-                request.planet_positions
+                request.planet_speeds.get(planet, 0.0),
+                aspects,
+                request.birth_time_is_day
             )
-            results[planet] = result
             
         # Calculate overall chart strength
         total_strength = sum(r['total_strength'] for r in results.values())
@@ -164,3 +223,30 @@ async def analyze_all_planets(request: ShadbalaAnalysisRequest):
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/batch", tags=["Shadbala"])
+async def batch_shadbala(request: ShadbalaBatchRequest):
+    """
+    Calculate Shadbala for many charts from birth data alone
+    
+    Houses, day/night and aspects are derived server-side; all planets of
+    each chunk of charts are computed in one batched pass.
+    
+    Args:
+        request: ShadbalaBatchRequest with the birth data of each chart
+        
+    Returns:
+        Newline-delimited JSON, one Shadbala analysis per chart in request
+        order, streamed as chunks complete
+    """
+    births = [
+        BirthData(chart.datetime_utc, chart.latitude, chart.longitude, chart.altitude)
+        for chart in request.charts
+    ]
+    
+    def lines():
+        analyses = batch_calculator.iter_analyses(births, request.ayanamsa_system, request.chunk_size)
+        for index, analysis in enumerate(analyses):
+            yield json.dumps({'index': index, **analysis}) + "\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -0,0 +1,85 @@
+"""Benchmark regression CLI.
+
+Run from the backend directory:
+
+    python -m app.core.benchmarks                    # compare with the baseline
+    python -m app.core.benchmarks --cases strength   # a group or case subset
+    python -m app.core.benchmarks --update-baseline  # record a new baseline
+
+Exits with status 1 when any case fails or regresses by more than the
+threshold and 2 when the baseline file is missing. A baseline is only
+written when every case ran without error. Baselines are machine dependent; record
+them on the machine that runs the comparison.
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from .harness import DEFAULT_SEED, BenchmarkReport, compare, get_cases, run_benchmarks
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "baseline.json"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run calculation benchmarks and check for regressions")
+    parser.add_argument("--cases", nargs="*", help="Case names or groups to run (default: all)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.3, help="Allowed relative regression (default: 0.3)")
+    parser.add_argument("--output", type=Path, help="Write this run's results to a JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Store results as the new baseline")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Workload seed")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed rounds per case (best is kept)")
+    parser.add_argument("--list", action="store_true", help="List cases and exit")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(message)s")
+    cases = get_cases(args.cases)
+    if args.list:
+        for case in cases:
+            print(f"{case.name:32} {case.description}")
+        return 0
+
+    report = run_benchmarks(cases, args.seed, args.rounds)
+    print(f"{'case':32} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'ops/s':>10} {'peak KiB':>10}")
+    for name, result in sorted(report.results.items()):
+        if result.error:
+            print(f"{name:32} ERROR {result.error}")
+            continue
+        print(
+            f"{name:32} {result.p50_ms:10.3f} {result.p95_ms:10.3f} {result.p99_ms:10.3f} "
+            f"{result.throughput_per_s:10.1f} {result.peak_memory_kb:10.1f}"
+        )
+
+    if args.output:
+        report.save(args.output)
+
+    if args.update_baseline:
+        failed = sorted(name for name, result in report.results.items() if result.error)
+        if failed:
+            print(f"Baseline not updated; cases failed: {', '.join(failed)}", file=sys.stderr)
+            return 1
+        if args.baseline.exists():
+            # Keep results of cases that were not run this time
+            previous = BenchmarkReport.load(args.baseline)
+            report.results = {**previous.results, **report.results}
+        report.save(args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"Baseline {args.baseline} not found; run with --update-baseline", file=sys.stderr)
+        return 2
+
+    regressions = compare(report, BenchmarkReport.load(args.baseline), args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"\nNo regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""Regression benchmark harness for calculation engines.
+
+Cases are registered with ``@benchmark`` and build their workload from a
+seeded random generator, so every run times the same inputs. Each case
+returns one zero-argument callable per workload item; the harness times
+every call (after a warm-up, over several rounds) to report latency
+percentiles and throughput, then measures peak traced memory in a separate
+pass so tracing overhead does not distort the timings.
+"""
+import json
+import logging
+import platform
+import random
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seed used for every workload unless a case overrides it
+DEFAULT_SEED = 20240101
+
+# Metrics compared against the baseline; higher is worse for all of them
+REGRESSION_METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'peak_memory_kb')
+
+
+@dataclass
+class BenchmarkCase:
+    """A named benchmark with a reproducible workload"""
+    name: str
+    group: str
+    build: Callable[[random.Random], List[Callable[[], object]]]
+    description: str = ""
+    warmup: int = 5
+
+
+@dataclass
+class CaseResult:
+    """Latency, throughput and memory of one benchmark case"""
+    name: str
+    group: str
+    calls: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    throughput_per_s: float
+    peak_memory_kb: float
+    error: Optional[str] = None
+
+
+@dataclass
+class Regression:
+    """A metric that exceeded its baseline by more than the threshold"""
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1 if self.baseline else float('inf')
+
+    def __str__(self) -> str:
+        return (
+            f"{self.case}: {self.metric} {self.baseline:.4g} -> {self.current:.4g} "
+            f"({self.change:+.1%})"
+        )
+
+
+@dataclass
+class BenchmarkReport:
+    """Results of a benchmark run with the environment they were taken in"""
+    results: Dict[str, CaseResult]
+    environment: Dict[str, str] = field(default_factory=dict)
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat(timespec='seconds'))
+
+    def to_dict(self) -> Dict:
+        return {
+            'timestamp': self.timestamp,
+            'environment': self.environment,
+            'results': {name: asdict(result) for name, result in sorted(self.results.items())}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'BenchmarkReport':
+        return cls(
+            results={name: CaseResult(**result) for name, result in data['results'].items()},
+            environment=data.get('environment', {}),
+            timestamp=data.get('timestamp', '')
+        )
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+
+    @classmethod
+    def load(cls, path: Path) -> 'BenchmarkReport':
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+
+_registry: Dict[str, BenchmarkCase] = {}
+
+
+def benchmark(name: str, group: str, description: str = "", warmup: int = 5):
+    """Register a workload builder as a benchmark case"""
+    def decorator(build):
+        if name in _registry:
+            raise ValueError(f"Duplicate benchmark case: {name}")
+        _registry[name] = BenchmarkCase(name, group, build, description or (build.__doc__ or "").strip(), warmup)
+        return build
+    return decorator
+
+
+def get_cases(selection: Optional[Iterable[str]] = None) -> List[BenchmarkCase]:
+    """Registered cases, optionally filtered by case name or group"""
+    # Importing the workloads registers them
+    from . import workloads  # noqa: F401
+
+    cases = sorted(_registry.values(), key=lambda case: case.name)
+    if not selection:
+        return cases
+    selection = set(selection)
+    unknown = selection - {case.name for case in cases} - {case.group for case in cases}
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases: {', '.join(sorted(unknown))}")
+    return [case for case in cases if case.name in selection or case.group in selection]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile (0-100) of sorted values"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _time_calls(calls: List[Callable[[], object]]) -> Tuple[List[float], float]:
+    durations = []
+    started = time.perf_counter()
+    for call in calls:
+        start = time.perf_counter()
+        call()
+        durations.append((time.perf_counter() - start) * 1000)
+    return sorted(durations), time.perf_counter() - started
+
+
+def run_case(case: BenchmarkCase, seed: int = DEFAULT_SEED, rounds: int = 3) -> CaseResult:
+    """
+    Time every workload call of a case and measure its peak memory
+
+    Each round times a freshly built workload; the reported percentiles
+    and throughput are the best over rounds, which filters out
+    interference from other processes.
+    """
+    try:
+        # Warm up on a different workload so timed calls start cold in caches
+        for call in case.build(random.Random(seed + 1))[:case.warmup]:
+            call()
+
+        timings = [_time_calls(case.build(random.Random(seed))) for _ in range(rounds)]
+
+        # Fresh workload so cached results do not hide allocations
+        memory_calls = case.build(random.Random(seed))
+        tracemalloc.start()
+        try:
+            for call in memory_calls:
+                call()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as e:
+        logger.warning(f"Benchmark {case.name} failed: {e}")
+        return CaseResult(case.name, case.group, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, error=f"{type(e).__name__}: {e}")
+
+    calls = len(timings[0][0])
+    return CaseResult(
+        name=case.name,
+        group=case.group,
+        calls=calls,
+        p50_ms=min(percentile(durations, 50) for durations, _ in timings),
+        p95_ms=min(percentile(durations, 95) for durations, _ in timings),
+        p99_ms=min(percentile(durations, 99) for durations, _ in timings),
+        mean_ms=min(sum(durations) / calls if calls else 0.0 for durations, _ in timings),
+        throughput_per_s=max(calls / elapsed if elapsed else 0.0 for _, elapsed in timings),
+        peak_memory_kb=peak / 1024
+    )
+
+
+def environment() -> Dict[str, str]:
+    """Interpreter and machine description stored with results"""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'processor': platform.processor()
+    }
+
+
+def run_benchmarks(cases: Iterable[BenchmarkCase], seed: int = DEFAULT_SEED, rounds: int = 3) -> BenchmarkReport:
+    """Run cases in order and collect their results"""
+    results = {}
+    for case in cases:
+        logger.info(f"Running benchmark {case.name}")
+        results[case.name] = run_case(case, seed, rounds)
+    return BenchmarkReport(results=results, environment=environment())
+
+
+def compare(
+    current: BenchmarkReport,
+    baseline: BenchmarkReport,
+    threshold: float = 0.3,
+    metrics: Iterable[str] = REGRESSION_METRICS,
+    min_delta_ms: float = 0.02
+) -> List[Regression]:
+    """
+    Regressions of the current run against a baseline
+
+    Args:
+        current: Results to check
+        baseline: Reference results
+        threshold: Allowed relative increase (0.3 allows +30%)
+        metrics: Metrics to compare
+        min_delta_ms: Absolute latency increase below which changes are noise
+
+    Returns:
+        Regressions, including every case that failed to run
+    """
+    regressions = []
+    for name, result in sorted(current.results.items()):
+        if result.error:
+            regressions.append(Regression(name, 'error', 0.0, 1.0))
+            continue
+        reference = baseline.results.get(name)
+        if reference is None or reference.error:
+            continue
+        for metric in metrics:
+            before = getattr(reference, metric)
+            after = getattr(result, metric)
+            if metric.endswith('_ms') and after - before < min_delta_ms:
+                continue
+            if after > before * (1 + threshold):
+                regressions.append(Regression(name, metric, before, after))
+        if result.throughput_per_s < reference.throughput_per_s / (1 + threshold):
+            regressions.append(Regression(
+                name, 'throughput_per_s', reference.throughput_per_s, result.throughput_per_s
+            ))
+    return regressions
@@ -0,0 +1,632 @@
+"""Reproducible benchmark workloads for the calculation engines.
+
+Every builder receives a seeded ``random.Random`` and returns one
+zero-argument callable per workload item. Inputs (birth moments,
+locations and tropical positions) are generated before any callable is
+returned, so only the engine under test is timed.
+"""
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, List
+
+import swisseph as swe
+
+from app.core.calculations.astronomical import SWE_STATE_LOCK
+from app.models.enums import Planet
+from app.models.location import Location
+from .harness import benchmark
+
+CHART_COUNT = 200
+HTTP_REQUEST_COUNT = 50
+
+PLANET_NAMES = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
+
+DIVISIONS = [1, 2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40]
+
+# Birth places spread over latitudes where all house systems are defined
+LOCATIONS = [
+    (28.6139, 77.2090),   # New Delhi
+    (13.0827, 80.2707),   # Chennai
+    (19.0760, 72.8777),   # Mumbai
+    (51.5074, -0.1278),   # London
+    (40.7128, -74.0060),  # New York
+    (-33.8688, 151.2093), # Sydney
+    (1.3521, 103.8198),   # Singapore
+    (-23.5505, -46.6333)  # Sao Paulo
+]
+
+Workload = List[Callable[[], object]]
+
+# Julian days of 1950-01-01 and 2030-01-01, the sampled birth range
+FIRST_JD = 2433282.5
+LAST_JD = 2462502.5
+
+
+@lru_cache(maxsize=None)
+def _warm_ayanamsa_manager():
+    """Manager with every interpolation block of the sampled range built
+
+    Shared between workload builds so ayanamsa cases time the steady state
+    rather than table construction.
+    """
+    from app.core.calculations.ayanamsa import EnhancedAyanamsaManager
+
+    manager = EnhancedAyanamsaManager()
+    manager.calculate_ayanamsa_matrix([FIRST_JD + day for day in range(int(LAST_JD - FIRST_JD) + 1)])
+    return manager
+
+
+@dataclass
+class SampleChart:
+    """Birth data with precomputed positions"""
+    birth_time: datetime
+    latitude: float
+    longitude: float
+    jd: float
+    ascendant: float
+    longitudes: Dict[str, float]
+    speeds: Dict[str, float]
+
+    @property
+    def houses(self) -> Dict[str, int]:
+        """Whole-sign houses from the ascendant"""
+        lagna_sign = int(self.ascendant // 30)
+        return {
+            planet: (int(longitude // 30) - lagna_sign) % 12 + 1
+            for planet, longitude in self.longitudes.items()
+        }
+
+
+def sample_charts(rng: random.Random, count: int = CHART_COUNT) -> List[SampleChart]:
+    """Random births between 1950 and 2030 at the benchmark locations (Lahiri)"""
+    start = datetime(1950, 1, 1)
+    span = (datetime(2030, 1, 1) - start).total_seconds()
+    charts = []
+    for _ in range(count):
+        birth_time = start + timedelta(seconds=int(rng.random() * span))
+        latitude, longitude = rng.choice(LOCATIONS)
+        jd = swe.julday(
+            birth_time.year, birth_time.month, birth_time.day,
+            birth_time.hour + birth_time.minute / 60 + birth_time.second / 3600
+        )
+        flags = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
+        longitudes, speeds = {}, {}
+        with SWE_STATE_LOCK:
+            swe.set_sid_mode(swe.SIDM_LAHIRI)
+            for planet, body in zip(PLANET_NAMES[:8], [
+                swe.SUN, swe.MOON, swe.MARS, swe.MERCURY,
+                swe.JUPITER, swe.VENUS, swe.SATURN, swe.MEAN_NODE
+            ]):
+                position = swe.calc_ut(jd, body, flags)[0]
+                longitudes[planet], speeds[planet] = position[0], position[3]
+            ascendant = swe.houses_ex(jd, latitude, longitude, b'W', swe.FLG_SIDEREAL)[1][0]
+        longitudes['Ketu'] = (longitudes['Rahu'] + 180) % 360
+        speeds['Ketu'] = speeds['Rahu']
+        charts.append(SampleChart(birth_time, latitude, longitude, jd, ascendant, longitudes, speeds))
+    return charts
+
+
+@benchmark("positions.tropical", "positions")
+def positions_tropical(rng: random.Random) -> Workload:
+    """Uncached tropical positions of all nine planets"""
+    from app.core.calculations.astronomical import AstronomicalCalculator
+
+    calculator = AstronomicalCalculator()
+    planets = list(Planet)
+
+    def call(jd):
+        return lambda: [calculator.calculate_position_jd(jd, planet) for planet in planets]
+    return [call(chart.jd) for chart in sample_charts(rng)]
+
+
+@benchmark("positions.sidereal_all_systems", "positions")
+def positions_sidereal(rng: random.Random) -> Workload:
+    """Sidereal positions of all nine planets in every ayanamsa system"""
+    from app.core.calculations.sidereal import SiderealPositionService
+
+    service = SiderealPositionService(ayanamsa_manager=_warm_ayanamsa_manager())
+
+    def call(jd):
+        return lambda: service.calculate_arrays([jd])
+    return [call(chart.jd) for chart in sample_charts(rng)]
+
+
+@benchmark("ayanamsa.precise", "ayanamsa")
+def ayanamsa_precise(rng: random.Random) -> Workload:
+    """Rounded ayanamsa of one system per call"""
+    manager = _warm_ayanamsa_manager()
+    systems = manager.get_available_systems()
+
+    def call(moment, system):
+        return lambda: manager.calculate_precise_ayanamsa(moment, system)
+    return [call(chart.birth_time, rng.choice(systems)) for chart in sample_charts(rng)]
+
+
+@benchmark("cusps.placidus", "cusps")
+def cusps_placidus(rng: random.Random) -> Workload:
+    """Placidus cusps at distinct moments and places"""
+    from app.core.calculations.astronomical import AstronomicalCalculator
+
+    calculator = AstronomicalCalculator()
+
+    def call(chart):
+        location = Location(latitude=chart.latitude, longitude=chart.longitude)
+        return lambda: calculator.calculate_house_cusps(chart.birth_time, location)
+    return [call(chart) for chart in sample_charts(rng)]
+
+
+@benchmark("cusps.batch", "cusps")
+def cusps_batch(rng: random.Random) -> Workload:
+    """Sidereal Placidus, Equal and Whole sign cusps of one instant at 100 places"""
+    from app.core.calculations.houses import calculate_house_batch
+
+    def call(chart):
+        latitudes = [rng.uniform(-60, 60) for _ in range(100)]
+        longitudes = [rng.uniform(-180, 180) for _ in range(100)]
+        return lambda: calculate_house_batch(chart.jd, latitudes, longitudes, ('P', 'E', 'W'), 'LAHIRI')
+    return [call(chart) for chart in sample_charts(rng, 20)]
+
+
+@benchmark("cusps.assign_houses", "cusps")
+def cusps_assign_houses(rng: random.Random) -> Workload:
+    """Houses of 9 bodies in 200 charts against each chart's Placidus cusps"""
+    import numpy as np
+    from app.core.calculations.house_kernel import assign_houses
+    from app.core.calculations.houses import calculate_house_batch
+
+    charts = sample_charts(rng)
+    cusps = calculate_house_batch(
+        [chart.jd for chart in charts], [chart.latitude for chart in charts],
+        [chart.longitude for chart in charts]
+    ).system_cusps('P')
+    longitudes = np.array([[chart.longitudes[name] for name in PLANET_NAMES] for chart in charts])
+    return [lambda: assign_houses(longitudes, cusps)] * 20
+
+
+@benchmark("divisional.all_vargas", "divisional")
+def divisional_all_vargas(rng: random.Random) -> Workload:
+    """Fourteen divisional charts of nine planets"""
+    from app.core.calculations.divisional import EnhancedDivisionalChartEngine
+
+    engine = EnhancedDivisionalChartEngine()
+
+    def call(longitudes):
+        return lambda: [engine.calculate_divisional_chart(longitudes, division) for division in DIVISIONS]
+    return [call(chart.longitudes) for chart in sample_charts(rng)]
+
+
+@benchmark("divisional.all_divisions", "divisional")
+def divisional_all_divisions(rng: random.Random) -> Workload:
+    """Fourteen divisional charts of nine planets in one kernel pass"""
+    from app.core.calculations.divisional import EnhancedDivisionalChartEngine
+
+    engine = EnhancedDivisionalChartEngine()
+    charts = [f"D{division}" for division in DIVISIONS]
+
+    def call(longitudes):
+        return lambda: engine.calculate_all_divisions(longitudes, charts=charts)
+    return [call(chart.longitudes) for chart in sample_charts(rng)]
+
+
+@benchmark("divisional.kernel_batch", "divisional")
+def divisional_kernel_batch(rng: random.Random) -> Workload:
+    """Signs of 1000 charts x 9 planets x 16 divisions per call"""
+    import numpy as np
+    from app.core.calculations.divisional_charts import SUPPORTED_DIVISIONS
+    from app.core.calculations.divisional_kernel import compute_vargas
+
+    def call(longitudes):
+        return lambda: compute_vargas(longitudes, SUPPORTED_DIVISIONS, with_longitudes=False)
+    return [
+        call(np.array([[rng.uniform(0, 360) for _ in PLANET_NAMES] for _ in range(1000)]))
+        for _ in range(20)
+    ]
+
+
+@benchmark("strength.shadbala", "strength")
+def strength_shadbala(rng: random.Random) -> Workload:
+    """Simplified Shadbala of the seven classical planets"""
+    from app.core.calculations.shadbala import ShadbalaSystem
+
+    shadbala = ShadbalaSystem()
+
+    def call(chart):
+        houses = chart.houses
+        is_day = rng.random() < 0.5
+        return lambda: [
+            shadbala.calculate_shadbala(planet, houses[planet], chart.speeds[planet], [], is_day)
+            for planet in PLANET_NAMES[:7]
+        ]
+    return [call(chart) for chart in sample_charts(rng)]
+
+
+@benchmark("strength.complete", "strength")
+def strength_complete(rng: random.Random) -> Workload:
+    """Complete strength profile of the seven classical planets"""
+    from app.core.calculations.strength import EnhancedPlanetaryStrengthEngine
+
+    engine = EnhancedPlanetaryStrengthEngine()
+
+    def call(chart):
+        houses = chart.houses
+        planets = {
+            name: {
+                'name': name,
+                'longitude': chart.longitudes[name],
+                'latitude': 0.0,
+                'speed': chart.speeds[name],
+                'house': houses[name]
+            }
+            for name in PLANET_NAMES[:7]
+        }
+        data = {
+            'ascendant': chart.ascendant,
+            'planets': planets,
+            'houses': {house: (chart.ascendant + 30 * (house - 1)) % 360 for house in range(1, 13)},
+            'aspects': [],
+            'is_day': rng.random() < 0.5
+        }
+        return lambda: [engine.calculate_complete_strengths(planet, data) for planet in planets.values()]
+    return [call(chart) for chart in sample_charts(rng)]
+
+
+@benchmark("strength.chart", "strength")
+def strength_chart(rng: random.Random) -> Workload:
+    """Complete strength profiles of the seven classical planets in one array pass"""
+    from app.core.calculations.strength import EnhancedPlanetaryStrengthEngine
+
+    engine = EnhancedPlanetaryStrengthEngine()
+
+    def call(chart):
+        planets = {
+            name: {
+                'name': name,
+                'longitude': chart.longitudes[name],
+                'latitude': 0.0,
+                'speed': chart.speeds[name],
+                'house': chart.houses[name]
+            }
+            for name in PLANET_NAMES[:7]
+        }
+        data = {'planets': planets, 'aspects': [], 'is_day': rng.random() < 0.5}
+        return lambda: engine.calculate_chart_strengths(data)
+    return [call(chart) for chart in sample_charts(rng)]
+
+
+@benchmark("strength.kernel_batch", "strength")
+def strength_kernel_batch(rng: random.Random) -> Workload:
+    """Strength arrays of 1000 charts per call"""
+    import numpy as np
+    from app.core.calculations.strength_kernel import compute_strengths
+
+    def call(longitudes, speeds, houses, is_day):
+        return lambda: compute_strengths(PLANET_NAMES, longitudes, speeds, houses, is_day)
+    return [
+        call(
+            np.array([[rng.uniform(0, 360) for _ in PLANET_NAMES] for _ in range(1000)]),
+            np.array([[rng.uniform(-1, 13) for _ in PLANET_NAMES] for _ in range(1000)]),
+            np.array([[rng.randint(1, 12) for _ in PLANET_NAMES] for _ in range(1000)]),
+            np.array([rng.random() < 0.5 for _ in range(1000)])
+        )
+        for _ in range(10)
+    ]
+
+
+@benchmark("strength.transit_frames", "strength")
+def strength_transit_frames(rng: random.Random) -> Workload:
+    """Strength profiles of 60 one-minute transit frames moving the Moon"""
+    import numpy as np
+    from app.core.calculations.strength_kernel import compute_strengths
+
+    def call(chart):
+        # One row per frame; only the Moon's column moves
+        longitudes = np.tile([chart.longitudes[name] for name in PLANET_NAMES], (60, 1))
+        longitudes[:, PLANET_NAMES.index('Moon')] = np.mod(
+            chart.longitudes['Moon'] + np.arange(1, 61) * chart.speeds['Moon'] / 1440, 360
+        )
+        speeds = [chart.speeds[name] for name in PLANET_NAMES]
+        houses = [chart.houses[name] for name in PLANET_NAMES]
+        is_day = np.ones(60, dtype=bool)
+        return lambda: compute_strengths(PLANET_NAMES, longitudes, speeds, houses, is_day).total
+    return [call(chart) for chart in sample_charts(rng, 20)]
+
+
+@benchmark("strength.shared_vargas", "strength")
+def strength_shared_vargas(rng: random.Random) -> Workload:
+    """Divisional charts and strength profiles from one varga batch"""
+    from app.core.calculations.divisional_charts import SUPPORTED_DIVISIONS, DivisionalChartEngine
+    from app.core.calculations.strength import EnhancedPlanetaryStrengthEngine
+
+    divisional = DivisionalChartEngine()
+    engine = EnhancedPlanetaryStrengthEngine()
+
+    def call(chart):
+        planets = {
+            name: {'longitude': chart.longitudes[name], 'speed': chart.speeds[name], 'house': chart.houses[name]}
+            for name in PLANET_NAMES
+        }
+        is_day = rng.random() < 0.5
+
+        def analyze():
+            vargas = divisional.calculate_varga_batch(planets, SUPPORTED_DIVISIONS, with_degrees=True)
+            return (
+                vargas.to_dict(PLANET_NAMES),
+                engine.calculate_chart_strengths({'planets': planets, 'is_day': is_day}, vargas=vargas)
+            )
+        return analyze
+    return [call(chart) for chart in sample_charts(rng)]
+
+
+@benchmark("shadbala.batch", "strength")
+def shadbala_batch(rng: random.Random) -> Workload:
+    """Shadbala of 100 charts from birth data in one batched pass"""
+    from app.core.calculations.shadbala_batch import BirthData, ShadbalaBatchCalculator
+
+    calculator = ShadbalaBatchCalculator()
+    calculator.sidereal.ayanamsa_manager = _warm_ayanamsa_manager()
+
+    def call(charts):
+        births = [BirthData(chart.birth_time, chart.latitude, chart.longitude) for chart in charts]
+        return lambda: calculator.calculate(births)
+    charts = sample_charts(rng, 500)
+    return [call(charts[start:start + 100]) for start in range(0, len(charts), 100)]
+
+
+@benchmark("ashtakavarga.sarva", "ashtakavarga")
+def ashtakavarga_sarva(rng: random.Random) -> Workload:
+    """Sarvashtakavarga from house positions"""
+    from app.core.calculations.ashtakavarga import Ashtakavarga
+
+    def call(houses):
+        return lambda: Ashtakavarga.calculate_sarvashtakavarga(houses)
+    return [
+        call({planet: house for planet, house in chart.houses.items() if planet in PLANET_NAMES[:7]})
+        for chart in sample_charts(rng)
+    ]
+
+
+@benchmark("ashtakavarga.complete", "ashtakavarga")
+def ashtakavarga_complete(rng: random.Random) -> Workload:
+    """Complete Bhinnashtakavarga and Sarvashtakavarga from house positions"""
+    from app.core.calculations.ashtakavarga import Ashtakavarga
+
+    def call(houses):
+        return lambda: Ashtakavarga.calculate_ashtakavarga(houses)
+    return [
+        call({planet: house for planet, house in chart.houses.items() if planet in PLANET_NAMES[:7]})
+        for chart in sample_charts(rng)
+    ]
+
+
+@benchmark("ashtakavarga.kernel_batch", "ashtakavarga")
+def ashtakavarga_kernel_batch(rng: random.Random) -> Workload:
+    """Ashtakavarga of 1000 charts per call from planet and lagna longitudes"""
+    from app.core.calculations.ashtakavarga_kernel import compute_ashtakavarga, contributor_signs
+
+    def call(charts):
+        longitudes = [[chart.longitudes[name] for name in PLANET_NAMES[:7]] for chart in charts]
+        signs = contributor_signs(longitudes, [chart.ascendant for chart in charts])
+        return lambda: compute_ashtakavarga(signs)
+    charts = sample_charts(rng)
+    return [call([rng.choice(charts) for _ in range(1000)]) for _ in range(20)]
+
+
+@benchmark("ashtakavarga.transit_hourly", "ashtakavarga")
+def ashtakavarga_transit_hourly(rng: random.Random) -> Workload:
+    """Hourly transit bindu series of 30 days against one natal chart"""
+    from app.core.calculations.ashtakavarga_transits import AshtakavargaTransitScorer, TransitSignSampler
+
+    sampler = TransitSignSampler(ayanamsa_manager=_warm_ayanamsa_manager())
+
+    def call(chart):
+        scorer = AshtakavargaTransitScorer(
+            {name: chart.longitudes[name] for name in PLANET_NAMES[:7]}, chart.ascendant, sampler
+        )
+        return lambda: scorer.score_period(chart.birth_time, chart.birth_time + timedelta(days=30), timedelta(hours=1))
+    return [call(chart) for chart in sample_charts(rng, 10)]
+
+
+@benchmark("dasha.all_levels", "dasha")
+def dasha_all_levels(rng: random.Random) -> Workload:
+    """Vimshottari maha, antar and pratyantar dashas"""
+    from app.core.calculations.dasha_system import VimshottariDasha
+
+    dasha = VimshottariDasha()
+
+    def call(chart):
+        return lambda: dasha.calculate_all_dasha_levels(chart.birth_time, chart.longitudes['Moon'])
+    return [call(chart) for chart in sample_charts(rng)]
+
+
+@benchmark("yoga.classical", "yoga")
+def yoga_classical(rng: random.Random) -> Workload:
+    """Raj, Dhana and Mahapurusha yogas"""
+    from app.core.calculations.yoga_calculator import YogaCalculator
+
+    calculator = YogaCalculator()
+
+    def call(chart):
+        positions = {name: {'longitude': chart.longitudes[name]} for name in PLANET_NAMES[:7]}
+        occupants = {house: [] for house in range(1, 13)}
+        for name, house in chart.houses.items():
+            if name in positions:
+                occupants[house].append(name)
+        return lambda: (
+            calculator.calculate_raj_yoga(positions, occupants),
+            calculator.calculate_dhana_yoga(positions, occupants),
+            calculator.calculate_mahapurusha_yoga(positions)
+        )
+    return [call(chart) for chart in sample_charts(rng)]
+
+
+@benchmark("yoga.rules_batch", "yoga")
+def yoga_rules_batch(rng: random.Random) -> Workload:
+    """300 compiled yoga rules over batches of 250 charts"""
+    import numpy as np
+    from app.core.calculations.yoga_rules import (
+        Aspects, Conjunct, HasDignity, LordOf, Placed, YogaRule, YogaRuleSet, sign_dignities
+    )
+
+    planets = PLANET_NAMES[:7]
+
+    def body():
+        return LordOf(rng.randint(1, 12)) if rng.random() < 0.5 else rng.choice(planets)
+
+    def condition():
+        kind = rng.randrange(4)
+        if kind == 0:
+            return Placed(body(), tuple(rng.sample(range(1, 13), 4)))
+        if kind == 1:
+            return Conjunct(body(), body())
+        if kind == 2:
+            return Aspects(body(), body())
+        return HasDignity(body(), ('own', 'exalted'))
+
+    rules = YogaRuleSet([
+        YogaRule(f"Rule {index}", None, condition() & (condition() | ~condition()), body(), "", ())
+        for index in range(300)
+    ])
+
+    def call(charts):
+        longitudes = np.array([[chart.longitudes[name] for name in planets] for chart in charts])
+        lagna_signs = np.array([int(chart.ascendant // 30) for chart in charts])
+        return lambda: rules.find_yogas(
+            rules.batch_features(longitudes, sign_dignities(longitudes, planets), lagna_signs)
+        )
+    charts = sample_charts(rng, 1000)
+    return [call(charts[start:start + 250]) for start in range(0, len(charts), 250)]
+
+
+@benchmark("aspects.enhanced", "aspects")
+def aspects_enhanced(rng: random.Random) -> Workload:
+    """Pairwise aspects with strengths"""
+    from app.core.calculations.aspects import EnhancedAspectCalculator
+
+    calculator = EnhancedAspectCalculator()
+
+    def call(chart):
+        houses = chart.houses
+        positions = {
+            name: {'longitude': chart.longitudes[name], 'speed': chart.speeds[name], 'house': houses[name]}
+            for name in PLANET_NAMES
+        }
+        return lambda: calculator.calculate_aspects(positions)
+    return [call(chart) for chart in sample_charts(rng)]
+
+
+@benchmark("aspects.graha_drishti", "aspects")
+def aspects_graha_drishti(rng: random.Random) -> Workload:
+    """House-based aspect influences"""
+    from app.core.calculations.aspect_analysis import AspectAnalyzer
+
+    analyzer = AspectAnalyzer()
+
+    def call(chart):
+        positions = {name: {'longitude': chart.longitudes[name]} for name in PLANET_NAMES[:7]}
+        return lambda: analyzer.calculate_all_aspects(positions)
+    return [call(chart) for chart in sample_charts(rng)]
+
+
+@benchmark("aspects.kernel_batch", "aspects")
+def aspects_kernel_batch(rng: random.Random) -> Workload:
+    """Transit-natal aspects of a month of hourly positions"""
+    import numpy as np
+    from app.core.calculations.aspect_kernel import find_aspects
+    from app.core.calculations.aspects import EnhancedAspectCalculator
+
+    table = EnhancedAspectCalculator.ASPECT_TABLE
+
+    def call(chart):
+        natal = np.array([chart.longitudes[name] for name in PLANET_NAMES])
+        # Linear motion from the chart's speeds over 720 hours
+        hours = np.arange(720)[:, np.newaxis] / 24.0
+        transits = natal + hours * np.array([chart.speeds[name] for name in PLANET_NAMES])
+        return lambda: find_aspects(transits, table, others=natal)
+    return [call(chart) for chart in sample_charts(rng, 20)]
+
+
+@benchmark("aspects.timeline_nightly", "aspects")
+def aspects_timeline_nightly(rng: random.Random) -> Workload:
+    """Transit-to-natal aspect events of 100 charts over one day"""
+    from app.core.calculations.aspect_timeline import AspectTimeline
+
+    timeline = AspectTimeline(ayanamsa_manager=_warm_ayanamsa_manager())
+
+    def call(charts):
+        natal = [[chart.longitudes[name] for name in PLANET_NAMES] for chart in charts]
+        start = charts[0].birth_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        return lambda: timeline.transit_natal_events(natal, start, start + timedelta(days=1))
+    charts = sample_charts(rng, 500)
+    return [call(charts[start:start + 100]) for start in range(0, len(charts), 100)]
+
+
+@benchmark("unified.analyze_chart", "unified", warmup=2)
+def unified_analyze_chart(rng: random.Random) -> Workload:
+    """Complete unified chart analysis"""
+    from app.core.unified_analyzer import UnifiedAnalyzer
+
+    analyzer = UnifiedAnalyzer()
+
+    def call(chart):
+        positions = {name: {'longitude': chart.longitudes[name]} for name in PLANET_NAMES[:7]}
+        return lambda: analyzer.analyze_chart(chart.birth_time, chart.latitude, chart.longitude, positions)
+    return [call(chart) for chart in sample_charts(rng, CHART_COUNT // 4)]
+
+
+def _client():
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    return TestClient(app)
+
+
+def _checked(client, method: str, url: str, **kwargs) -> Callable[[], object]:
+    def call():
+        response = client.request(method, url, **kwargs)
+        if response.status_code != 200:
+            raise RuntimeError(f"{method} {url} returned {response.status_code}")
+        return response
+    return call
+
+
+@benchmark("http.ashtakavarga", "http")
+def http_ashtakavarga(rng: random.Random) -> Workload:
+    """POST /api/v1/ashtakavarga/calculate"""
+    client = _client()
+    return [
+        _checked(client, "POST", "/api/v1/ashtakavarga/calculate", json={
+            "planet_positions": {name: chart.houses[name] for name in PLANET_NAMES[:7]}
+        })
+        for chart in sample_charts(rng, HTTP_REQUEST_COUNT)
+    ]
+
+
+@benchmark("http.dasha", "http")
+def http_dasha(rng: random.Random) -> Workload:
+    """POST /api/v1/dasha/dasha/vimshottari"""
+    client = _client()
+    return [
+        _checked(client, "POST", "/api/v1/dasha/dasha/vimshottari", json={
+            "birth_date": chart.birth_time.isoformat(),
+            "moon_longitude": chart.longitudes['Moon']
+        })
+        for chart in sample_charts(rng, HTTP_REQUEST_COUNT)
+    ]
+
+
+@benchmark("http.muhurta", "http")
+def http_muhurta(rng: random.Random) -> Workload:
+    """POST /api/v1/prediction/muhurta/calculate"""
+    client = _client()
+    classical = ['sun', 'moon', 'mars', 'mercury', 'jupiter', 'venus', 'saturn']
+    return [
+        _checked(client, "POST", "/api/v1/prediction/muhurta/calculate", json={
+            "datetime_utc": chart.birth_time.isoformat(),
+            "activity_type": rng.choice(['business', 'marriage', 'travel', 'education']),
+            "planet_positions": {name: chart.longitudes[name.title()] for name in classical},
+            "planet_strengths": {name: round(rng.random(), 2) for name in classical}
+        })
+        for chart in sample_charts(rng, HTTP_REQUEST_COUNT)
+    ]
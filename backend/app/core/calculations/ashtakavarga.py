@@ -4,6 +4,8 @@ Ashtakavarga calculation system for Vedic astrology
 from typing import Dict, List, Tuple
 from decimal import Decimal
 
+from .ashtakavarga_kernel import compute_ashtakavarga, house_signs
+
 class Ashtakavarga:
     """
     Implements Ashtakavarga calculations for analyzing planetary strengths and influences
@@ -104,6 +106,25 @@ class Ashtakavarga:
             
         return result
     
+    @classmethod
+    def calculate_ashtakavarga(cls,
+                               planet_positions: Dict[str, int]) -> Dict[str, List[int]]:
+        """
+        Calculate the complete Parashari Bhinnashtakavarga and Sarvashtakavarga
+        
+        All eight contributors (the seven planets and the lagna) are counted,
+        see ashtakavarga_kernel.
+        
+        Args:
+            planet_positions: Dictionary of planet positions in houses, the
+                lagna being house 1
+            
+        Returns:
+            Dictionary of bindu counts for each house for each planet, and
+            the Sarvashtakavarga under ``Sarva``
+        """
+        return compute_ashtakavarga(house_signs(planet_positions)).to_dict()
+    
     @classmethod
     def calculate_house_strength(cls, 
                                house: int, 
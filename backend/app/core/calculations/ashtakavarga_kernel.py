@@ -0,0 +1,188 @@
+"""
+Ashtakavarga Kernel
+Bhinnashtakavarga and Sarvashtakavarga of many charts as arrays.
+
+The Parashari contribution tables give, for each of the seven planets, the
+houses counted from each of the eight contributors (the seven planets and
+the lagna) that receive a bindu. They are compiled into 12-bit masks, bit
+``h - 1`` set for house ``h``. A contributor in sign ``s`` gives its bindus
+to the signs of its mask rotated left by ``s``. All twelve rotations of
+every mask are unpacked once into a lookup table, so the
+Bhinnashtakavarga of a batch of charts is eight table lookups (one per
+contributor) and a sum, and the Sarvashtakavarga is the sum over the seven
+planets.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+import logging
+
+import numpy as np
+
+from app.core.monitoring.instrumentation import instrument
+
+logger = logging.getLogger(__name__)
+
+ASHTAKAVARGA_PLANETS = ('Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn')
+CONTRIBUTORS = ASHTAKAVARGA_PLANETS + ('Lagna',)
+
+# Houses from each contributor (columns in CONTRIBUTORS order) that give a
+# bindu in the planet's Bhinnashtakavarga
+CONTRIBUTIONS = {
+    'Sun': (
+        (1, 2, 4, 7, 8, 9, 10, 11), (3, 6, 10, 11), (1, 2, 4, 7, 8, 9, 10, 11), (3, 5, 6, 9, 10, 11, 12),
+        (5, 6, 9, 11), (6, 7, 12), (1, 2, 4, 7, 8, 9, 10, 11), (3, 4, 6, 10, 11, 12)
+    ),
+    'Moon': (
+        (3, 6, 7, 8, 10, 11), (1, 3, 6, 7, 10, 11), (2, 3, 5, 6, 9, 10, 11), (1, 3, 4, 5, 7, 8, 10, 11),
+        (1, 4, 7, 8, 10, 11, 12), (3, 4, 5, 7, 9, 10, 11), (3, 5, 6, 11), (3, 6, 10, 11)
+    ),
+    'Mars': (
+        (3, 5, 6, 10, 11), (3, 6, 11), (1, 2, 4, 7, 8, 10, 11), (3, 5, 6, 11),
+        (6, 10, 11, 12), (6, 8, 11, 12), (1, 4, 7, 8, 9, 10, 11), (1, 3, 6, 10, 11)
+    ),
+    'Mercury': (
+        (5, 6, 9, 11, 12), (2, 4, 6, 8, 10, 11), (1, 2, 4, 7, 8, 9, 10, 11), (1, 3, 5, 6, 9, 10, 11, 12),
+        (6, 8, 11, 12), (1, 2, 3, 4, 5, 8, 9, 11), (1, 2, 4, 7, 8, 9, 10, 11), (1, 2, 4, 6, 8, 10, 11)
+    ),
+    'Jupiter': (
+        (1, 2, 3, 4, 7, 8, 9, 10, 11), (2, 5, 7, 9, 11), (1, 2, 4, 7, 8, 10, 11), (1, 2, 4, 5, 6, 9, 10, 11),
+        (1, 2, 3, 4, 7, 8, 10, 11), (2, 5, 6, 9, 10, 11), (3, 5, 6, 12), (1, 2, 4, 5, 6, 7, 9, 10, 11)
+    ),
+    'Venus': (
+        (8, 11, 12), (1, 2, 3, 4, 5, 8, 9, 11, 12), (3, 5, 6, 9, 11, 12), (3, 5, 6, 9, 11),
+        (5, 8, 9, 10, 11), (1, 2, 3, 4, 5, 8, 9, 10, 11), (3, 4, 5, 8, 9, 10, 11), (1, 2, 3, 4, 5, 8, 9, 11)
+    ),
+    'Saturn': (
+        (1, 2, 4, 7, 8, 10, 11), (3, 6, 11), (3, 5, 6, 10, 11, 12), (6, 8, 9, 10, 11, 12),
+        (5, 6, 11, 12), (6, 11, 12), (3, 5, 6, 11), (1, 3, 4, 6, 10, 11)
+    )
+}
+
+# Sign index marking a contributor without a known position; it gives no bindus
+MISSING_SIGN = -1
+
+_BITS = np.arange(12, dtype=np.uint16)
+
+
+def _mask(houses: Sequence[int]) -> int:
+    return sum(1 << (house - 1) for house in houses)
+
+
+# (planets, contributors) 12-bit masks
+CONTRIBUTION_MASKS = np.array(
+    [[_mask(houses) for houses in CONTRIBUTIONS[planet]] for planet in ASHTAKAVARGA_PLANETS],
+    dtype=np.uint16
+)
+CONTRIBUTION_MASKS.flags.writeable = False
+
+# (planets, contributors, houses) boolean form of the masks
+CONTRIBUTION_TABLE = ((CONTRIBUTION_MASKS[..., np.newaxis] >> _BITS) & 1).astype(bool)
+CONTRIBUTION_TABLE.flags.writeable = False
+
+# Bindus of each Bhinnashtakavarga over all signs (48, 49, 39, 54, 56, 52, 39)
+BINDU_TOTALS = dict(zip(ASHTAKAVARGA_PLANETS, CONTRIBUTION_TABLE.sum(axis=(1, 2)).tolist()))
+
+# (contributors, sign + 1, planets, signs) bindus given by a contributor in
+# each sign; the extra last row, reached by MISSING_SIGN, gives none
+_ROTATIONS = np.zeros((len(CONTRIBUTORS), 13, len(ASHTAKAVARGA_PLANETS), 12), dtype=np.int8)
+for _sign in range(12):
+    _ROTATIONS[:, _sign] = np.roll(CONTRIBUTION_TABLE, _sign, axis=2).transpose(1, 0, 2)
+_ROTATIONS.flags.writeable = False
+
+
+@dataclass(frozen=True)
+class AshtakavargaBatch:
+    """Ashtakavarga of a batch of charts"""
+    bhinna: np.ndarray  # (charts, planets, signs) bindus of each planet's Bhinnashtakavarga
+    sarva: np.ndarray  # (charts, signs) Sarvashtakavarga
+
+    def to_dict(self, chart: int = 0) -> Dict[str, List[int]]:
+        """
+        Ashtakavarga of one chart
+
+        Args:
+            chart: Row of the chart in the batch
+
+        Returns:
+            Dictionary mapping each planet, and ``Sarva``, to its bindus in
+            the twelve signs (Aries first)
+        """
+        result = dict(zip(ASHTAKAVARGA_PLANETS, self.bhinna[chart].tolist()))
+        result['Sarva'] = self.sarva[chart].tolist()
+        return result
+
+
+@instrument()
+def compute_ashtakavarga(signs: np.ndarray) -> AshtakavargaBatch:
+    """
+    Bhinnashtakavarga and Sarvashtakavarga of many charts
+
+    Args:
+        signs: Sign indices 0-11 of the eight contributors, (charts, 8) or
+            (8,) for a single chart, in CONTRIBUTORS order (the seven planets,
+            then the lagna); MISSING_SIGN for unknown positions
+
+    Returns:
+        AshtakavargaBatch with one row per chart
+    """
+    signs = np.asarray(signs, dtype=int)
+    if signs.ndim == 1:
+        signs = signs[np.newaxis, :]
+    if signs.ndim != 2 or signs.shape[1] != len(CONTRIBUTORS):
+        raise ValueError("Signs must be a (charts, 8) array of the seven planets and the lagna")
+    if (signs >= 12).any() or (signs < MISSING_SIGN).any():
+        raise ValueError("Sign indices must be 0-11 or MISSING_SIGN")
+
+    bhinna = _ROTATIONS[0, signs[:, 0]].copy()
+    for contributor in range(1, len(CONTRIBUTORS)):
+        bhinna += _ROTATIONS[contributor, signs[:, contributor]]
+    return AshtakavargaBatch(bhinna=bhinna, sarva=bhinna.sum(axis=1, dtype=np.int16))
+
+
+def contributor_signs(
+    longitudes: np.ndarray,
+    ascendants: np.ndarray
+) -> np.ndarray:
+    """
+    Contributor sign indices from sidereal longitudes
+
+    Args:
+        longitudes: Longitudes of the seven planets (charts, 7), NaN where
+            unknown
+        ascendants: Lagna longitudes (charts,)
+
+    Returns:
+        int array (charts, 8) for compute_ashtakavarga
+    """
+    positions = np.concatenate(
+        [np.atleast_2d(np.asarray(longitudes, dtype=float)),
+         np.asarray(ascendants, dtype=float).reshape(-1, 1)],
+        axis=1
+    )
+    missing = np.isnan(positions)
+    signs = (np.mod(np.where(missing, 0.0, positions), 360) // 30).astype(int)
+    return np.where(missing, MISSING_SIGN, signs)
+
+
+def house_signs(
+    planet_houses: Dict[str, int],
+    lagna_sign: int = 0
+) -> np.ndarray:
+    """
+    Contributor sign indices of one chart from house positions
+
+    Args:
+        planet_houses: Planet name to house 1-12; planets missing from the
+            dictionary give no bindus
+        lagna_sign: Sign of the first house (default: Aries, so that sign
+            indices equal house numbers minus one)
+
+    Returns:
+        int array (8,) for compute_ashtakavarga
+    """
+    signs = [
+        (lagna_sign + planet_houses[planet] - 1) % 12 if planet in planet_houses else MISSING_SIGN
+        for planet in ASHTAKAVARGA_PLANETS
+    ]
+    return np.array(signs + [lagna_sign % 12])
@@ -0,0 +1,238 @@
+"""
+Ashtakavarga Transit Scoring
+Transit bindu series of a natal chart over a period.
+
+The natal Bhinnashtakavarga of the seven planets and the Sarvashtakavarga
+are computed once into an (8, 12) bindu table. Transit sign indices of the
+seven planets come from the ephemeris for every instant of the period, and
+each planet's bindus at each instant are a single gather from its table
+row. The series is kept as columns (one array per quantity, instants along
+the last axis) rather than one record per instant.
+
+Signs change far less often than hourly series are sampled, so the sampler
+evaluates the ephemeris on a daily grid and only falls back to every
+instant of a day when the planet could have touched a sign boundary in it,
+judged from its distance to the boundaries and its maximum daily motion.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence
+import logging
+
+import numpy as np
+
+from app.core.monitoring.instrumentation import instrument
+from app.models.enums import Planet
+from .ashtakavarga_kernel import ASHTAKAVARGA_PLANETS, compute_ashtakavarga, contributor_signs
+from .astronomical import AstronomicalCalculator
+from .ayanamsa import EnhancedAyanamsaManager
+from .prediction_engine import PredictionEngine
+
+logger = logging.getLogger(__name__)
+
+# Bindus from which a planet's transit through a sign counts as favourable
+FAVOURABLE_BINDUS = 4
+
+# Upper bounds of geocentric daily motion in degrees, with a margin
+MAX_DAILY_MOTION = {
+    'Sun': 1.1,
+    'Moon': 16.0,
+    'Mars': 0.9,
+    'Mercury': 2.5,
+    'Jupiter': 0.3,
+    'Venus': 1.4,
+    'Saturn': 0.15
+}
+
+
+class TransitSignSampler:
+    """Transit sign indices of many instants with few ephemeris calls"""
+
+    def __init__(
+        self,
+        calculator: Optional[AstronomicalCalculator] = None,
+        ayanamsa_manager: Optional[EnhancedAyanamsaManager] = None,
+        coarse_step: float = 1.0
+    ):
+        """
+        Args:
+            calculator: Ephemeris source
+            ayanamsa_manager: Ayanamsa source for sidereal signs
+            coarse_step: Spacing in days of the instants always evaluated
+        """
+        self.calculator = calculator or AstronomicalCalculator()
+        self.ayanamsa_manager = ayanamsa_manager or EnhancedAyanamsaManager()
+        self.coarse_step = coarse_step
+        # Ephemeris evaluations and instants filled from the coarse grid
+        self.evaluated = 0
+        self.skipped = 0
+
+    def _longitudes(self, jds: np.ndarray, planet: Planet, ayanamsa_system: Optional[str]) -> np.ndarray:
+        longitudes = np.array([self.calculator.calculate_position_jd(float(jd), planet)[0] for jd in jds])
+        self.evaluated += len(jds)
+        if ayanamsa_system:
+            longitudes = longitudes - self.ayanamsa_manager.calculate_ayanamsa_series(jds, ayanamsa_system)
+        return np.mod(longitudes, 360.0)
+
+    def signs(
+        self,
+        jds: np.ndarray,
+        planets: Sequence[str] = ASHTAKAVARGA_PLANETS,
+        ayanamsa_system: Optional[str] = 'LAHIRI'
+    ) -> np.ndarray:
+        """
+        Sign indices of planets at increasing instants
+
+        Args:
+            jds: Increasing Julian days (instants,)
+            planets: Planet names
+            ayanamsa_system: Ayanamsa for sidereal signs, or None for tropical
+
+        Returns:
+            int8 array (planets, instants) of sign indices 0-11
+        """
+        jds = np.asarray(jds, dtype=float)
+        count = len(jds)
+        result = np.empty((len(planets), count), dtype=np.int8)
+        if count == 0:
+            return result
+
+        # Instants on the coarse grid, always including the last one
+        spacing = (jds[-1] - jds[0]) / (count - 1) if count > 1 else self.coarse_step
+        stride = max(1, int(self.coarse_step / spacing + 1e-9)) if spacing > 0 else 1
+        coarse = np.unique(np.append(np.arange(0, count, stride), count - 1))
+        interval = np.searchsorted(coarse, np.arange(count), side='right') - 1
+        between = np.ones(count, dtype=bool)
+        between[coarse] = False
+
+        for row, name in enumerate(planets):
+            planet = Planet[name.upper()]
+            longitudes = self._longitudes(jds[coarse], planet, ayanamsa_system)
+            signs = (longitudes // 30).astype(int) % 12
+            within = np.mod(longitudes, 30)
+            margin = np.minimum(within, 30 - within)
+            # Leaving a sign and returning within an interval takes at least
+            # the distance to a boundary from both ends
+            steady = (signs[:-1] == signs[1:]) & (
+                margin[:-1] + margin[1:] > MAX_DAILY_MOTION.get(name, 16.0) * np.diff(jds[coarse])
+            )
+
+            result[row, coarse] = signs
+            fill = between.copy()
+            if len(steady):
+                fill &= steady[np.minimum(interval, len(steady) - 1)]
+            result[row, fill] = signs[interval[fill]]
+            exact = between & ~fill
+            if exact.any():
+                result[row, exact] = (self._longitudes(jds[exact], planet, ayanamsa_system) // 30).astype(int) % 12
+            self.skipped += int(fill.sum())
+        return result
+
+
+@lru_cache(maxsize=1)
+def get_transit_sampler() -> TransitSignSampler:
+    """Shared sampler for scorers created without one"""
+    return TransitSignSampler()
+
+
+@dataclass(frozen=True)
+class TransitScoreSeries:
+    """Ashtakavarga transit scores of one natal chart over a period"""
+    planets: Sequence[str]
+    jds: np.ndarray  # (instants,) Julian days (UT)
+    signs: np.ndarray  # (planets, instants) transit sign indices 0-11
+    bindus: np.ndarray  # (planets, instants) bindus of the sign in the planet's own Bhinnashtakavarga
+    sarva: np.ndarray  # (planets, instants) Sarvashtakavarga bindus of the sign
+    score: np.ndarray  # (instants,) bindus summed over the planets
+
+    def to_columns(self) -> Dict[str, Any]:
+        """Series as JSON-ready columns keyed by quantity, then planet"""
+        return {
+            'planets': list(self.planets),
+            'jd': self.jds.tolist(),
+            'signs': dict(zip(self.planets, self.signs.tolist())),
+            'bindus': dict(zip(self.planets, self.bindus.tolist())),
+            'sarva': dict(zip(self.planets, self.sarva.tolist())),
+            'favourable': dict(zip(self.planets, (self.bindus >= FAVOURABLE_BINDUS).sum(axis=1).tolist())),
+            'score': self.score.tolist()
+        }
+
+
+class AshtakavargaTransitScorer:
+    """Transit bindus of the seven planets against one natal chart"""
+
+    def __init__(
+        self,
+        natal_longitudes: Dict[str, float],
+        lagna: float,
+        sampler: Optional[TransitSignSampler] = None
+    ):
+        """
+        Compute the natal bindu table
+
+        Args:
+            natal_longitudes: Sidereal longitudes of the seven planets
+            lagna: Sidereal longitude of the ascendant
+            sampler: Transit sign source (default: a shared sampler)
+        """
+        self.sampler = sampler or get_transit_sampler()
+        missing = [planet for planet in ASHTAKAVARGA_PLANETS if planet not in natal_longitudes]
+        if missing:
+            raise ValueError(f"Missing natal positions: {', '.join(missing)}")
+        signs = contributor_signs(
+            [[natal_longitudes[planet] for planet in ASHTAKAVARGA_PLANETS]], [lagna]
+        )
+        natal = compute_ashtakavarga(signs)
+        # Rows: the seven Bhinnashtakavargas, then the Sarvashtakavarga
+        self.table = np.vstack([natal.bhinna[0], natal.sarva[0]]).astype(np.int16)
+        self.table.flags.writeable = False
+        self._rows = np.arange(len(ASHTAKAVARGA_PLANETS))[:, np.newaxis]
+
+    def score(self, jds: np.ndarray, transit_signs: np.ndarray) -> TransitScoreSeries:
+        """
+        Score given transit sign indices
+
+        Args:
+            jds: Julian days of the instants (instants,)
+            transit_signs: Sign indices of the seven planets (7, instants)
+
+        Returns:
+            TransitScoreSeries of the instants
+        """
+        signs = np.asarray(transit_signs, dtype=np.int8)
+        if signs.ndim != 2 or signs.shape[0] != len(ASHTAKAVARGA_PLANETS):
+            raise ValueError("Transit signs must be a (7, instants) array")
+        bindus = self.table[self._rows, signs]
+        return TransitScoreSeries(
+            planets=ASHTAKAVARGA_PLANETS,
+            jds=np.asarray(jds, dtype=float),
+            signs=signs,
+            bindus=bindus.astype(np.int8),
+            sarva=self.table[-1][signs],
+            score=bindus.sum(axis=0, dtype=np.int16)
+        )
+
+    @instrument()
+    def score_period(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        resolution: timedelta = timedelta(days=1),
+        ayanamsa_system: Optional[str] = 'LAHIRI'
+    ) -> TransitScoreSeries:
+        """
+        Score the transits of a period sampled from the ephemeris
+
+        Args:
+            start_time: Period start time (UTC)
+            end_time: Period end time (UTC)
+            resolution: Sampling interval (daily by default)
+            ayanamsa_system: Ayanamsa matching the natal positions
+
+        Returns:
+            TransitScoreSeries of the sampled instants
+        """
+        jds = PredictionEngine.transit_instants(start_time, end_time, resolution)
+        return self.score(jds, self.sampler.signs(jds, ASHTAKAVARGA_PLANETS, ayanamsa_system))
@@ -10,6 +10,10 @@ from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 import math
 
+import numpy as np
+
+from .aspect_kernel import sign_distance_matrix
+
 class AspectType(Enum):
     """Types of aspects in Vedic astrology"""
     FULL = "full"      # Full aspect (100% strength)
@@ -112,25 +116,27 @@ class AspectAnalyzer:
         aspects = {}
         planets = list(planet_positions.keys())
         
-        for i, p1 in enumerate(planets):
-            for p2 in planets[i+1:]:
-                houses_between = self._calculate_houses_between(
-                    planet_positions[p1]['longitude'],
-                    planet_positions[p2]['longitude']
-                )
-                reverse_houses = self._calculate_houses_between(
-                    planet_positions[p2]['longitude'],
-                    planet_positions[p1]['longitude']
-                )
-                
-                # Check aspects in both directions
-                aspect1 = self.calculate_aspect_influence(p1, p2, houses_between)
-                aspect2 = self.calculate_aspect_influence(p2, p1, reverse_houses)
-                
-                if aspect1:
-                    aspects[(p1, p2)] = aspect1
-                if aspect2:
-                    aspects[(p2, p1)] = aspect2
+        # Houses counted from each planet to each other planet, and whether
+        # the planet casts an aspect on that house (bit h of its mask)
+        houses = sign_distance_matrix(
+            [planet_positions[planet]['longitude'] for planet in planets]
+        )[0]
+        masks = np.array([
+            sum(1 << house for house in self.standard_aspects.get(planet, [])) for planet in planets
+        ], dtype=np.int64)
+        aspected = (masks[:, np.newaxis] >> houses) & 1 == 1
+        
+        # Only pairs with an aspect in either direction are evaluated
+        for i, j in zip(*(index.tolist() for index in np.nonzero(aspected | aspected.T))):
+            if i > j:
+                continue
+            p1, p2 = planets[i], planets[j]
+            
+            # Check aspects in both directions
+            if aspected[i, j]:
+                aspects[(p1, p2)] = self.calculate_aspect_influence(p1, p2, int(houses[i, j]))
+            if aspected[j, i]:
+                aspects[(p2, p1)] = self.calculate_aspect_influence(p2, p1, int(houses[j, i]))
         
         return aspects
     
@@ -0,0 +1,164 @@
+"""
+Aspect Kernel
+Pairwise aspect detection for many bodies and instants as arrays.
+
+The angular distances between two sets of bodies are computed as one
+(instants, bodies, others) matrix, every aspect angle and orb is tested by
+broadcasting against it, and the hits come back as one structured array
+(instant, bodies, aspect, separation, orb) instead of objects per pair.
+Natal-natal input tests each unordered pair of one set once; transit-natal
+input tests every transiting body against every natal point, with the
+natal points fixed or moving per instant. Aspect objects of the callers
+are built from the hits only when asked for.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+import logging
+
+import numpy as np
+
+from app.core.monitoring.instrumentation import instrument
+
+logger = logging.getLogger(__name__)
+
+# One row per aspect hit
+ASPECT_HIT_DTYPE = np.dtype([
+    ('instant', np.int32),
+    ('body1', np.int16),
+    ('body2', np.int16),
+    ('aspect', np.int16),
+    ('separation', np.float64),
+    ('orb', np.float64)
+])
+
+# Broadcast cells (instants x bodies x others x aspects) evaluated at once
+CHUNK_CELLS = 1 << 20
+
+
+@dataclass(frozen=True)
+class AspectTable:
+    """Aspect angles and orbs in a fixed order"""
+    names: Tuple[str, ...]
+    angles: np.ndarray  # (aspects,) degrees 0-180
+    orbs: np.ndarray  # (aspects,) degrees
+
+    @classmethod
+    def from_pairs(cls, aspects: Iterable[Tuple[str, float, float]]) -> 'AspectTable':
+        """Table from (name, angle, orb) triples"""
+        aspects = list(aspects)
+        return cls(
+            names=tuple(name for name, _, _ in aspects),
+            angles=np.array([angle for _, angle, _ in aspects], dtype=float),
+            orbs=np.array([orb for _, _, orb in aspects], dtype=float)
+        )
+
+
+def separation_matrix(longitudes: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """
+    Angular distances 0-180 between two sets of longitudes
+
+    Args:
+        longitudes: (instants, bodies)
+        others: (instants, others) or (others,) for fixed points
+
+    Returns:
+        (instants, bodies, others) distances
+    """
+    others = np.asarray(others, dtype=float)
+    if others.ndim == 1:
+        others = others[np.newaxis, :]
+    distance = np.abs(np.mod(longitudes, 360)[:, :, np.newaxis] - np.mod(others, 360)[:, np.newaxis, :])
+    return np.where(distance > 180, 360 - distance, distance)
+
+
+def _as_instants(longitudes: np.ndarray) -> np.ndarray:
+    longitudes = np.asarray(longitudes, dtype=float)
+    if longitudes.ndim == 1:
+        return longitudes[np.newaxis, :]
+    if longitudes.ndim != 2:
+        raise ValueError("Longitudes must be (bodies,) or (instants, bodies)")
+    return longitudes
+
+
+@instrument()
+def find_aspects(
+    longitudes: np.ndarray,
+    table: AspectTable,
+    others: Optional[np.ndarray] = None,
+    first_only: bool = False
+) -> np.ndarray:
+    """
+    All aspects within orb between bodies
+
+    Args:
+        longitudes: Body longitudes, (bodies,) or (instants, bodies)
+        table: Aspects to test
+        others: Second set of longitudes, (others,) fixed or
+            (instants, others); when omitted each unordered pair of
+            ``longitudes`` is tested once (body1 < body2)
+        first_only: Keep only the first aspect in table order per pair
+
+    Returns:
+        Structured array of ASPECT_HIT_DTYPE ordered by instant, body1,
+        body2 and aspect; body2 indexes ``others`` when given
+    """
+    longitudes = _as_instants(longitudes)
+    instants, bodies = longitudes.shape
+    if others is None:
+        targets = longitudes
+        pairs = np.triu(np.ones((bodies, bodies), dtype=bool), k=1)
+    else:
+        targets = np.asarray(others, dtype=float)
+        if targets.ndim == 2 and targets.shape[0] != instants:
+            raise ValueError("Moving points must have one row per instant")
+        pairs = None
+
+    width = targets.shape[-1]
+    step = max(1, CHUNK_CELLS // max(1, bodies * width * len(table.angles)))
+    chunks = []
+    for start in range(0, instants, step):
+        stop = min(instants, start + step)
+        chunk_targets = targets[start:stop] if targets.ndim == 2 else targets
+        separations = separation_matrix(longitudes[start:stop], chunk_targets)
+        deviation = np.abs(separations[..., np.newaxis] - table.angles)
+        within = deviation <= table.orbs
+        if pairs is not None:
+            within &= pairs[np.newaxis, :, :, np.newaxis]
+        if first_only:
+            within &= np.cumsum(within, axis=-1) == 1
+        instant, body1, body2, aspect = np.nonzero(within)
+
+        hits = np.empty(len(instant), dtype=ASPECT_HIT_DTYPE)
+        hits['instant'] = instant + start
+        hits['body1'] = body1
+        hits['body2'] = body2
+        hits['aspect'] = aspect
+        hits['separation'] = separations[instant, body1, body2]
+        hits['orb'] = deviation[instant, body1, body2, aspect]
+        chunks.append(hits)
+
+    if not chunks:
+        return np.empty(0, dtype=ASPECT_HIT_DTYPE)
+    return np.concatenate(chunks)
+
+
+def sign_distance_matrix(longitudes: np.ndarray, others: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Houses counted from each body to each other body by sign
+
+    Args:
+        longitudes: (bodies,) or (instants, bodies)
+        others: Second set as in find_aspects (default: ``longitudes``)
+
+    Returns:
+        int array (instants, bodies, others) of counts 1-12, the body's own
+        sign counting as 1
+    """
+    longitudes = _as_instants(longitudes)
+    targets = longitudes if others is None else np.asarray(others, dtype=float)
+    if targets.ndim == 1:
+        targets = targets[np.newaxis, :]
+    difference = np.mod(targets[:, np.newaxis, :] - longitudes[:, :, np.newaxis], 360)
+    return (difference // 30).astype(int) % 12 + 1
+
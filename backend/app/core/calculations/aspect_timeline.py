@@ -0,0 +1,459 @@
+"""
+Aspect Timeline
+Orb entry, exact and orb exit times of aspects over a date range.
+
+The longitude difference of two bodies makes an aspect exact when it
+reaches the aspect angle on either side (+A or -A), and the aspect is in
+orb while the difference stays within the orb of that target. Every event
+is therefore a crossing of the difference through a fixed boundary
+(target - orb, target or target + orb).
+
+Each moving body (a transiting planet, or the difference of two of them)
+is sampled once into a track: knots spaced from its maximum rate of motion
+and split at its stations, so that it is monotonic between knots. The
+crossings of any number of boundaries are found on a track at once by
+counting how often the unwrapped longitude passes each boundary, and each
+crossing is refined with Newton steps on the ephemeris from the
+interpolated time, falling back to Brent's method within the bracket near
+stations. Transit-to-natal timelines of many charts share the planets'
+tracks, so the ephemeris is sampled once per planet for the whole batch and
+evaluated again only to refine the crossings found.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import groupby
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import logging
+import math
+
+import numpy as np
+
+from app.core.monitoring.instrumentation import instrument
+from app.models.enums import Planet
+from .aspect_kernel import AspectTable
+from .aspects import EnhancedAspectCalculator
+from .astronomical import AstronomicalCalculator
+from .ayanamsa import EnhancedAyanamsaManager
+from .event_solver import EventSolver, brent_root, datetime_to_julian_day, julian_day_to_datetime
+
+logger = logging.getLogger(__name__)
+
+# Event phases
+IN_ORB = 0  # Already within orb at the range start
+ENTRY = 1
+EXACT = 2
+EXIT = 3
+PHASE_NAMES = ('in_orb', 'entry', 'exact', 'exit')
+
+# One row per aspect event
+ASPECT_EVENT_DTYPE = np.dtype([
+    ('chart', np.int32),
+    ('body1', np.int16),
+    ('body2', np.int16),
+    ('aspect', np.int16),
+    ('side', np.int8),  # 1: body1 ahead of body2 by the aspect angle, -1: behind
+    ('phase', np.int8),
+    ('jd', np.float64)
+])
+
+# Major aspects with the orbs of EnhancedAspectCalculator
+MAJOR_ASPECTS = AspectTable.from_pairs(
+    (name, aspect.angle, aspect.orb)
+    for name, aspect in EnhancedAspectCalculator.ASPECTS.items()
+    if name in ('Conjunction', 'Opposition', 'Trine', 'Square', 'Sextile')
+)
+
+
+def _signed_angle(angle: float) -> float:
+    """Wrap an angle difference into [-180, 180)"""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+@dataclass(frozen=True)
+class MotionTrack:
+    """Longitude of a moving body at knots between which it is monotonic"""
+    state: Callable[[float], Tuple[float, float]]  # jd -> (longitude, daily speed)
+    jds: np.ndarray  # (knots,) Julian days, the range ends included
+    values: np.ndarray  # (knots,) unwrapped longitudes
+
+    def crossings(self, boundaries: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Crossings of many boundaries between knots
+
+        Args:
+            boundaries: Longitudes (boundaries,)
+
+        Returns:
+            (boundary, interval, direction) arrays, one entry per crossing;
+            direction is 1 for increasing and -1 for decreasing longitude
+        """
+        wraps = np.floor((self.values[np.newaxis, :] - boundaries[:, np.newaxis]) / 360.0)
+        steps = np.diff(wraps, axis=1)
+        boundary, interval = np.nonzero(steps)
+        return boundary, interval, steps[boundary, interval].astype(np.int8)
+
+
+@dataclass(frozen=True)
+class _Targets:
+    """Exact targets of an aspect table and their orb edges"""
+    aspect: np.ndarray  # (targets,) aspect index
+    side: np.ndarray  # (targets,) 1 or -1
+    offset: np.ndarray  # (targets,) side * angle
+    orb: np.ndarray  # (targets,)
+    edges: np.ndarray  # (targets * 3,) offsets of target - orb, target, target + orb
+    kinds: np.ndarray  # (targets * 3,) -1, 0, 1 for the three edges
+
+    @classmethod
+    def compile(cls, table: AspectTable) -> '_Targets':
+        aspect, side = [], []
+        for index, angle in enumerate(table.angles.tolist()):
+            # Conjunction and opposition are reached from both sides at once
+            for sign in ((1,) if angle % 180 == 0 else (1, -1)):
+                aspect.append(index)
+                side.append(sign)
+        aspect = np.array(aspect, dtype=int)
+        side = np.array(side, dtype=int)
+        offset = side * table.angles[aspect]
+        orb = table.orbs[aspect]
+        kinds = np.tile([-1, 0, 1], len(aspect))
+        edges = np.repeat(offset, 3) + kinds * np.repeat(orb, 3)
+        return cls(aspect, side, offset, orb, edges, kinds)
+
+
+@dataclass
+class AspectWindow:
+    """One period in orb of an aspect"""
+    chart: int
+    body1: str
+    body2: str
+    aspect: str
+    side: int
+    entry: Optional[float]  # None when already in orb at the range start
+    exact: List[float] = field(default_factory=list)  # several with retrograde motion
+    exit: Optional[float] = None  # None when still in orb at the range end
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serialize for reports"""
+        def time(jd: Optional[float]) -> Optional[str]:
+            return julian_day_to_datetime(jd).isoformat() if jd is not None else None
+
+        return {
+            'chart': self.chart,
+            'body1': self.body1,
+            'body2': self.body2,
+            'aspect': self.aspect,
+            'side': self.side,
+            'entry': time(self.entry),
+            'exact': [time(jd) for jd in self.exact],
+            'exit': time(self.exit)
+        }
+
+
+def aspect_windows(
+    events: np.ndarray,
+    table: AspectTable,
+    body1_names: Sequence[str],
+    body2_names: Sequence[str]
+) -> List[AspectWindow]:
+    """
+    Group aspect events into orb windows
+
+    Args:
+        events: ASPECT_EVENT_DTYPE array
+        table: Aspect table the events were found with
+        body1_names: Names indexed by the events' body1
+        body2_names: Names indexed by the events' body2
+
+    Returns:
+        Windows ordered by chart, bodies, aspect, side and time
+    """
+    order = np.lexsort((events['jd'], events['side'], events['aspect'], events['body2'],
+                        events['body1'], events['chart']))
+    rows = events[order].tolist()
+    windows = []
+    for (chart, body1, body2, aspect, side), group in groupby(rows, key=lambda row: row[:5]):
+        window = None
+        for *_, phase, jd in group:
+            if window is None:
+                window = AspectWindow(
+                    chart=chart,
+                    body1=body1_names[body1],
+                    body2=body2_names[body2],
+                    aspect=table.names[aspect],
+                    side=side,
+                    entry=jd if phase == ENTRY else None
+                )
+            if phase == EXACT:
+                window.exact.append(jd)
+            elif phase == EXIT:
+                window.exit = jd
+                windows.append(window)
+                window = None
+        if window is not None:
+            windows.append(window)
+    return windows
+
+
+class AspectTimeline:
+    """Solves aspect entry, exact and exit times on top of AstronomicalCalculator"""
+
+    def __init__(
+        self,
+        calculator: Optional[AstronomicalCalculator] = None,
+        ayanamsa_manager: Optional[EnhancedAyanamsaManager] = None,
+        ayanamsa_system: Optional[str] = 'LAHIRI',
+        coverage: float = 0.5,
+        max_step_days: float = 5.0,
+        xtol_days: float = 1e-6,
+        newton_steps: int = 8
+    ):
+        """
+        Args:
+            calculator: Ephemeris backend
+            ayanamsa_manager: Ayanamsa source for sidereal longitudes
+            ayanamsa_system: Ayanamsa system of the natal longitudes, or None
+                for tropical longitudes
+            coverage: Fraction of a half circle a body may traverse per knot
+            max_step_days: Upper bound on the knot spacing
+            xtol_days: Root-finding tolerance in days
+            newton_steps: Newton iterations before falling back to Brent's method
+        """
+        self.calculator = calculator or AstronomicalCalculator()
+        self.ayanamsa_system = ayanamsa_system
+        self.ayanamsa_manager = ayanamsa_manager
+        if ayanamsa_system and ayanamsa_manager is None:
+            self.ayanamsa_manager = EnhancedAyanamsaManager()
+        self.coverage = coverage
+        self.max_step_days = max_step_days
+        self.xtol_days = xtol_days
+        self.newton_steps = newton_steps
+
+    def _ayanamsa(self, jd: float) -> float:
+        """Ayanamsa at a Julian day (0 for tropical)"""
+        if not self.ayanamsa_system:
+            return 0.0
+        return self.ayanamsa_manager.ayanamsa_at(jd, self.ayanamsa_system)
+
+    def _planet_state(self, planet: Planet) -> Callable[[float], Tuple[float, float]]:
+        """Return jd -> (longitude, speed) for a planet"""
+        def state(jd: float) -> Tuple[float, float]:
+            longitude, speed = self.calculator.calculate_position_jd(jd, planet)
+            return (longitude - self._ayanamsa(jd)) % 360, speed
+        return state
+
+    def _pair_state(self, planet1: Planet, planet2: Planet) -> Callable[[float], Tuple[float, float]]:
+        """Return jd -> (longitude difference, its rate) for two planets"""
+        def state(jd: float) -> Tuple[float, float]:
+            longitude1, speed1 = self.calculator.calculate_position_jd(jd, planet1)
+            longitude2, speed2 = self.calculator.calculate_position_jd(jd, planet2)
+            return (longitude1 - longitude2) % 360, speed1 - speed2
+        return state
+
+    def _track(
+        self,
+        state: Callable[[float], Tuple[float, float]],
+        max_rate: float,
+        start_jd: float,
+        end_jd: float
+    ) -> MotionTrack:
+        """Sample a body on knots sized from its maximum rate, split at stations"""
+        step = min(self.max_step_days, self.coverage * 180.0 / max(max_rate, 1e-9))
+        count = max(1, math.ceil((end_jd - start_jd) / step))
+        grid = np.linspace(start_jd, end_jd, count + 1).tolist()
+        states = [state(jd) for jd in grid]
+
+        knots, values = [grid[0]], [states[0][0]]
+        for a, b, (_, sa), (vb, sb) in zip(grid, grid[1:], states, states[1:]):
+            if (sa < 0) != (sb < 0):
+                station = brent_root(lambda jd: state(jd)[1], a, b, sa, sb, self.xtol_days)
+                knots.append(station)
+                values.append(state(station)[0])
+            knots.append(b)
+            values.append(vb)
+        return MotionTrack(
+            state=state,
+            jds=np.array(knots),
+            values=np.unwrap(np.array(values), period=360.0)
+        )
+
+    def planet_track(self, planet: Planet, start_jd: float, end_jd: float) -> MotionTrack:
+        """Track of a planet's (sidereal) longitude"""
+        return self._track(
+            self._planet_state(planet), EventSolver.MAX_DAILY_MOTION[planet], start_jd, end_jd
+        )
+
+    def pair_track(self, planet1: Planet, planet2: Planet, start_jd: float, end_jd: float) -> MotionTrack:
+        """Track of the longitude difference of two planets"""
+        return self._track(
+            self._pair_state(planet1, planet2),
+            EventSolver.MAX_DAILY_MOTION[planet1] + EventSolver.MAX_DAILY_MOTION[planet2],
+            start_jd,
+            end_jd
+        )
+
+    def _refine(self, track: MotionTrack, boundary: float, interval: int) -> float:
+        """Time a track crosses a boundary within a knot interval"""
+        a, b = track.jds[interval], track.jds[interval + 1]
+        va, vb = track.values[interval], track.values[interval + 1]
+        # The boundary's turn lying between the two knot values
+        target = boundary + 360.0 * math.floor((max(va, vb) - boundary) / 360.0)
+        if vb == va:
+            return float(b)
+
+        jd = a + (b - a) * (target - va) / (vb - va)
+        for _ in range(self.newton_steps):
+            value, speed = track.state(jd)
+            if speed == 0:
+                break
+            step = _signed_angle(value - target) / speed
+            jd -= step
+            if not a <= jd <= b:
+                break
+            if abs(step) <= self.xtol_days:
+                return jd
+
+        def distance(t: float) -> float:
+            return _signed_angle(track.state(t)[0] - target)
+
+        return brent_root(distance, a, b, va - target, vb - target, self.xtol_days)
+
+    def _events(self, track: MotionTrack, bases: np.ndarray, targets: _Targets) -> np.ndarray:
+        """
+        Aspect events of one track against fixed longitudes
+
+        Args:
+            track: Moving body
+            bases: Fixed longitudes (charts, points) the targets are offset from
+            targets: Compiled aspect table
+
+        Returns:
+            ASPECT_EVENT_DTYPE array with body2 indexing the points; body1
+            is left for the caller
+        """
+        charts, points = bases.shape
+        boundaries = (bases[:, :, np.newaxis] + targets.edges).ravel()
+        boundary, interval, direction = track.crossings(boundaries)
+        chart, point, edge = np.unravel_index(boundary, (charts, points, len(targets.edges)))
+        target = edge // 3
+        kind = targets.kinds[edge]
+
+        # Pairs already in orb at the range start
+        start = np.abs(np.mod(track.values[0] - bases[:, :, np.newaxis] - targets.offset + 180, 360) - 180)
+        in_chart, in_point, in_target = np.nonzero(start <= targets.orb)
+
+        events = np.empty(len(boundary) + len(in_chart), dtype=ASPECT_EVENT_DTYPE)
+        events['chart'] = np.concatenate([in_chart, chart])
+        events['body2'] = np.concatenate([in_point, point])
+        events['aspect'] = targets.aspect[np.concatenate([in_target, target])]
+        events['side'] = targets.side[np.concatenate([in_target, target])]
+        events['phase'][:len(in_chart)] = IN_ORB
+        events['phase'][len(in_chart):] = np.where(kind == 0, EXACT, np.where(kind * direction < 0, ENTRY, EXIT))
+        events['jd'][:len(in_chart)] = track.jds[0]
+        events['jd'][len(in_chart):] = [
+            self._refine(track, value, index)
+            for value, index in zip(boundaries[boundary].tolist(), interval.tolist())
+        ]
+        return events
+
+    def _range(self, start: datetime, end: datetime) -> Tuple[float, float]:
+        start_jd = datetime_to_julian_day(start)
+        end_jd = datetime_to_julian_day(end)
+        if end_jd <= start_jd:
+            raise ValueError("End date must be after start date")
+        return start_jd, end_jd
+
+    @staticmethod
+    def _ordered(events: List[np.ndarray]) -> np.ndarray:
+        if not events:
+            return np.empty(0, dtype=ASPECT_EVENT_DTYPE)
+        events = np.concatenate(events)
+        return events[np.lexsort((events['jd'], events['chart']))]
+
+    def iter_transit_natal_events(
+        self,
+        natal: np.ndarray,
+        start: datetime,
+        end: datetime,
+        planets: Optional[Sequence[Planet]] = None,
+        table: AspectTable = MAJOR_ASPECTS,
+        chunk_size: int = 500
+    ) -> Iterator[np.ndarray]:
+        """
+        Stream transit-to-natal aspect events chunk by chunk of charts
+
+        The planets' tracks are sampled once and shared by all chunks.
+
+        Args:
+            natal: Natal longitudes (points,) or (charts, points), in the
+                timeline's zodiac
+            start: Range start (UTC or timezone-aware)
+            end: Range end (UTC or timezone-aware)
+            planets: Transiting planets (default: all)
+            table: Aspects to time
+            chunk_size: Charts per chunk
+
+        Yields:
+            ASPECT_EVENT_DTYPE arrays ordered by chart and time; chart
+            indexes the rows of ``natal``, body1 ``planets`` and body2 the
+            natal points
+        """
+        natal = np.atleast_2d(np.asarray(natal, dtype=float))
+        start_jd, end_jd = self._range(start, end)
+        planets = list(planets or Planet)
+        targets = _Targets.compile(table)
+        tracks = [self.planet_track(planet, start_jd, end_jd) for planet in planets]
+
+        for offset in range(0, len(natal), chunk_size):
+            chunk = []
+            for body, track in enumerate(tracks):
+                events = self._events(track, natal[offset:offset + chunk_size], targets)
+                events['chart'] += offset
+                events['body1'] = body
+                chunk.append(events)
+            yield self._ordered(chunk)
+
+    @instrument()
+    def transit_natal_events(
+        self,
+        natal: np.ndarray,
+        start: datetime,
+        end: datetime,
+        planets: Optional[Sequence[Planet]] = None,
+        table: AspectTable = MAJOR_ASPECTS
+    ) -> np.ndarray:
+        """All transit-to-natal aspect events, see iter_transit_natal_events"""
+        return self._ordered(list(self.iter_transit_natal_events(natal, start, end, planets, table)))
+
+    @instrument()
+    def transit_events(
+        self,
+        start: datetime,
+        end: datetime,
+        planets: Optional[Sequence[Planet]] = None,
+        table: AspectTable = MAJOR_ASPECTS
+    ) -> np.ndarray:
+        """
+        Aspect events between transiting planets
+
+        Args:
+            start: Range start (UTC or timezone-aware)
+            end: Range end (UTC or timezone-aware)
+            planets: Planets whose unordered pairs are timed (default: all)
+            table: Aspects to time
+
+        Returns:
+            ASPECT_EVENT_DTYPE array ordered by time; body1 < body2 index
+            ``planets`` and chart is 0
+        """
+        start_jd, end_jd = self._range(start, end)
+        planets = list(planets or Planet)
+        targets = _Targets.compile(table)
+        events = []
+        for i, planet1 in enumerate(planets):
+            for j in range(i + 1, len(planets)):
+                pair = self._events(self.pair_track(planet1, planets[j], start_jd, end_jd), np.zeros((1, 1)), targets)
+                pair['body1'] = i
+                pair['body2'] = j
+                events.append(pair)
+        return self._ordered(events)
@@ -2,6 +2,10 @@ from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 import math
 
+import numpy as np
+
+from .aspect_kernel import AspectTable, find_aspects
+
 @dataclass
 class Aspect:
     name: str
@@ -38,6 +42,11 @@ class EnhancedAspectCalculator:
         "Contraparallel": Aspect("Contraparallel", 180, 1, True, 40, -20)
     }
     
+    # ASPECTS compiled for the aspect kernel, in definition order
+    ASPECT_TABLE = AspectTable.from_pairs(
+        (name, aspect.angle, aspect.orb) for name, aspect in ASPECTS.items()
+    )
+    
     # Planetary relationships (friendship, neutrality, enmity)
     PLANETARY_RELATIONSHIPS = {
         "Sun": {"friend": ["Moon", "Mars", "Jupiter"], "enemy": ["Saturn", "Venus"]},
@@ -182,6 +191,23 @@ class EnhancedAspectCalculator:
         
         return max(0, min(100, influence))
     
+    def find_aspect_hits(
+        self,
+        planetary_positions: Dict[str, Dict[str, Any]]
+    ) -> np.ndarray:
+        """
+        Aspects within orb between planets as a structured array
+
+        Args:
+            planetary_positions: Planet details keyed by name
+
+        Returns:
+            ASPECT_HIT_DTYPE array; bodies index the planets in dictionary
+            order and aspects index ASPECTS in definition order
+        """
+        longitudes = [data["longitude"] for data in planetary_positions.values()]
+        return find_aspects(longitudes, self.ASPECT_TABLE)
+
     def calculate_aspects(
         self,
         planetary_positions: Dict[str, Dict[str, Any]]
@@ -189,56 +215,41 @@ class EnhancedAspectCalculator:
         """Calculate enhanced aspects between planets"""
         aspects = []
         planets = list(planetary_positions.keys())
+        aspect_types = list(self.ASPECTS.values())
         
-        for i, planet1 in enumerate(planets):
-            for planet2 in planets[i+1:]:
-                # Get planet details
-                p1_data = planetary_positions[planet1]
-                p2_data = planetary_positions[planet2]
-                
-                # Calculate basic angular difference
-                long1 = p1_data["longitude"]
-                long2 = p2_data["longitude"]
-                diff = abs(long1 - long2)
-                if diff > 180:
-                    diff = 360 - diff
-                
-                # Check for aspects
-                for aspect in self.ASPECTS.values():
-                    if abs(diff - aspect.angle) <= aspect.orb:
-                        # Calculate if aspect is applying
-                        is_applying = self._is_applying(p1_data, p2_data)
-                        
-                        # Calculate orb
-                        orb = abs(diff - aspect.angle)
-                        
-                        # Calculate strength
-                        strength = self.calculate_aspect_strength(
-                            aspect,
-                            {'name': planet1, **p1_data},
-                            {'name': planet2, **p2_data},
-                            orb
-                        )
-                        
-                        # Calculate total influence
-                        total_influence = self.calculate_total_influence(
-                            aspect,
-                            strength,
-                            is_applying
-                        )
-                        
-                        # Create PlanetaryAspect object
-                        planetary_aspect = PlanetaryAspect(
-                            planet1=planet1,
-                            planet2=planet2,
-                            aspect=aspect,
-                            orb=round(orb, 2),
-                            is_applying=is_applying,
-                            strength=round(strength, 2),
-                            total_influence=round(total_influence, 2)
-                        )
-                        
-                        aspects.append(planetary_aspect)
+        for _, i, j, index, _, orb in self.find_aspect_hits(planetary_positions).tolist():
+            planet1, planet2 = planets[i], planets[j]
+            p1_data = planetary_positions[planet1]
+            p2_data = planetary_positions[planet2]
+            aspect = aspect_types[index]
+            
+            # Calculate if aspect is applying
+            is_applying = self._is_applying(p1_data, p2_data)
+            
+            # Calculate strength
+            strength = self.calculate_aspect_strength(
+                aspect,
+                {'name': planet1, **p1_data},
+                {'name': planet2, **p2_data},
+                orb
+            )
+            
+            # Calculate total influence
+            total_influence = self.calculate_total_influence(
+                aspect,
+                strength,
+                is_applying
+            )
+            
+            aspects.append(PlanetaryAspect(
+                planet1=planet1,
+                planet2=planet2,
+                aspect=aspect,
+                orb=round(orb, 2),
+                is_applying=is_applying,
+                strength=round(strength, 2),
+                total_influence=round(total_influence, 2)
+            ))
         
         return aspects
     
@@ -1,11 +1,21 @@
 """Astronomical calculations module."""
 from datetime import datetime
+from threading import RLock
 from typing import Dict, List, Optional, Tuple
 import swisseph as swe
 from app.core.cache.calculation_cache import CalculationCache
 from app.core.config.settings import settings
+from app.core.monitoring.instrumentation import instrument
 from app.models.enums import Planet, House, Aspect
 from app.models.location import Location
+from .aspect_kernel import AspectTable, find_aspects
+from .house_kernel import planet_houses
+
+
+# Guards Swiss Ephemeris global state (sidereal mode, topocentric position).
+# Any code that sets such state must hold this lock until its dependent
+# calculation has finished.
+SWE_STATE_LOCK = RLock()
 
 
 class AstronomicalCalculator:
@@ -41,6 +51,7 @@ class AstronomicalCalculator:
             date.hour + date.minute/60.0 + date.second/3600.0
         )
 
+    @instrument()
     def calculate_planet_position(
         self,
         date: datetime,
@@ -64,19 +75,21 @@ class AstronomicalCalculator:
             speed = -rahu_pos["speed"]  # Opposite direction
         else:
             # Calculate using Swiss Ephemeris
-            flags = swe.FLG_SWIEPH
+            flags = swe.FLG_SWIEPH | swe.FLG_SPEED
             if location:
                 # Use topocentric positions if location provided
                 flags |= swe.FLG_TOPOCTR
-                swe.set_topo(
-                    location.latitude,
-                    location.longitude,
-                    location.altitude or 0
-                )
-            
-            result = swe.calc_ut(jd, self._planet_map[planet], flags)
+                with SWE_STATE_LOCK:
+                    swe.set_topo(
+                        location.longitude,
+                        location.latitude,
+                        location.altitude or 0
+                    )
+                    result = swe.calc_ut(jd, self._planet_map[planet], flags)
+            else:
+                result = swe.calc_ut(jd, self._planet_map[planet], flags)
             position = result[0][0]  # Longitude
-            speed = result[3]  # Daily motion
+            speed = result[0][3]  # Daily motion
 
         # Store result
         result = {
@@ -88,6 +101,27 @@ class AstronomicalCalculator:
         self._cache.set(cache_key, result)
         return result
 
+    def calculate_position_jd(
+        self,
+        jd: float,
+        planet: Planet
+    ) -> Tuple[float, float]:
+        """Calculate geocentric tropical longitude and daily speed for a Julian day.
+
+        Uncached; intended for solvers that evaluate many nearby instants.
+        """
+        if planet == Planet.KETU:
+            longitude, speed = self.calculate_position_jd(jd, Planet.RAHU)
+            return (longitude + 180) % 360, speed
+
+        result = swe.calc_ut(
+            jd,
+            self._planet_map[planet],
+            swe.FLG_SWIEPH | swe.FLG_SPEED
+        )
+        return result[0][0], result[0][3]
+
+    @instrument()
     def calculate_house_cusps(
         self,
         date: datetime,
@@ -117,7 +151,7 @@ class AstronomicalCalculator:
         )
         
         # Store and return results
-        result = list(cusps[1:13])  # Only need the 12 house cusps
+        result = list(cusps[:12])  # The 12 house cusps, house 1 first
         self._cache.set(cache_key, result)
         return result
 
@@ -144,33 +178,21 @@ class AstronomicalCalculator:
         orb: float = 1.0
     ) -> List[Tuple[Planet, Planet, Aspect]]:
         """Calculate all aspects between planets."""
-        aspects = []
         planets = list(positions.keys())
-        
-        for i, p1 in enumerate(planets):
-            for p2 in planets[i+1:]:
-                aspect = self.calculate_aspect(
-                    positions[p1],
-                    positions[p2],
-                    orb
-                )
-                if aspect:
-                    aspects.append((p1, p2, aspect))
-        
-        return aspects
+        aspect_types = list(Aspect)
+        table = AspectTable.from_pairs((aspect.name, aspect.angle, orb) for aspect in aspect_types)
+        # The first aspect in enum order per pair, as calculate_aspect
+        hits = find_aspects(list(positions.values()), table, first_only=True)
+        return [
+            (planets[i], planets[j], aspect_types[index])
+            for i, j, index in zip(hits['body1'].tolist(), hits['body2'].tolist(), hits['aspect'].tolist())
+        ]
 
     def get_house(self, longitude: float, cusps: List[float]) -> House:
         """Determine house from longitude and cusps."""
-        for i in range(12):
-            next_i = (i + 1) % 12
-            if cusps[next_i] < cusps[i]:  # Cusp crosses 0°
-                if longitude >= cusps[i] or longitude < cusps[next_i]:
-                    return House(i + 1)
-            elif cusps[i] <= longitude < cusps[next_i]:
-                return House(i + 1)
-        
+        house = planet_houses({'planet': longitude}, cusps)['planet']
         # Fallback (shouldn't happen with valid data)
-        return House(1)
+        return House(house) if house else House(1)
 
     def calculate_planetary_positions(
         self,
@@ -4,6 +4,8 @@ Bhava (House) Analysis System for Vedic Astrology
 from typing import Dict, List, Tuple, Optional
 from decimal import Decimal
 
+from .house_kernel import planet_houses
+
 class BhavaSystem:
     """
     Implements comprehensive Bhava (House) analysis including aspects,
@@ -54,7 +56,8 @@ class BhavaSystem:
     def calculate_house_strength(cls, 
                                house: int, 
                                planet_positions: Dict[str, float],
-                               aspects: Dict[str, List[int]]) -> Dict[str, any]:
+                               aspects: Dict[str, List[int]],
+                               houses: Optional[Dict[str, int]] = None) -> Dict[str, any]:
         """
         Calculate strength and influences for a specific house
         
@@ -62,6 +65,7 @@ class BhavaSystem:
             house: House number (1-12)
             planet_positions: Dictionary of planet positions
             aspects: Dictionary of aspects to the house
+            houses: Houses of the planets, when already known
             
         Returns:
             Dictionary containing house strength analysis
@@ -88,16 +92,16 @@ class BhavaSystem:
         
         # Occupying planets
         occupants = []
-        for planet, position in planet_positions.items():
-            house_position = ((position // 30) + 1)
-            if house_position == house:
+        houses = houses or planet_houses(planet_positions)
+        for planet in planet_positions:
+            if houses[planet] == house:
                 occupants.append(planet)
                 strength += Decimal('0.2')
         
         # House lord strength
         house_lord = cls.get_house_lord(house)
         if house_lord in planet_positions:
-            lord_house = ((planet_positions[house_lord] // 30) + 1)
+            lord_house = houses[house_lord]
             lord_strength = cls.analyze_lord_placement(house, lord_house)
             strength += lord_strength
         
@@ -194,13 +198,15 @@ class BhavaSystem:
             Dictionary containing analysis of all houses
         """
         analysis = {}
+        houses = planet_houses(planet_positions)
         
         # Analyze each house
         for house in range(1, 13):
             analysis[house] = cls.calculate_house_strength(
                 house,
                 planet_positions,
-                aspects
+                aspects,
+                houses
             )
         
         # Find strongest and weakest houses
@@ -1,5 +1,11 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Union
 import math
+from app.models.enums import Planet
+from .divisional_kernel import compute_vargas
+from .varga_tables import ENHANCED, ENHANCED_STANDARD
+
+# Charts calculated by calculate_all_divisions when none are requested
+DEFAULT_CHARTS = ['D1', 'D2', 'D3', 'D4', 'D7', 'D9', 'D10', 'D12', 'D16', 'D20', 'D24', 'D27', 'D30', 'D40']
 
 class EnhancedDivisionalChartEngine:
     """Enhanced engine for calculating divisional charts with improved precision"""
@@ -126,25 +132,48 @@ class EnhancedDivisionalChartEngine:
         Returns:
             Dictionary of calculated divisional positions
         """
+        self._validate_division(division)
+        scheme = ENHANCED if apply_special_rules else ENHANCED_STANDARD
+        batch = compute_vargas(list(longitudes.values()), (division,), scheme)
+        return batch.to_dict(list(longitudes))[division]
+
+    def calculate_all_divisions(
+        self,
+        planetary_positions: Dict[Union[str, Planet], Any],
+        ayanamsa_value: float = 0.0,
+        charts: Optional[List[str]] = None,
+        apply_special_rules: bool = True
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Calculate several divisional charts in one pass
+
+        Args:
+            planetary_positions: Planet (name or Planet) to tropical longitude,
+                or to a dictionary with a 'longitude' entry
+            ayanamsa_value: Ayanamsa subtracted to get sidereal longitudes
+            charts: Chart names such as 'D9' (default: DEFAULT_CHARTS)
+            apply_special_rules: Whether to apply special rules for D9, D12, D30
+
+        Returns:
+            Dictionary mapping chart name to planet name to divisional position
+        """
+        charts = [str(chart).upper() for chart in charts or DEFAULT_CHARTS]
+        divisions = []
+        for chart in charts:
+            if not chart.startswith('D') or not chart[1:].isdigit():
+                raise ValueError(f"Invalid divisional chart: {chart}")
+            divisions.append(int(chart[1:]))
+            self._validate_division(divisions[-1])
+
+        names = [planet.name if isinstance(planet, Planet) else str(planet) for planet in planetary_positions]
+        longitudes = [
+            (position['longitude'] if isinstance(position, dict) else position) - ayanamsa_value
+            for position in planetary_positions.values()
+        ]
+        scheme = ENHANCED if apply_special_rules else ENHANCED_STANDARD
+        result = compute_vargas(longitudes, divisions, scheme).to_dict(names)
+        return {chart: result[division] for chart, division in zip(charts, divisions)}
+
+    def _validate_division(self, division: int) -> None:
         if division < 1 or division > 40:
             raise ValueError("Division must be between 1 and 40")
-        
-        result = {}
-        division_type = f'D{division}'
-        
-        for planet, longitude in longitudes.items():
-            # Check if special calculation is needed
-            if apply_special_rules and division_type in self.special_divisions:
-                result[planet] = self._normalize_longitude(
-                    self.special_divisions[division_type](longitude)
-                )
-            else:
-                # Standard division calculation
-                sign_index = self._get_sign_from_longitude(longitude)
-                sign_remainder = self._calculate_division_remainder(longitude, division)
-                
-                result[planet] = self._normalize_longitude(
-                    sign_index * 30 + sign_remainder * division
-                )
-        
-        return result
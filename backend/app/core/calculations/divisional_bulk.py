@@ -0,0 +1,194 @@
+"""
+Bulk Divisional Placements
+Divisional sign indices for whole chart collections.
+
+Analytics jobs read stored charts page by page as columnar
+(charts, planets) longitude matrices and map them to
+(charts, planets, divisions) sign indices with the divisional kernel,
+without per-chart engines, caches or timers. Pages are computed in worker
+processes with a bounded number of pages in flight, so memory stays
+proportional to the page size however large the collection is.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+import logging
+import os
+
+import numpy as np
+from sqlalchemy import column, select, table
+from sqlalchemy.orm import Session
+
+from .divisional_kernel import compute_vargas
+from .varga_tables import DIVISIONAL
+
+logger = logging.getLogger(__name__)
+
+PLANET_COLUMNS = ('Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu')
+
+# Sign index reported for planets without a stored position
+MISSING_SIGN = -1
+
+# Migrated schema (alembic 26b1e8b640ca) as written by app.crud.birth_chart;
+# longitude is the full 0-360 degree position
+_birth_charts = table('birth_charts', column('id'))
+_planetary_positions = table(
+    'planetary_positions', column('birth_chart_id'), column('planet_name'), column('longitude')
+)
+
+
+@dataclass
+class LongitudePage:
+    """A page of stored charts as a longitude matrix"""
+    chart_ids: List[str]
+    longitudes: np.ndarray  # (charts, planets), NaN where a position is missing
+
+
+def divisional_signs(
+    longitudes: np.ndarray,
+    divisions: Sequence[int],
+    scheme: str = DIVISIONAL
+) -> np.ndarray:
+    """
+    Divisional sign indices of many charts
+
+    Args:
+        longitudes: Sidereal longitudes (charts, planets); NaN marks missing
+            positions
+        divisions: Division numbers
+        scheme: Rule set (see varga_tables)
+
+    Returns:
+        int8 array (charts, planets, divisions) of sign indices 0-11, with
+        MISSING_SIGN for missing positions
+    """
+    longitudes = np.asarray(longitudes, dtype=float)
+    missing = np.isnan(longitudes)
+    signs = compute_vargas(np.where(missing, 0.0, longitudes), divisions, scheme, with_longitudes=False).signs
+    if missing.any():
+        signs = signs.copy()
+        signs[missing] = MISSING_SIGN
+    return signs
+
+
+def iter_longitude_pages(
+    session: Session,
+    page_size: int = 1000,
+    planets: Sequence[str] = PLANET_COLUMNS
+) -> Iterator[LongitudePage]:
+    """
+    Stored charts with their planetary longitudes, one page at a time
+
+    Charts are read in id order with keyset pagination, so pages stay cheap
+    deep into large tables and only one page is held in memory.
+
+    Args:
+        session: Database session
+        page_size: Charts per page
+        planets: Planet names, one matrix column each (matched ignoring case)
+
+    Yields:
+        LongitudePage per page of charts
+    """
+    columns = {planet.upper(): column for column, planet in enumerate(planets)}
+    last_id = None
+    while True:
+        query = select(_birth_charts.c.id).order_by(_birth_charts.c.id)
+        if last_id is not None:
+            query = query.where(_birth_charts.c.id > last_id)
+        chart_ids = list(session.execute(query.limit(page_size)).scalars())
+        if not chart_ids:
+            return
+
+        rows = {chart_id: row for row, chart_id in enumerate(chart_ids)}
+        longitudes = np.full((len(chart_ids), len(planets)), np.nan)
+        positions = session.execute(
+            select(
+                _planetary_positions.c.birth_chart_id,
+                _planetary_positions.c.planet_name,
+                _planetary_positions.c.longitude
+            ).where(_planetary_positions.c.birth_chart_id.in_(chart_ids))
+        )
+        for chart_id, planet, longitude in positions:
+            column = columns.get(planet.upper())
+            if column is not None:
+                longitudes[rows[chart_id], column] = longitude
+
+        yield LongitudePage(chart_ids, longitudes)
+        last_id = chart_ids[-1]
+
+
+def _page_signs(longitudes: np.ndarray, divisions: Tuple[int, ...], scheme: str) -> np.ndarray:
+    # Module level so process pools can pickle it
+    return divisional_signs(longitudes, divisions, scheme)
+
+
+def stream_divisional_signs(
+    pages: Iterable[LongitudePage],
+    divisions: Sequence[int],
+    scheme: str = DIVISIONAL,
+    executor: Optional[Executor] = None,
+    max_pending: int = 4
+) -> Iterator[Tuple[List[str], np.ndarray]]:
+    """
+    Divisional sign indices for a stream of pages, in page order
+
+    Args:
+        pages: Longitude pages, for example from iter_longitude_pages
+        divisions: Division numbers
+        scheme: Rule set (see varga_tables)
+        executor: Executor computing pages (default: compute inline)
+        max_pending: Pages submitted ahead of the one being yielded
+
+    Yields:
+        (chart ids, signs (charts, planets, divisions)) per page
+    """
+    divisions = tuple(divisions)
+    if executor is None:
+        for page in pages:
+            yield page.chart_ids, divisional_signs(page.longitudes, divisions, scheme)
+        return
+
+    pending = deque()
+    for page in pages:
+        pending.append((page.chart_ids, executor.submit(_page_signs, page.longitudes, divisions, scheme)))
+        if len(pending) >= max_pending:
+            chart_ids, future = pending.popleft()
+            yield chart_ids, future.result()
+    while pending:
+        chart_ids, future = pending.popleft()
+        yield chart_ids, future.result()
+
+
+def collection_divisional_signs(
+    session: Session,
+    divisions: Sequence[int] = (9, 10, 60),
+    scheme: str = DIVISIONAL,
+    page_size: int = 1000,
+    workers: Optional[int] = None,
+    planets: Sequence[str] = PLANET_COLUMNS
+) -> Iterator[Tuple[List[str], np.ndarray]]:
+    """
+    Divisional sign indices of every stored chart
+
+    Args:
+        session: Database session
+        divisions: Division numbers
+        scheme: Rule set (see varga_tables)
+        page_size: Charts per page
+        workers: Worker processes (default: one per CPU; 0 computes inline)
+        planets: Planet names, one column each
+
+    Yields:
+        (chart ids, signs (charts, planets, divisions)) per page
+    """
+    pages = iter_longitude_pages(session, page_size, planets)
+    if workers == 0:
+        yield from stream_divisional_signs(pages, divisions, scheme)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from stream_divisional_signs(pages, divisions, scheme, executor, 2 * workers)
@@ -11,11 +11,19 @@ import logging
 from dataclasses import dataclass
 import swisseph as swe
 from .astronomical import AstronomicalCalculator
+from .ayanamsa import EnhancedAyanamsaManager
+from .divisional_kernel import VargaBatch, compute_vargas
+from .event_solver import datetime_to_julian_day
+from .varga_tables import DIVISIONAL
+from app.models.location import Location
 from ..cache.calculation_cache import CalculationCache
 from ..metrics.performance_metrics import MetricsTimer, metrics
 
 logger = logging.getLogger(__name__)
 
+# Supported divisions in the order they are computed
+SUPPORTED_DIVISIONS = (1, 2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60)
+
 @dataclass
 class DivisionalChart:
     """Represents a divisional chart with all planetary positions"""
@@ -29,10 +37,17 @@ class DivisionalChart:
 class DivisionalChartEngine:
     """Enhanced engine for calculating divisional charts with high precision"""
     
-    def __init__(self, cache: Optional[CalculationCache] = None):
+    def __init__(
+        self,
+        cache: Optional[CalculationCache] = None,
+        ayanamsa_manager: Optional[EnhancedAyanamsaManager] = None,
+        ayanamsa_system: str = 'LAHIRI'
+    ):
         """Initialize the divisional chart engine"""
         self.calculator = AstronomicalCalculator()
         self.cache = cache or CalculationCache()
+        self.ayanamsa_manager = ayanamsa_manager or EnhancedAyanamsaManager()
+        self.ayanamsa_system = ayanamsa_system
         self.default_location = {"lat": 28.6139, "lon": 77.2090, "alt": 0.0}  # New Delhi
         
         # Division specific calculations
@@ -57,40 +72,101 @@ class DivisionalChartEngine:
     
     def calculate_chart(self, date: datetime, division: int, location: Optional[Dict[str, float]] = None) -> DivisionalChart:
         """Calculate divisional chart for given date and division"""
+        if division not in self.division_map:
+            raise ValueError(f"Unsupported division D{division}")
+
         with MetricsTimer(metrics, f"divisional_chart_d{division}"):
             # Use provided location or default
             chart_location = location or self.default_location
-            
-            # Check cache first
-            cache_key = f"D{division}_{date.isoformat()}_{chart_location['lat']}_{chart_location['lon']}"
-            cached_result = self.cache.get(cache_key)
-            if cached_result:
-                return cached_result
-            
-            # Calculate base planetary positions
-            planets = self.calculator.calculate_planetary_positions(date, chart_location)
-            houses = self.calculator.calculate_house_cusps(date, chart_location)
-            ayanamsa = self.calculator.get_ayanamsa(date)
-            
-            # Apply divisional calculation
-            if division not in self.division_map:
-                raise ValueError(f"Unsupported division D{division}")
-            
-            divisional_positions = self.division_map[division](planets)
-            
-            chart = DivisionalChart(
+            base = self._calculate_base_chart(date, chart_location)
+
+            return DivisionalChart(
                 division=division,
-                planets=divisional_positions,
-                houses=houses,
-                ayanamsa=ayanamsa,
+                planets=base['vargas'][division],
+                houses=base['houses'],
+                ayanamsa=base['ayanamsa'],
                 timestamp=date,
                 location=chart_location
             )
-            
-            # Cache result
-            self.cache.set(cache_key, chart)
-            return chart
-    
+
+    def _calculate_base_chart(self, date: datetime, chart_location: Dict[str, float]) -> Dict[str, Any]:
+        """Positions, houses and every varga of a chart, cached as one entry"""
+        cache_key = (
+            f"vargas_{date.isoformat()}_{chart_location['lat']}_{chart_location['lon']}_{self.ayanamsa_system}"
+        )
+        cached_result = self.cache.get(cache_key)
+        if cached_result:
+            return cached_result
+
+        location = Location(
+            latitude=chart_location['lat'],
+            longitude=chart_location['lon'],
+            altitude=chart_location.get('alt', 0.0)
+        )
+        planets = {
+            planet.name: position
+            for planet, position in self.calculator.calculate_planetary_positions(date, location).items()
+        }
+        base = {
+            'houses': self.calculator.calculate_house_cusps(date, location),
+            'ayanamsa': self.ayanamsa_manager.ayanamsa_at(datetime_to_julian_day(date), self.ayanamsa_system),
+            'vargas': self.calculate_all_vargas(planets)
+        }
+
+        self.cache.set(cache_key, base)
+        return base
+
+    def calculate_all_vargas(
+        self,
+        positions: Dict[str, Any],
+        divisions: Optional[List[int]] = None
+    ) -> Dict[int, Dict[str, float]]:
+        """
+        Calculate several divisional charts from one set of positions
+
+        Args:
+            positions: Planet name to longitude, or to a dictionary with a
+                'longitude' entry
+            divisions: Divisions to calculate (default: all supported)
+
+        Returns:
+            Dictionary mapping division to planet name to divisional longitude
+        """
+        return self.calculate_varga_batch(positions, divisions).to_dict(list(positions))
+
+    def calculate_varga_batch(
+        self,
+        positions: Dict[str, Any],
+        divisions: Optional[List[int]] = None,
+        with_degrees: bool = False
+    ) -> VargaBatch:
+        """
+        Divisional placements of one chart as arrays
+
+        The batch can be shared with other engines of the same analysis,
+        such as the strength kernel, instead of each deriving its vargas.
+
+        Args:
+            positions: Planet name to longitude, or to a dictionary with a
+                'longitude' entry
+            divisions: Divisions to calculate (default: all supported)
+            with_degrees: Also compute degrees within the divisional signs
+
+        Returns:
+            VargaBatch with one chart and the planets in positions order
+        """
+        divisions = tuple(divisions or SUPPORTED_DIVISIONS)
+        for division in divisions:
+            if division not in self.division_map:
+                raise ValueError(f"Unsupported division D{division}")
+
+        with MetricsTimer(metrics, "divisional_all_vargas"):
+            longitudes = [
+                position['longitude'] if isinstance(position, dict) else position
+                for position in positions.values()
+            ]
+            return compute_vargas(longitudes, divisions, DIVISIONAL, with_degrees=with_degrees)
+
     def _normalize_longitude(self, longitude: float) -> float:
         """Normalize longitude to 0-360 range"""
         return longitude % 360
@@ -0,0 +1,89 @@
+"""
+Divisional Chart Kernel
+Batch divisional placements shared by the divisional engines.
+
+Longitudes of many charts go in as one (charts, planets) array. Every
+longitude is looked up in the precompiled varga tables for all requested
+divisions at once, giving (charts, planets, divisions) arrays of target sign
+indices and divisional longitudes. ``DivisionalChartEngine``,
+``EnhancedDivisionalChartEngine`` and the horoscope endpoint all compute
+through this kernel and select their rules with ``scheme``.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from app.core.monitoring.instrumentation import instrument
+from .varga_tables import DIVISIONAL, get_stack
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class VargaBatch:
+    """Divisional placements of a batch of charts"""
+    scheme: str
+    divisions: Tuple[int, ...]
+    signs: np.ndarray  # (charts, planets, divisions) int8 sign indices 0-11
+    longitudes: Optional[np.ndarray] = None  # (charts, planets, divisions) degrees
+    degrees: Optional[np.ndarray] = None  # (charts, planets, divisions) degrees within the varga sign
+
+    def to_dict(self, names: Sequence[str], chart: int = 0) -> Dict[int, Dict[str, float]]:
+        """
+        Divisional longitudes of one chart
+
+        Args:
+            names: Planet names in column order
+            chart: Row of the chart in the batch
+
+        Returns:
+            Dictionary mapping division to planet name to longitude
+        """
+        if self.longitudes is None:
+            raise ValueError("Batch was computed without longitudes")
+        rows = self.longitudes[chart].T.tolist()
+        return {division: dict(zip(names, row)) for division, row in zip(self.divisions, rows)}
+
+
+@instrument()
+def compute_vargas(
+    longitudes: np.ndarray,
+    divisions: Sequence[int],
+    scheme: str = DIVISIONAL,
+    with_longitudes: bool = True,
+    with_degrees: bool = False
+) -> VargaBatch:
+    """
+    Divisional placements of many charts for several divisions
+
+    Args:
+        longitudes: Sidereal longitudes, (charts, planets) or (planets,)
+            for a single chart
+        divisions: Division numbers
+        scheme: Rule set (see varga_tables)
+        with_longitudes: Also compute divisional longitudes, not only signs
+        with_degrees: Also compute varga degrees, the position within each
+            divisional sign (see VargaStack.map_all)
+
+    Returns:
+        VargaBatch with (charts, planets, divisions) arrays
+    """
+    longitudes = np.asarray(longitudes, dtype=float)
+    if longitudes.ndim == 1:
+        longitudes = longitudes[np.newaxis, :]
+    if longitudes.ndim != 2:
+        raise ValueError("Longitudes must be a (charts, planets) array")
+
+    divisions = tuple(divisions)
+    signs, values, degrees = get_stack(scheme, divisions).map_all(longitudes, with_longitudes, with_degrees)
+    # (divisions, charts, planets) -> (charts, planets, divisions)
+    return VargaBatch(
+        scheme=scheme,
+        divisions=divisions,
+        signs=signs.transpose(1, 2, 0),
+        longitudes=None if values is None else values.transpose(1, 2, 0),
+        degrees=None if degrees is None else degrees.transpose(1, 2, 0)
+    )
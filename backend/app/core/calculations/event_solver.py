@@ -0,0 +1,502 @@
+"""
+Event-Time Solver
+Finds exact times of sign ingresses, nakshatra and pada changes, tithi,
+karana and yoga boundaries and retrograde/direct stations.
+
+Each event is the zero of a target function (angular distance to a segment
+boundary, or planetary speed for stations). Sign changes are bracketed on a
+coarse grid whose step is sized from the body's maximum daily motion, then
+refined with Brent's method.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import logging
+import math
+
+import swisseph as swe
+
+from app.core.monitoring.instrumentation import instrument
+from app.models.enums import Planet
+from .astronomical import AstronomicalCalculator
+from .ayanamsa import EnhancedAyanamsaManager
+from ..cache.calculation_cache import CalculationCache
+
+logger = logging.getLogger(__name__)
+
+SIGN_SPAN = 30.0
+NAKSHATRA_SPAN = 360.0 / 27
+PADA_SPAN = NAKSHATRA_SPAN / 4
+TITHI_SPAN = 12.0
+KARANA_SPAN = 6.0
+YOGA_SPAN = 360.0 / 27
+
+
+class EventType(Enum):
+    """Types of solvable events"""
+    SIGN_INGRESS = "sign_ingress"
+    NAKSHATRA_CHANGE = "nakshatra_change"
+    PADA_CHANGE = "pada_change"
+    TITHI_CHANGE = "tithi_change"
+    KARANA_CHANGE = "karana_change"
+    YOGA_CHANGE = "yoga_change"
+    STATION = "station"
+
+
+@dataclass
+class AstronomicalEvent:
+    """A solved event.
+
+    For segment events ``from_index``/``to_index`` are zero-based segment
+    numbers (sign 0-11, nakshatra 0-26, pada 0-107, tithi 0-29, karana 0-59,
+    yoga 0-26). For stations
+    they are the direction of motion: 1 for direct, -1 for retrograde.
+    """
+    event_type: EventType
+    body: str
+    jd: float
+    time: datetime
+    from_index: int
+    to_index: int
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serialize for API responses"""
+        return {
+            'event_type': self.event_type.value,
+            'body': self.body,
+            'jd': self.jd,
+            'time': self.time.isoformat(),
+            'from_index': self.from_index,
+            'to_index': self.to_index
+        }
+
+
+def datetime_to_julian_day(date: datetime) -> float:
+    """Convert a (UTC or timezone-aware) datetime to a Julian day"""
+    if date.tzinfo is not None:
+        date = date.astimezone(timezone.utc).replace(tzinfo=None)
+    return swe.julday(
+        date.year,
+        date.month,
+        date.day,
+        date.hour + date.minute / 60.0 + (date.second + date.microsecond / 1e6) / 3600.0
+    )
+
+
+def julian_day_to_datetime(jd: float) -> datetime:
+    """Convert a Julian day to a naive UTC datetime"""
+    year, month, day, hour = swe.revjul(jd)
+    return datetime(year, month, day) + timedelta(hours=hour)
+
+
+def brent_root(
+    func: Callable[[float], float],
+    a: float,
+    b: float,
+    fa: float,
+    fb: float,
+    xtol: float,
+    max_iter: int = 100
+) -> float:
+    """Find a root of ``func`` bracketed by ``[a, b]`` using Brent's method"""
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(max_iter):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2e-15 * abs(b) + 0.5 * xtol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or fb == 0:
+            return b
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            # Inverse quadratic interpolation or secant step
+            s = fb / fa
+            if a == c:
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if m > 0 else -tol)
+        fb = func(b)
+
+    return b
+
+
+def _signed_angle(angle: float) -> float:
+    """Wrap an angle difference into [-180, 180)"""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+class EventSolver:
+    """Solves exact event times on top of AstronomicalCalculator"""
+
+    # Upper bounds on geocentric daily motion (degrees/day)
+    MAX_DAILY_MOTION = {
+        Planet.SUN: 1.02,
+        Planet.MOON: 15.4,
+        Planet.MARS: 0.80,
+        Planet.MERCURY: 2.25,
+        Planet.JUPITER: 0.25,
+        Planet.VENUS: 1.27,
+        Planet.SATURN: 0.14,
+        Planet.RAHU: 0.06,
+        Planet.KETU: 0.06
+    }
+
+    # Moon-Sun elongation rate bound for tithi/karana boundaries
+    MAX_ELONGATION_RATE = 15.4
+
+    # Sun+Moon longitude sum rate bound for yoga boundaries
+    MAX_YOGA_RATE = 16.5
+
+    # Bodies that can turn retrograde (mean nodes are always retrograde)
+    STATIONARY_PLANETS = (
+        Planet.MARS, Planet.MERCURY, Planet.JUPITER, Planet.VENUS, Planet.SATURN
+    )
+
+    SEGMENT_SPANS = {
+        EventType.SIGN_INGRESS: SIGN_SPAN,
+        EventType.NAKSHATRA_CHANGE: NAKSHATRA_SPAN,
+        EventType.PADA_CHANGE: PADA_SPAN
+    }
+
+    TITHI_BODY = "Moon-Sun"
+    YOGA_BODY = "Sun+Moon"
+
+    ELONGATION_SPANS = {
+        EventType.TITHI_CHANGE: TITHI_SPAN,
+        EventType.KARANA_CHANGE: KARANA_SPAN
+    }
+
+    def __init__(
+        self,
+        calculator: Optional[AstronomicalCalculator] = None,
+        ayanamsa_manager: Optional[EnhancedAyanamsaManager] = None,
+        ayanamsa_system: Optional[str] = 'LAHIRI',
+        cache: Optional[CalculationCache] = None,
+        coverage: float = 0.5,
+        max_step_days: float = 5.0,
+        xtol_days: float = 1e-6
+    ):
+        """
+        Args:
+            calculator: Ephemeris backend
+            ayanamsa_manager: Ayanamsa source for sidereal longitudes
+            ayanamsa_system: Ayanamsa system, or None for tropical longitudes
+            cache: Cache for yearly event tables
+            coverage: Fraction of a segment a body may traverse per grid step
+            max_step_days: Upper bound on the grid step
+            xtol_days: Root-finding tolerance in days
+        """
+        self.calculator = calculator or AstronomicalCalculator()
+        self.ayanamsa_system = ayanamsa_system
+        self.ayanamsa_manager = ayanamsa_manager
+        if ayanamsa_system and ayanamsa_manager is None:
+            self.ayanamsa_manager = EnhancedAyanamsaManager()
+        self.cache = cache or CalculationCache(max_size=32)
+        self.coverage = coverage
+        self.max_step_days = max_step_days
+        self.xtol_days = xtol_days
+
+    def _ayanamsa(self, jd: float) -> float:
+        """Ayanamsa at a Julian day (0 for tropical)"""
+        if not self.ayanamsa_system:
+            return 0.0
+        return self.ayanamsa_manager.ayanamsa_at(jd, self.ayanamsa_system)
+
+    def _planet_state(self, planet: Planet) -> Callable[[float], Tuple[float, float]]:
+        """Return jd -> (longitude, speed) for a planet"""
+        def state(jd: float) -> Tuple[float, float]:
+            longitude, speed = self.calculator.calculate_position_jd(jd, planet)
+            return (longitude - self._ayanamsa(jd)) % 360, speed
+        return state
+
+    def _elongation_state(self, jd: float) -> Tuple[float, float]:
+        """Moon-Sun elongation and its rate (ayanamsa cancels out)"""
+        moon, moon_speed = self.calculator.calculate_position_jd(jd, Planet.MOON)
+        sun, sun_speed = self.calculator.calculate_position_jd(jd, Planet.SUN)
+        return (moon - sun) % 360, moon_speed - sun_speed
+
+    def _yoga_state(self, jd: float) -> Tuple[float, float]:
+        """Sidereal Sun+Moon longitude sum and its rate"""
+        moon, moon_speed = self.calculator.calculate_position_jd(jd, Planet.MOON)
+        sun, sun_speed = self.calculator.calculate_position_jd(jd, Planet.SUN)
+        return (moon + sun - 2 * self._ayanamsa(jd)) % 360, moon_speed + sun_speed
+
+    def _grid_step(self, spans: Sequence[float], max_rate: float) -> float:
+        """Grid step in days so a body covers at most ``coverage`` of a segment"""
+        step = self.max_step_days
+        for span in spans:
+            step = min(step, self.coverage * span / max_rate)
+        return step
+
+    @staticmethod
+    def _body_name(planet: Planet) -> str:
+        return planet.name.capitalize()
+
+    def _segment_events(
+        self,
+        event_type: EventType,
+        body: str,
+        span: float,
+        value_at: Callable[[float], float],
+        a: float,
+        b: float,
+        va: float,
+        vb: float
+    ) -> List[AstronomicalEvent]:
+        """Solve every boundary crossed on a monotonic interval ``[a, b]``"""
+        delta = _signed_angle(vb - va)
+        start_k = math.floor(va / span)
+        end_k = math.floor((va + delta) / span)
+        if start_k == end_k:
+            return []
+
+        segments = round(360.0 / span)
+        if delta > 0:
+            boundaries = [(k, (k - 1) % segments, k % segments) for k in range(start_k + 1, end_k + 1)]
+        else:
+            boundaries = [(k, k % segments, (k - 1) % segments) for k in range(start_k, end_k, -1)]
+
+        events = []
+        for k, from_index, to_index in boundaries:
+            boundary = k * span
+
+            def distance(jd: float, boundary=boundary) -> float:
+                return _signed_angle(value_at(jd) - boundary)
+
+            fa = _signed_angle(va - boundary)
+            fb = _signed_angle(vb - boundary)
+            if (fa > 0) == (fb > 0) and fa != 0 and fb != 0:
+                continue
+            jd = brent_root(distance, a, b, fa, fb, self.xtol_days)
+            events.append(AstronomicalEvent(
+                event_type=event_type,
+                body=body,
+                jd=jd,
+                time=julian_day_to_datetime(jd),
+                from_index=from_index,
+                to_index=to_index
+            ))
+        return events
+
+    def _scan_body(
+        self,
+        body: str,
+        state: Callable[[float], Tuple[float, float]],
+        targets: Dict[EventType, float],
+        max_rate: float,
+        can_station: bool,
+        emit_stations: bool,
+        start_jd: float,
+        end_jd: float
+    ) -> List[AstronomicalEvent]:
+        """Scan one body's grid, splitting intervals at stations
+
+        Splitting keeps every piece monotonic so each boundary crossed on a
+        piece is bracketed exactly once.
+        """
+        events: List[AstronomicalEvent] = []
+        step = self._grid_step(list(targets.values()), max_rate)
+
+        def value_at(jd: float) -> float:
+            return state(jd)[0]
+
+        def speed_at(jd: float) -> float:
+            return state(jd)[1]
+
+        a = start_jd
+        va, sa = state(a)
+        while a < end_jd:
+            b = min(a + step, end_jd)
+            vb, sb = state(b)
+
+            pieces = [(a, b, va, vb)]
+            if can_station and (sa < 0) != (sb < 0):
+                s = brent_root(speed_at, a, b, sa, sb, self.xtol_days)
+                vs = value_at(s)
+                pieces = [(a, s, va, vs), (s, b, vs, vb)]
+            if emit_stations and len(pieces) == 2:
+                events.append(AstronomicalEvent(
+                    event_type=EventType.STATION,
+                    body=body,
+                    jd=s,
+                    time=julian_day_to_datetime(s),
+                    from_index=-1 if sa < 0 else 1,
+                    to_index=-1 if sb < 0 else 1
+                ))
+
+            for event_type, span in targets.items():
+                for pa, pb, pva, pvb in pieces:
+                    events.extend(self._segment_events(
+                        event_type, body, span, value_at, pa, pb, pva, pvb
+                    ))
+
+            a, va, sa = b, vb, sb
+
+        return events
+
+    def _solve_window(
+        self,
+        start_jd: float,
+        end_jd: float,
+        event_types: Sequence[EventType],
+        planets: Sequence[Planet]
+    ) -> List[AstronomicalEvent]:
+        """Solve all requested events in ``[start_jd, end_jd]``"""
+        events: List[AstronomicalEvent] = []
+        segment_types = [t for t in event_types if t in self.SEGMENT_SPANS]
+
+        for planet in planets:
+            targets = {t: self.SEGMENT_SPANS[t] for t in segment_types}
+            can_station = planet in self.STATIONARY_PLANETS
+            emit_stations = can_station and EventType.STATION in event_types
+            if not targets and not emit_stations:
+                continue
+            events.extend(self._scan_body(
+                self._body_name(planet),
+                self._planet_state(planet),
+                targets,
+                self.MAX_DAILY_MOTION[planet],
+                can_station,
+                emit_stations,
+                start_jd,
+                end_jd
+            ))
+
+        elongation_targets = {
+            t: span for t, span in self.ELONGATION_SPANS.items() if t in event_types
+        }
+        if elongation_targets:
+            events.extend(self._scan_body(
+                self.TITHI_BODY,
+                self._elongation_state,
+                elongation_targets,
+                self.MAX_ELONGATION_RATE,
+                False,
+                False,
+                start_jd,
+                end_jd
+            ))
+
+        if EventType.YOGA_CHANGE in event_types:
+            events.extend(self._scan_body(
+                self.YOGA_BODY,
+                self._yoga_state,
+                {EventType.YOGA_CHANGE: YOGA_SPAN},
+                self.MAX_YOGA_RATE,
+                False,
+                False,
+                start_jd,
+                end_jd
+            ))
+
+        events.sort(key=lambda event: event.jd)
+        return events
+
+    def iter_events(
+        self,
+        start: datetime,
+        end: datetime,
+        event_types: Optional[Sequence[EventType]] = None,
+        planets: Optional[Sequence[Planet]] = None,
+        chunk_days: float = 30.0
+    ) -> Iterator[AstronomicalEvent]:
+        """
+        Stream events between two dates in chronological order
+
+        The range is solved in windows of ``chunk_days`` so memory stays
+        bounded and the first events are available before the range is done.
+
+        Args:
+            start: Range start (UTC or timezone-aware)
+            end: Range end (UTC or timezone-aware)
+            event_types: Events to solve (default: all)
+            planets: Planets for ingress/nakshatra/pada/station events (default: all)
+            chunk_days: Window length in days
+        """
+        event_types = list(event_types or EventType)
+        planets = list(planets or Planet)
+        start_jd = datetime_to_julian_day(start)
+        end_jd = datetime_to_julian_day(end)
+        if end_jd <= start_jd:
+            raise ValueError("End date must be after start date")
+
+        window_start = start_jd
+        while window_start < end_jd:
+            window_end = min(window_start + chunk_days, end_jd)
+            yield from self._solve_window(window_start, window_end, event_types, planets)
+            window_start = window_end
+
+    @instrument()
+    def find_events(
+        self,
+        start: datetime,
+        end: datetime,
+        event_types: Optional[Sequence[EventType]] = None,
+        planets: Optional[Sequence[Planet]] = None
+    ) -> List[AstronomicalEvent]:
+        """Return all events between two dates in chronological order"""
+        return list(self.iter_events(start, end, event_types, planets))
+
+    def yearly_event_table(
+        self,
+        year: int,
+        event_types: Optional[Sequence[EventType]] = None,
+        planets: Optional[Sequence[Planet]] = None
+    ) -> List[AstronomicalEvent]:
+        """
+        Precompute all events of a calendar year (UTC)
+
+        Tables are cached per (year, event types, planets, ayanamsa system).
+        """
+        event_types = list(event_types or EventType)
+        planets = list(planets or Planet)
+        cache_key = self.cache.generate_key(
+            "event_table",
+            year,
+            [t.value for t in event_types],
+            [p.name for p in planets],
+            self.ayanamsa_system
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        table = self.find_events(
+            datetime(year, 1, 1),
+            datetime(year + 1, 1, 1),
+            event_types,
+            planets
+        )
+        self.cache.set(cache_key, table)
+        return table
@@ -0,0 +1,116 @@
+"""
+House Kernel
+House membership of many bodies in many charts as arrays.
+
+Cusps are unwrapped so that they increase from the first cusp, and a
+longitude's offset from the first cusp is placed among the cusp offsets
+with ``searchsorted``; the number of cusps at or before it is its house.
+Charts sharing one set of cusps (the natural zodiac, or transits against a
+single natal chart) are one ``searchsorted`` call; per-chart cusps compare
+every offset with its own chart's twelve cusp offsets, which is the same
+count without mixing charts in one sorted array.
+
+Without cusps the houses are the signs counted from Aries
+(``NATURAL_CUSPS``), the convention of the analyzers that have no house
+cusps of their own.
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, Mapping
+import logging
+import math
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Cusps of the natural zodiac: house n is the n-th sign from Aries
+NATURAL_CUSPS = np.arange(12) * 30.0
+NATURAL_CUSPS.flags.writeable = False
+_NATURAL_EDGES = NATURAL_CUSPS.tolist()
+
+
+def unwrap_cusps(cusps: np.ndarray) -> np.ndarray:
+    """
+    Cusps made increasing from the first cusp
+
+    Args:
+        cusps: (12,) or (charts, 12) cusp longitudes in house order
+
+    Returns:
+        Array of the same shape starting at the first cusp, each later cusp
+        within 360 degrees above it
+    """
+    cusps = np.asarray(cusps, dtype=float)
+    if cusps.shape[-1] != 12:
+        raise ValueError("Cusps must have 12 entries per chart")
+    first = cusps[..., :1]
+    return first + np.mod(cusps - first, 360.0)
+
+
+def assign_houses(longitudes: np.ndarray, cusps: np.ndarray = NATURAL_CUSPS) -> np.ndarray:
+    """
+    House of each longitude
+
+    A body on a cusp belongs to the house that cusp begins.
+
+    Args:
+        longitudes: (bodies,) or (charts, bodies) longitudes
+        cusps: (12,) cusps shared by all charts, or (charts, 12) per chart
+            (default: the natural zodiac)
+
+    Returns:
+        int array shaped like ``longitudes`` with houses 1-12, 0 where the
+        longitude or the chart's cusps are undefined (NaN)
+    """
+    longitudes = np.asarray(longitudes, dtype=float)
+    unwrapped = unwrap_cusps(cusps)
+    first = unwrapped[..., :1]
+    edges = unwrapped - first
+
+    if unwrapped.ndim == 1:
+        offsets = np.mod(longitudes - first[0], 360.0)
+        houses = np.searchsorted(edges, offsets, side='right')
+    else:
+        if longitudes.ndim != 2 or longitudes.shape[0] != unwrapped.shape[0]:
+            raise ValueError("Per-chart cusps need (charts, bodies) longitudes")
+        offsets = np.mod(longitudes - first, 360.0)
+        houses = np.count_nonzero(offsets[:, :, np.newaxis] >= edges[:, np.newaxis, :], axis=-1)
+
+    undefined = np.isnan(offsets)
+    if unwrapped.ndim > 1:
+        undefined |= np.isnan(edges).any(axis=-1, keepdims=True)
+    return np.where(undefined, 0, houses)
+
+
+def planet_houses(planet_positions: Mapping[str, Any], cusps: np.ndarray = NATURAL_CUSPS) -> Dict[str, int]:
+    """
+    Houses of the planets of one chart
+
+    A single chart's handful of planets is placed with ``bisect`` on the
+    same unwrapped cusp offsets as assign_houses, without array overhead.
+
+    Args:
+        planet_positions: Planet name to longitude, or to a dictionary with
+            a ``longitude`` entry
+        cusps: (12,) cusps (default: the natural zodiac)
+
+    Returns:
+        Planet name to house 1-12 (0 for an undefined longitude)
+    """
+    if cusps is NATURAL_CUSPS:
+        first, edges = 0.0, _NATURAL_EDGES
+    else:
+        values = [float(cusp) for cusp in cusps]
+        if len(values) != 12:
+            raise ValueError("Cusps must have 12 entries per chart")
+        first = values[0]
+        edges = [(cusp - first) % 360.0 for cusp in values]
+        if any(math.isnan(edge) for edge in edges):
+            return {planet: 0 for planet in planet_positions}
+
+    houses = {}
+    for planet, position in planet_positions.items():
+        longitude = float(position['longitude'] if isinstance(position, dict) else position)
+        houses[planet] = 0 if math.isnan(longitude) else bisect_right(edges, (longitude - first) % 360.0)
+    return houses
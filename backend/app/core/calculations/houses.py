@@ -1,7 +1,24 @@
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
 import swisseph as swe
 from decimal import Decimal
-from .astronomical import Location
+import numpy as np
+from app.core.monitoring.instrumentation import instrument
+from .astronomical import Location, SWE_STATE_LOCK
+
+HOUSE_SYSTEMS = {
+    'P': 'Placidus',
+    'K': 'Koch',
+    'O': 'Porphyrius',
+    'R': 'Regiomontanus',
+    'C': 'Campanus',
+    'E': 'Equal',
+    'W': 'Whole sign'
+}
+
+# Systems whose cusps follow from the ascendant alone
+_ASCENDANT_SYSTEMS = ('E', 'W')
 
 class HouseCalculator:
     def __init__(self, house_system: str = 'P'):
@@ -52,3 +69,126 @@ class HouseCalculator:
             'armc': armc,
             'vertex': vertex
         }
+
+
+@dataclass(frozen=True)
+class HouseCuspBatch:
+    """House cusps and angles of many charts in several house systems"""
+    systems: Tuple[str, ...]
+    cusps: np.ndarray  # (systems, charts, 12) degrees, NaN where a system is undefined
+    ascendant: np.ndarray  # (charts,)
+    midheaven: np.ndarray  # (charts,)
+    armc: np.ndarray  # (charts,)
+    vertex: np.ndarray  # (charts,)
+
+    def system_cusps(self, system: str) -> np.ndarray:
+        """(charts, 12) cusps of one house system"""
+        return self.cusps[self.systems.index(system)]
+
+    def to_dict(self, chart: int = 0, system: Optional[str] = None) -> Dict[str, object]:
+        """
+        Houses of one chart in the layout of HouseCalculator.calculate_houses
+
+        Args:
+            chart: Row of the chart in the batch
+            system: House system (default: the first of the batch)
+        """
+        row = self.systems.index(system) if system else 0
+        return {
+            'cusps': self.cusps[row, chart].tolist(),
+            'ascendant': float(self.ascendant[chart]),
+            'midheaven': float(self.midheaven[chart]),
+            'armc': float(self.armc[chart]),
+            'vertex': float(self.vertex[chart])
+        }
+
+
+@instrument()
+def calculate_house_batch(
+    julian_days: Sequence[float],
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    systems: Sequence[str] = ('P',),
+    ayanamsa_system: Optional[str] = None
+) -> HouseCuspBatch:
+    """
+    House cusps of many (moment, place) charts in several house systems
+
+    Inputs broadcast against each other, so one Julian day with arrays of
+    coordinates renders the same instant for many places. Quadrant systems
+    take one Swiss Ephemeris call per chart; Equal and Whole sign cusps are
+    derived from the ascendant of that call. A quadrant system undefined at
+    a chart's latitude (Placidus or Koch near the poles) gives NaN cusps for
+    that chart instead of failing the batch.
+
+    Args:
+        julian_days: Julian days (UT)
+        latitudes: Geographic latitudes in degrees
+        longitudes: Geographic longitudes in degrees (east positive)
+        systems: House system codes from HOUSE_SYSTEMS
+        ayanamsa_system: Swiss Ephemeris sidereal mode (e.g. 'LAHIRI') for
+            sidereal cusps and angles computed with FLG_SIDEREAL, or None
+            for tropical
+
+    Returns:
+        HouseCuspBatch with one row per chart
+    """
+    jds, lats, lons = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(julian_days, dtype=float)),
+        np.atleast_1d(np.asarray(latitudes, dtype=float)),
+        np.atleast_1d(np.asarray(longitudes, dtype=float))
+    )
+    systems = tuple(systems)
+    unknown = [system for system in systems if system not in HOUSE_SYSTEMS]
+    if unknown:
+        raise ValueError(f"Invalid house systems: {', '.join(unknown)}")
+    sidereal_mode = None
+    if ayanamsa_system:
+        sidereal_mode = getattr(swe, f'SIDM_{ayanamsa_system}', None)
+        if sidereal_mode is None:
+            raise ValueError(f"Invalid ayanamsa system: {ayanamsa_system}")
+
+    charts = len(jds)
+    # The first call of each chart also gives the angles
+    quadrant = [system for system in systems if system not in _ASCENDANT_SYSTEMS] or ['E']
+    computed = np.full((len(quadrant), charts, 12), np.nan)
+    angles = np.full((charts, 4), np.nan)
+    flags = swe.FLG_SWIEPH | (swe.FLG_SIDEREAL if sidereal_mode is not None else 0)
+    codes = [system.encode() for system in quadrant]
+
+    with SWE_STATE_LOCK:
+        if sidereal_mode is not None:
+            swe.set_sid_mode(sidereal_mode)
+        for chart, (jd, lat, lon) in enumerate(zip(jds.tolist(), lats.tolist(), lons.tolist())):
+            for row, code in enumerate(codes):
+                try:
+                    cusps, ascmc = swe.houses_ex(jd, lat, lon, code, flags)
+                except swe.Error:
+                    continue
+                computed[row, chart] = cusps[:12]
+                if np.isnan(angles[chart, 0]):
+                    angles[chart] = ascmc[:4]
+            if np.isnan(angles[chart, 0]):
+                # Only undefined quadrant systems were asked for; the angles
+                # come from the ascendant-based systems
+                angles[chart] = swe.houses_ex(jd, lat, lon, b'E', flags)[1][:4]
+
+    ascendant = angles[:, 0]
+    offsets = 30.0 * np.arange(12)
+    result = np.empty((len(systems), charts, 12))
+    for row, system in enumerate(systems):
+        if system == 'E':
+            result[row] = np.mod(ascendant[:, np.newaxis] + offsets, 360.0)
+        elif system == 'W':
+            result[row] = np.mod((ascendant - np.mod(ascendant, 30.0))[:, np.newaxis] + offsets, 360.0)
+        else:
+            result[row] = computed[quadrant.index(system)]
+
+    return HouseCuspBatch(
+        systems=systems,
+        cusps=result,
+        ascendant=ascendant,
+        midheaven=angles[:, 1],
+        armc=angles[:, 2],
+        vertex=angles[:, 3]
+    )
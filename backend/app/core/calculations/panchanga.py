@@ -0,0 +1,433 @@
+"""
+Panchanga Engine
+Precomputes tithi, nakshatra, yoga, karana and vara transitions together with
+sunrise, sunset, moonrise and moonset for a location and year.
+
+Tables are columnar NumPy arrays (one sorted transition-time column and one
+element-index column per element) so "panchanga at instant" queries are a
+binary search per element. Tables can be persisted as compressed ``.npz``
+files and are cached per location, timezone, year and ayanamsa system.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+import json
+import logging
+import math
+
+import numpy as np
+import swisseph as swe
+
+from app.models.enums import Planet
+from app.models.location import Location
+from .event_solver import (
+    EventSolver,
+    EventType,
+    KARANA_SPAN,
+    NAKSHATRA_SPAN,
+    TITHI_SPAN,
+    YOGA_SPAN,
+    datetime_to_julian_day,
+    julian_day_to_datetime
+)
+from .nakshatra import NakshatraCalculator
+from ..cache.calculation_cache import CalculationCache
+
+logger = logging.getLogger(__name__)
+
+TITHI_NAMES = [
+    "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
+    "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
+    "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi"
+]
+
+YOGA_NAMES = [
+    "Vishkambha", "Priti", "Ayushman", "Saubhagya", "Shobhana", "Atiganda",
+    "Sukarma", "Dhriti", "Shula", "Ganda", "Vriddhi", "Dhruva", "Vyaghata",
+    "Harshana", "Vajra", "Siddhi", "Vyatipata", "Variyana", "Parigha",
+    "Shiva", "Siddha", "Sadhya", "Shubha", "Shukla", "Brahma", "Indra",
+    "Vaidhriti"
+]
+
+MOVABLE_KARANAS = ["Bava", "Balava", "Kaulava", "Taitila", "Garaja", "Vanija", "Vishti"]
+
+VARA_NAMES = [
+    "Ravivara", "Somavara", "Mangalavara", "Budhavara",
+    "Guruvara", "Shukravara", "Shanivara"
+]
+
+# Element -> event type driving its transitions
+ELEMENT_EVENTS = {
+    'tithi': EventType.TITHI_CHANGE,
+    'nakshatra': EventType.NAKSHATRA_CHANGE,
+    'yoga': EventType.YOGA_CHANGE,
+    'karana': EventType.KARANA_CHANGE
+}
+
+RISE_SET_COLUMNS = ('sunrise', 'sunset', 'moonrise', 'moonset')
+
+
+def tithi_name(index: int) -> str:
+    """Name of a zero-based tithi (0-29)"""
+    if index == 14:
+        return "Purnima"
+    if index == 29:
+        return "Amavasya"
+    paksha = "Shukla" if index < 15 else "Krishna"
+    return f"{paksha} {TITHI_NAMES[index % 15]}"
+
+
+def karana_name(index: int) -> str:
+    """Name of a zero-based karana (0-59)"""
+    if index == 0:
+        return "Kimstughna"
+    if index >= 57:
+        return ["Shakuni", "Chatushpada", "Naga"][index - 57]
+    return MOVABLE_KARANAS[(index - 1) % 7]
+
+
+ELEMENT_NAMES = {
+    'tithi': tithi_name,
+    'nakshatra': lambda index: NakshatraCalculator.NAKSHATRAS[index],
+    'yoga': lambda index: YOGA_NAMES[index],
+    'karana': karana_name
+}
+
+
+@dataclass
+class PanchangaTable:
+    """Columnar panchanga table for one location and date range
+
+    ``transitions[element]`` holds ``(jd, index)`` arrays: the element has
+    value ``index[i]`` from ``jd[i]`` until ``jd[i + 1]``. Rise/set columns
+    hold one Julian day per local date starting at ``first_date``; NaN marks
+    days without the event (circumpolar bodies, moonless days).
+    """
+    latitude: float
+    longitude: float
+    altitude: float
+    timezone: str
+    ayanamsa_system: Optional[str]
+    first_date: date
+    start_jd: float
+    end_jd: float
+    transitions: Dict[str, Tuple[np.ndarray, np.ndarray]] = field(default_factory=dict)
+    rise_set: Dict[str, np.ndarray] = field(default_factory=dict)
+    # (days, jds) of the days with a sunrise, built on the first lookup
+    _sunrises: Optional[Tuple[np.ndarray, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def covers(self, jd: float) -> bool:
+        """Whether a Julian day lies inside the table range"""
+        return self.start_jd <= jd < self.end_jd
+
+    def element_at(self, element: str, jd: float) -> Tuple[int, float, Optional[float]]:
+        """Return (index, start jd, end jd) of an element at a Julian day"""
+        jds, indices = self.transitions[element]
+        i = int(np.searchsorted(jds, jd, side='right')) - 1
+        if i < 0:
+            raise ValueError(f"Julian day {jd} precedes the panchanga table")
+        end = float(jds[i + 1]) if i + 1 < len(jds) else None
+        return int(indices[i]), float(jds[i]), end
+
+    def last_sunrise(self, jd: float) -> Tuple[int, float]:
+        """Return (day offset, jd) of the latest sunrise at or before ``jd``"""
+        if self._sunrises is None:
+            sunrise = self.rise_set['sunrise']
+            days = np.flatnonzero(np.isfinite(sunrise))
+            self._sunrises = (days, sunrise[days])
+        # Sunrises of the days that have one are in date order
+        days, sunrises = self._sunrises
+        i = int(np.searchsorted(sunrises, jd, side='right')) - 1
+        if i < 0:
+            raise ValueError(f"No sunrise before Julian day {jd} in panchanga table")
+        return int(days[i]), float(sunrises[i])
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Persist the table as a compressed ``.npz`` file"""
+        meta = {
+            'latitude': self.latitude,
+            'longitude': self.longitude,
+            'altitude': self.altitude,
+            'timezone': self.timezone,
+            'ayanamsa_system': self.ayanamsa_system,
+            'first_date': self.first_date.isoformat(),
+            'start_jd': self.start_jd,
+            'end_jd': self.end_jd
+        }
+        arrays = {'meta': np.array(json.dumps(meta))}
+        for element, (jds, indices) in self.transitions.items():
+            arrays[f'{element}_jd'] = jds
+            arrays[f'{element}_index'] = indices
+        arrays.update(self.rise_set)
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'PanchangaTable':
+        """Load a table written by :meth:`save`"""
+        with np.load(path) as data:
+            meta = json.loads(str(data['meta']))
+            meta['first_date'] = date.fromisoformat(meta['first_date'])
+            table = cls(**meta)
+            for element in ELEMENT_EVENTS:
+                table.transitions[element] = (data[f'{element}_jd'], data[f'{element}_index'])
+            for column in RISE_SET_COLUMNS:
+                table.rise_set[column] = data[column]
+        return table
+
+
+class PanchangaEngine:
+    """Builds and queries precomputed panchanga tables for a location"""
+
+    # Days added around each table so queries near the range edges still
+    # find the previous sunrise and the surrounding transitions
+    MARGIN_DAYS = 2
+
+    def __init__(
+        self,
+        location: Location,
+        timezone_name: str = 'UTC',
+        ayanamsa_system: Optional[str] = 'LAHIRI',
+        solver: Optional[EventSolver] = None,
+        cache: Optional[CalculationCache] = None,
+        directory: Optional[Union[str, Path]] = None,
+        rise_flags: int = 0
+    ):
+        """
+        Args:
+            location: Observer location
+            timezone_name: IANA timezone for local dates and results
+            ayanamsa_system: Ayanamsa for nakshatra and yoga
+            solver: Event solver (default: one using ``ayanamsa_system``)
+            cache: Cache for built tables
+            directory: Optional directory for persisted ``.npz`` tables
+            rise_flags: Extra ``swe.rise_trans`` flags, e.g. ``swe.BIT_HINDU_RISING``
+        """
+        self.location = location
+        self.timezone_name = timezone_name
+        self.tz = ZoneInfo(timezone_name)
+        self.ayanamsa_system = ayanamsa_system
+        self.solver = solver or EventSolver(ayanamsa_system=ayanamsa_system)
+        self.cache = cache or CalculationCache(max_size=16)
+        self.directory = Path(directory) if directory else None
+        self.rise_flags = rise_flags
+
+    @property
+    def _geopos(self) -> Tuple[float, float, float]:
+        return (
+            self.location.longitude,
+            self.location.latitude,
+            self.location.altitude or 0.0
+        )
+
+    def _to_local(self, jd: Optional[float]) -> Optional[datetime]:
+        if jd is None or math.isnan(jd):
+            return None
+        return julian_day_to_datetime(jd).replace(tzinfo=timezone.utc).astimezone(self.tz)
+
+    def _local_midnight_jd(self, day: date) -> float:
+        return datetime_to_julian_day(datetime.combine(day, time(0), tzinfo=self.tz))
+
+    def _rise_trans(self, jd: float, body: int, event: int) -> float:
+        """Next rise/set of a body after ``jd`` (NaN when it does not occur)"""
+        res, tret = swe.rise_trans(jd, body, event | self.rise_flags, self._geopos)
+        return tret[0] if res == 0 else math.nan
+
+    def _initial_indices(self, jd: float) -> Dict[str, int]:
+        """Element values at a Julian day"""
+        elongation, _ = self.solver._elongation_state(jd)
+        moon, _ = self.solver._planet_state(Planet.MOON)(jd)
+        yoga_sum, _ = self.solver._yoga_state(jd)
+        return {
+            'tithi': int(elongation // TITHI_SPAN),
+            'nakshatra': int(moon // NAKSHATRA_SPAN),
+            'yoga': int(yoga_sum // YOGA_SPAN),
+            'karana': int(elongation // KARANA_SPAN)
+        }
+
+    def build_table(self, first_date: date, last_date: date) -> PanchangaTable:
+        """
+        Compute a panchanga table for local dates ``first_date``..``last_date``
+
+        Args:
+            first_date: First local date
+            last_date: Last local date (inclusive)
+
+        Returns:
+            PanchangaTable covering the range plus ``MARGIN_DAYS`` on each side
+        """
+        if last_date < first_date:
+            raise ValueError("Last date must not precede first date")
+
+        table_first = first_date - timedelta(days=self.MARGIN_DAYS)
+        table_last = last_date + timedelta(days=self.MARGIN_DAYS)
+        start_jd = self._local_midnight_jd(table_first)
+        end_jd = self._local_midnight_jd(table_last + timedelta(days=1))
+
+        table = PanchangaTable(
+            latitude=self.location.latitude,
+            longitude=self.location.longitude,
+            altitude=self.location.altitude or 0.0,
+            timezone=self.timezone_name,
+            ayanamsa_system=self.ayanamsa_system,
+            first_date=table_first,
+            start_jd=start_jd,
+            end_jd=end_jd
+        )
+
+        events = self.solver.find_events(
+            julian_day_to_datetime(start_jd),
+            julian_day_to_datetime(end_jd),
+            event_types=list(ELEMENT_EVENTS.values()),
+            planets=[Planet.MOON]
+        )
+        initial = self._initial_indices(start_jd)
+        for element, event_type in ELEMENT_EVENTS.items():
+            times = [start_jd]
+            indices = [initial[element]]
+            for event in events:
+                if event.event_type == event_type:
+                    times.append(event.jd)
+                    indices.append(event.to_index)
+            table.transitions[element] = (
+                np.array(times, dtype=np.float64),
+                np.array(indices, dtype=np.int16)
+            )
+
+        days = (table_last - table_first).days + 1
+        columns = {column: np.full(days, np.nan) for column in RISE_SET_COLUMNS}
+        for offset in range(days):
+            midnight = self._local_midnight_jd(table_first + timedelta(days=offset))
+            sunrise = self._rise_trans(midnight, swe.SUN, swe.CALC_RISE)
+            columns['sunrise'][offset] = sunrise
+            columns['sunset'][offset] = self._rise_trans(
+                sunrise if not math.isnan(sunrise) else midnight, swe.SUN, swe.CALC_SET
+            )
+            columns['moonrise'][offset] = self._rise_trans(midnight, swe.MOON, swe.CALC_RISE)
+            columns['moonset'][offset] = self._rise_trans(midnight, swe.MOON, swe.CALC_SET)
+
+        # Drop events that fall on the following local date
+        for offset in range(days):
+            next_midnight = self._local_midnight_jd(table_first + timedelta(days=offset + 1))
+            for column in RISE_SET_COLUMNS:
+                if columns[column][offset] >= next_midnight:
+                    columns[column][offset] = np.nan
+        table.rise_set = columns
+        return table
+
+    def _table_path(self, year: int) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        name = "panchanga_{}_{:.4f}_{:.4f}_{:.0f}_{}_{}.npz".format(
+            year,
+            self.location.latitude,
+            self.location.longitude,
+            self.location.altitude or 0.0,
+            self.timezone_name.replace('/', '-'),
+            self.ayanamsa_system or 'TROPICAL'
+        )
+        return self.directory / name
+
+    def get_table(self, year: int) -> PanchangaTable:
+        """
+        Return the table for a local calendar year
+
+        Tables are served from the in-memory cache, then from ``directory``,
+        and are built (and persisted) otherwise.
+        """
+        cache_key = self.cache.generate_key(
+            "panchanga",
+            year,
+            self.location.latitude,
+            self.location.longitude,
+            self.location.altitude,
+            self.timezone_name,
+            self.ayanamsa_system,
+            self.rise_flags
+        )
+        table = self.cache.get(cache_key)
+        if table is not None:
+            return table
+
+        path = self._table_path(year)
+        if path is not None and path.exists():
+            table = PanchangaTable.load(path)
+        else:
+            logger.info(f"Building panchanga table for {year} at {self._geopos}")
+            table = self.build_table(date(year, 1, 1), date(year, 12, 31))
+            if path is not None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                table.save(path)
+
+        self.cache.set(cache_key, table)
+        return table
+
+    def panchanga_at(
+        self,
+        instant: datetime,
+        table: Optional[PanchangaTable] = None
+    ) -> Dict[str, object]:
+        """
+        Panchanga at an instant
+
+        Args:
+            instant: Query time; naive datetimes are in the engine's timezone
+            table: Table to query (default: the table of the local year)
+
+        Returns:
+            Dictionary with tithi, nakshatra, yoga, karana and vara (each
+            with number, name and local start/end), sunrise-based muhurta
+            and the day's rise/set times
+        """
+        if instant.tzinfo is None:
+            instant = instant.replace(tzinfo=self.tz)
+        local = instant.astimezone(self.tz)
+        jd = datetime_to_julian_day(instant)
+        if table is None or not table.covers(jd):
+            table = self.get_table(local.year)
+
+        result: Dict[str, object] = {}
+        for element in ELEMENT_EVENTS:
+            index, start, end = table.element_at(element, jd)
+            result[element] = {
+                'number': index + 1,
+                'name': ELEMENT_NAMES[element](index),
+                'start': self._to_local(start),
+                'end': self._to_local(end)
+            }
+
+        # The Vedic day runs from sunrise to the next sunrise
+        day, sunrise = table.last_sunrise(jd)
+        day_date = table.first_date + timedelta(days=day)
+        sunrises = table.rise_set['sunrise']
+        next_sunrise = sunrises[day + 1] if day + 1 < len(sunrises) else math.nan
+        sunset = table.rise_set['sunset'][day]
+        weekday = (day_date.weekday() + 1) % 7  # Sunday = 0
+        result['vara'] = {
+            'number': weekday + 1,
+            'name': VARA_NAMES[weekday],
+            'start': self._to_local(sunrise),
+            'end': self._to_local(next_sunrise)
+        }
+
+        # 15 muhurtas from sunrise to sunset and 15 from sunset to next sunrise
+        muhurta = None
+        if not math.isnan(sunset):
+            if jd < sunset:
+                muhurta = int(15 * (jd - sunrise) / (sunset - sunrise)) + 1
+            elif not math.isnan(next_sunrise):
+                muhurta = int(15 * (jd - sunset) / (next_sunrise - sunset)) + 16
+        result['muhurta'] = muhurta
+        result['is_day'] = bool(not math.isnan(sunset) and jd < sunset)
+
+        local_day = (local.date() - table.first_date).days
+        result['rise_set'] = {
+            column: self._to_local(float(table.rise_set[column][local_day]))
+            for column in RISE_SET_COLUMNS
+        }
+        result['datetime'] = local
+        return result
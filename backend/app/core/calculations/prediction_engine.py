@@ -3,10 +3,17 @@ Prediction Engine for Vedic Astrology calculations
 Handles event timing, Muhurta, and transit analysis
 """
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from decimal import Decimal
 import math
 
+import numpy as np
+
+from app.models.enums import Planet
+from .astronomical import AstronomicalCalculator
+from .ayanamsa import EnhancedAyanamsaManager
+from .event_solver import datetime_to_julian_day
+
 class PredictionEngine:
     """
     Core prediction engine implementing event timing and Muhurta calculations
@@ -56,6 +63,22 @@ class PredictionEngine:
         }
     }
     
+    # Transit aspects as signed offsets from the natal point; each side of a
+    # two-sided aspect is tracked separately so deviations cross zero cleanly
+    transit_aspect_offsets = (
+        (0.0, 'Conjunction'),
+        (60.0, 'Sextile'), (-60.0, 'Sextile'),
+        (90.0, 'Square'), (-90.0, 'Square'),
+        (120.0, 'Trine'), (-120.0, 'Trine'),
+        (180.0, 'Opposition')
+    )
+    transit_orb = 8.0
+    suitability_threshold = 0.6
+    max_transit_samples = 200000
+
+    _calculator: Optional[AstronomicalCalculator] = None
+    _ayanamsa_manager: Optional[EnhancedAyanamsaManager] = None
+
     @classmethod
     def calculate_muhurta(cls, 
                          datetime_utc: datetime,
@@ -166,13 +189,332 @@ class PredictionEngine:
         
         return None
     
+    @classmethod
+    def calculate_muhurta_grid(cls,
+                               start_time: datetime,
+                               end_time: datetime,
+                               planet_strengths: Dict[str, float],
+                               interval: timedelta = timedelta(minutes=30),
+                               activities: Optional[Sequence[str]] = None,
+                               ayanamsa_system: Optional[str] = 'LAHIRI') -> Dict[str, any]:
+        """
+        Score every activity at every instant of a period in one pass
+        
+        Sun and Moon positions are generated once per instant; tithi,
+        nakshatra and muhurta are shared by all activities, and scores are
+        a single (instant x planet) by (planet x activity) product.
+        ``suitable`` and ``auspicious`` match ``is_suitable`` and
+        ``is_auspicious_muhurta`` of calculate_muhurta for each cell.
+        
+        Args:
+            start_time: First instant (UTC)
+            end_time: Last instant (UTC)
+            planet_strengths: Planetary strengths, either one value per
+                planet or one value per planet and instant
+            interval: Spacing between instants
+            activities: Activities to score (default: all)
+            ayanamsa_system: Ayanamsa for nakshatra, or None for tropical
+            
+        Returns:
+            Dictionary with per-instant shared state and (instant x activity)
+            score, suitability and auspicious muhurta grids
+        """
+        activities = list(activities or cls.muhurta_qualities)
+        for activity in activities:
+            if activity not in cls.muhurta_qualities:
+                raise ValueError(f"Invalid activity type: {activity}")
+        
+        jds, longitudes = cls.generate_transit_series(
+            start_time, end_time, ['sun', 'moon'], interval, ayanamsa_system
+        )
+        samples = len(jds)
+        times = [min(start_time + i * interval, end_time) for i in range(samples)]
+        sun, moon = longitudes
+        
+        tithi = np.floor(((moon - sun) % 360) / 12).astype(int) + 1
+        nakshatra = np.floor(moon / 13.333333).astype(int)
+        muhurta_index = np.array([t.hour * 2 + (1 if t.minute >= 30 else 0) for t in times])
+        muhurta_names = [cls._get_muhurta_name(i) for i in range(10)]
+        muhurta_name_index = muhurta_index % 10
+        
+        # Strengths (instant x planet) and requirement weights (planet x activity)
+        planets = sorted({p for a in activities for p in cls.activity_requirements[a]})
+        strengths = np.column_stack([
+            np.broadcast_to(np.asarray(planet_strengths.get(p, 0), dtype=float), (samples,))
+            for p in planets
+        ])
+        weights = np.zeros((len(planets), len(activities)))
+        auspicious_table = np.zeros((len(activities), len(muhurta_names)), dtype=bool)
+        for col, activity in enumerate(activities):
+            required = cls.activity_requirements[activity]
+            for planet in required:
+                weights[planets.index(planet), col] = 1.0 / len(required)
+            for name_idx, name in enumerate(muhurta_names):
+                auspicious_table[col, name_idx] = name in cls.muhurta_qualities[activity]
+        
+        scores = strengths @ weights
+        auspicious = auspicious_table[:, muhurta_name_index].T
+        suitable = scores >= cls.suitability_threshold - 1e-9
+        
+        return {
+            'period': {
+                'start': start_time.isoformat(),
+                'end': end_time.isoformat()
+            },
+            'interval_minutes': interval.total_seconds() / 60.0,
+            'activities': activities,
+            'times': [t.isoformat() for t in times],
+            'tithi': tithi.tolist(),
+            'nakshatra': nakshatra.tolist(),
+            'muhurta': [muhurta_names[i] for i in muhurta_name_index],
+            'scores': np.round(scores, 4).tolist(),
+            'suitable': suitable.tolist(),
+            'auspicious': auspicious.tolist()
+        }
+    
+    @classmethod
+    def generate_transit_series(cls,
+                                start_time: datetime,
+                                end_time: datetime,
+                                planets: Sequence[str],
+                                resolution: timedelta = timedelta(hours=6),
+                                ayanamsa_system: Optional[str] = 'LAHIRI'
+                                ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sample transit longitudes from the ephemeris
+        
+        Args:
+            start_time: Period start time (UTC)
+            end_time: Period end time (UTC)
+            planets: Planet names to sample
+            resolution: Sampling interval
+            ayanamsa_system: Ayanamsa for sidereal output, or None for tropical
+            
+        Returns:
+            Tuple of (Julian days with shape (N,), longitudes with shape (P, N))
+        """
+        jds = cls.transit_instants(start_time, end_time, resolution)
+        
+        if cls._calculator is None:
+            cls._calculator = AstronomicalCalculator()
+        bodies = [cls._planet_enum(name) for name in planets]
+        longitudes = np.empty((len(bodies), len(jds)))
+        for row, body in enumerate(bodies):
+            for col, jd in enumerate(jds):
+                longitudes[row, col] = cls._calculator.calculate_position_jd(jd, body)[0]
+        
+        if ayanamsa_system:
+            if cls._ayanamsa_manager is None:
+                cls._ayanamsa_manager = EnhancedAyanamsaManager()
+            ayanamsa = cls._ayanamsa_manager.calculate_ayanamsa_series(jds, ayanamsa_system)
+            longitudes = (longitudes - ayanamsa) % 360
+        
+        return jds, longitudes
+    
+    @classmethod
+    def transit_instants(cls,
+                         start_time: datetime,
+                         end_time: datetime,
+                         resolution: timedelta = timedelta(hours=6)) -> np.ndarray:
+        """
+        Julian days sampling a period at a fixed interval
+        
+        The end of the period is always the last instant, after a shorter
+        step when the period is not a whole number of intervals.
+        
+        Args:
+            start_time: Period start time (UTC)
+            end_time: Period end time (UTC)
+            resolution: Sampling interval
+        
+        Returns:
+            Julian days with shape (N,)
+        """
+        if end_time <= start_time:
+            raise ValueError("End time must be after start time")
+        if resolution <= timedelta(0):
+            raise ValueError("Resolution must be positive")
+        
+        start_jd = datetime_to_julian_day(start_time)
+        end_jd = datetime_to_julian_day(end_time)
+        step = resolution.total_seconds() / 86400.0
+        samples = int(math.floor((end_jd - start_jd) / step + 1e-9)) + 1
+        if samples > cls.max_transit_samples:
+            raise ValueError(
+                f"Transit series of {samples} samples exceeds limit of "
+                f"{cls.max_transit_samples}; use a coarser resolution"
+            )
+        jds = start_jd + step * np.arange(samples)
+        if jds[-1] < end_jd:
+            jds = np.append(jds, end_jd)
+        return jds
+    
+    @classmethod
+    def find_aspect_intervals(cls,
+                              jds: np.ndarray,
+                              transit_longitudes: np.ndarray,
+                              natal_longitudes: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Detect transit-to-natal aspect intervals
+        
+        All transit planets, natal points, aspects and samples are evaluated
+        in one array pass. Orb entry/exit and exact times are refined by
+        linear interpolation between neighbouring samples.
+        
+        Args:
+            jds: Sample Julian days, shape (N,)
+            transit_longitudes: Transit longitudes, shape (P, N)
+            natal_longitudes: Natal longitudes, shape (M,)
+            
+        Returns:
+            Columnar dictionary with one entry per interval: transit and natal
+            row indices, aspect index into ``transit_aspect_offsets``, start,
+            exact and end Julian days (exact is NaN when the aspect does not
+            perfect), number of perfections and closest deviation
+        """
+        jds = np.asarray(jds, dtype=float)
+        transit = np.atleast_2d(np.asarray(transit_longitudes, dtype=float))
+        natal = np.atleast_1d(np.asarray(natal_longitudes, dtype=float))
+        offsets = np.array([offset for offset, _ in cls.transit_aspect_offsets])
+        orb = cls.transit_orb
+        n_transit, n_natal, n_aspects = len(transit), len(natal), len(offsets)
+        samples = len(jds)
+        
+        # Signed deviation from exact, shape (P, M, K, N) flattened to rows
+        dev = (
+            transit[:, None, None, :]
+            - natal[None, :, None, None]
+            - offsets[None, None, :, None]
+            + 180.0
+        ) % 360.0 - 180.0
+        dev = dev.reshape(-1, samples)
+        in_orb = np.abs(dev) <= orb
+        
+        padded = np.zeros((len(dev), samples + 2), dtype=np.int8)
+        padded[:, 1:-1] = in_orb
+        edges = np.diff(padded, axis=1)
+        start_rows, start_idx = np.nonzero(edges == 1)
+        _, end_idx = np.nonzero(edges == -1)
+        end_idx = end_idx - 1  # last in-orb sample
+        
+        # Orb entry/exit: interpolate |dev| - orb against the outside sample
+        def crossing(inside, outside):
+            f_in = np.abs(dev[start_rows, inside]) - orb
+            f_out = np.abs(dev[start_rows, outside]) - orb
+            frac = np.divide(f_in, f_in - f_out, out=np.zeros_like(f_in), where=f_in != f_out)
+            return jds[inside] + frac * (jds[outside] - jds[inside])
+        
+        has_before = start_idx > 0
+        has_after = end_idx < samples - 1
+        start_jd = jds[start_idx].copy()
+        end_jd = jds[end_idx].copy()
+        if has_before.any():
+            start_jd[has_before] = crossing(start_idx, np.maximum(start_idx - 1, 0))[has_before]
+        if has_after.any():
+            end_jd[has_after] = crossing(end_idx, np.minimum(end_idx + 1, samples - 1))[has_after]
+        
+        # Perfections: sign changes of dev between two in-orb samples
+        sign_change = (
+            ((dev[:, :-1] > 0) != (dev[:, 1:] > 0))
+            & in_orb[:, :-1] & in_orb[:, 1:]
+        )
+        cross_rows, cross_idx = np.nonzero(sign_change)
+        d0 = dev[cross_rows, cross_idx]
+        d1 = dev[cross_rows, cross_idx + 1]
+        frac = np.divide(d0, d0 - d1, out=np.zeros_like(d0), where=d0 != d1)
+        cross_jd = jds[cross_idx] + frac * (jds[cross_idx + 1] - jds[cross_idx])
+        
+        cross_key = cross_rows * samples + cross_idx
+        first = np.searchsorted(cross_key, start_rows * samples + start_idx)
+        last = np.searchsorted(cross_key, start_rows * samples + end_idx)
+        passes = last - first
+        exact_jd = np.full(len(start_rows), np.nan)
+        perfected = passes > 0
+        exact_jd[perfected] = cross_jd[first[perfected]]
+        
+        # Closest approach of intervals that never perfect (e.g. a station
+        # inside the orb); perfected intervals have deviation zero at exact
+        closest = np.zeros(len(start_rows))
+        closest_jd = exact_jd.copy()
+        for i in np.flatnonzero(~perfected):
+            row, s, e = start_rows[i], start_idx[i], end_idx[i]
+            j = s + int(np.argmin(np.abs(dev[row, s:e + 1])))
+            closest[i] = abs(dev[row, j])
+            closest_jd[i] = jds[j]
+        
+        transit_idx, rest = np.divmod(start_rows, n_natal * n_aspects)
+        natal_idx, aspect_idx = np.divmod(rest, n_aspects)
+        order = np.lexsort((transit_idx, start_jd))
+        
+        return {
+            'transit': transit_idx[order],
+            'natal': natal_idx[order],
+            'aspect': aspect_idx[order],
+            'start': start_jd[order],
+            'exact': exact_jd[order],
+            'end': end_jd[order],
+            'passes': passes[order],
+            'closest': closest[order],
+            'closest_time': closest_jd[order]
+        }
+    
+    @classmethod
+    def analyze_transits(cls,
+                         start_time: datetime,
+                         end_time: datetime,
+                         natal_positions: Dict[str, float],
+                         planets: Optional[Sequence[str]] = None,
+                         resolution: timedelta = timedelta(hours=6),
+                         ayanamsa_system: Optional[str] = 'LAHIRI') -> Dict[str, any]:
+        """
+        Find transit aspect intervals of several planets to natal positions
+        
+        Args:
+            start_time: Period start time (UTC)
+            end_time: Period end time (UTC)
+            natal_positions: Natal longitudes keyed by planet/point name
+            planets: Transiting planets (default: the nine grahas)
+            resolution: Sampling interval of the transit series
+            ayanamsa_system: Ayanamsa matching the natal positions, or None
+            
+        Returns:
+            Dictionary containing one entry per aspect interval
+        """
+        planets = list(planets or [p.name.lower() for p in Planet])
+        natal_names = list(natal_positions)
+        jds, longitudes = cls.generate_transit_series(
+            start_time, end_time, planets, resolution, ayanamsa_system
+        )
+        columns = cls.find_aspect_intervals(
+            jds, longitudes, np.array([natal_positions[n] for n in natal_names])
+        )
+        
+        aspects = []
+        for i in range(len(columns['start'])):
+            interval = cls._format_interval(columns, i, jds[0], start_time)
+            interval['transit_planet'] = planets[columns['transit'][i]]
+            interval['natal_point'] = natal_names[columns['natal'][i]]
+            interval['effect'] = cls._get_aspect_effect(interval['type'], interval['transit_planet'])
+            aspects.append(interval)
+        
+        return {
+            'period': {
+                'start': start_time.isoformat(),
+                'end': end_time.isoformat()
+            },
+            'resolution_minutes': resolution.total_seconds() / 60.0,
+            'aspects': aspects
+        }
+    
     @classmethod
     def analyze_transit_period(cls,
                              start_time: datetime,
                              end_time: datetime,
                              planet: str,
                              natal_position: float,
-                             transit_positions: List[Tuple[datetime, float]]) -> Dict[str, any]:
+                             transit_positions: Optional[List[Tuple[datetime, float]]] = None,
+                             resolution: timedelta = timedelta(hours=6),
+                             ayanamsa_system: Optional[str] = 'LAHIRI') -> Dict[str, any]:
         """
         Analyze transit period effects
         
@@ -181,29 +523,32 @@ class PredictionEngine:
             end_time: Period end time
             planet: Planet to analyze
             natal_position: Planet's natal position
-            transit_positions: List of (time, position) tuples for transit
+            transit_positions: Optional (time, position) samples; generated
+                from the ephemeris at ``resolution`` when omitted
+            resolution: Sampling interval for generated series
+            ayanamsa_system: Ayanamsa for generated series, or None for tropical
             
         Returns:
-            Dictionary containing transit analysis
+            Dictionary containing transit analysis with one entry per
+            aspect interval (start, exact, end)
         """
-        aspects = []
-        effects = []
+        if transit_positions is None:
+            jds, longitudes = cls.generate_transit_series(
+                start_time, end_time, [planet], resolution, ayanamsa_system
+            )
+        else:
+            transit_positions = sorted(transit_positions, key=lambda sample: sample[0])
+            jds = np.array([datetime_to_julian_day(time) for time, _ in transit_positions])
+            longitudes = np.array([[position for _, position in transit_positions]])
         
-        for time, position in transit_positions:
-            # Calculate aspect angle
-            angle = abs(position - natal_position)
-            if angle > 180:
-                angle = 360 - angle
-            
-            # Check major aspects
-            aspect = cls._get_aspect_type(angle)
-            if aspect:
-                aspects.append({
-                    'time': time.isoformat(),
-                    'type': aspect,
-                    'angle': angle,
-                    'effect': cls._get_aspect_effect(aspect, planet)
-                })
+        aspects = []
+        if len(jds):
+            columns = cls.find_aspect_intervals(jds, longitudes, np.array([natal_position]))
+            origin = transit_positions[0][0] if transit_positions else start_time
+            for i in range(len(columns['start'])):
+                interval = cls._format_interval(columns, i, jds[0], origin)
+                interval['effect'] = cls._get_aspect_effect(interval['type'], planet)
+                aspects.append(interval)
         
         # Analyze overall period
         strength = cls._calculate_transit_strength(aspects)
@@ -220,6 +565,39 @@ class PredictionEngine:
             'overall_effect': cls._get_period_effect(strength)
         }
     
+    @classmethod
+    def _format_interval(cls,
+                         columns: Dict[str, np.ndarray],
+                         index: int,
+                         origin_jd: float,
+                         origin: datetime) -> Dict[str, any]:
+        """Convert one row of ``find_aspect_intervals`` output to a dict"""
+        def to_iso(jd: float) -> Optional[str]:
+            if np.isnan(jd):
+                return None
+            return (origin + timedelta(days=float(jd - origin_jd))).isoformat()
+        
+        offset, name = cls.transit_aspect_offsets[columns['aspect'][index]]
+        exact = columns['exact'][index]
+        return {
+            'type': name,
+            'angle': abs(offset),
+            'start': to_iso(columns['start'][index]),
+            'exact': to_iso(exact),
+            'end': to_iso(columns['end'][index]),
+            'time': to_iso(exact if not np.isnan(exact) else columns['closest_time'][index]),
+            'passes': int(columns['passes'][index]),
+            'closest_orb': round(float(columns['closest'][index]), 4)
+        }
+    
+    @staticmethod
+    def _planet_enum(name: str) -> Planet:
+        """Resolve a planet name to the Planet enum"""
+        try:
+            return Planet[name.upper()]
+        except KeyError:
+            raise ValueError(f"Invalid planet: {name}")
+    
     @staticmethod
     def _calculate_tithi(moon_pos: float, sun_pos: float) -> int:
         """Calculate tithi from Moon and Sun positions"""
@@ -280,7 +658,7 @@ class PredictionEngine:
         for aspect in aspects:
             total_weight += weights.get(aspect['type'], 0)
             
-        return max(0, min(1, (total_weight + 1) / 2))
+        return float(max(0, min(1, (total_weight + 1) / 2)))
     
     @staticmethod
     def _get_period_effect(strength: float) -> str:
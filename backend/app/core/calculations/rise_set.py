@@ -0,0 +1,291 @@
+"""
+Sunrise/Sunset Service
+Cached ``swe.rise_trans`` results for time-dependent strengths and muhurta.
+
+Entries are keyed on quantized location and local solar date (the date at
+the location's mean solar time), so nearby observers share entries without
+needing a timezone. Optionally, entries are interpolated between the edges
+of a latitude band when the band has been verified to be linear within a
+tolerance, so many distinct latitudes in a band cost three exact
+computations per date instead of one each.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from threading import Lock
+from typing import Dict, Optional, Tuple
+import logging
+import math
+import time
+
+import swisseph as swe
+
+from app.core.monitoring.instrumentation import instrument
+from .event_solver import datetime_to_julian_day
+from ..cache.calculation_cache import CalculationCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RiseSetTimes:
+    """Sunrise and sunset of one local solar date (Julian days, UT)
+
+    NaN marks an event that does not occur (polar day or night).
+    """
+    day: date
+    sunrise: float
+    sunset: float
+
+    @property
+    def day_length(self) -> float:
+        """Length of daylight in hours (NaN when undefined)"""
+        return (self.sunset - self.sunrise) * 24.0
+
+    @property
+    def is_complete(self) -> bool:
+        return not (math.isnan(self.sunrise) or math.isnan(self.sunset))
+
+
+class RiseSetService:
+    """Cached sunrise/sunset lookups on a quantized location grid"""
+
+    def __init__(
+        self,
+        location_precision: float = 0.01,
+        altitude_precision: float = 100.0,
+        latitude_band: float = 0.0,
+        interpolation_tolerance: float = 0.5,
+        max_size: int = 20000,
+        rise_flags: int = 0
+    ):
+        """
+        Args:
+            location_precision: Latitude/longitude quantization in degrees
+            altitude_precision: Altitude quantization in meters
+            latitude_band: Band width in degrees for interpolation (0 disables)
+            interpolation_tolerance: Maximum interpolation error in minutes
+            max_size: Maximum number of cached entries
+            rise_flags: Extra ``swe.rise_trans`` flags, e.g. ``swe.BIT_HINDU_RISING``
+        """
+        self.location_precision = location_precision
+        self.altitude_precision = altitude_precision
+        self.latitude_band = latitude_band
+        self.interpolation_tolerance = interpolation_tolerance
+        self.rise_flags = rise_flags
+        self._cache = CalculationCache(max_size=max_size)
+        self._lock = Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'interpolated': 0,
+            'computations': 0,
+            'compute_time': 0.0
+        }
+
+    def _quantize(self, value: float, precision: float) -> float:
+        return round(round(value / precision) * precision, 10)
+
+    @staticmethod
+    def solar_date(moment: datetime, longitude: float) -> date:
+        """Local mean solar date of a (UTC or aware) moment at a longitude"""
+        jd = datetime_to_julian_day(moment) + longitude / 360.0
+        year, month, day, _ = swe.revjul(jd + 0.5)
+        return date(year, month, day)
+
+    def _count(self, stat: str, amount: float = 1) -> None:
+        with self._lock:
+            self._stats[stat] += amount
+
+    def _rise_trans(self, jd: float, event: int, geopos: Tuple[float, float, float]) -> float:
+        res, tret = swe.rise_trans(jd, swe.SUN, event | self.rise_flags, geopos)
+        return tret[0] if res == 0 else math.nan
+
+    @instrument()
+    def _compute(self, latitude: float, longitude: float, altitude: float, day: date) -> RiseSetTimes:
+        """Exact sunrise/sunset for a local solar date"""
+        start = time.perf_counter()
+        geopos = (longitude, latitude, altitude)
+        midnight = swe.julday(day.year, day.month, day.day, 0.0) - longitude / 360.0
+        sunrise = self._rise_trans(midnight, swe.CALC_RISE, geopos)
+        sunset = self._rise_trans(
+            sunrise if not math.isnan(sunrise) else midnight, swe.CALC_SET, geopos
+        )
+        # Events after the next local midnight belong to the following date
+        if sunrise >= midnight + 1:
+            sunrise = math.nan
+        if sunset >= midnight + 1:
+            sunset = math.nan
+        duration = time.perf_counter() - start
+        self._count('computations')
+        self._count('compute_time', duration)
+        return RiseSetTimes(day=day, sunrise=sunrise, sunset=sunset)
+
+    def _exact(self, latitude: float, longitude: float, altitude: float, day: date) -> RiseSetTimes:
+        """Exact entry at a quantized location, through the cache"""
+        key = self._cache.generate_key("rise_set", latitude, longitude, altitude, day)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._count('hits')
+            return entry
+        self._count('misses')
+        entry = self._compute(latitude, longitude, altitude, day)
+        self._cache.set(key, entry)
+        return entry
+
+    def _band(
+        self, band: int, longitude: float, altitude: float, day: date
+    ) -> Tuple[Optional[Tuple[RiseSetTimes, RiseSetTimes]], bool]:
+        """
+        Band edge entries, or None if the band is not linear within
+        tolerance, and whether the edges were computed by this call
+        """
+        key = self._cache.generate_key("rise_set_band", band, self.latitude_band, longitude, altitude, day)
+        entry = self._cache.get(key)
+        computed = entry is None
+        if computed:
+            low_lat = band * self.latitude_band
+            high_lat = low_lat + self.latitude_band
+            low = self._compute(low_lat, longitude, altitude, day)
+            high = self._compute(high_lat, longitude, altitude, day)
+            mid = self._compute(low_lat + self.latitude_band / 2, longitude, altitude, day)
+            linear = low.is_complete and high.is_complete and mid.is_complete and all(
+                abs(getattr(mid, field) - (getattr(low, field) + getattr(high, field)) / 2) * 1440.0
+                <= self.interpolation_tolerance
+                for field in ('sunrise', 'sunset')
+            )
+            entry = (low, high) if linear else ()
+            self._cache.set(key, entry)
+        return entry or None, computed
+
+    @instrument()
+    def get_rise_set(
+        self,
+        latitude: float,
+        longitude: float,
+        day: date,
+        altitude: float = 0.0
+    ) -> RiseSetTimes:
+        """
+        Sunrise and sunset for a location and local solar date
+
+        Args:
+            latitude: Geographic latitude
+            longitude: Geographic longitude (east positive)
+            day: Local solar date
+            altitude: Altitude in meters
+
+        Returns:
+            RiseSetTimes with Julian days in UT
+        """
+        lon_q = self._quantize(longitude, self.location_precision)
+        alt_q = self._quantize(altitude or 0.0, self.altitude_precision)
+
+        if self.latitude_band > 0 and abs(latitude) + self.latitude_band < 90:
+            band = math.floor(latitude / self.latitude_band)
+            edges, computed = self._band(band, lon_q, alt_q, day)
+            if edges is not None:
+                low, high = edges
+                fraction = (latitude - band * self.latitude_band) / self.latitude_band
+                # A hit only when the band's edges were already cached
+                self._count('misses' if computed else 'hits')
+                self._count('interpolated')
+                return RiseSetTimes(
+                    day=day,
+                    sunrise=low.sunrise + fraction * (high.sunrise - low.sunrise),
+                    sunset=low.sunset + fraction * (high.sunset - low.sunset)
+                )
+
+        lat_q = self._quantize(latitude, self.location_precision)
+        return self._exact(lat_q, lon_q, alt_q, day)
+
+    @instrument()
+    def precompute_year(
+        self,
+        latitude: float,
+        longitude: float,
+        year: int,
+        altitude: float = 0.0
+    ) -> Dict[date, RiseSetTimes]:
+        """
+        Bulk-compute a location's entries for every date of a year
+
+        Returns:
+            Entries keyed by local solar date
+        """
+        day = date(year, 1, 1)
+        entries = {}
+        while day.year == year:
+            entries[day] = self.get_rise_set(latitude, longitude, day, altitude)
+            day += timedelta(days=1)
+        return entries
+
+    def _sun_altitude(self, jd: float, latitude: float, longitude: float, altitude: float) -> float:
+        """Apparent altitude of the Sun, for days without sunrise or sunset"""
+        position = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH)[0]
+        return swe.azalt(
+            jd, swe.ECL2HOR, (longitude, latitude, altitude), 0, 0,
+            (position[0], position[1], position[2])
+        )[2]
+
+    def is_day(
+        self,
+        moment: datetime,
+        latitude: float,
+        longitude: float,
+        altitude: float = 0.0
+    ) -> bool:
+        """Whether the Sun is up at a moment (UTC or timezone-aware)"""
+        jd = datetime_to_julian_day(moment)
+        entry = self.get_rise_set(latitude, longitude, self.solar_date(moment, longitude), altitude)
+        if math.isnan(entry.sunrise) or math.isnan(entry.sunset):
+            return self._sun_altitude(jd, latitude, longitude, altitude) > 0
+        return entry.sunrise <= jd < entry.sunset
+
+    def muhurta_number(
+        self,
+        moment: datetime,
+        latitude: float,
+        longitude: float,
+        altitude: float = 0.0
+    ) -> Optional[int]:
+        """
+        Muhurta (1-30) at a moment: 15 from sunrise to sunset and 15 from
+        sunset to the next sunrise. None where the Sun does not rise or set.
+        """
+        jd = datetime_to_julian_day(moment)
+        day = self.solar_date(moment, longitude)
+        entry = self.get_rise_set(latitude, longitude, day, altitude)
+        if not entry.is_complete:
+            return None
+        if entry.sunrise <= jd < entry.sunset:
+            return int(15 * (jd - entry.sunrise) / (entry.sunset - entry.sunrise)) + 1
+        if jd >= entry.sunset:
+            night_start = entry.sunset
+            night_end = self.get_rise_set(latitude, longitude, day + timedelta(days=1), altitude).sunrise
+        else:
+            night_start = self.get_rise_set(latitude, longitude, day - timedelta(days=1), altitude).sunset
+            night_end = entry.sunrise
+        if math.isnan(night_start) or math.isnan(night_end):
+            return None
+        return min(int(15 * (jd - night_start) / (night_end - night_start)), 14) + 16
+
+    def get_metrics(self) -> Dict[str, float]:
+        """
+        Cache hit rate and compute time statistics
+
+        Every lookup is a hit or a miss, interpolated ones included;
+        ``interpolated`` counts the lookups answered from a latitude band.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        stats['average_compute_time'] = (
+            stats['compute_time'] / stats['computations'] if stats['computations'] else 0.0
+        )
+        return stats
+
+
+# Shared service instance
+rise_set_service = RiseSetService()
@@ -1,13 +1,23 @@
 """Shadbala calculation module."""
+from datetime import datetime
 from typing import Dict, List, Optional
 import math
 
+from app.models.location import Location
+from .rise_set import RiseSetService, rise_set_service
+
 
 class ShadbalaSystem:
     """Shadbala calculation system."""
 
-    def __init__(self):
-        """Initialize Shadbala system."""
+    def __init__(self, rise_set: Optional[RiseSetService] = None):
+        """Initialize Shadbala system.
+
+        Args:
+            rise_set: Sunrise/sunset source used when ``is_day`` is not given
+        """
+        self.rise_set = rise_set or rise_set_service
+
         self.planet_strengths = {
             'Sun': 60,
             'Moon': 51,
@@ -79,9 +89,21 @@ class ShadbalaSystem:
         house: int,
         speed: float,
         aspects: List[Dict],
-        is_day: bool
+        is_day: Optional[bool] = None,
+        birth_time: Optional[datetime] = None,
+        location: Optional[Location] = None
     ) -> Dict:
-        """Calculate total Shadbala strength."""
+        """Calculate total Shadbala strength.
+
+        ``is_day`` may be omitted when ``birth_time`` and ``location`` are
+        given; it is then derived from local sunrise and sunset.
+        """
+        if is_day is None:
+            if birth_time is None or location is None:
+                raise ValueError("Either is_day or birth_time and location are required")
+            is_day = self.rise_set.is_day(
+                birth_time, location.latitude, location.longitude, location.altitude or 0.0
+            )
         sthan_bala = self.calculate_sthan_bala(house)
         dig_bala = self.calculate_dig_bala(planet, house)
         chesta_bala = self.calculate_chesta_bala(planet, speed)
@@ -107,4 +129,17 @@ class ShadbalaSystem:
             'chesta_bala': chesta_bala,
             'aspect_bala': aspect_bala,
             'kala_bala': kala_bala
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def _interpret_strength(strength: float) -> Dict[str, str]:
+        """Interpret a Shadbala strength."""
+        if strength >= 80:
+            return {'status': "Excellent", 'effect': "Planet gives its full results"}
+        if strength >= 70:
+            return {'status': "Strong", 'effect': "Planet gives mostly favourable results"}
+        if strength >= 50:
+            return {'status': "Moderate", 'effect': "Planet gives mixed results"}
+        if strength >= 30:
+            return {'status': "Weak", 'effect': "Planet struggles to give its results"}
+        return {'status': "Very Weak", 'effect': "Planet needs remedial support"}
@@ -0,0 +1,243 @@
+"""
+Batch Shadbala
+Shadbala of many charts from birth data alone.
+
+Clients send the moment and place of each birth. Sidereal positions come
+from one tropical pass of the sidereal position service, the ascendant
+from ``swe.houses_ex``, houses are whole signs counted from the ascendant
+and day/night comes from the rise/set service. Drik bala is derived from
+the pairwise separations of the chart's own planets, so no aspect lists
+are needed. The six Shadbala components of all planets of all charts are
+then evaluated in one pass of the strength kernel.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+import swisseph as swe
+
+from app.core.monitoring.instrumentation import instrument
+from app.models.enums import Planet
+from .event_solver import datetime_to_julian_day
+from .rise_set import RiseSetService, rise_set_service
+from .sidereal import SiderealPositionService
+from .strength_kernel import (
+    BASELINE_STRENGTH, CLASSICAL_PLANETS, PAIR_COMPONENTS, PLANET_COMPONENTS, SHADBALA_COMPONENTS,
+    get_planet_tables, planet_inputs, separation_matrix
+)
+
+logger = logging.getLogger(__name__)
+
+SHADBALA_PLANETS = CLASSICAL_PLANETS
+
+# Lower bounds of the total as a share of BASELINE_STRENGTH
+STRENGTH_GRADES = (
+    (1.1, "Very strong"),
+    (1.0, "Strong"),
+    (0.85, "Moderate"),
+    (0.7, "Weak"),
+    (0.0, "Very weak")
+)
+
+
+def interpret_shadbala(total: float) -> str:
+    """Grade of a Shadbala total (sum of the six components)"""
+    ratio = total / BASELINE_STRENGTH
+    for bound, grade in STRENGTH_GRADES:
+        if ratio >= bound:
+            return grade
+    return STRENGTH_GRADES[-1][1]
+
+
+@dataclass(frozen=True)
+class BirthData:
+    """Moment (UTC or timezone-aware) and place of a birth"""
+    moment: datetime
+    latitude: float
+    longitude: float
+    altitude: float = 0.0
+
+
+@dataclass(frozen=True)
+class ShadbalaBatch:
+    """Shadbala of a batch of charts"""
+    planets: Tuple[str, ...]
+    longitudes: np.ndarray  # (charts, planets) sidereal degrees
+    houses: np.ndarray  # (charts, planets) whole-sign houses 1-12
+    is_day: np.ndarray  # (charts,)
+    components: Dict[str, np.ndarray]  # SHADBALA_COMPONENTS, (charts, planets) each
+    totals: np.ndarray  # (charts, planets)
+
+    def to_dict(self, chart: int = 0, names: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Shadbala analysis of one chart
+
+        Args:
+            chart: Row of the chart in the batch
+            names: Names to report the planets under, in column order
+                (default: the kernel's planet names)
+
+        Returns:
+            Dictionary with ``planets`` (name to total, components and
+            interpretation) and ``chart_analysis``
+        """
+        names = list(names or self.planets)
+        values = {name: array[chart].tolist() for name, array in self.components.items()}
+        totals = self.totals[chart].tolist()
+        longitudes = self.longitudes[chart].tolist()
+        houses = self.houses[chart].tolist()
+
+        planets = {}
+        for column, name in enumerate(names):
+            planets[name] = {
+                'longitude': longitudes[column],
+                'house': houses[column],
+                'total_strength': totals[column],
+                'components': {component: values[component][column] for component in SHADBALA_COMPONENTS},
+                'interpretation': interpret_shadbala(totals[column])
+            }
+        average = sum(totals) / len(totals)
+        return {
+            'planets': planets,
+            'chart_analysis': {
+                'is_day': bool(self.is_day[chart]),
+                'total_strength': sum(totals),
+                'average_strength': average,
+                'interpretation': interpret_shadbala(average)
+            }
+        }
+
+
+def shadbala_components(
+    planets: Sequence[str],
+    longitudes: np.ndarray,
+    speeds: np.ndarray,
+    houses: np.ndarray,
+    is_day: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    The six Shadbala components of many charts
+
+    Only the Shadbala entries of the strength kernel are evaluated.
+
+    Args:
+        planets: Planet names in column order
+        longitudes: Sidereal longitudes (charts, planets)
+        speeds: Daily motions, same shape
+        houses: House numbers 1-12, same shape
+        is_day: Whether each chart is a day birth, (charts,)
+
+    Returns:
+        Dictionary mapping component name to a (charts, planets) array
+    """
+    longitudes = np.asarray(longitudes, dtype=float)
+    tables = get_planet_tables(tuple(planets))
+    inputs = planet_inputs(
+        longitudes,
+        np.broadcast_to(np.asarray(speeds, dtype=float), longitudes.shape),
+        np.broadcast_to(np.asarray(houses, dtype=int), longitudes.shape),
+        np.asarray(is_day, dtype=bool).reshape(-1, 1)
+    )
+    separations = separation_matrix(longitudes)
+    others = ~np.eye(len(planets), dtype=bool)
+
+    components = {}
+    for name in SHADBALA_COMPONENTS:
+        if name in PLANET_COMPONENTS:
+            components[name] = np.asarray(PLANET_COMPONENTS[name][1](tables, inputs), dtype=float)
+        else:
+            components[name] = PAIR_COMPONENTS[name][1](tables, separations, others)
+    return components
+
+
+class ShadbalaBatchCalculator:
+    """Shadbala of many charts from their birth data"""
+
+    def __init__(
+        self,
+        sidereal: Optional[SiderealPositionService] = None,
+        rise_set: Optional[RiseSetService] = None
+    ):
+        self.sidereal = sidereal or SiderealPositionService()
+        self.rise_set = rise_set or rise_set_service
+        self._planets = tuple(Planet[name.upper()] for name in SHADBALA_PLANETS)
+
+    def _ascendants(self, jds: np.ndarray, births: Sequence[BirthData]) -> np.ndarray:
+        # Tropical ascendants; houses_ex without FLG_SIDEREAL leaves the
+        # sidereal mode alone
+        return np.array([
+            swe.houses_ex(float(jd), birth.latitude, birth.longitude, b'W')[1][0]
+            for jd, birth in zip(jds, births)
+        ])
+
+    @instrument()
+    def calculate(self, births: Sequence[BirthData], system: str = 'LAHIRI') -> ShadbalaBatch:
+        """
+        Shadbala of all classical planets of many charts
+
+        Args:
+            births: Birth data of each chart
+            system: Ayanamsa system
+
+        Returns:
+            ShadbalaBatch with one row per birth
+        """
+        births = list(births)
+        if not births:
+            raise ValueError("At least one birth is required")
+        jds = np.array([datetime_to_julian_day(birth.moment) for birth in births])
+
+        arrays = self.sidereal.calculate_arrays(jds, [system], self._planets)
+        longitudes = arrays['longitude'][0].T
+        speeds = arrays['speed'].T
+        ascendants = np.mod(self._ascendants(jds, births) - arrays['ayanamsa'][0], 360.0)
+        houses = np.mod((longitudes // 30).astype(int) - (ascendants // 30).astype(int)[:, np.newaxis], 12) + 1
+        is_day = np.array([
+            self.rise_set.is_day(birth.moment, birth.latitude, birth.longitude, birth.altitude)
+            for birth in births
+        ])
+
+        components = shadbala_components(SHADBALA_PLANETS, longitudes, speeds, houses, is_day)
+        totals = np.zeros(longitudes.shape)
+        for name in SHADBALA_COMPONENTS:
+            totals = totals + components[name]
+        return ShadbalaBatch(
+            planets=SHADBALA_PLANETS,
+            longitudes=longitudes,
+            houses=houses,
+            is_day=is_day,
+            components=components,
+            totals=totals
+        )
+
+    def iter_analyses(
+        self,
+        births: Iterable[BirthData],
+        system: str = 'LAHIRI',
+        chunk_size: int = 500
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Shadbala analyses of a stream of births, in input order
+
+        Births are computed ``chunk_size`` at a time, so the first results
+        are available before the whole input has been computed.
+
+        Yields:
+            Chart analysis per birth (see ShadbalaBatch.to_dict)
+        """
+        chunk = []
+        for birth in births:
+            chunk.append(birth)
+            if len(chunk) >= chunk_size:
+                yield from self._analyses(chunk, system)
+                chunk = []
+        if chunk:
+            yield from self._analyses(chunk, system)
+
+    def _analyses(self, births: Sequence[BirthData], system: str) -> Iterator[Dict[str, Any]]:
+        batch = self.calculate(births, system)
+        for row in range(len(births)):
+            yield batch.to_dict(row)
@@ -0,0 +1,142 @@
+"""
+Sidereal Position Service
+Sidereal longitudes for several ayanamsa systems from a single tropical
+computation.
+
+Swiss Ephemeris keeps the sidereal mode in process-global state, so
+computing positions with ``FLG_SIDEREAL`` after ``set_sid_mode`` races when
+requests for different systems run concurrently. This service never touches
+that state: it computes tropical positions once and subtracts a per-system
+ayanamsa vector read from the manager's interpolation tables. Instances
+hold no per-request state and are safe to share between threads; pickling
+re-creates a fresh instance so they can be passed to process pools.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from app.core.monitoring.instrumentation import instrument
+from app.models.enums import Planet
+from .astronomical import AstronomicalCalculator
+from .ayanamsa import EnhancedAyanamsaManager
+
+logger = logging.getLogger(__name__)
+
+
+class SiderealPositionService:
+    """Tropical positions once, sidereal longitudes for every requested system"""
+
+    def __init__(
+        self,
+        ayanamsa_manager: Optional[EnhancedAyanamsaManager] = None,
+        calculator: Optional[AstronomicalCalculator] = None
+    ):
+        self.ayanamsa_manager = ayanamsa_manager or EnhancedAyanamsaManager()
+        self.calculator = calculator or AstronomicalCalculator()
+
+    def __reduce__(self):
+        # Tables and caches hold locks; workers build their own
+        return (self.__class__, ())
+
+    def _systems(self, systems: Optional[Sequence[str]]) -> Tuple[str, ...]:
+        systems = tuple(systems or self.ayanamsa_manager.get_available_systems())
+        for system in systems:
+            if not self.ayanamsa_manager.validate_system(system):
+                raise ValueError(f"Invalid ayanamsa system: {system}")
+        return systems
+
+    def tropical_positions(
+        self,
+        jds: Sequence[float],
+        planets: Optional[Sequence[Planet]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Geocentric tropical longitudes and daily speeds
+
+        Args:
+            jds: Julian days (UT)
+            planets: Planets to compute (default: all nine)
+
+        Returns:
+            (longitudes, speeds), each of shape (planets, jds)
+        """
+        planets = tuple(planets or Planet)
+        jds = np.atleast_1d(np.asarray(jds, dtype=float))
+        longitudes = np.empty((len(planets), len(jds)))
+        speeds = np.empty_like(longitudes)
+        for row, planet in enumerate(planets):
+            for column, jd in enumerate(jds):
+                longitudes[row, column], speeds[row, column] = \
+                    self.calculator.calculate_position_jd(float(jd), planet)
+        return longitudes, speeds
+
+    @instrument()
+    def calculate_arrays(
+        self,
+        jds: Sequence[float],
+        systems: Optional[Sequence[str]] = None,
+        planets: Optional[Sequence[Planet]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Sidereal longitudes of many planets and instants in several systems
+
+        Args:
+            jds: Julian days (UT)
+            systems: Ayanamsa systems (default: all supported)
+            planets: Planets to compute (default: all nine)
+
+        Returns:
+            Dictionary with ``ayanamsa`` (systems, jds), ``tropical`` and
+            ``speed`` (planets, jds) and ``longitude`` (systems, planets, jds)
+        """
+        systems = self._systems(systems)
+        jds = np.atleast_1d(np.asarray(jds, dtype=float))
+        tropical, speeds = self.tropical_positions(jds, planets)
+        ayanamsa = self.ayanamsa_manager.calculate_ayanamsa_matrix(jds, systems)
+        return {
+            'ayanamsa': ayanamsa,
+            'tropical': tropical,
+            'speed': speeds,
+            'longitude': np.mod(tropical[np.newaxis, :, :] - ayanamsa[:, np.newaxis, :], 360.0)
+        }
+
+    def calculate(
+        self,
+        date: datetime,
+        systems: Optional[Sequence[str]] = None,
+        planets: Optional[Sequence[Planet]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Sidereal positions at one moment in several ayanamsa systems
+
+        Args:
+            date: Moment (UTC)
+            systems: Ayanamsa systems (default: all supported)
+            planets: Planets to compute (default: all nine)
+
+        Returns:
+            Dictionary keyed by system with its ayanamsa and the longitude,
+            speed and retrograde flag of each planet
+        """
+        systems = self._systems(systems)
+        planets = tuple(planets or Planet)
+        jd = EnhancedAyanamsaManager._to_julian_day(date)
+        arrays = self.calculate_arrays([jd], systems, planets)
+
+        result = {}
+        for row, system in enumerate(systems):
+            result[system] = {
+                'ayanamsa': float(arrays['ayanamsa'][row, 0]),
+                'positions': {
+                    planet.name: {
+                        'longitude': float(arrays['longitude'][row, column, 0]),
+                        'speed': float(arrays['speed'][column, 0]),
+                        'is_retrograde': bool(arrays['speed'][column, 0] < 0)
+                    }
+                    for column, planet in enumerate(planets)
+                }
+            }
+        return result
@@ -3,6 +3,10 @@ from typing import Dict, Any, Optional, List
 import math
 from datetime import datetime
 
+from .rise_set import RiseSetService, rise_set_service
+from .divisional_kernel import VargaBatch
+from .strength_kernel import compute_strengths
+
 @dataclass
 class Planet:
     name: str
@@ -23,7 +27,10 @@ class Chart:
     aspects: List[Dict[str, Any]]
 
 class EnhancedPlanetaryStrengthEngine:
-    def __init__(self):
+    def __init__(self, rise_set: Optional[RiseSetService] = None):
+        # Sunrise/sunset source for day/night dependent strengths
+        self.rise_set = rise_set or rise_set_service
+        
         # Natural strengths of planets
         self.natural_strengths = {
             'Sun': 60,
@@ -157,9 +164,12 @@ class EnhancedPlanetaryStrengthEngine:
         # Positive speed (direct motion) is stronger than negative (retrograde)
         speed_strength = 50 + (min(abs(speed), 1) * 50 * (1 if speed >= 0 else -0.5))
         
-        # Calculate diurnal/nocturnal strength
-        # Divide zodiac into day (0-180) and night (180-360) portions
-        is_day = 0 <= longitude < 180
+        # Calculate diurnal/nocturnal strength from local sunrise/sunset when
+        # the chart carries birth time and location; otherwise divide the
+        # zodiac into day (0-180) and night (180-360) portions
+        is_day = self._is_day_birth(chart)
+        if is_day is None:
+            is_day = 0 <= longitude < 180
         
         # Define diurnal/nocturnal preferences for planets
         day_night_preferences = {
@@ -190,6 +200,29 @@ class EnhancedPlanetaryStrengthEngine:
         
         return max(0, min(100, strength))  # Clamp between 0 and 100
     
+    def _is_day_birth(self, chart: Dict[str, Any]) -> Optional[bool]:
+        """Whether the chart's birth falls between sunrise and sunset
+        
+        Uses an explicit ``is_day`` entry, or ``birth_time`` and ``location``
+        (object or dict with latitude/longitude) through the rise/set
+        service. Returns None when the chart carries neither.
+        """
+        if not isinstance(chart, dict):
+            return None
+        if chart.get("is_day") is not None:
+            return bool(chart["is_day"])
+        birth_time = chart.get("birth_time")
+        location = chart.get("location")
+        if birth_time is None or location is None:
+            return None
+        if isinstance(location, dict):
+            latitude, longitude = location["latitude"], location["longitude"]
+            altitude = location.get("altitude") or 0.0
+        else:
+            latitude, longitude = location.latitude, location.longitude
+            altitude = getattr(location, "altitude", 0.0) or 0.0
+        return self.rise_set.is_day(birth_time, latitude, longitude, altitude)
+    
     def _calculate_chesta_bala(self, planet: Dict[str, Any]) -> float:
         """Calculate motional strength"""
         # Get planet's speed
@@ -893,6 +926,33 @@ class EnhancedPlanetaryStrengthEngine:
             'total': total_strength
         }
 
+    def calculate_chart_strengths(
+        self,
+        chart: Dict[str, Any],
+        vargas: Optional[VargaBatch] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Complete strength profiles of every planet in the chart
+        
+        Evaluates all planets of ``chart["planets"]`` in one array pass;
+        each profile matches calculate_complete_strengths for that planet.
+        ``vargas`` is the chart's VargaBatch with varga degrees, in
+        ``chart["planets"]`` order (see
+        DivisionalChartEngine.calculate_varga_batch), to reuse for the
+        saptavarga positions instead of deriving them.
+        """
+        planets = chart.get("planets", {})
+        names = list(planets)
+        is_day = self._is_day_birth(chart)
+        batch = compute_strengths(
+            names,
+            [planets[name]["longitude"] for name in names],
+            [planets[name].get("speed", 0) for name in names],
+            [planets[name].get("house", 1) for name in names],
+            None if is_day is None else [is_day],
+            vargas
+        )
+        return batch.to_dict()
+
     def _calculate_yuddha_bala(self, planet: Dict[str, Any], chart: Dict[str, Any]) -> float:
         """Calculate war strength (planetary combat)"""
         # Get planet's longitude
@@ -0,0 +1,185 @@
+"""
+Incremental Strength Evaluation
+Strength profiles of a chart that changes a few planets at a time.
+
+Transit overlays recompute strengths frame after frame while only the fast
+planets move. The evaluator keeps every component of the last frame and,
+from the declared inputs of each component in the strength kernel (the
+planet's own longitude, house and speed, the chart's day/night, and the
+separations to other planets), recomputes only the components a change of
+positions can affect. Pairwise components are recomputed only for planets
+that had another planet within one of their aspect or combat zones before
+or after the move.
+
+Frames known in advance, such as a transit overlay over a fixed period,
+are cheaper as one (frames, planets) call of compute_strengths: at nine
+planets per-call array overhead outweighs the components saved, so the
+evaluator suits frames that arrive one at a time.
+"""
+
+from typing import Any, Dict, Optional
+import logging
+
+import numpy as np
+
+from .strength_kernel import (
+    PAIR_COMPONENTS, PLANET_COMPONENTS, StrengthBatch, aggregate_strengths,
+    get_planet_tables, planet_inputs, separation_matrix
+)
+
+logger = logging.getLogger(__name__)
+
+# Marks an update that keeps the chart's day/night
+KEEP = object()
+
+INPUTS = ('longitude', 'speed', 'house')
+
+
+class IncrementalStrengthEvaluator:
+    """Strength profiles of one chart, updated from position deltas"""
+
+    def __init__(self, planets: Dict[str, Dict[str, Any]], is_day: Optional[bool] = None):
+        """
+        Evaluate every component of the initial chart
+
+        Args:
+            planets: Planet name to longitude, speed and house, as in the
+                chart dictionaries of EnhancedPlanetaryStrengthEngine
+            is_day: Whether the chart is a day birth; when None each
+                planet's longitude decides, as in the engine
+        """
+        self.planets = tuple(planets)
+        self._columns = {name: column for column, name in enumerate(self.planets)}
+        self._tables = get_planet_tables(self.planets)
+        self._others = ~np.eye(len(self.planets), dtype=bool)
+        self._is_day = is_day
+        self._values = {
+            'longitude': np.array([[planets[name]['longitude'] for name in self.planets]], dtype=float),
+            'speed': np.array([[planets[name].get('speed', 0) for name in self.planets]], dtype=float),
+            'house': np.array([[planets[name].get('house', 1) for name in self.planets]], dtype=int)
+        }
+        self._separations = separation_matrix(self._values['longitude'])
+
+        inputs = self._inputs()
+        self._components = {
+            name: np.array(evaluate(self._tables, inputs), dtype=float)
+            for name, (_, evaluate) in PLANET_COMPONENTS.items()
+        }
+        for name, (_, evaluate) in PAIR_COMPONENTS.items():
+            self._components[name] = evaluate(self._tables, self._separations, self._others)
+        self._totals = aggregate_strengths(self._components)
+
+        # Component values recomputed and kept over all updates
+        self.evaluated = 0
+        self.reused = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of component values kept from the previous frame"""
+        total = self.evaluated + self.reused
+        return self.reused / total if total else 0.0
+
+    def _inputs(self, columns: Optional[np.ndarray] = None):
+        longitudes, speeds, houses = (self._values[key] for key in INPUTS)
+        if columns is not None:
+            longitudes, speeds, houses = longitudes[:, columns], speeds[:, columns], houses[:, columns]
+        is_day = longitudes < 180 if self._is_day is None else np.full((1, 1), self._is_day)
+        return planet_inputs(longitudes, speeds, houses, is_day)
+
+    def update(
+        self,
+        changes: Optional[Dict[str, Dict[str, Any]]] = None,
+        is_day: Any = KEEP
+    ) -> StrengthBatch:
+        """
+        Apply position changes and recompute the affected components
+
+        Args:
+            changes: Planet name to the changed longitude, speed and/or house
+            is_day: New day/night of the chart (default: unchanged)
+
+        Returns:
+            StrengthBatch of the new frame
+        """
+        changed = {key: np.zeros(len(self.planets), dtype=bool) for key in INPUTS + ('day',)}
+        previous = self._values['longitude'].copy()
+        for name, values in (changes or {}).items():
+            if name not in self._columns:
+                raise ValueError(f"Unknown planet: {name}")
+            column = self._columns[name]
+            for key in INPUTS:
+                if key in values and values[key] != self._values[key][0, column]:
+                    self._values[key][0, column] = values[key]
+                    changed[key][column] = True
+
+        if is_day is not KEEP and is_day != self._is_day:
+            self._is_day = is_day
+            changed['day'][:] = True
+        elif self._is_day is None:
+            changed['day'] |= (previous[0] < 180) != (self._values['longitude'][0] < 180)
+
+        # Components sharing the affected planets share their inputs
+        groups = {}
+        for name, (depends_on, evaluate) in PLANET_COMPONENTS.items():
+            affected = np.zeros(len(self.planets), dtype=bool)
+            for key in depends_on:
+                affected |= changed[key]
+            groups.setdefault(affected.tobytes(), (affected, []))[1].append(name)
+        for affected, names in groups.values():
+            columns = np.flatnonzero(affected)
+            if len(columns):
+                tables = self._tables.take(columns)
+                inputs = self._inputs(columns)
+                for name in names:
+                    self._replace(name, columns, PLANET_COMPONENTS[name][1](tables, inputs))
+            self._count(len(columns), len(names))
+
+        moved = changed['longitude']
+        if not moved.any():
+            self._count(0, len(PAIR_COMPONENTS))
+        else:
+            separations = separation_matrix(self._values['longitude'])
+            for name, (zone, evaluate) in PAIR_COMPONENTS.items():
+                # A pair matters when one planet moved and the other was or
+                # is within the zone
+                pairs = (zone(self._separations[0][:, moved]) | zone(separations[0][:, moved]))
+                pairs &= self._others[:, moved]
+                affected = pairs.any(axis=1)
+                affected[moved] |= pairs.any(axis=0)
+                columns = np.flatnonzero(affected)
+                if len(columns):
+                    self._replace(name, columns, evaluate(
+                        self._tables, separations[:, columns, :], self._others[columns]
+                    ))
+                self._count(len(columns), 1)
+            self._separations = separations
+
+        self._totals = aggregate_strengths(self._components)
+        return self.batch()
+
+    def _replace(self, name: str, columns: np.ndarray, values: np.ndarray) -> None:
+        # Copy on write, so batches of earlier frames keep their values
+        component = self._components[name].copy()
+        component[:, columns] = values
+        self._components[name] = component
+
+    def _count(self, planets: int, components: int) -> None:
+        self.evaluated += planets * components
+        self.reused += (len(self.planets) - planets) * components
+
+    def batch(self) -> StrengthBatch:
+        """Strength arrays of the current frame, (1, planets) each"""
+        shadbala, vimshopaka, special, relative, total = self._totals
+        return StrengthBatch(
+            planets=self.planets,
+            components=dict(self._components),
+            shadbala=shadbala,
+            vimshopaka=vimshopaka,
+            special_strength=special,
+            relative_strength=relative,
+            total=total
+        )
+
+    def profiles(self) -> Dict[str, Dict[str, Any]]:
+        """Complete strength profiles of the current frame"""
+        return self.batch().to_dict()
@@ -0,0 +1,621 @@
+"""
+Strength Kernel
+Array evaluation of the planetary strength profile.
+
+Computes every component of
+``EnhancedPlanetaryStrengthEngine.calculate_complete_strengths`` for all
+planets of many charts at once. The per-planet rules are compiled into
+array tables (sign strengths, dignity classes, own signs, exaltation points,
+moolatrikona ranges, directional and temporal preferences) indexed by
+planet row and sign, so a batch is evaluated with table lookups and
+elementwise arithmetic instead of dictionary lookups and branches per
+planet. Planets without rules of their own use the same defaults as the
+engine.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from app.core.monitoring.instrumentation import instrument
+from .divisional_kernel import VargaBatch
+
+logger = logging.getLogger(__name__)
+
+CLASSICAL_PLANETS = ('Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn')
+
+# Strength of each planet in the twelve signs (Aries first)
+SIGN_STRENGTHS = {
+    'Sun': (60, 70, 50, 40, 100, 50, 20, 40, 80, 30, 70, 60),
+    'Moon': (50, 100, 60, 90, 50, 40, 50, 20, 70, 40, 60, 70),
+    'Mars': (90, 50, 40, 30, 70, 50, 40, 90, 100, 100, 60, 40),
+    'Mercury': (40, 70, 90, 60, 50, 90, 100, 40, 50, 20, 70, 60),
+    'Jupiter': (70, 60, 20, 100, 60, 40, 50, 50, 90, 40, 40, 90),
+    'Venus': (20, 90, 70, 60, 40, 100, 90, 50, 40, 60, 50, 70),
+    'Saturn': (20, 40, 60, 50, 30, 70, 100, 50, 40, 90, 90, 40)
+}
+
+# Exaltation point (sign, degree)
+EXALTATION_POINTS = {
+    'Sun': (0, 10),
+    'Moon': (1, 3),
+    'Mars': (9, 28),
+    'Mercury': (5, 15),
+    'Jupiter': (3, 5),
+    'Venus': (11, 27),
+    'Saturn': (6, 20)
+}
+
+# Moolatrikona (sign, start degree, end degree)
+MOOLATRIKONA_RANGES = {
+    'Sun': (4, 0, 20),
+    'Moon': (1, 3, 30),
+    'Mars': (0, 0, 12),
+    'Mercury': (5, 15, 20),
+    'Jupiter': (8, 0, 10),
+    'Venus': (6, 0, 15),
+    'Saturn': (10, 0, 20)
+}
+
+OWN_SIGNS = {
+    'Sun': (4,),
+    'Moon': (3,),
+    'Mars': (0, 7),
+    'Mercury': (2, 5),
+    'Jupiter': (8, 11),
+    'Venus': (1, 6),
+    'Saturn': (9, 10)
+}
+
+# Dignity (exaltation, debilitation, own signs, friendly signs, enemy signs)
+DIGNITIES = {
+    'Sun': (0, 6, (4,), (0, 8), (10, 11)),
+    'Moon': (1, 7, (3,), (2, 4), (5, 6)),
+    'Mars': (9, 3, (0, 7), (4, 8), (1, 2)),
+    'Mercury': (5, 11, (2, 5), (1, 4), (7, 8)),
+    'Jupiter': (3, 9, (8, 11), (0, 4), (5, 6)),
+    'Venus': (11, 5, (1, 6), (3, 9), (7, 8)),
+    'Saturn': (6, 0, (9, 10), (2, 5), (3, 4))
+}
+
+# Dignity base strength by class; the position in the sign adds up to 10
+DIGNITY_BASES = {
+    'exaltation': 90, 'debilitation': 0, 'own_sign': 70,
+    'friend': 50, 'enemy': 20, 'neutral': 40
+}
+
+# Directional strength (best house, worst house)
+DIRECTIONAL_HOUSES = {
+    'Sun': (10, 4),
+    'Moon': (4, 10),
+    'Mars': (10, 4),
+    'Mercury': (1, 7),
+    'Jupiter': (1, 7),
+    'Venus': (4, 10),
+    'Saturn': (7, 1)
+}
+
+# Day (1), night (-1) or either (0) preference for kala bala
+DAY_NIGHT_PREFERENCES = {
+    'Sun': 1, 'Moon': -1, 'Mars': -1, 'Mercury': 0,
+    'Jupiter': 1, 'Venus': -1, 'Saturn': -1
+}
+
+TYPICAL_SPEEDS = {
+    'Sun': 1.0, 'Moon': 13.0, 'Mars': 0.5, 'Mercury': 1.2,
+    'Jupiter': 0.1, 'Venus': 1.0, 'Saturn': 0.03
+}
+
+NATURAL_STRENGTHS = {
+    'Sun': 100, 'Moon': 85, 'Mars': 70, 'Mercury': 60,
+    'Jupiter': 75, 'Venus': 65, 'Saturn': 50
+}
+
+BENEFIC_NAKSHATRAS = (0, 3, 5, 7, 10, 12, 15, 17, 20, 22, 25)
+MALEFIC_NAKSHATRAS = (1, 4, 6, 9, 11, 14, 16, 19, 21, 24, 26)
+
+# Vimshopaka aspects: angle -> strength, received with a 6 degree orb
+VIMSHOPAKA_ASPECTS = ((0, 100), (60, 75), (120, 100), (180, 25))
+VIMSHOPAKA_ORB = 6
+BENEFICS = ('Jupiter', 'Venus', 'Mercury', 'Moon')
+MALEFICS = ('Saturn', 'Mars', 'Sun')
+
+# Drik bala aspects: angle -> strength, scaled by exactness within 8 degrees
+DRIK_ASPECTS = ((0, 100), (60, 50), (90, 25), (120, 75), (180, 50))
+DRIK_ORB = 8
+
+# Saptavargaja bala: (multiplier, upper bounds, strengths) per varga
+SAPTAVARGA_STEPS = (
+    (1, (10, 20), (100, 75, 50)),
+    (2, (15,), (100, 75)),
+    (3, (10, 20), (100, 75, 50)),
+    (4, (7.5, 15, 22.5), (100, 75, 50, 25)),
+    (7, (4.3, 8.6, 12.9, 17.2, 21.5, 25.8), (100, 85, 70, 55, 40, 25, 10)),
+    (9, (3.33, 6.66, 10, 13.33, 16.66, 20, 23.33, 26.66), (100, 90, 80, 70, 60, 50, 40, 30, 20)),
+    (12, (2.5, 5, 7.5, 10, 12.5, 15, 17.5, 20, 22.5, 25), (100, 90, 80, 70, 60, 50, 40, 30, 20, 10, 0))
+)
+
+# Vargas of saptavargaja bala, in SAPTAVARGA_STEPS order
+SAPTAVARGA_DIVISIONS = tuple(division for division, _, _ in SAPTAVARGA_STEPS)
+
+SHADBALA_COMPONENTS = ('sthana_bala', 'dig_bala', 'kala_bala', 'chesta_bala', 'naisargika_bala', 'drik_bala')
+VIMSHOPAKA_COMPONENTS = (
+    'sign_position', 'nakshatra_position', 'navamsa_position', 'aspect_strength', 'dignity_strength'
+)
+SPECIAL_COMPONENTS = ('yuddha_bala', 'kendradi_bala', 'drekkana_bala', 'saptavargaja_bala')
+
+# Theoretical maximum the weighted totals are related to
+BASELINE_STRENGTH = 600
+
+
+@dataclass(frozen=True)
+class PlanetTables:
+    """Strength rules of a planet sequence as arrays indexed by planet row"""
+    sign_strengths: np.ndarray  # (planets, 12)
+    own_signs: np.ndarray  # (planets, 12) bool
+    dignity_bases: np.ndarray  # (planets, 12)
+    exaltation_points: np.ndarray  # (planets,) degrees
+    moolatrikona: np.ndarray  # (planets, 3) sign, start, end
+    directional_houses: np.ndarray  # (planets, 2) best, worst
+    day_night: np.ndarray  # (planets,) 1 day, -1 night, 0 either
+    typical_speeds: np.ndarray  # (planets,)
+    natural_strengths: np.ndarray  # (planets,)
+    aspect_weights: np.ndarray  # (planets,) factor of aspects cast by the planet
+
+    def take(self, rows: np.ndarray) -> 'PlanetTables':
+        """Tables of a subset of the planets"""
+        return PlanetTables(**{name: array[rows] for name, array in vars(self).items()})
+
+
+def _dignity_row(name: str) -> np.ndarray:
+    if name not in DIGNITIES:
+        return np.full(12, DIGNITY_BASES['neutral'], dtype=float)
+    exaltation, debilitation, own, friends, enemies = DIGNITIES[name]
+    row = np.full(12, DIGNITY_BASES['neutral'], dtype=float)
+    # Lowest precedence first so exaltation wins where classes overlap
+    row[list(enemies)] = DIGNITY_BASES['enemy']
+    row[list(friends)] = DIGNITY_BASES['friend']
+    row[list(own)] = DIGNITY_BASES['own_sign']
+    row[debilitation] = DIGNITY_BASES['debilitation']
+    row[exaltation] = DIGNITY_BASES['exaltation']
+    return row
+
+
+@lru_cache(maxsize=32)
+def get_planet_tables(planets: Tuple[str, ...]) -> PlanetTables:
+    """
+    Compile the strength rules for a planet sequence
+
+    Args:
+        planets: Planet names in column order
+
+    Returns:
+        PlanetTables with one row per planet
+    """
+    def rows(table, default):
+        return [table.get(name, default) for name in planets]
+
+    own_signs = np.zeros((len(planets), 12), dtype=bool)
+    for row, signs in enumerate(rows(OWN_SIGNS, OWN_SIGNS['Sun'])):
+        own_signs[row, list(signs)] = True
+
+    tables = PlanetTables(
+        sign_strengths=np.array(rows(SIGN_STRENGTHS, SIGN_STRENGTHS['Sun']), dtype=float).reshape(-1, 12),
+        own_signs=own_signs,
+        dignity_bases=np.array([_dignity_row(name) for name in planets]).reshape(-1, 12),
+        exaltation_points=np.array(
+            [sign * 30 + degree for sign, degree in rows(EXALTATION_POINTS, EXALTATION_POINTS['Sun'])], dtype=float
+        ),
+        moolatrikona=np.array(rows(MOOLATRIKONA_RANGES, MOOLATRIKONA_RANGES['Sun']), dtype=float).reshape(-1, 3),
+        directional_houses=np.array(rows(DIRECTIONAL_HOUSES, DIRECTIONAL_HOUSES['Sun'])).reshape(-1, 2),
+        day_night=np.array(rows(DAY_NIGHT_PREFERENCES, 0)),
+        typical_speeds=np.array(rows(TYPICAL_SPEEDS, 1.0), dtype=float),
+        natural_strengths=np.array(rows(NATURAL_STRENGTHS, 50), dtype=float),
+        aspect_weights=np.array(
+            [1.0 if name in BENEFICS else 0.5 if name in MALEFICS else 0.75 for name in planets]
+        )
+    )
+    for array in vars(tables).values():
+        array.flags.writeable = False
+    return tables
+
+
+@dataclass(frozen=True)
+class StrengthBatch:
+    """Strength profiles of all planets of a batch of charts"""
+    planets: Tuple[str, ...]
+    components: Dict[str, np.ndarray]  # component -> (charts, planets)
+    shadbala: np.ndarray  # (charts, planets) weighted totals
+    vimshopaka: np.ndarray
+    special_strength: np.ndarray
+    relative_strength: np.ndarray
+    total: np.ndarray
+
+    def to_dict(self, chart: int = 0) -> Dict[str, Dict[str, Any]]:
+        """
+        Strength profiles of one chart
+
+        Args:
+            chart: Row of the chart in the batch
+
+        Returns:
+            Dictionary mapping planet name to the profile returned by
+            calculate_complete_strengths
+        """
+        values = {name: array[chart].tolist() for name, array in self.components.items()}
+        totals = {
+            name: getattr(self, name)[chart].tolist()
+            for name in ('shadbala', 'vimshopaka', 'special_strength', 'relative_strength', 'total')
+        }
+        profiles = {}
+        for column, planet in enumerate(self.planets):
+            def group(names):
+                return {name: values[name][column] for name in names}
+            profiles[planet] = {
+                'shadbala': group(SHADBALA_COMPONENTS),
+                'vimshopaka': group(VIMSHOPAKA_COMPONENTS),
+                'special_strength': group(SPECIAL_COMPONENTS),
+                'component_strengths': {
+                    'shadbala': totals['shadbala'][column],
+                    'vimshopaka': totals['vimshopaka'][column],
+                    'special_strength': totals['special_strength'][column],
+                    'dignity': values['dignity_strength'][column]
+                },
+                'relative_strength': totals['relative_strength'][column],
+                'total': totals['total'][column]
+            }
+        return profiles
+
+
+def separation_matrix(longitudes: np.ndarray) -> np.ndarray:
+    """Pairwise angular distances (charts, planets, others) in 0-180"""
+    distance = np.abs(longitudes[:, :, np.newaxis] - longitudes[:, np.newaxis, :])
+    return np.where(distance > 180, 360 - distance, distance)
+
+
+def _sthana_bala(tables: PlanetTables, signs: np.ndarray, degrees: np.ndarray) -> np.ndarray:
+    rows = np.arange(signs.shape[1])
+    sign_strength = tables.sign_strengths[rows, signs]
+
+    # Exaltation: 100 at the exaltation point falling to 0 opposite it
+    position = signs * 30 + degrees
+    distance = np.abs(position - tables.exaltation_points)
+    distance = np.minimum(distance, np.abs(position - (tables.exaltation_points + 360)))
+    distance = np.minimum(distance, np.abs(position - (tables.exaltation_points - 360)))
+    exaltation = 100 - (np.minimum(distance, 180) / 180) * 100
+
+    # Moolatrikona: 75-100 inside the range, peaking at its centre
+    sign, start, end = tables.moolatrikona.T
+    inside = (signs == sign) & (start <= degrees) & (degrees <= end)
+    half = (end - start) / 2
+    moolatrikona = np.where(inside, 100 - (np.abs(degrees - start - half) / half) * 25, 50)
+
+    # Own sign: 80-100, peaking mid-sign
+    own = np.where(tables.own_signs[rows, signs], 100 - (np.abs(degrees - 15) / 15) * 20, 50)
+
+    return sign_strength + exaltation + moolatrikona + own
+
+
+def _dig_bala(tables: PlanetTables, houses: np.ndarray) -> np.ndarray:
+    def house_distance(target):
+        return np.minimum(
+            np.minimum(np.abs(houses - target), np.abs(houses - (target + 12))),
+            np.abs(houses - (target - 12))
+        )
+    best = house_distance(tables.directional_houses[:, 0])
+    worst = house_distance(tables.directional_houses[:, 1])
+    strength = np.where(best < worst, 100 - (best / 6) * 50, 50 - (worst / 6) * 50)
+    return np.clip(strength, 0, 100)
+
+
+def _kala_bala(tables: PlanetTables, speeds: np.ndarray, is_day: np.ndarray) -> np.ndarray:
+    speed_strength = 50 + np.minimum(np.abs(speeds), 1) * 50 * np.where(speeds >= 0, 1, -0.5)
+    preferred = np.where(is_day, 1, -1) == tables.day_night
+    day_night = np.where(tables.day_night == 0, 75, np.where(preferred, 100, 50))
+    return np.clip(speed_strength * 0.6 + day_night * 0.4, 0, 100)
+
+
+def _chesta_bala(tables: PlanetTables, speeds: np.ndarray) -> np.ndarray:
+    ratio = np.abs(speeds) / tables.typical_speeds
+    direct = np.where(ratio > 1, 100, 50 + ratio * 50)
+    retrograde = np.where(ratio > 1, 0, 50 - ratio * 50)
+    return np.clip(np.where(speeds >= 0, direct, retrograde), 0, 100)
+
+
+def _drik_bala(separations: np.ndarray, others: np.ndarray) -> np.ndarray:
+    total = np.zeros(separations.shape[:2])
+    count = np.zeros(separations.shape[:2])
+    for angle, strength in DRIK_ASPECTS:
+        deviation = np.abs(separations - angle)
+        aspecting = (deviation <= DRIK_ORB) & others
+        total += np.where(aspecting, strength * (1 - deviation / DRIK_ORB), 0).sum(axis=2)
+        count += aspecting.sum(axis=2)
+    strength = np.where(count > 0, total / np.maximum(count, 1), 50)
+    return np.clip(strength, 0, 100)
+
+
+def _aspect_strength(tables: PlanetTables, separations: np.ndarray, others: np.ndarray) -> np.ndarray:
+    # Aspects received are folded in one at a time as running averages,
+    # (total + strength) / 2 starting from 50, in the order of the chart's
+    # planets. The k-th of n aspects therefore carries weight 2^-(n-k+1).
+    received = np.zeros(separations.shape)
+    aspecting = np.zeros(separations.shape, dtype=bool)
+    for angle, strength in VIMSHOPAKA_ASPECTS:
+        within = (np.abs(separations - angle) <= VIMSHOPAKA_ORB) & others
+        received = np.where(within, strength * tables.aspect_weights, received)
+        aspecting |= within
+    count = aspecting.sum(axis=2)
+    rank = np.cumsum(aspecting, axis=2)
+    weights = np.where(aspecting, np.exp2(rank - count[:, :, np.newaxis] - 1), 0)
+    strength = 50 * np.exp2(-count) + (weights * received).sum(axis=2)
+    return np.clip(strength, 0, 100)
+
+
+def _yuddha_bala(separations: np.ndarray, others: np.ndarray) -> np.ndarray:
+    change = np.select(
+        [separations < 1, separations < 3, separations < 10, (170 < separations) & (separations < 190)],
+        [-25, -15, -5, 10],
+        0
+    )
+    return np.clip(50 + np.where(others, change, 0).sum(axis=2), 0, 100)
+
+
+def _sign_position_strength(degrees: np.ndarray) -> np.ndarray:
+    middle = 75 - ((degrees - 15) / 10) ** 2 * 25
+    strength = np.where(
+        degrees <= 5, 75 + (degrees / 5) * 25,
+        np.where(degrees >= 25, 50 - ((degrees - 25) / 5) * 25, middle)
+    )
+    return np.clip(strength, 0, 100)
+
+
+_NAKSHATRA_BASES = np.array([
+    75 if index in BENEFIC_NAKSHATRAS else 25 if index in MALEFIC_NAKSHATRAS else 50
+    for index in range(27)
+], dtype=float)
+
+
+def _nakshatra_strength(longitudes: np.ndarray) -> np.ndarray:
+    nakshatra = np.mod(longitudes * 27 / 360, 27)
+    position = np.mod(nakshatra, 1) * 100
+    base = _NAKSHATRA_BASES[nakshatra.astype(int)]
+    strength = np.where(position < 25, base + 25, np.where(position > 75, base - 25, base))
+    return np.clip(strength, 0, 100)
+
+
+def _navamsa_strength(navamsa: np.ndarray) -> np.ndarray:
+    # navamsa: navamsa number within the sign plus the fraction through it
+    third = np.minimum(navamsa // 3, 2)
+    strength = 100 - third * 25 - ((navamsa - third * 3) / 3) * 25
+    return np.clip(strength, 0, 100)
+
+
+def _dignity_strength(tables: PlanetTables, signs: np.ndarray, degrees: np.ndarray) -> np.ndarray:
+    bases = tables.dignity_bases[np.arange(signs.shape[1]), signs]
+    return np.clip(bases + degrees / 3, 0, 100)
+
+
+def _kendradi_bala(houses: np.ndarray) -> np.ndarray:
+    return np.choose(np.mod(houses - 1, 3), [100.0, 75.0, 50.0])
+
+
+def _drekkana_bala(degrees: np.ndarray) -> np.ndarray:
+    base = np.choose(np.minimum((degrees / 10).astype(int), 2), [100.0, 75.0, 50.0])
+    within = np.mod(degrees, 10)
+    strength = np.where(within < 3, base, np.where(within < 7, base - 10, base - 20))
+    return np.clip(strength, 0, 100)
+
+
+def _step_tables():
+    width = max(len(bounds) for _, bounds, _ in SAPTAVARGA_STEPS)
+    bounds = np.full((len(SAPTAVARGA_STEPS), width), np.inf)
+    strengths = np.zeros((len(SAPTAVARGA_STEPS), width + 1))
+    for row, (_, limits, values) in enumerate(SAPTAVARGA_STEPS):
+        bounds[row, :len(limits)] = limits
+        strengths[row, :len(values)] = values
+    return bounds, strengths
+
+
+# Upper bounds of the steps of each varga, padded with infinity, and the
+# strength of each step
+_SAPTAVARGA_BOUNDS, _SAPTAVARGA_STRENGTHS = _step_tables()
+_SAPTAVARGA_MULTIPLIERS = np.array(SAPTAVARGA_DIVISIONS, dtype=float)
+
+
+def _saptavargaja_bala(degrees: np.ndarray) -> np.ndarray:
+    # degrees: (charts, planets, vargas) positions within the varga signs
+    steps = (degrees[..., np.newaxis] >= _SAPTAVARGA_BOUNDS).sum(axis=-1)
+    return _SAPTAVARGA_STRENGTHS[np.arange(len(SAPTAVARGA_DIVISIONS)), steps].mean(axis=-1)
+
+
+def varga_positions(vargas: VargaBatch) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Saptavarga inputs from precomputed divisional placements
+
+    Args:
+        vargas: Divisional batch with varga degrees covering the saptavarga
+            divisions
+
+    Returns:
+        (degrees within each saptavarga sign (charts, planets, 7),
+        navamsa number within the sign plus fraction (charts, planets))
+    """
+    if vargas.degrees is None:
+        raise ValueError("Saptavarga positions need a batch computed with varga degrees")
+    columns = {division: column for column, division in enumerate(vargas.divisions)}
+    missing = [division for division in SAPTAVARGA_DIVISIONS if division not in columns]
+    if missing:
+        raise ValueError(f"Vargas lack divisions {missing}")
+
+    degrees = vargas.degrees[..., [columns[division] for division in SAPTAVARGA_DIVISIONS]]
+    return degrees, degrees[..., 0] * 9 / 30
+
+
+class PlanetInputs(NamedTuple):
+    """Inputs of the single-planet components, (charts, planets) each"""
+    longitudes: np.ndarray
+    speeds: np.ndarray
+    houses: np.ndarray
+    is_day: np.ndarray
+    signs: np.ndarray
+    degrees: np.ndarray
+    varga_degrees: np.ndarray  # (charts, planets, 7) degrees within the saptavarga signs
+    navamsa: np.ndarray
+
+
+def planet_inputs(
+    longitudes: np.ndarray,
+    speeds: np.ndarray,
+    houses: np.ndarray,
+    is_day: np.ndarray,
+    vargas: Optional[VargaBatch] = None
+) -> PlanetInputs:
+    """
+    Bundle the single-planet inputs with the derived sign placements
+
+    Saptavarga and navamsa positions are taken from ``vargas`` when given
+    and derived from the longitudes otherwise.
+    """
+    if vargas is None:
+        varga_degrees = np.mod(longitudes[..., np.newaxis] * _SAPTAVARGA_MULTIPLIERS, 30)
+        navamsa = np.mod(longitudes * 9 / 30, 9)
+    else:
+        varga_degrees, navamsa = varga_positions(vargas)
+    return PlanetInputs(
+        longitudes, speeds, houses, is_day, (longitudes / 30).astype(int), np.mod(longitudes, 30),
+        varga_degrees, navamsa
+    )
+
+
+# Single-planet components: the planet's own inputs each one reads
+# ('day' is the chart's day/night, or the planet's longitude when unknown)
+# and its evaluation over PlanetInputs.
+PLANET_COMPONENTS: Dict[str, Tuple[Tuple[str, ...], Callable[[PlanetTables, PlanetInputs], np.ndarray]]] = {
+    'sthana_bala': (('longitude',), lambda tables, x: _sthana_bala(tables, x.signs, x.degrees)),
+    'dig_bala': (('house',), lambda tables, x: _dig_bala(tables, x.houses)),
+    'kala_bala': (('speed', 'day'), lambda tables, x: _kala_bala(tables, x.speeds, x.is_day)),
+    'chesta_bala': (('speed',), lambda tables, x: _chesta_bala(tables, x.speeds)),
+    'naisargika_bala': ((), lambda tables, x: np.broadcast_to(tables.natural_strengths, x.longitudes.shape)),
+    'sign_position': (('longitude',), lambda tables, x: _sign_position_strength(x.degrees)),
+    'nakshatra_position': (('longitude',), lambda tables, x: _nakshatra_strength(x.longitudes)),
+    'navamsa_position': (('longitude',), lambda tables, x: _navamsa_strength(x.navamsa)),
+    'dignity_strength': (('longitude',), lambda tables, x: _dignity_strength(tables, x.signs, x.degrees)),
+    'kendradi_bala': (('house',), lambda tables, x: _kendradi_bala(x.houses)),
+    'drekkana_bala': (('longitude',), lambda tables, x: _drekkana_bala(x.degrees)),
+    'saptavargaja_bala': (('longitude',), lambda tables, x: _saptavargaja_bala(x.varga_degrees))
+}
+
+
+def _within(separations: np.ndarray, aspects, orb: float) -> np.ndarray:
+    angles = np.array([angle for angle, _ in aspects], dtype=float)
+    return (np.abs(separations[..., np.newaxis] - angles) <= orb).any(axis=-1)
+
+
+# Pairwise components: the separations at which another planet contributes
+# to the value at all, and the evaluation over (charts, planets, others)
+# separations. A planet outside the zone before and after a move leaves the
+# value unchanged.
+PAIR_COMPONENTS: Dict[str, Tuple[Callable[[np.ndarray], np.ndarray], Callable[..., np.ndarray]]] = {
+    'drik_bala': (
+        lambda separations: _within(separations, DRIK_ASPECTS, DRIK_ORB),
+        lambda tables, separations, others: _drik_bala(separations, others)
+    ),
+    'aspect_strength': (
+        lambda separations: _within(separations, VIMSHOPAKA_ASPECTS, VIMSHOPAKA_ORB),
+        _aspect_strength
+    ),
+    'yuddha_bala': (
+        lambda separations: (separations < 10) | (separations > 170),
+        lambda tables, separations, others: _yuddha_bala(separations, others)
+    )
+}
+
+
+def aggregate_strengths(components: Dict[str, np.ndarray]) -> Tuple[np.ndarray, ...]:
+    """
+    Weighted totals of a set of component arrays
+
+    Returns:
+        (shadbala, vimshopaka, special_strength, relative_strength, total)
+    """
+    def weighted(names, weight):
+        total = np.zeros(np.shape(components[names[0]]))
+        for name in names:
+            total = total + components[name]
+        return total * weight
+
+    shadbala = weighted(SHADBALA_COMPONENTS, 0.4)
+    vimshopaka = weighted(VIMSHOPAKA_COMPONENTS, 0.3)
+    special = weighted(SPECIAL_COMPONENTS, 0.3)
+    relative = (shadbala + vimshopaka + special) / BASELINE_STRENGTH
+
+    # Debilitated planets are capped at twice their dignity strength
+    dignity = components['dignity_strength']
+    total = np.where(dignity < 10, dignity * 2, np.minimum(100, (relative * 0.6 + dignity * 0.4) * 100))
+    return shadbala, vimshopaka, special, relative, total
+
+
+@instrument()
+def compute_strengths(
+    planets: Sequence[str],
+    longitudes: np.ndarray,
+    speeds: np.ndarray,
+    houses: np.ndarray,
+    is_day: Optional[np.ndarray] = None,
+    vargas: Optional[VargaBatch] = None
+) -> StrengthBatch:
+    """
+    Complete strength profiles of all planets of many charts
+
+    Args:
+        planets: Planet names in column order; the planets of each chart
+            aspect and fight each other
+        longitudes: Sidereal longitudes, (charts, planets) or (planets,)
+        speeds: Daily motions in degrees, same shape as longitudes
+        houses: House numbers 1-12, same shape as longitudes
+        is_day: Whether each chart is a day birth, (charts,); when omitted
+            each planet's longitude decides, as in the engine
+        vargas: Divisional placements of the same charts and planets already
+            computed elsewhere (see varga_positions); saptavargaja bala and
+            navamsa strength read them instead of deriving their own
+
+    Returns:
+        StrengthBatch with (charts, planets) arrays
+    """
+    planets = tuple(planets)
+    longitudes = np.asarray(longitudes, dtype=float)
+    if longitudes.ndim == 1:
+        longitudes = longitudes[np.newaxis, :]
+    if longitudes.ndim != 2 or longitudes.shape[1] != len(planets):
+        raise ValueError("Longitudes must be a (charts, planets) array matching the planet names")
+    speeds = np.broadcast_to(np.asarray(speeds, dtype=float), longitudes.shape)
+    houses = np.broadcast_to(np.asarray(houses, dtype=int), longitudes.shape)
+    if is_day is None:
+        is_day = longitudes < 180
+    else:
+        is_day = np.asarray(is_day, dtype=bool).reshape(-1, 1)
+
+    tables = get_planet_tables(planets)
+    if vargas is not None and vargas.signs.shape[:2] != longitudes.shape:
+        raise ValueError("Vargas must cover the same charts and planets")
+    inputs = planet_inputs(longitudes, speeds, houses, is_day, vargas)
+    separations = separation_matrix(longitudes)
+    others = ~np.eye(len(planets), dtype=bool)
+
+    components = {name: evaluate(tables, inputs) for name, (_, evaluate) in PLANET_COMPONENTS.items()}
+    for name, (_, evaluate) in PAIR_COMPONENTS.items():
+        components[name] = evaluate(tables, separations, others)
+    shadbala, vimshopaka, special, relative, total = aggregate_strengths(components)
+
+    return StrengthBatch(
+        planets=planets,
+        components=components,
+        shadbala=shadbala,
+        vimshopaka=vimshopaka,
+        special_strength=special,
+        relative_strength=relative,
+        total=total
+    )
@@ -0,0 +1,332 @@
+"""
+Precompiled Varga Lookup Tables
+
+Every divisional chart splits each sign into equal segments and sends each
+(sign, segment) cell to a target sign. The tables below are compiled once at
+import time for every supported division, so mapping longitudes to vargas
+is a few array indexing operations instead of per-planet branching.
+
+Two rule sets are compiled, one per divisional engine:
+
+* ``divisional``: the D1-D60 rules of ``DivisionalChartEngine``. Each output
+  is the start of the segment (step index times a fixed step in degrees),
+  which for most divisions is not the start of a sign.
+* ``enhanced``: the D1-D40 rules of ``EnhancedDivisionalChartEngine`` with the
+  special navamsa (element starts), dwadasamsa and trimsamsa (odd/even
+  planet sequences) rules; ``enhanced_standard`` is the same engine without
+  special rules. Outputs are the target sign, plus for the special rules the
+  position within the segment spread over the target sign.
+
+A flat table at arc-second resolution (one row of signs per arc-second of
+the zodiac) can be written to disk and memory-mapped by worker processes.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Union
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DIVISIONAL = 'divisional'
+ENHANCED = 'enhanced'
+ENHANCED_STANDARD = 'enhanced_standard'
+
+ARCSECONDS_PER_SIGN = 30 * 3600
+ARCSECONDS_PER_CIRCLE = 12 * ARCSECONDS_PER_SIGN
+
+# Sign at which the navamsa count starts for fire, earth, air and water signs
+NAVAMSA_STARTS = (0, 3, 6, 9)
+
+# Trimsamsa target signs for the 5-degree segments of odd and even signs;
+# the sixth segment (25-30 degrees) falls back to Aries
+TRIMSAMSA_ODD = (0, 6, 4, 2, 1, 0)
+TRIMSAMSA_EVEN = (1, 2, 4, 6, 0, 0)
+
+
+@dataclass(frozen=True)
+class VargaTable:
+    """Compiled mapping of one varga over (sign, segment) cells"""
+    division: int
+    segments: int  # Equal segments per sign
+    signs: np.ndarray  # (12, segments) target sign of each cell
+    longitudes: np.ndarray  # (12, segments) output longitude at the start of each cell
+    span: float  # Degrees the position within a segment is spread over (0: none)
+    # The engines locate segments with different floating-point expressions,
+    # degree * segments / 30 or degree / (30 / segments), which disagree on
+    # some exact boundaries; each table records the one its rules use
+    by_width: bool
+    # Whether the sign is taken from the longitude rounded to 6 decimals
+    rounded_sign: bool
+    # Segments counted over the whole zodiac rather than within the sign;
+    # every row of such a table is the same
+    zodiacal: bool = False
+
+
+def _table(
+    division: int,
+    segments: int,
+    longitudes: np.ndarray,
+    span: float = 0.0,
+    by_width: bool = False,
+    rounded_sign: bool = False,
+    zodiacal: bool = False
+) -> VargaTable:
+    longitudes = np.mod(longitudes, 360)
+    signs = np.floor(longitudes / 30).astype(np.int8)
+    for array in (signs, longitudes):
+        array.setflags(write=False)
+    return VargaTable(division, segments, signs, longitudes, span, by_width, rounded_sign, zodiacal)
+
+
+def _cells(segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    return np.meshgrid(np.arange(12), np.arange(segments), indexing='ij')
+
+
+def _compile_divisional() -> Dict[int, VargaTable]:
+    """Tables for the DivisionalChartEngine rules"""
+    steps = {
+        2: 15, 3: 10, 4: 7.5, 7: 360/84, 9: 40, 10: 3, 12: 2.5, 16: 360/192,
+        20: 360/240, 24: 360/288, 30: 360/360, 40: 360/480, 45: 360/540, 60: 360/720
+    }
+    tables = {}
+
+    sign, _ = _cells(1)
+    tables[1] = _table(1, 1, sign * 30.0, span=30.0)
+
+    for division, step in steps.items():
+        sign, segment = _cells(division)
+        tables[division] = _table(
+            division, division, (sign * division + segment) * step, by_width=division in (2, 3)
+        )
+
+    # Nakshatras are counted over the whole zodiac
+    _, nakshatra = _cells(27)
+    tables[27] = _table(27, 27, nakshatra * (360/27), zodiacal=True)
+
+    return dict(sorted(tables.items()))
+
+
+def _compile_enhanced(special_rules: bool) -> Dict[int, VargaTable]:
+    """Tables for the EnhancedDivisionalChartEngine rules"""
+    tables = {}
+    for division in range(1, 41):
+        sign, segment = _cells(division)
+        tables[division] = _table(
+            division, division, (sign + segment) * 30.0, by_width=True, rounded_sign=True
+        )
+
+    if special_rules:
+        sign, segment = _cells(9)
+        starts = np.array(NAVAMSA_STARTS)[sign % 4]
+        tables[9] = _table(9, 9, (starts + segment) * 30.0, span=30.0, by_width=True)
+
+        sign, segment = _cells(12)
+        tables[12] = _table(12, 12, (sign + segment) * 30.0, span=30.0, by_width=True)
+
+        sign, segment = _cells(6)
+        targets = np.where(sign % 2 == 0, np.array(TRIMSAMSA_ODD)[segment], np.array(TRIMSAMSA_EVEN)[segment])
+        tables[30] = _table(30, 6, targets * 30.0, span=30.0, by_width=True, rounded_sign=True)
+
+    return tables
+
+
+# Compiled at import; read-only and shared between threads
+TABLES: Dict[str, Dict[int, VargaTable]] = {
+    DIVISIONAL: _compile_divisional(),
+    ENHANCED: _compile_enhanced(special_rules=True),
+    ENHANCED_STANDARD: _compile_enhanced(special_rules=False)
+}
+
+# Decimal places the engines round output longitudes to
+OUTPUT_DECIMALS = {DIVISIONAL: None, ENHANCED: 6, ENHANCED_STANDARD: 6}
+
+
+class VargaStack:
+    """Tables of several divisions stacked for one-shot lookups
+
+    Cells are padded to the largest segment count so that a single fancy
+    index over (division, sign, segment) maps every longitude to every
+    division at once.
+    """
+
+    def __init__(self, scheme: str, divisions: Sequence[int]):
+        if scheme not in TABLES:
+            raise ValueError(f"Unknown varga scheme: {scheme}")
+        unsupported = [division for division in divisions if division not in TABLES[scheme]]
+        if unsupported:
+            raise ValueError(f"Unsupported division D{unsupported[0]} for {scheme} rules")
+
+        tables = [TABLES[scheme][division] for division in divisions]
+        width = max(table.segments for table in tables)
+        self.scheme = scheme
+        self.divisions = tuple(divisions)
+        self.decimals = OUTPUT_DECIMALS[scheme]
+        self.segments = np.array([table.segments for table in tables], dtype=float)
+        self.spans = np.array([table.span for table in tables])
+        by_width = [table.by_width for table in tables]
+        self.zodiacal = np.array([table.zodiacal for table in tables])
+        arcs = np.where(self.zodiacal, 360.0, 30.0)
+        # scaled = position * multiplier / divisor reproduces either segment expression
+        self.multipliers = np.where(by_width, 1.0, self.segments)
+        self.divisors = np.where(by_width, arcs / self.segments, arcs)
+        self.widths = arcs / self.segments
+        self.rounded_sign = np.array([table.rounded_sign for table in tables])
+        self._column_cache: Dict[int, Dict[str, np.ndarray]] = {}
+        self.signs = np.zeros((len(tables), 12, width), dtype=np.int8)
+        self.longitudes = np.zeros((len(tables), 12, width))
+        for row, table in enumerate(tables):
+            self.signs[row, :, :table.segments] = table.signs
+            self.longitudes[row, :, :table.segments] = table.longitudes
+
+    def _columns(self, ndim: int) -> Dict[str, np.ndarray]:
+        """Per-division constants shaped to broadcast against ndim-dimensional input"""
+        columns = self._column_cache.get(ndim)
+        if columns is None:
+            shape = (-1,) + (1,) * ndim
+            columns = {
+                name: getattr(self, name).reshape(shape)
+                for name in ('segments', 'spans', 'zodiacal', 'multipliers', 'divisors', 'widths', 'rounded_sign')
+            }
+            columns['last_segment'] = columns['segments'] - 1
+            columns['rows'] = np.arange(len(self.divisions)).reshape(shape)
+            self._column_cache[ndim] = columns
+        return columns
+
+    def locate(self, longitudes: np.ndarray) -> Tuple[Tuple[np.ndarray, ...], np.ndarray]:
+        """
+        Cell indices of every longitude in every division
+
+        Returns:
+            ((division rows, signs, segments), positions): index arrays that
+            broadcast to (divisions,) + longitudes.shape, and the position
+            (degrees within the sign, or within the zodiac for zodiacal
+            tables) the segment was found from
+        """
+        longitudes = np.mod(np.asarray(longitudes, dtype=float), 360)
+        columns = self._columns(longitudes.ndim)
+        if self.rounded_sign.all():
+            sign = np.floor(np.mod(np.round(longitudes, 6), 360) / 30)
+        else:
+            sign = np.floor(longitudes / 30)
+            if self.rounded_sign.any():
+                rounded = np.floor(np.mod(np.round(longitudes, 6), 360) / 30)
+                sign = np.where(columns['rounded_sign'], rounded, sign)
+        positions = np.mod(longitudes, 30)
+        if self.zodiacal.any():
+            sign = np.where(columns['zodiacal'], 0, sign)
+            positions = np.where(columns['zodiacal'], longitudes, positions)
+        sign = np.minimum(sign, 11).astype(np.intp)
+        scaled = positions * columns['multipliers'] / columns['divisors']
+        segment = np.minimum(np.floor(scaled), columns['last_segment']).astype(np.intp)
+        return (columns['rows'], sign, segment), positions
+
+    def map(self, longitudes: np.ndarray, with_longitudes: bool = True) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Target signs and, optionally, divisional longitudes from one lookup
+
+        Returns:
+            (signs, longitudes), each of shape (divisions,) + longitudes.shape;
+            longitudes is None when not requested
+        """
+        signs, result, _ = self.map_all(longitudes, with_longitudes)
+        return signs, result
+
+    def map_all(
+        self,
+        longitudes: np.ndarray,
+        with_longitudes: bool = True,
+        with_degrees: bool = False
+    ) -> Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Target signs, divisional longitudes and varga degrees from one lookup
+
+        Varga degrees (0-30) place each longitude within its divisional sign
+        in proportion to how far through its segment it lies, the position
+        grading rules such as saptavargaja bala read.
+
+        Returns:
+            (signs, longitudes, degrees), each of shape
+            (divisions,) + longitudes.shape; arrays that were not requested
+            are None
+        """
+        cells, positions = self.locate(longitudes)
+        signs = self.signs[cells]
+        result = degrees = None
+        if with_longitudes:
+            result = self.longitudes[cells]
+            # Cell starts are exact; only positions spread within a segment need rounding
+            if self.spans.any():
+                columns = self._columns(signs.ndim - 1)
+                widths = columns['widths']
+                result = np.mod(result + np.mod(positions, widths) / widths * columns['spans'], 360)
+                if self.decimals is not None:
+                    result = np.mod(np.round(result, self.decimals), 360)
+        if with_degrees:
+            columns = self._columns(signs.ndim - 1)
+            arcs = columns['widths'] * columns['segments']
+            degrees = np.mod(positions * columns['segments'], arcs) * (30.0 / arcs)
+        return signs, result, degrees
+
+    def map_signs(self, longitudes: np.ndarray) -> np.ndarray:
+        """Target sign indices (0-11), shape (divisions,) + longitudes.shape"""
+        return self.map(longitudes, with_longitudes=False)[0]
+
+    def map_longitudes(self, longitudes: np.ndarray) -> np.ndarray:
+        """Divisional longitudes, shape (divisions,) + longitudes.shape"""
+        return self.map(longitudes)[1]
+
+
+@lru_cache(maxsize=64)
+def get_stack(scheme: str, divisions: Tuple[int, ...]) -> VargaStack:
+    """Shared stacked tables for a scheme and division tuple"""
+    return VargaStack(scheme, divisions)
+
+
+def build_arcsecond_table(
+    scheme: str = DIVISIONAL,
+    divisions: Optional[Sequence[int]] = None,
+    path: Optional[Union[str, Path]] = None
+) -> np.ndarray:
+    """
+    Flat table of target signs for every arc-second of the zodiac
+
+    Row ``n`` holds the signs of longitude ``n / 3600`` degrees and applies
+    to the whole arc-second above it. Divisions whose segment width is not
+    a whole number of arc-seconds (such as D7) can be off by one segment for
+    longitudes within one arc-second above a segment boundary.
+
+    Args:
+        scheme: Rule set
+        divisions: Divisions, one column each (default: all of the scheme)
+        path: Optional .npy file to write for memory-mapping
+
+    Returns:
+        int8 array of shape (1296000, divisions)
+    """
+    divisions = tuple(divisions or TABLES[scheme])
+    stack = get_stack(scheme, divisions)
+    table = np.empty((ARCSECONDS_PER_CIRCLE, len(divisions)), dtype=np.int8)
+    # One sign at a time keeps the intermediate index arrays small
+    for start in range(0, ARCSECONDS_PER_CIRCLE, ARCSECONDS_PER_SIGN):
+        grid = np.arange(start, start + ARCSECONDS_PER_SIGN) / 3600
+        table[start:start + ARCSECONDS_PER_SIGN] = stack.map_signs(grid).T
+    if path is not None:
+        np.save(Path(path), table)
+        logger.info(f"Wrote arc-second varga table for {scheme} {divisions} to {path}")
+    return table
+
+
+def load_arcsecond_table(path: Union[str, Path]) -> np.ndarray:
+    """Memory-map a table written by build_arcsecond_table"""
+    return np.load(Path(path), mmap_mode='r')
+
+
+def arcsecond_signs(table: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Target signs from an arc-second table, shape (divisions,) + longitudes.shape"""
+    arcseconds = np.floor(np.mod(np.asarray(longitudes, dtype=float), 360) * 3600).astype(np.intp)
+    rows = table[np.minimum(arcseconds, ARCSECONDS_PER_CIRCLE - 1)]
+    return np.moveaxis(rows, -1, 0)
@@ -17,6 +17,8 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Set, Tuple
 from enum import Enum
 
+from .yoga_rules import KENDRAS, TRIKONAS, HasDignity, LordOf, Placed, YogaRule, YogaRuleSet, yoga_strength
+
 class YogaType(Enum):
     """Types of Vedic yogas"""
     RAJ = "raj"                   # Royal combinations
@@ -38,6 +40,58 @@ class YogaResult:
     effects: List[str]
     is_complete: bool  # Whether all required conditions are met
 
+MAHAPURUSHA_NAMES = {
+    "Mars": "Ruchaka",
+    "Mercury": "Bhadra",
+    "Jupiter": "Hamsa",
+    "Venus": "Malavya",
+    "Saturn": "Sasa"
+}
+
+def raj_yoga_rules() -> List[YogaRule]:
+    """Lords of trine houses (1, 5, 9) in quadrant houses (1, 4, 7, 10)"""
+    return [
+        YogaRule(
+            name=f"Raj Yoga of the {trine} house lord",
+            yoga_type=YogaType.RAJ,
+            condition=Placed(LordOf(trine), KENDRAS),
+            subject=LordOf(trine),
+            description=f"Lord of {trine} house in {{house}} house",
+            effects=("Authority", "Leadership", "Success"),
+            houses=(trine,)
+        )
+        for trine in TRIKONAS
+    ]
+
+def dhana_yoga_rules() -> List[YogaRule]:
+    """Lords of the wealth houses (2, 11) in beneficial houses"""
+    return [
+        YogaRule(
+            name=f"Dhana Yoga of the {house} house lord",
+            yoga_type=YogaType.DHANA,
+            condition=Placed(LordOf(house), (1, 2, 4, 5, 9, 11)),
+            subject=LordOf(house),
+            description=f"Lord of {house} house in {{house}} house",
+            effects=("Financial gains", "Material prosperity", "Wealth"),
+            houses=(house,)
+        )
+        for house in (2, 11)
+    ]
+
+def mahapurusha_yoga_rules(conditions: Dict[str, List[int]]) -> List[YogaRule]:
+    """Planets in their own sign or exaltation in the listed houses"""
+    return [
+        YogaRule(
+            name=f"{MAHAPURUSHA_NAMES[planet]} Yoga",
+            yoga_type=YogaType.MAHAPURUSHA,
+            condition=Placed(planet, tuple(houses)) & HasDignity(planet, ('own', 'exalted')),
+            subject=planet,
+            description=f"{MAHAPURUSHA_NAMES[planet]} Yoga by {{planet}} in {{house}} house",
+            effects=("Great personality", "Success", "Leadership")
+        )
+        for planet, houses in conditions.items()
+    ]
+
 class YogaCalculator:
     """Calculates and analyzes yoga formations in a horoscope"""
     
@@ -105,6 +159,12 @@ class YogaCalculator:
             "Venus": [1, 4, 7, 10],     # Malavya Yoga
             "Saturn": [1, 4, 7, 10]     # Sasa Yoga
         }
+        
+        # Compiled form of the same yogas for chart batches (see YogaRuleSet);
+        # single charts take the direct loops below, which are cheaper per call
+        self.rules = YogaRuleSet(
+            raj_yoga_rules() + dhana_yoga_rules() + mahapurusha_yoga_rules(self.mahapurusha_conditions)
+        )
     
     def calculate_raj_yoga(
         self,
@@ -115,14 +175,11 @@ class YogaCalculator:
         raj_yogas = []
         
         # Check for lords of trine houses (1, 5, 9) in quadrant houses (1, 4, 7, 10)
-        trine_houses = {1, 5, 9}
-        quadrant_houses = {1, 4, 7, 10}
-        
-        for trine in trine_houses:
+        for trine in TRIKONAS:
             trine_lord = self.house_lords[trine]
             trine_lord_house = self._get_planet_house(trine_lord, planet_positions)
             
-            if trine_lord_house in quadrant_houses:
+            if trine_lord_house in KENDRAS:
                 # Calculate strength based on planet's dignity and house position
                 strength = self._calculate_yoga_strength(
                     trine_lord,
@@ -151,7 +208,7 @@ class YogaCalculator:
         dhana_yogas = []
         
         # Check for 2nd and 11th house lords' positions
-        wealth_houses = {2, 11}
+        wealth_houses = (2, 11)
         beneficial_houses = {1, 2, 4, 5, 9, 11}
         
         for house in wealth_houses:
@@ -197,14 +254,7 @@ class YogaCalculator:
                         planet_positions
                     )
                     
-                    yoga_name = {
-                        "Mars": "Ruchaka",
-                        "Mercury": "Bhadra",
-                        "Jupiter": "Hamsa",
-                        "Venus": "Malavya",
-                        "Saturn": "Sasa"
-                    }[planet]
-                    
+                    yoga_name = MAHAPURUSHA_NAMES[planet]
                     mahapurusha_yogas.append(YogaResult(
                         yoga_type=YogaType.MAHAPURUSHA,
                         strength=strength,
@@ -217,6 +267,17 @@ class YogaCalculator:
         
         return mahapurusha_yogas
     
+    def calculate_yogas(
+        self,
+        planet_positions: Dict[str, Dict[str, float]]
+    ) -> List[YogaResult]:
+        """Raj, Dhana and Mahapurusha yogas of one chart"""
+        return (
+            self.calculate_raj_yoga(planet_positions, {})
+            + self.calculate_dhana_yoga(planet_positions, {})
+            + self.calculate_mahapurusha_yoga(planet_positions)
+        )
+    
     def _get_planet_house(
         self,
         planet: str,
@@ -245,29 +306,4 @@ class YogaCalculator:
         planet_positions: Dict[str, Dict[str, float]]
     ) -> float:
         """Calculate the strength of a yoga formation"""
-        base_strength = 70  # Base strength
-        
-        # Modify based on dignity
-        dignity_factor = {
-            'exalted': 1.3,
-            'own': 1.2,
-            'friend': 1.1,
-            'neutral': 1.0,
-            'enemy': 0.9,
-            'debilitated': 0.7
-        }
-        
-        dignity = self._get_planet_dignity(planet, planet_positions)
-        strength = base_strength * dignity_factor[dignity]
-        
-        # Modify based on house position
-        if house in {1, 4, 7, 10}:  # Kendra (angular) houses
-            strength *= 1.2
-        elif house in {5, 9}:  # Trikona (trine) houses
-            strength *= 1.1
-        elif house in {3, 6, 11}:  # Upachaya (growth) houses
-            strength *= 1.05
-        elif house in {6, 8, 12}:  # Dusthana (malefic) houses
-            strength *= 0.8
-        
-        return min(100, strength)  # Cap at 100
+        return yoga_strength(self._get_planet_dignity(planet, planet_positions), house)
@@ -0,0 +1,498 @@
+"""
+Yoga Rules
+Declarative yoga conditions compiled to bitmask predicates.
+
+A yoga is a YogaRule whose condition is built from placement, lordship,
+conjunction, aspect and dignity predicates combined with ``&``, ``|`` and
+``~``. A YogaRuleSet compiles every condition once into a closure over
+chart feature columns: each body's house as a number and as a one-hot
+12-bit mask, its dignity as a one-hot mask and the houses it aspects as a
+12-bit mask counted from its own house. The lords of the twelve houses are
+extra columns next to the planets, so "lord of the 9th in a kendra" is the
+same mask test as "Jupiter in a kendra".
+
+Feature columns are Python ints for one chart and (charts,) arrays for a
+batch, and the compiled predicates only use operators both support, so one
+rule set answers a single chart without array overhead and a large batch
+without a Python loop over charts.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+import logging
+import math
+
+import numpy as np
+
+from .house_kernel import assign_houses
+from .strength_kernel import CLASSICAL_PLANETS, DIGNITIES as SIGN_DIGNITIES
+
+logger = logging.getLogger(__name__)
+
+KENDRAS = (1, 4, 7, 10)
+TRIKONAS = (1, 5, 9)
+
+# Lord of each sign, Aries first
+SIGN_LORDS = (
+    'Mars', 'Venus', 'Mercury', 'Moon', 'Sun', 'Mercury',
+    'Venus', 'Mars', 'Jupiter', 'Saturn', 'Saturn', 'Jupiter'
+)
+
+# Houses aspected by each planet, counted from its own house
+GRAHA_DRISHTI = {'Mars': (4, 7, 8), 'Jupiter': (5, 7, 9), 'Saturn': (3, 7, 10)}
+DEFAULT_DRISHTI = (7,)
+
+DIGNITY_NAMES = ('exalted', 'own', 'friend', 'neutral', 'enemy', 'debilitated')
+DIGNITY_CODES = {name: code for code, name in enumerate(DIGNITY_NAMES)}
+NEUTRAL = DIGNITY_CODES['neutral']
+
+# Yoga strength: base scaled by the subject's dignity and house
+BASE_STRENGTH = 70
+DIGNITY_FACTORS = {
+    'exalted': 1.3,
+    'own': 1.2,
+    'friend': 1.1,
+    'neutral': 1.0,
+    'enemy': 0.9,
+    'debilitated': 0.7
+}
+
+
+def house_factor(house: int) -> float:
+    """Strength factor of a yoga formed from a house"""
+    if house in {1, 4, 7, 10}:  # Kendra (angular) houses
+        return 1.2
+    if house in {5, 9}:  # Trikona (trine) houses
+        return 1.1
+    if house in {3, 6, 11}:  # Upachaya (growth) houses
+        return 1.05
+    if house in {6, 8, 12}:  # Dusthana (malefic) houses
+        return 0.8
+    return 1.0
+
+
+def yoga_strength(dignity: str, house: int) -> float:
+    """Strength 0-100 of a yoga whose subject has a dignity and house"""
+    strength = BASE_STRENGTH * DIGNITY_FACTORS[dignity]
+    strength *= house_factor(house)
+    return min(100, strength)
+
+
+_DIGNITY_FACTOR_TABLE = np.array([DIGNITY_FACTORS[name] for name in DIGNITY_NAMES])
+_HOUSE_FACTOR_TABLE = np.array([house_factor(house) for house in range(13)])
+
+# One-hot masks by house (0 for unknown) and by dignity code (-1 for unknown)
+_HOUSE_MASKS = (0,) + tuple(1 << house for house in range(12))
+_DIGNITY_MASKS = {-1: 0, **{code: 1 << code for code in range(len(DIGNITY_NAMES))}}
+
+
+@dataclass(frozen=True)
+class LordOf:
+    """The planet ruling a house"""
+    house: int
+
+    def __post_init__(self):
+        if not 1 <= self.house <= 12:
+            raise ValueError(f"House must be 1-12, got {self.house}")
+
+
+Body = Union[str, LordOf]
+
+
+class Predicate:
+    """Condition on the feature columns of a chart"""
+
+    def __and__(self, other: 'Predicate') -> 'Predicate':
+        return AllOf(self, other)
+
+    def __or__(self, other: 'Predicate') -> 'Predicate':
+        return AnyOf(self, other)
+
+    def __invert__(self) -> 'Predicate':
+        return Not(self)
+
+    def compile(self, slot: Callable[[Body], int]) -> Callable[['ChartFeatures'], Any]:
+        """Closure testing the condition, given the column slot of a body"""
+        raise NotImplementedError
+
+
+def _mask(houses: Sequence[int]) -> int:
+    mask = 0
+    for house in houses:
+        if not 1 <= house <= 12:
+            raise ValueError(f"House must be 1-12, got {house}")
+        mask |= 1 << (house - 1)
+    return mask
+
+
+@dataclass(frozen=True)
+class Placed(Predicate):
+    """Body in one of the houses"""
+    body: Body
+    houses: Tuple[int, ...]
+
+    def compile(self, slot):
+        index, mask = slot(self.body), _mask(self.houses)
+        return lambda features: (features.house_mask[index] & mask) != 0
+
+
+@dataclass(frozen=True)
+class HasDignity(Predicate):
+    """Body in one of the dignities"""
+    body: Body
+    dignities: Tuple[str, ...]
+
+    def compile(self, slot):
+        index = slot(self.body)
+        mask = 0
+        for dignity in self.dignities:
+            mask |= 1 << DIGNITY_CODES[dignity]
+        return lambda features: (features.dignity_mask[index] & mask) != 0
+
+
+@dataclass(frozen=True)
+class Conjunct(Predicate):
+    """Two bodies in the same house"""
+    first: Body
+    second: Body
+
+    def compile(self, slot):
+        first, second = slot(self.first), slot(self.second)
+        return lambda features: (features.house_mask[first] & features.house_mask[second]) != 0
+
+
+@dataclass(frozen=True)
+class Aspects(Predicate):
+    """Source casts its graha drishti on the house of the target"""
+    source: Body
+    target: Body
+
+    def compile(self, slot):
+        source, target = slot(self.source), slot(self.target)
+
+        def aspects(features):
+            source_house, target_house = features.house[source], features.house[target]
+            cast = (features.aspect_mask[source] >> ((target_house - source_house) % 12)) & 1
+            return (cast != 0) & (source_house > 0) & (target_house > 0)
+        return aspects
+
+
+@dataclass(frozen=True)
+class AllOf(Predicate):
+    """Every condition holds"""
+    conditions: Tuple[Predicate, ...]
+
+    def __init__(self, *conditions: Predicate):
+        object.__setattr__(self, 'conditions', conditions)
+
+    def compile(self, slot):
+        compiled = [condition.compile(slot) for condition in self.conditions]
+        if len(compiled) == 1:
+            return compiled[0]
+
+        def every(features):
+            result = compiled[0](features)
+            for test in compiled[1:]:
+                # A single chart's False settles it; arrays are never False
+                if result is False:
+                    return result
+                result = result & test(features)
+            return result
+        return every
+
+
+@dataclass(frozen=True)
+class AnyOf(Predicate):
+    """At least one condition holds"""
+    conditions: Tuple[Predicate, ...]
+
+    def __init__(self, *conditions: Predicate):
+        object.__setattr__(self, 'conditions', conditions)
+
+    def compile(self, slot):
+        compiled = [condition.compile(slot) for condition in self.conditions]
+        if len(compiled) == 1:
+            return compiled[0]
+
+        def either(features):
+            result = compiled[0](features)
+            for test in compiled[1:]:
+                if result is True:
+                    return result
+                result = result | test(features)
+            return result
+        return either
+
+
+@dataclass(frozen=True)
+class Not(Predicate):
+    """The condition does not hold"""
+    condition: Predicate
+
+    def compile(self, slot):
+        test = self.condition.compile(slot)
+        # ``^ True`` negates Python bools and bool arrays alike; ``~True`` is -2
+        return lambda features: test(features) ^ True
+
+
+@dataclass(frozen=True)
+class YogaRule:
+    """
+    Declarative yoga
+
+    The subject is the body whose house and dignity give the yoga's strength
+    and fill ``{planet}`` and ``{house}`` in the description; ``houses`` are
+    reported before the subject's house.
+    """
+    name: str
+    yoga_type: Any
+    condition: Predicate
+    subject: Body
+    description: str
+    effects: Tuple[str, ...]
+    houses: Tuple[int, ...] = ()
+
+
+class ChartFeatures(NamedTuple):
+    """
+    Feature columns of one chart or a batch of charts
+
+    Columns are indexed by slot, one per body the rule set mentions. An
+    entry is an int for one chart and a (charts,) array for a batch;
+    ``charts`` is None for one chart.
+    """
+    planet: Sequence  # planet index of the slot
+    house: Sequence  # house 1-12, 0 when unknown
+    house_mask: Sequence  # 1 << (house - 1), 0 when unknown
+    dignity: Sequence  # index into DIGNITY_NAMES, -1 when unknown
+    dignity_mask: Sequence  # 1 << dignity, 0 when unknown
+    aspect_mask: Sequence  # bit n - 1 set when the body aspects the n-th house from its own
+    charts: Optional[int] = None
+
+
+class YogaMatch(NamedTuple):
+    """Rule satisfied by one chart"""
+    rule: YogaRule
+    planet: str
+    house: int
+
+
+YOGA_HIT_DTYPE = np.dtype([
+    ('chart', np.int32),
+    ('rule', np.int32),
+    ('planet', np.int8),
+    ('house', np.int8),
+    ('strength', np.float64)
+])
+
+
+def sign_dignities(longitudes: np.ndarray, planets: Sequence[str]) -> np.ndarray:
+    """
+    Dignity codes of planets from their signs
+
+    Exaltation and debilitation signs take precedence over own, friendly
+    and enemy signs; planets without dignity rules are neutral.
+
+    Args:
+        longitudes: (..., planets) longitudes
+        planets: Planet names of the last axis
+
+    Returns:
+        int array of DIGNITY_NAMES indices shaped like ``longitudes``
+    """
+    table = np.full((len(planets), 12), NEUTRAL, dtype=np.int8)
+    for row, name in enumerate(planets):
+        if name not in SIGN_DIGNITIES:
+            continue
+        exaltation, debilitation, own, friends, enemies = SIGN_DIGNITIES[name]
+        table[row, list(enemies)] = DIGNITY_CODES['enemy']
+        table[row, list(friends)] = DIGNITY_CODES['friend']
+        table[row, list(own)] = DIGNITY_CODES['own']
+        table[row, debilitation] = DIGNITY_CODES['debilitated']
+        table[row, exaltation] = DIGNITY_CODES['exalted']
+    signs = (np.mod(np.asarray(longitudes, dtype=float), 360.0) // 30).astype(np.int64)
+    return table[np.arange(len(planets)), signs]
+
+
+class YogaRuleSet:
+    """
+    Rules compiled against a fixed planet order
+
+    Only the bodies the rules mention get feature columns, so a small rule
+    set extracts a few columns per chart and a large one shares each
+    body's column among all the rules that test it.
+    """
+
+    def __init__(self, rules: Sequence[YogaRule], planets: Sequence[str] = CLASSICAL_PLANETS):
+        self.rules = tuple(rules)
+        self.planets = tuple(planets)
+        self._index = {name: index for index, name in enumerate(self.planets)}
+        missing = set(SIGN_LORDS) - set(self.planets)
+        if missing:
+            raise ValueError(f"Planets must include the sign lords, missing {sorted(missing)}")
+        self._sign_lords = [self._index[name] for name in SIGN_LORDS]
+        self._aspect_masks = [_mask(GRAHA_DRISHTI.get(name, DEFAULT_DRISHTI)) for name in self.planets]
+
+        self._bodies: List[Body] = []
+        self._slots: Dict[Body, int] = {}
+        self._tests = [rule.condition.compile(self._slot) for rule in self.rules]
+        self._subject_slots = [self._slot(rule.subject) for rule in self.rules]
+        self._subjects = np.array(self._subject_slots, dtype=np.int64)
+
+        # Planet index of every slot for each lagna sign
+        self._slot_planets = np.array(
+            [[self._planet(body, lagna_sign) for body in self._bodies] for lagna_sign in range(12)],
+            dtype=np.int64
+        ).reshape(12, len(self._bodies))
+        self._lagna_slots = [
+            ([self.planets[index] for index in row], row, [self._aspect_masks[index] for index in row])
+            for row in self._slot_planets.tolist()
+        ]
+
+    def _slot(self, body: Body) -> int:
+        """Feature column of a body, added on first use"""
+        if body not in self._slots:
+            if not isinstance(body, LordOf) and body not in self._index:
+                raise ValueError(f"Unknown planet {body!r}")
+            self._slots[body] = len(self._bodies)
+            self._bodies.append(body)
+        return self._slots[body]
+
+    def _planet(self, body: Body, lagna_sign: int) -> int:
+        if isinstance(body, LordOf):
+            return self._sign_lords[(lagna_sign + body.house - 1) % 12]
+        return self._index[body]
+
+    def features(self, planet_positions: Mapping[str, Any], lagna_sign: int = 0) -> ChartFeatures:
+        """
+        Feature columns of one chart
+
+        Houses are counted in whole signs from the lagna sign (Aries by
+        default, the natural zodiac of YogaCalculator and planet_houses).
+        Dignities are read from each position's ``dignity`` entry, neutral
+        when absent; a planet missing from the positions is in no house.
+
+        Args:
+            planet_positions: Planet name to a dictionary with ``longitude``
+                and optionally ``dignity``
+            lagna_sign: Sign of the first house, 0 for Aries
+
+        Returns:
+            ChartFeatures with int columns
+        """
+        names, planet, aspect_mask = self._lagna_slots[lagna_sign]
+        house, house_mask, dignity, dignity_mask = [], [], [], []
+        for name in names:
+            position = planet_positions.get(name)
+            if position is None:
+                value, code = 0, NEUTRAL
+            else:
+                if isinstance(position, dict):
+                    longitude = float(position['longitude'])
+                    code = DIGNITY_CODES.get(position.get('dignity', 'neutral'), -1)
+                else:
+                    longitude, code = float(position), NEUTRAL
+                value = 0 if math.isnan(longitude) else (int(longitude % 360.0 // 30) - lagna_sign) % 12 + 1
+            house.append(value)
+            house_mask.append(_HOUSE_MASKS[value])
+            dignity.append(code)
+            dignity_mask.append(_DIGNITY_MASKS[code])
+        return ChartFeatures(planet, house, house_mask, dignity, dignity_mask, aspect_mask)
+
+    def batch_features(
+        self,
+        longitudes: np.ndarray,
+        dignities: Optional[np.ndarray] = None,
+        lagna_signs: Optional[np.ndarray] = None
+    ) -> ChartFeatures:
+        """
+        Feature columns of many charts
+
+        Args:
+            longitudes: (charts, planets) longitudes in the rule set's
+                planet order
+            dignities: (charts, planets) DIGNITY_NAMES indices, neutral when
+                omitted as in features (sign_dignities derives them from the
+                signs)
+            lagna_signs: (charts,) sign of the first house (default: Aries)
+
+        Returns:
+            ChartFeatures with (slots, charts) array columns
+        """
+        longitudes = np.asarray(longitudes, dtype=float)
+        if longitudes.ndim != 2 or longitudes.shape[1] != len(self.planets):
+            raise ValueError(f"Longitudes must be (charts, {len(self.planets)})")
+        charts = longitudes.shape[0]
+        if dignities is None:
+            dignities = np.full(longitudes.shape, NEUTRAL, dtype=np.int64)
+        dignities = np.asarray(dignities, dtype=np.int64).T
+        houses = assign_houses(longitudes).T
+
+        if lagna_signs is None:
+            rows = self._slot_planets[0]
+            planet = np.broadcast_to(rows[:, np.newaxis], (len(rows), charts))
+            house, dignity = houses[rows], dignities[rows]
+        else:
+            lagna_signs = np.asarray(lagna_signs, dtype=np.int64)
+            houses = np.where(houses > 0, (houses - 1 - lagna_signs) % 12 + 1, 0)
+            planet = self._slot_planets[lagna_signs].T
+            columns = np.arange(charts)
+            house, dignity = houses[planet, columns], dignities[planet, columns]
+
+        known = dignity >= 0
+        return ChartFeatures(
+            planet=planet,
+            house=house,
+            house_mask=np.where(house > 0, np.left_shift(1, np.maximum(house - 1, 0)), 0),
+            dignity=dignity,
+            dignity_mask=np.where(known, np.left_shift(1, np.where(known, dignity, 0)), 0),
+            aspect_mask=np.array(self._aspect_masks)[planet],
+            charts=charts
+        )
+
+    def evaluate(self, features: ChartFeatures) -> Any:
+        """
+        Truth of every rule
+
+        Returns:
+            List of bools for one chart, (charts, rules) bool array for a batch
+        """
+        if features.charts is None:
+            return [bool(test(features)) for test in self._tests]
+        result = np.empty((features.charts, len(self._tests)), dtype=bool)
+        for column, test in enumerate(self._tests):
+            result[:, column] = test(features)
+        return result
+
+    def matches(self, features: ChartFeatures) -> List[YogaMatch]:
+        """Rules satisfied by one chart, in rule order"""
+        found = []
+        for rule, test, subject in zip(self.rules, self._tests, self._subject_slots):
+            if test(features):
+                found.append(YogaMatch(rule, self.planets[features.planet[subject]], features.house[subject]))
+        return found
+
+    def strengths(self, features: ChartFeatures) -> np.ndarray:
+        """(charts, rules) strength of each rule from its subject, whether or not it holds"""
+        house = np.asarray(features.house)[self._subjects].T
+        dignity = np.asarray(features.dignity)[self._subjects].T
+        factor = np.where(dignity >= 0, _DIGNITY_FACTOR_TABLE[np.maximum(dignity, 0)], np.nan)
+        return np.minimum(100, BASE_STRENGTH * factor * _HOUSE_FACTOR_TABLE[house])
+
+    def find_yogas(self, features: ChartFeatures) -> np.ndarray:
+        """
+        Yogas present in a batch of charts
+
+        Returns:
+            YOGA_HIT_DTYPE array ordered by chart, then rule
+        """
+        held = self.evaluate(features)
+        charts, rules = np.nonzero(held)
+        subjects = self._subjects[rules]
+        hits = np.empty(len(charts), dtype=YOGA_HIT_DTYPE)
+        hits['chart'] = charts
+        hits['rule'] = rules
+        hits['planet'] = np.asarray(features.planet)[subjects, charts]
+        hits['house'] = np.asarray(features.house)[subjects, charts]
+        hits['strength'] = self.strengths(features)[charts, rules]
+        return hits
@@ -65,6 +65,10 @@ class Settings(BaseSettings):
         description="Path to Swiss Ephemeris data files"
     )
 
+    # Instrumentation settings
+    INSTRUMENTATION_SAMPLE_EVERY: int = int(os.getenv("INSTRUMENTATION_SAMPLE_EVERY", "100"))
+    PROFILING_MAX_SECONDS: float = float(os.getenv("PROFILING_MAX_SECONDS", "30"))
+
     model_config = SettingsConfigDict(env_file=env_file, case_sensitive=True)
 
 
@@ -5,6 +5,9 @@ from datetime import datetime
 from typing import Dict, Any, Optional, Callable
 from dataclasses import dataclass, field
 from contextlib import contextmanager
+from itertools import count
+
+from app.core.monitoring.instrumentation import LatencyHistogram, instrumentation
 
 @dataclass
 class CalculationMetrics:
@@ -22,24 +25,33 @@ class CalculationMetrics:
         return self.end_time - self.start_time
 
 class AyanamsaMonitor:
-    """Monitor for Ayanamsa calculations with performance tracking"""
+    """Monitor for Ayanamsa calculations with performance tracking
+    
+    Every calculation is counted, but only one in ``sample_every`` is timed
+    into a fixed-size latency histogram, so memory use does not grow with
+    the number of calculations. ``total_duration`` is therefore an estimate
+    scaled up from the timed calculations; ``sampled_duration`` is the time
+    actually measured.
+    """
     
-    def __init__(self):
+    def __init__(self, sample_every: Optional[int] = None):
         """Initialize the monitor"""
         self.logger = logging.getLogger(__name__)
-        self.metrics: Dict[str, CalculationMetrics] = {}
+        self.sample_every = sample_every or instrumentation.sample_every
+        self.latency = LatencyHistogram()
+        self.last_metrics: Optional[CalculationMetrics] = None
+        self._calls = count(1)
         self.total_calculations = 0
         self.successful_calculations = 0
         self.failed_calculations = 0
-        self.total_duration = 0.0
+        self.sampled_duration = 0.0
         self.last_calculation_time = None
         
     @contextmanager
     def track_calculation(self):
         """Context manager to track a calculation's performance"""
-        calc_id = str(time.time())
-        metrics = CalculationMetrics()
-        self.metrics[calc_id] = metrics
+        sampled = next(self._calls) % self.sample_every == 0
+        metrics = CalculationMetrics(start_time=time.perf_counter() if sampled else 0.0)
         
         try:
             yield
@@ -53,23 +65,20 @@ class AyanamsaMonitor:
             raise
             
         finally:
-            metrics.end_time = time.time()
             self.total_calculations += 1
-            self.total_duration += metrics.duration
-            self.last_calculation_time = datetime.now()
-            
-            # Log performance metrics
-            self.logger.debug(
-                f"Calculation completed in {metrics.duration:.3f}s "
-                f"(success={metrics.success})"
-            )
+            if sampled:
+                metrics.end_time = time.perf_counter()
+                self.latency.record(metrics.duration)
+                self.sampled_duration += metrics.duration
+                self.last_metrics = metrics
+                self.last_calculation_time = datetime.now()
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current monitoring metrics"""
-        avg_duration = (
-            self.total_duration / self.total_calculations 
-            if self.total_calculations > 0 else 0.0
-        )
+        latency = self.latency.snapshot()
+        avg_duration = latency['mean_ms'] / 1000
+        # Only sampled calculations are timed; scale their mean to all of them
+        total_duration = avg_duration * self.total_calculations
         
         success_rate = (
             self.successful_calculations / self.total_calculations * 100
@@ -82,15 +91,19 @@ class AyanamsaMonitor:
             'failed_calculations': self.failed_calculations,
             'success_rate': success_rate,
             'average_duration': avg_duration,
-            'total_duration': self.total_duration,
-            'last_calculation_time': self.last_calculation_time
+            'total_duration': total_duration,
+            'sampled_duration': self.sampled_duration,
+            'last_calculation_time': self.last_calculation_time,
+            'latency': latency
         }
     
     def reset_metrics(self):
         """Reset all metrics to initial state"""
-        self.metrics.clear()
+        self.latency.reset()
+        self.last_metrics = None
+        self._calls = count(1)
         self.total_calculations = 0
         self.successful_calculations = 0
         self.failed_calculations = 0
-        self.total_duration = 0.0
+        self.sampled_duration = 0.0
         self.last_calculation_time = None
@@ -0,0 +1,367 @@
+"""
+Hot-path instrumentation for calculators
+
+Calls and errors of instrumented functions are counted, but only one call
+in ``sample_every`` is timed. Timings go into fixed-size, log-spaced latency
+histograms (one per function), so memory stays constant however many calls
+are made, and no log line is written per call. Additional sinks can be
+registered to receive the sampled timings.
+
+On-demand profiling runs for a bounded window and returns collapsed stacks
+(``frame;frame;frame count``), the input format of flame graph tools:
+
+* ``sample`` polls the stacks of all threads at a fixed interval.
+* ``cprofile`` runs cProfile on the calling thread, which for async
+  endpoints is the event loop serving the requests. cProfile records
+  caller/callee pairs rather than full stacks, so its stacks are two frames
+  deep and weighted by microseconds of own time.
+"""
+
+import asyncio
+import cProfile
+import logging
+import math
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Dict, List, Optional
+
+from app.core.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """Fixed-size latency histogram with log-spaced buckets
+
+    Buckets cover ``min_latency`` to ``max_latency`` seconds with
+    ``buckets_per_decade`` buckets per factor of ten (about 12% relative
+    resolution at the default of 20); values outside the range are clamped
+    to the first or last bucket.
+    """
+
+    def __init__(
+        self,
+        min_latency: float = 1e-7,
+        max_latency: float = 100.0,
+        buckets_per_decade: int = 20
+    ):
+        self.min_latency = min_latency
+        self.buckets_per_decade = buckets_per_decade
+        self._log_min = math.log10(min_latency)
+        decades = math.log10(max_latency) - self._log_min
+        self.counts = [0] * (int(math.ceil(decades * buckets_per_decade)) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def _bucket(self, seconds: float) -> int:
+        if seconds <= self.min_latency:
+            return 0
+        index = int((math.log10(seconds) - self._log_min) * self.buckets_per_decade) + 1
+        return min(index, len(self.counts) - 1)
+
+    def _upper_bound(self, index: int) -> float:
+        return 10 ** (self._log_min + index / self.buckets_per_decade)
+
+    def record(self, seconds: float) -> None:
+        """Add one latency measurement"""
+        index = self._bucket(seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile (0-100), in seconds"""
+        with self._lock:
+            counts = list(self.counts)
+            total = self.count
+            maximum = self.max
+        if not total:
+            return 0.0
+        rank = max(1, math.ceil(total * q / 100.0))
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self._upper_bound(index), maximum)
+        return maximum
+
+    def snapshot(self) -> Dict[str, float]:
+        """Summary statistics in milliseconds"""
+        with self._lock:
+            total = self.count
+            mean = self.total / total if total else 0.0
+            minimum = self.min if total else 0.0
+            maximum = self.max
+        return {
+            'samples': total,
+            'mean_ms': mean * 1000,
+            'min_ms': minimum * 1000,
+            'max_ms': maximum * 1000,
+            'p50_ms': self.percentile(50) * 1000,
+            'p95_ms': self.percentile(95) * 1000,
+            'p99_ms': self.percentile(99) * 1000
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts = [0] * len(self.counts)
+            self.count = 0
+            self.total = 0.0
+            self.min = math.inf
+            self.max = 0.0
+
+
+@dataclass
+class _FunctionStats:
+    histogram: LatencyHistogram
+    sample_every: int
+    calls: int = 0
+    errors: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def count_error(self) -> None:
+        with self.lock:
+            self.errors += 1
+
+    def read(self) -> Dict[str, int]:
+        with self.lock:
+            return {'calls': self.calls, 'errors': self.errors}
+
+    def reset(self) -> None:
+        with self.lock:
+            self.calls = 0
+            self.errors = 0
+
+
+class Instrumentation:
+    """Registry of sampled per-function latency histograms"""
+
+    def __init__(self, sample_every: int = 100, enabled: bool = True):
+        """
+        Args:
+            sample_every: Time one call in this many (1 times every call)
+            enabled: Whether instrumented calls are counted and timed at all
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        self.sample_every = sample_every
+        self.enabled = enabled
+        self._functions: Dict[str, _FunctionStats] = {}
+        self._sinks: List[Callable[[str, float], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, name: str, sample_every: Optional[int]) -> _FunctionStats:
+        with self._lock:
+            stats = self._functions.get(name)
+            if stats is None:
+                stats = _FunctionStats(
+                    histogram=LatencyHistogram(),
+                    sample_every=sample_every or self.sample_every
+                )
+                self._functions[name] = stats
+            return stats
+
+    def add_sink(self, sink: Callable[[str, float], None]) -> None:
+        """Register a callback receiving (function name, seconds) for sampled calls"""
+        self._sinks.append(sink)
+
+    def remove_sink(self, sink: Callable[[str, float], None]) -> None:
+        self._sinks.remove(sink)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a latency measured elsewhere"""
+        self._register(name, None).histogram.record(seconds)
+        for sink in self._sinks:
+            try:
+                sink(name, seconds)
+            except Exception as e:
+                logger.warning(f"Instrumentation sink failed: {e}")
+
+    def instrument(self, name: Optional[str] = None, sample_every: Optional[int] = None):
+        """
+        Decorator counting calls and errors and timing a sample of calls
+
+        Args:
+            name: Histogram name (default: module and qualified function name)
+            sample_every: Per-function sampling interval (default: registry's)
+        """
+        def decorator(func):
+            metric_name = name or f"{func.__module__}.{func.__qualname__}"
+            stats = self._register(metric_name, sample_every)
+
+            lock = stats.lock
+            every = stats.sample_every
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with lock:
+                    stats.calls += 1
+                    sampled = stats.calls % every == 0
+                if not sampled:
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception:
+                        stats.count_error()
+                        raise
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                except Exception:
+                    stats.count_error()
+                    raise
+                finally:
+                    self.record(metric_name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Call counts and latency percentiles of every instrumented function"""
+        with self._lock:
+            functions = sorted(self._functions.items())
+        result = {}
+        for name, stats in functions:
+            result[name] = {
+                **stats.read(),
+                'sample_every': stats.sample_every,
+                **stats.histogram.snapshot()
+            }
+        return result
+
+    def reset(self) -> None:
+        """Clear counts and histograms, keeping registrations"""
+        with self._lock:
+            for stats in self._functions.values():
+                stats.reset()
+                stats.histogram.reset()
+
+
+def _frame_label(code) -> str:
+    module = code.co_filename.rsplit('/', 1)[-1].rsplit('.', 1)[0]
+    return f"{module}:{code.co_name}"
+
+
+def collapse_samples(frames_list) -> Counter:
+    """Collapsed stacks (root first) from a list of leaf frames"""
+    stacks = Counter()
+    for frame in frames_list:
+        labels = []
+        while frame is not None:
+            labels.append(_frame_label(frame.f_code))
+            frame = frame.f_back
+        stacks[';'.join(reversed(labels))] += 1
+    return stacks
+
+
+class StackSampler:
+    """Statistical profiler polling the stacks of all other threads"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            frames = [
+                frame for ident, frame in sys._current_frames().items()
+                if ident != own
+            ]
+            self.stacks.update(collapse_samples(frames))
+            self.samples += 1
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.stacks
+
+
+def collapse_cprofile(profiler: cProfile.Profile) -> Counter:
+    """Caller;callee stacks weighted by own time in microseconds"""
+    stacks = Counter()
+    stats = pstats.Stats(profiler).stats
+    for (filename, line, name), (_, _, own_time, _, callers) in stats.items():
+        callee = f"{filename.rsplit('/', 1)[-1].rsplit('.', 1)[0]}:{name}"
+        if not callers:
+            stacks[callee] += int(own_time * 1e6)
+            continue
+        for (caller_file, _, caller_name), caller_stats in callers.items():
+            caller = f"{caller_file.rsplit('/', 1)[-1].rsplit('.', 1)[0]}:{caller_name}"
+            stacks[f"{caller};{callee}"] += int(caller_stats[2] * 1e6)
+    return Counter({stack: weight for stack, weight in stacks.items() if weight > 0})
+
+
+def format_collapsed(stacks: Counter, limit: Optional[int] = None) -> List[str]:
+    """Collapsed stack lines, heaviest first"""
+    return [f"{stack} {weight}" for stack, weight in stacks.most_common(limit)]
+
+
+class ProfilingBusyError(RuntimeError):
+    """Raised when a profiling window is requested while another is running"""
+
+
+_profiling_lock = threading.Lock()
+
+
+async def profile_window(duration: float, mode: str = 'sample', interval: float = 0.005) -> Counter:
+    """
+    Profile the process for a bounded window
+
+    Args:
+        duration: Window length in seconds (capped by settings.PROFILING_MAX_SECONDS)
+        mode: 'sample' (all threads) or 'cprofile' (event loop thread)
+        interval: Sampling interval in seconds for 'sample'
+
+    Returns:
+        Collapsed stacks with sample counts or microsecond weights
+    """
+    if mode not in ('sample', 'cprofile'):
+        raise ValueError(f"Invalid profiling mode: {mode}")
+    duration = min(duration, settings.PROFILING_MAX_SECONDS)
+    if not _profiling_lock.acquire(blocking=False):
+        raise ProfilingBusyError("A profiling window is already running")
+    try:
+        if mode == 'sample':
+            sampler = StackSampler(interval)
+            sampler.start()
+            try:
+                await asyncio.sleep(duration)
+            finally:
+                stacks = sampler.stop()
+            return stacks
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            profiler.disable()
+        return collapse_cprofile(profiler)
+    finally:
+        _profiling_lock.release()
+
+
+# Shared registry for calculators
+instrumentation = Instrumentation(settings.INSTRUMENTATION_SAMPLE_EVERY)
+instrument = instrumentation.instrument
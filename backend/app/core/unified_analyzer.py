@@ -24,6 +24,7 @@ from .calculations.planetary_strength import PlanetaryStrengthCalculator, Planet
 from .calculations.house_analysis import EnhancedHouseAnalysisEngine, HouseStrength
 from .calculations.aspect_analysis import AspectAnalyzer, AspectInfluence
 from .calculations.yoga_calculator import YogaCalculator, YogaResult
+from .calculations.house_kernel import planet_houses
 
 @dataclass
 class ChartAnalysis:
@@ -91,11 +92,10 @@ class UnifiedAnalyzer:
         
         # 2. Generate divisional charts
         divisions = [1, 2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60]
-        location = {'lat': latitude, 'lon': longitude}
-        divisional_charts = {
-            d: self.divisional_calc.calculate_chart(birth_time, d, location)
-            for d in divisions
-        }
+        divisional_charts = self.divisional_calc.calculate_all_vargas(planet_positions, divisions)
+        
+        # Houses of the natural zodiac, shared by every step below
+        houses = planet_houses(planet_positions)
         
         # 3. Calculate planetary strengths
         planetary_strengths = {}
@@ -104,26 +104,26 @@ class UnifiedAnalyzer:
                 planet=planet,
                 longitude=data['longitude'],
                 chart_time=birth_time,
-                house_position=int(data['longitude'] / 30) + 1
+                house_position=houses[planet]
             )
             planetary_strengths[planet] = strength
         
         # 4. Analyze house strengths
-        house_positions = self._get_house_positions(planet_positions)
+        house_positions = self._get_house_positions(planet_positions, houses)
         house_strengths = {}
         
         for house in range(1, 13):
             occupants = [
                 {'name': p, **d}
                 for p, d in planet_positions.items()
-                if int(d['longitude'] / 30) + 1 == house
+                if houses[p] == house
             ]
             
             # Get aspects to this house
-            aspects = self._get_aspects_to_house(house, planet_positions)
+            aspects = self._get_aspects_to_house(house, planet_positions, houses)
             
             # Get house lord
-            lord = self._get_house_lord(house, planet_positions)
+            lord = self._get_house_lord(house, planet_positions, houses)
             
             analysis = self.house_analyzer.analyze_house(
                 house=house,
@@ -137,10 +137,7 @@ class UnifiedAnalyzer:
         aspects = self.aspect_analyzer.calculate_all_aspects(planet_positions)
         
         # 6. Calculate yogas
-        yogas = []
-        yogas.extend(self.yoga_calc.calculate_raj_yoga(planet_positions, house_positions))
-        yogas.extend(self.yoga_calc.calculate_dhana_yoga(planet_positions, house_positions))
-        yogas.extend(self.yoga_calc.calculate_mahapurusha_yoga(planet_positions))
+        yogas = self.yoga_calc.calculate_yogas(planet_positions)
         
         # 7. Calculate overall chart strength
         chart_strength = self._calculate_chart_strength(
@@ -176,27 +173,29 @@ class UnifiedAnalyzer:
     
     def _get_house_positions(
         self,
-        planet_positions: Dict[str, Dict[str, float]]
+        planet_positions: Dict[str, Dict[str, float]],
+        houses: Optional[Dict[str, int]] = None
     ) -> Dict[int, List[str]]:
         """Convert planet positions to house positions"""
-        houses = {i: [] for i in range(1, 13)}
-        for planet, data in planet_positions.items():
-            house = int(data['longitude'] / 30) + 1
-            houses[house].append(planet)
-        return houses
+        houses = houses or planet_houses(planet_positions)
+        positions = {i: [] for i in range(1, 13)}
+        for planet in planet_positions:
+            positions[houses[planet]].append(planet)
+        return positions
     
     def _get_aspects_to_house(
         self,
         house: int,
-        planet_positions: Dict[str, Dict[str, float]]
+        planet_positions: Dict[str, Dict[str, float]],
+        houses: Optional[Dict[str, int]] = None
     ) -> List[Dict[str, Any]]:
         """Get list of aspects to a specific house"""
         aspects = []
         house_longitude = (house - 1) * 30
+        houses = houses or planet_houses(planet_positions)
         
         for planet, data in planet_positions.items():
-            planet_house = int(data['longitude'] / 30) + 1
-            if planet_house != house:  # Don't consider self-aspect
+            if houses[planet] != house:  # Don't consider self-aspect
                 aspect = {
                     'planet': planet,
                     'strength': data.get('strength', 50),
@@ -216,7 +215,8 @@ class UnifiedAnalyzer:
     def _get_house_lord(
         self,
         house: int,
-        planet_positions: Dict[str, Dict[str, float]]
+        planet_positions: Dict[str, Dict[str, float]],
+        houses: Optional[Dict[str, int]] = None
     ) -> Dict[str, Any]:
         """Get details of house lord"""
         # Simplified lordship (using natural zodiac)
@@ -230,7 +230,7 @@ class UnifiedAnalyzer:
         return {
             'planet': lord,
             'strength': planet_positions[lord].get('strength', 50),
-            'house': int(planet_positions[lord]['longitude'] / 30) + 1,
+            'house': houses[lord] if houses else planet_houses({lord: planet_positions[lord]})[lord],
             'dignity': planet_positions[lord].get('dignity', 'neutral')
         }
     
@@ -3,7 +3,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 
-from .api.endpoints import charts, health, birth_charts, horoscope, dasha, ashtakavarga, bhava, prediction, shadbala, ayanamsa
+from .api.endpoints import charts, health, birth_charts, horoscope, dasha, ashtakavarga, bhava, prediction, shadbala, ayanamsa, diagnostics
 from .core.config import settings
 
 app = FastAPI(
@@ -89,6 +89,12 @@ app.include_router(
     tags=["ayanamsa"]
 )
 
+app.include_router(
+    diagnostics.router,
+    prefix="/api/v1/diagnostics",
+    tags=["diagnostics"]
+)
+
 app.include_router(
     health.router,
     prefix="/api/v1/health",
@@ -128,3 +128,39 @@ def test_analyze_planet():
         }
     )
     assert response.status_code == 422
+
+def test_score_transits():
+    natal = {
+        "Sun": 10.0, "Moon": 100.0, "Mars": 200.0, "Mercury": 30.0,
+        "Jupiter": 250.0, "Venus": 330.0, "Saturn": 290.0, "Lagna": 75.0
+    }
+    response = client.post(
+        "/api/v1/ashtakavarga/transits",
+        json={
+            "natal_positions": natal,
+            "start_time": "2024-01-01T00:00:00",
+            "end_time": "2024-01-03T00:00:00",
+            "resolution_minutes": 360
+        }
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert len(result["times"]) == len(result["score"]) == 9
+    assert result["times"][1] == "2024-01-01T06:00:00"
+    assert set(result["natal_table"]) == {
+        "Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn", "Sarva"
+    }
+    assert sum(result["natal_table"]["Sarva"]) == 337
+    for key in ("signs", "bindus", "sarva"):
+        assert all(len(values) == 9 for values in result[key].values())
+    
+    # Missing lagna
+    response = client.post(
+        "/api/v1/ashtakavarga/transits",
+        json={
+            "natal_positions": {k: v for k, v in natal.items() if k != "Lagna"},
+            "start_time": "2024-01-01T00:00:00",
+            "end_time": "2024-01-03T00:00:00"
+        }
+    )
+    assert response.status_code == 422
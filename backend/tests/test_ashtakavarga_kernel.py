@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from app.core.calculations.ashtakavarga import Ashtakavarga
+from app.core.calculations.ashtakavarga_kernel import (
+    ASHTAKAVARGA_PLANETS, BINDU_TOTALS, CONTRIBUTION_MASKS, CONTRIBUTION_TABLE, CONTRIBUTIONS, CONTRIBUTORS,
+    MISSING_SIGN, compute_ashtakavarga, contributor_signs, house_signs
+)
+
+
+def reference(signs):
+    """Bhinnashtakavarga counted contributor by contributor"""
+    bindus = np.zeros((7, 12), dtype=int)
+    for row, planet in enumerate(ASHTAKAVARGA_PLANETS):
+        for column, sign in enumerate(signs):
+            if sign == MISSING_SIGN:
+                continue
+            for house in CONTRIBUTIONS[planet][column]:
+                bindus[row, (sign + house - 1) % 12] += 1
+    return bindus
+
+
+def test_tables_are_complete():
+    assert CONTRIBUTION_TABLE.shape == (7, 8, 12)
+    assert CONTRIBUTORS[-1] == 'Lagna'
+    assert BINDU_TOTALS == {
+        'Sun': 48, 'Moon': 49, 'Mars': 39, 'Mercury': 54, 'Jupiter': 56, 'Venus': 52, 'Saturn': 39
+    }
+    # Bit h - 1 of each mask marks house h
+    assert int(CONTRIBUTION_MASKS[0, 7]) == sum(1 << (house - 1) for house in (3, 4, 6, 10, 11, 12))
+
+
+def test_batch_matches_reference():
+    rng = np.random.default_rng(8)
+    signs = rng.integers(0, 12, (300, 8))
+    batch = compute_ashtakavarga(signs)
+    assert batch.bhinna.shape == (300, 7, 12)
+    for row in range(300):
+        np.testing.assert_array_equal(batch.bhinna[row], reference(signs[row]))
+    # Every chart distributes all 337 bindus
+    np.testing.assert_array_equal(batch.sarva.sum(axis=1), 337)
+    np.testing.assert_array_equal(batch.sarva, batch.bhinna.sum(axis=1))
+
+
+def test_missing_contributors_give_no_bindus():
+    signs = np.array([3, MISSING_SIGN, 7, 0, MISSING_SIGN, 11, 5, 9])
+    batch = compute_ashtakavarga(signs)
+    np.testing.assert_array_equal(batch.bhinna[0], reference(signs))
+    missing = sum(len(CONTRIBUTIONS[planet][column]) for planet in ASHTAKAVARGA_PLANETS for column in (1, 4))
+    assert batch.sarva[0].sum() == 337 - missing
+
+
+def test_invalid_signs():
+    with pytest.raises(ValueError):
+        compute_ashtakavarga(np.zeros((2, 7), dtype=int))
+    with pytest.raises(ValueError):
+        compute_ashtakavarga([0, 1, 2, 3, 4, 5, 6, 12])
+
+
+def test_contributor_signs():
+    longitudes = [[10.0, 45.0, 359.9, np.nan, 120.0, 200.0, 300.0]]
+    signs = contributor_signs(longitudes, [95.0])
+    np.testing.assert_array_equal(signs, [[0, 1, 11, MISSING_SIGN, 4, 6, 10, 3]])
+
+
+def test_house_positions_count_from_lagna():
+    houses = {'Sun': 1, 'Moon': 4, 'Mars': 7, 'Mercury': 2, 'Jupiter': 5, 'Venus': 3, 'Saturn': 8}
+    result = Ashtakavarga.calculate_ashtakavarga(houses)
+    assert set(result) == set(ASHTAKAVARGA_PLANETS) | {'Sarva'}
+    assert sum(result['Sarva']) == 337
+
+    # The same chart with the lagna in Leo, by sign
+    by_sign = compute_ashtakavarga(house_signs(houses, lagna_sign=4)).to_dict()
+    for name, bindus in result.items():
+        assert bindus == by_sign[name][4:] + by_sign[name][:4]
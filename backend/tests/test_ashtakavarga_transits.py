@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.core.calculations.ashtakavarga_kernel import ASHTAKAVARGA_PLANETS, compute_ashtakavarga, contributor_signs
+from app.core.calculations.ashtakavarga_transits import AshtakavargaTransitScorer, TransitSignSampler
+from app.core.calculations.prediction_engine import PredictionEngine
+
+NATAL = {'Sun': 10.0, 'Moon': 100.0, 'Mars': 200.0, 'Mercury': 30.0, 'Jupiter': 250.0, 'Venus': 330.0, 'Saturn': 290.0}
+LAGNA = 75.0
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    return AshtakavargaTransitScorer(NATAL, LAGNA, TransitSignSampler())
+
+
+def test_natal_table(scorer):
+    natal = compute_ashtakavarga(contributor_signs([[NATAL[p] for p in ASHTAKAVARGA_PLANETS]], [LAGNA]))
+    np.testing.assert_array_equal(scorer.table[:7], natal.bhinna[0])
+    np.testing.assert_array_equal(scorer.table[7], natal.sarva[0])
+
+
+def test_scores_are_table_gathers(scorer):
+    rng = np.random.default_rng(2)
+    signs = rng.integers(0, 12, (7, 50))
+    series = scorer.score(np.arange(50.0), signs)
+    for row in range(7):
+        np.testing.assert_array_equal(series.bindus[row], scorer.table[row][signs[row]])
+        np.testing.assert_array_equal(series.sarva[row], scorer.table[7][signs[row]])
+    np.testing.assert_array_equal(series.score, series.bindus.sum(axis=0))
+
+    with pytest.raises(ValueError):
+        scorer.score(np.arange(5.0), signs[:6, :5])
+
+
+@pytest.mark.parametrize("resolution", [timedelta(hours=1), timedelta(minutes=20), timedelta(days=2)])
+def test_sampled_signs_match_every_instant(scorer, resolution):
+    start, end = datetime(2024, 3, 1), datetime(2024, 5, 10, 7)
+    series = scorer.score_period(start, end, resolution)
+    jds, longitudes = PredictionEngine.generate_transit_series(
+        start, end, [planet.lower() for planet in ASHTAKAVARGA_PLANETS], resolution, 'LAHIRI'
+    )
+    np.testing.assert_allclose(series.jds, jds)
+    np.testing.assert_array_equal(series.signs, (longitudes // 30).astype(int) % 12)
+
+
+def test_sampler_skips_steady_instants():
+    sampler = TransitSignSampler()
+    jds = PredictionEngine.transit_instants(datetime(2024, 1, 1), datetime(2024, 2, 1), timedelta(hours=1))
+    sampler.signs(jds)
+    assert sampler.evaluated + sampler.skipped == 7 * len(jds)
+    assert sampler.evaluated < 7 * len(jds) / 3
+
+
+def test_columns(scorer):
+    series = scorer.score_period(datetime(2024, 1, 1), datetime(2024, 1, 11))
+    columns = series.to_columns()
+    assert columns['planets'] == list(ASHTAKAVARGA_PLANETS)
+    assert len(columns['jd']) == len(columns['score']) == 11
+    for key in ('signs', 'bindus', 'sarva'):
+        assert set(columns[key]) == set(ASHTAKAVARGA_PLANETS)
+        assert all(len(values) == 11 for values in columns[key].values())
+    assert all(0 <= count <= 11 for count in columns['favourable'].values())
+
+
+def test_missing_natal_positions():
+    with pytest.raises(ValueError):
+        AshtakavargaTransitScorer({'Sun': 10.0}, LAGNA)
@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+from app.core.calculations import aspect_kernel
+from app.core.calculations.aspect_analysis import AspectAnalyzer
+from app.core.calculations.aspect_kernel import (
+    ASPECT_HIT_DTYPE, AspectTable, find_aspects, separation_matrix, sign_distance_matrix
+)
+from app.core.calculations.aspects import EnhancedAspectCalculator
+from app.core.calculations.astronomical import AstronomicalCalculator
+from app.models.enums import Aspect, Planet
+
+NAMES = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
+
+
+def reference_hits(longitudes, table, others=None):
+    """Aspects by looping over pairs and aspects"""
+    hits = []
+    for instant, row in enumerate(np.atleast_2d(longitudes)):
+        if others is None:
+            targets, pairs = row, [(i, j) for i in range(len(row)) for j in range(i + 1, len(row))]
+        else:
+            targets = np.atleast_2d(others)[instant if np.ndim(others) == 2 else 0]
+            pairs = [(i, j) for i in range(len(row)) for j in range(len(targets))]
+        for i, j in pairs:
+            diff = abs(row[i] - targets[j])
+            if diff > 180:
+                diff = 360 - diff
+            for index, (angle, orb) in enumerate(zip(table.angles, table.orbs)):
+                if abs(diff - angle) <= orb:
+                    hits.append((instant, i, j, index))
+    return hits
+
+
+def hit_keys(hits):
+    return list(zip(*(hits[field].tolist() for field in ('instant', 'body1', 'body2', 'aspect'))))
+
+
+def test_separation_matrix_wraps():
+    distances = separation_matrix(np.array([[350.0, 10.0]]), np.array([10.0, 190.0]))
+    np.testing.assert_allclose(distances[0], [[20.0, 160.0], [0.0, 180.0]])
+
+
+def test_natal_hits_match_loops():
+    rng = np.random.default_rng(46)
+    longitudes = rng.uniform(0, 360, (50, 9))
+    table = EnhancedAspectCalculator.ASPECT_TABLE
+    hits = find_aspects(longitudes, table)
+    assert hits.dtype == ASPECT_HIT_DTYPE
+    assert hit_keys(hits) == reference_hits(longitudes, table)
+    assert (hits['orb'] <= table.orbs[hits['aspect']]).all()
+
+
+def test_transit_hits_fixed_and_moving():
+    rng = np.random.default_rng(47)
+    transits = rng.uniform(0, 360, (30, 7))
+    natal = rng.uniform(0, 360, 9)
+    moving = rng.uniform(0, 360, (30, 4))
+    table = AspectTable.from_pairs([('Conjunction', 0, 8), ('Square', 90, 6), ('Opposition', 180, 8)])
+
+    assert hit_keys(find_aspects(transits, table, others=natal)) == reference_hits(transits, table, natal)
+    assert hit_keys(find_aspects(transits, table, others=moving)) == reference_hits(transits, table, moving)
+    with pytest.raises(ValueError):
+        find_aspects(transits, table, others=moving[:5])
+
+
+def test_chunked_instants(monkeypatch):
+    rng = np.random.default_rng(48)
+    longitudes = rng.uniform(0, 360, (40, 9))
+    table = EnhancedAspectCalculator.ASPECT_TABLE
+    whole = find_aspects(longitudes, table)
+    monkeypatch.setattr(aspect_kernel, 'CHUNK_CELLS', 100)
+    chunked = find_aspects(longitudes, table)
+    np.testing.assert_array_equal(chunked, whole)
+
+
+def test_first_only_keeps_first_aspect():
+    table = AspectTable.from_pairs([('Wide', 0, 10), ('Narrow', 0, 1), ('Opposition', 180, 5)])
+    hits = find_aspects([0.5, 0.0, 178.0], table, first_only=True)
+    assert hit_keys(hits) == [(0, 0, 1, 0), (0, 0, 2, 2), (0, 1, 2, 2)]
+    assert len(find_aspects([0.5, 0.0, 178.0], table)) == 4
+
+
+def test_enhanced_calculator_matches_loops():
+    rng = np.random.default_rng(49)
+    calculator = EnhancedAspectCalculator()
+    for _ in range(20):
+        positions = {
+            name: {'longitude': float(rng.uniform(0, 360)), 'speed': float(rng.normal()), 'house': 1}
+            for name in NAMES
+        }
+        aspects = calculator.calculate_aspects(positions)
+        longitudes = [data['longitude'] for data in positions.values()]
+        expected = reference_hits(longitudes, calculator.ASPECT_TABLE)
+        assert [(a.planet1, a.planet2, a.aspect.name) for a in aspects] == [
+            (NAMES[i], NAMES[j], calculator.ASPECT_TABLE.names[index]) for _, i, j, index in expected
+        ]
+        for aspect in aspects:
+            diff = abs(positions[aspect.planet1]['longitude'] - positions[aspect.planet2]['longitude'])
+            diff = 360 - diff if diff > 180 else diff
+            assert aspect.orb == round(abs(diff - aspect.aspect.angle), 2)
+
+
+def test_astronomical_calculator_matches_calculate_aspect():
+    rng = np.random.default_rng(50)
+    calculator = AstronomicalCalculator()
+    planets = list(Planet)[:7]
+    for _ in range(20):
+        positions = {planet: float(rng.uniform(0, 360)) for planet in planets}
+        expected = []
+        for i, p1 in enumerate(planets):
+            for p2 in planets[i + 1:]:
+                aspect = calculator.calculate_aspect(positions[p1], positions[p2], 6.0)
+                if aspect:
+                    expected.append((p1, p2, aspect))
+        assert calculator.calculate_aspects(positions, orb=6.0) == expected
+    assert all(isinstance(aspect, Aspect) for _, _, aspect in expected)
+
+
+def test_sign_distances_match_analyzer():
+    rng = np.random.default_rng(51)
+    analyzer = AspectAnalyzer()
+    longitudes = rng.uniform(0, 360, 7)
+    houses = sign_distance_matrix(longitudes)[0]
+    for i in range(7):
+        for j in range(7):
+            assert houses[i, j] == analyzer._calculate_houses_between(longitudes[i], longitudes[j])
+
+
+def test_graha_drishti_matches_loops():
+    rng = np.random.default_rng(52)
+    analyzer = AspectAnalyzer()
+    for _ in range(20):
+        positions = {name: {'longitude': float(rng.uniform(0, 360))} for name in NAMES[:7]}
+        expected = {}
+        planets = list(positions)
+        for i, p1 in enumerate(planets):
+            for p2 in planets[i + 1:]:
+                l1, l2 = positions[p1]['longitude'], positions[p2]['longitude']
+                forward = analyzer.calculate_aspect_influence(p1, p2, analyzer._calculate_houses_between(l1, l2))
+                backward = analyzer.calculate_aspect_influence(p2, p1, analyzer._calculate_houses_between(l2, l1))
+                if forward:
+                    expected[(p1, p2)] = forward
+                if backward:
+                    expected[(p2, p1)] = backward
+        result = analyzer.calculate_all_aspects(positions)
+        assert list(result) == list(expected)
+        assert result == expected
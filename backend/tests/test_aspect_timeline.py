@@ -0,0 +1,110 @@
+"""
+Tests for the aspect timeline
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.core.calculations.aspect_kernel import AspectTable
+from app.core.calculations.aspect_timeline import (
+    EXACT, IN_ORB, MAJOR_ASPECTS, AspectTimeline, aspect_windows
+)
+from app.core.calculations.event_solver import datetime_to_julian_day, julian_day_to_datetime
+from app.models.enums import Planet
+
+
+@pytest.fixture(scope="module")
+def timeline():
+    return AspectTimeline()
+
+
+def test_great_conjunction():
+    """Jupiter and Saturn were exactly conjunct on 2020-12-21 around 18:20 UTC"""
+    timeline = AspectTimeline(ayanamsa_system=None)
+    events = timeline.transit_events(
+        datetime(2020, 12, 1), datetime(2021, 1, 10), [Planet.JUPITER, Planet.SATURN]
+    )
+    exact = events[events['phase'] == EXACT]
+    assert len(exact) == 1
+    assert MAJOR_ASPECTS.names[exact['aspect'][0]] == 'Conjunction'
+    assert abs(julian_day_to_datetime(exact['jd'][0]) - datetime(2020, 12, 21, 18, 20)) < timedelta(minutes=10)
+
+    # Already within the 10 degree orb on Dec 1 and still in orb on Jan 10
+    windows = aspect_windows(events, MAJOR_ASPECTS, ['Jupiter', 'Saturn'], ['Jupiter', 'Saturn'])
+    assert len(windows) == 1
+    assert windows[0].entry is None and windows[0].exit is None
+
+
+def test_retrograde_window_has_three_exacts(timeline):
+    """Mercury retrograde in April 2024 passes a point three times"""
+    point = timeline._planet_state(Planet.MERCURY)(datetime_to_julian_day(datetime(2024, 4, 12)))[0]
+    table = AspectTable.from_pairs([('Conjunction', 0, 10)])
+    events = timeline.transit_natal_events([point], datetime(2024, 3, 1), datetime(2024, 6, 1), [Planet.MERCURY], table)
+    windows = aspect_windows(events, table, ['Mercury'], ['Point'])
+    assert len(windows) == 1
+    window = windows[0]
+    assert window.entry < window.exact[0] < window.exact[1] < window.exact[2] < window.exit
+    assert abs(window.exact[1] - datetime_to_julian_day(datetime(2024, 4, 12))) < 1e-4
+
+
+def test_events_are_exact_and_consistent(timeline):
+    rng = np.random.default_rng(47)
+    natal = rng.uniform(0, 360, (20, 5))
+    planets = [Planet.MOON, Planet.SUN, Planet.MARS]
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 15)
+    events = timeline.transit_natal_events(natal, start, end, planets)
+    assert (np.diff(events['chart']) >= 0).all()
+    start_jd, end_jd = datetime_to_julian_day(start), datetime_to_julian_day(end)
+    assert ((events['jd'] >= start_jd) & (events['jd'] <= end_jd)).all()
+
+    for event in events[events['phase'] != IN_ORB]:
+        longitude = timeline._planet_state(planets[event['body1']])(event['jd'])[0]
+        target = natal[event['chart'], event['body2']] + event['side'] * MAJOR_ASPECTS.angles[event['aspect']]
+        offset = abs((longitude - target + 180) % 360 - 180)
+        expected = 0 if event['phase'] == EXACT else MAJOR_ASPECTS.orbs[event['aspect']]
+        assert offset == pytest.approx(expected, abs=1e-4)
+
+    # Entries and exits alternate within every aspect of every pair
+    for window in aspect_windows(events, MAJOR_ASPECTS, ['Moon', 'Sun', 'Mars'], list('abcde')):
+        assert window.entry is None or window.entry >= start_jd
+        if window.exit is not None and window.entry is not None:
+            assert window.entry < window.exit
+        for jd in window.exact:
+            assert (window.entry or start_jd) <= jd <= (window.exit or end_jd)
+
+
+def test_moon_exacts_match_dense_sampling(timeline):
+    point = 123.4
+    table = AspectTable.from_pairs([('Square', 90, 8)])
+    events = timeline.transit_natal_events([point], datetime(2024, 2, 1), datetime(2024, 4, 1), [Planet.MOON], table)
+    state = timeline._planet_state(Planet.MOON)
+    jds = np.arange(datetime_to_julian_day(datetime(2024, 2, 1)), datetime_to_julian_day(datetime(2024, 4, 1)), 0.05)
+    offsets = np.unwrap([state(jd)[0] for jd in jds], period=360.0) - point
+    crossings = sum(
+        int(np.count_nonzero(np.diff(np.floor((offsets - target) / 360.0)))) for target in (90, -90)
+    )
+    assert np.count_nonzero(events['phase'] == EXACT) == crossings > 0
+
+
+def test_batch_matches_single_charts(timeline):
+    rng = np.random.default_rng(48)
+    natal = rng.uniform(0, 360, (7, 4))
+    start, end = datetime(2024, 5, 1), datetime(2024, 5, 4)
+    batch = timeline.transit_natal_events(natal, start, end, [Planet.MOON, Planet.VENUS])
+    chunks = list(timeline.iter_transit_natal_events(natal, start, end, [Planet.MOON, Planet.VENUS], chunk_size=3))
+    assert len(chunks) == 3
+    np.testing.assert_array_equal(np.concatenate(chunks), batch)
+
+    for chart in range(len(natal)):
+        single = timeline.transit_natal_events(natal[chart], start, end, [Planet.MOON, Planet.VENUS])
+        rows = batch[batch['chart'] == chart]
+        np.testing.assert_array_equal(single[['body1', 'body2', 'aspect', 'side', 'phase']],
+                                      rows[['body1', 'body2', 'aspect', 'side', 'phase']])
+        np.testing.assert_allclose(single['jd'], rows['jd'])
+
+
+def test_invalid_range(timeline):
+    with pytest.raises(ValueError):
+        timeline.transit_events(datetime(2024, 1, 2), datetime(2024, 1, 1))
+
@@ -5,7 +5,8 @@ from unittest.mock import patch, MagicMock
 import psutil
 import time
 import itertools
-from app.core.calculations.ayanamsa import EnhancedAyanamsaManager
+import numpy as np
+from app.core.calculations.ayanamsa import AyanamsaSystem, EnhancedAyanamsaManager
 
 @pytest.fixture
 def mock_swe():
@@ -670,3 +671,54 @@ def test_ayanamsa_system_comparison(mocker):
         nutation_diff = with_nutation[system] - without_nutation[system]
         assert abs(nutation_diff - expected_nutation_diff) < 1e-6, \
             f"Incorrect nutation effect for {system}. Expected {expected_nutation_diff}, got {nutation_diff}"
+
+def test_ayanamsa_series_matches_swiss_ephemeris():
+    """Interpolated series stays within the documented error of the reference path"""
+    manager = EnhancedAyanamsaManager()
+    rng = np.random.default_rng(42)
+    jds = rng.uniform(2433282.5, 2469807.5, 500)  # 1950-2050
+    
+    for system in manager.get_available_systems():
+        series = manager.calculate_ayanamsa_series(jds, system)
+        reference = np.array([sum(manager._reference_components(system, jd)) for jd in jds])
+        assert np.max(np.abs(series - reference)) < 1e-7
+        
+        mean = manager.calculate_ayanamsa_series(jds, system, apply_nutation=False)
+        reference = np.array([manager._reference_components(system, jd)[0] for jd in jds])
+        assert np.max(np.abs(mean - reference)) < 1e-10
+
+def test_ayanamsa_series_shape_and_scalar_path():
+    manager = EnhancedAyanamsaManager()
+    jds = 2460000.5 + np.arange(12).reshape(3, 4) * 0.37
+    
+    series = manager.calculate_ayanamsa_series(jds)
+    assert series.shape == (3, 4)
+    for jd, value in zip(jds.ravel(), series.ravel()):
+        assert manager.ayanamsa_at(jd) == pytest.approx(value, abs=1e-12)
+    
+    date = datetime(2024, 1, 1)
+    assert manager.calculate_precise_ayanamsa(date) == manager._calculate_precise_ayanamsa(date)
+    
+    with pytest.raises(ValueError):
+        manager.calculate_ayanamsa_series(jds, 'INVALID')
+
+def test_bulk_conversion_matches_per_chart_path():
+    rng = np.random.default_rng(7)
+    dates = [datetime(1950 + int(year), 1 + int(month), 1, 12) for year, month in zip(rng.integers(0, 100, 20), rng.integers(0, 12, 20))]
+    jds = np.array([swe.julday(d.year, d.month, d.day, d.hour) for d in dates])
+    longitudes = rng.uniform(0, 360, (20, 9))
+    systems = list(AyanamsaSystem.base_values)
+    
+    sidereal = AyanamsaSystem.convert_positions_bulk(longitudes, jds, systems)
+    assert sidereal.shape == (len(systems), 20, 9)
+    
+    for s, system in enumerate(systems):
+        for c, date in enumerate(dates):
+            positions = {str(p): lon for p, lon in enumerate(longitudes[c])}
+            expected = AyanamsaSystem.convert_all_positions(positions, date, system)
+            np.testing.assert_allclose(sidereal[s, c], [expected[str(p)] for p in range(9)], atol=1e-9)
+    
+    with pytest.raises(ValueError):
+        AyanamsaSystem.convert_positions_bulk(longitudes, jds[:5])
+    with pytest.raises(ValueError):
+        AyanamsaSystem.calculate_ayanamsa_series(jds, ['unknown'])
@@ -0,0 +1,116 @@
+"""Tests for the benchmark regression harness."""
+import json
+import random
+import pytest
+
+# Imported at collection so workloads use the real ephemeris, not the conftest mock
+from app.core.benchmarks import workloads  # noqa: F401
+from app.core.benchmarks.__main__ import main
+from app.core.benchmarks.harness import (
+    BenchmarkCase,
+    BenchmarkReport,
+    CaseResult,
+    compare,
+    get_cases,
+    percentile,
+    run_case
+)
+
+
+def _result(name, p50=1.0, error=None, memory=10.0):
+    return CaseResult(name, 'test', 100, p50, p50 * 2, p50 * 3, p50, 1000 / p50, memory, error)
+
+
+def test_percentile():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0.0
+
+
+def test_workloads_are_reproducible():
+    case = get_cases(['dasha.all_levels'])[0]
+    first = [call() for call in case.build(random.Random(1))[:3]]
+    second = [call() for call in case.build(random.Random(1))[:3]]
+    assert first == second
+
+
+def test_every_engine_is_covered():
+    groups = {case.group for case in get_cases()}
+    assert {
+        'positions', 'cusps', 'divisional', 'strength', 'ashtakavarga',
+        'dasha', 'yoga', 'aspects', 'unified', 'http'
+    } <= groups
+    with pytest.raises(ValueError):
+        get_cases(['no-such-case'])
+
+
+def test_run_case_reports_metrics_and_errors():
+    case = BenchmarkCase('sum', 'test', lambda rng: [lambda: sum(range(1000))] * 50)
+    result = run_case(case)
+    assert result.calls == 50
+    assert 0 < result.p50_ms <= result.p95_ms <= result.p99_ms
+    assert result.throughput_per_s > 0
+    assert result.error is None
+
+    def failing(rng):
+        raise RuntimeError("broken")
+    result = run_case(BenchmarkCase('broken', 'test', failing))
+    assert result.error == "RuntimeError: broken"
+
+
+def test_compare_thresholds():
+    baseline = BenchmarkReport({'a': _result('a'), 'b': _result('b'), 'c': _result('c')})
+    current = BenchmarkReport({
+        'a': _result('a', p50=1.1),
+        'b': _result('b', p50=2.0),
+        'c': _result('c', error='ValueError: x')
+    })
+    regressions = compare(current, baseline, threshold=0.2)
+
+    assert {(r.case, r.metric) for r in regressions} >= {('b', 'p50_ms'), ('b', 'p99_ms'), ('c', 'error')}
+    assert not any(r.case == 'a' for r in regressions)
+    assert compare(current, baseline, threshold=1.5) == [regressions[-1]]
+
+    # Errors fail the comparison even when the baseline errored or lacks the case
+    failing = BenchmarkReport({'c': _result('c', error='ValueError: y'), 'd': _result('d', error='ValueError: z')})
+    errored = BenchmarkReport({'c': _result('c', error='ValueError: x')})
+    assert [(r.case, r.metric) for r in compare(failing, errored)] == [('c', 'error'), ('d', 'error')]
+
+
+def test_report_round_trip(tmp_path):
+    report = BenchmarkReport({'a': _result('a')}, {'python': '3'})
+    report.save(tmp_path / 'report.json')
+    loaded = BenchmarkReport.load(tmp_path / 'report.json')
+    assert loaded.results == report.results
+    assert loaded.environment == {'python': '3'}
+
+
+def test_cli_fails_on_regression(tmp_path, capsys):
+    baseline = tmp_path / 'baseline.json'
+    assert main(['--cases', 'yoga.classical', '--baseline', str(baseline)]) == 2
+    assert main(['--cases', 'yoga.classical', '--baseline', str(baseline), '--update-baseline', '--rounds', '1']) == 0
+
+    data = json.loads(baseline.read_text())
+    result = data['results']['yoga.classical']
+    for metric in ('p50_ms', 'p95_ms', 'p99_ms'):
+        result[metric] /= 100
+    result['throughput_per_s'] *= 100
+    baseline.write_text(json.dumps(data))
+
+    assert main(['--cases', 'yoga.classical', '--baseline', str(baseline), '--rounds', '1']) == 1
+    assert 'regression' in capsys.readouterr().out
+
+
+def test_cli_refuses_baseline_with_errors(tmp_path, monkeypatch, capsys):
+    def failing(rng):
+        raise RuntimeError("broken")
+    monkeypatch.setattr(
+        'app.core.benchmarks.__main__.get_cases',
+        lambda selection: [BenchmarkCase('broken', 'test', failing)]
+    )
+    baseline = tmp_path / 'baseline.json'
+    assert main(['--cases', 'broken', '--baseline', str(baseline), '--update-baseline']) == 1
+    assert not baseline.exists()
+    assert 'broken' in capsys.readouterr().err
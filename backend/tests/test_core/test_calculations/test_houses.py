@@ -1,7 +1,9 @@
 """Test house calculations."""
+import numpy as np
 import pytest
+import swisseph as swe
 from datetime import datetime
-from app.core.calculations.houses import HouseCalculator
+from app.core.calculations.houses import HouseCalculator, calculate_house_batch
 from app.models.location import Location
 
 
@@ -41,3 +43,36 @@ def test_house_systems(calculator):
     
     # Houses should be different between systems
     assert houses_p["cusps"] != houses_k["cusps"]
+
+
+def test_house_batch_matches_swiss_ephemeris():
+    """Batch cusps equal one houses_ex call per chart and system"""
+    rng = np.random.default_rng(48)
+    latitudes = rng.uniform(-60, 60, 50)
+    longitudes = rng.uniform(-180, 180, 50)
+    jd = 2460000.25
+    batch = calculate_house_batch(jd, latitudes, longitudes, ('P', 'K', 'E', 'W'))
+    assert batch.cusps.shape == (4, 50, 12)
+    for system in batch.systems:
+        expected = [swe.houses_ex(jd, lat, lon, system.encode())[0] for lat, lon in zip(latitudes, longitudes)]
+        np.testing.assert_allclose(batch.system_cusps(system), expected, atol=1e-9)
+    angles = [swe.houses_ex(jd, lat, lon, b'P')[1][:4] for lat, lon in zip(latitudes, longitudes)]
+    np.testing.assert_allclose(np.column_stack([batch.ascendant, batch.midheaven, batch.armc, batch.vertex]), angles)
+
+
+def test_house_batch_sidereal_and_polar():
+    tropical = calculate_house_batch([2460000.25, 2460001.25], [28.6, 80.0], 77.2, ('P', 'W'))
+    sidereal = calculate_house_batch([2460000.25, 2460001.25], [28.6, 80.0], 77.2, ('P', 'W'), 'LAHIRI')
+    # Ayanamsa near 24 degrees in 2023
+    assert 23.5 < (tropical.ascendant[0] - sidereal.ascendant[0]) % 360 < 24.5
+    # Whole sign cusps start at the sign of the sidereal ascendant
+    assert sidereal.system_cusps('W')[0, 0] == sidereal.ascendant[0] // 30 * 30
+    # Placidus is undefined above the polar circle, the other charts are kept
+    assert np.isnan(sidereal.system_cusps('P')[1]).all()
+    assert not np.isnan(sidereal.system_cusps('W')[1]).any()
+    assert len(sidereal.to_dict(0, 'P')['cusps']) == 12
+
+    with pytest.raises(ValueError):
+        calculate_house_batch(2460000.25, 28.6, 77.2, ('X',))
+    with pytest.raises(ValueError):
+        calculate_house_batch(2460000.25, 28.6, 77.2, ('P',), 'UNKNOWN')
@@ -143,3 +143,25 @@ def test_invalid_division():
     for division in invalid_divisions:
         with pytest.raises(ValueError):
             engine.calculate_divisional_chart(test_positions, division)
+
+def test_calculate_all_divisions():
+    engine = EnhancedDivisionalChartEngine()
+    positions = {'Sun': {'longitude': 39.0}, 'Moon': 99.0}
+
+    charts = engine.calculate_all_divisions(positions, ayanamsa_value=24.0, charts=['D1', 'd9', 'D12'])
+
+    assert list(charts) == ['D1', 'D9', 'D12']
+    assert charts['D1'] == {'Sun': 0.0, 'Moon': 60.0}
+    for chart, division in (('D9', 9), ('D12', 12)):
+        expected = engine.calculate_divisional_chart({'Sun': 15.0, 'Moon': 75.0}, division)
+        assert charts[chart] == pytest.approx(expected)
+
+def test_calculate_all_divisions_defaults_and_errors():
+    engine = EnhancedDivisionalChartEngine()
+    charts = engine.calculate_all_divisions({'Sun': 10.0})
+    assert 'D40' in charts and 'D60' not in charts
+
+    with pytest.raises(ValueError):
+        engine.calculate_all_divisions({'Sun': 10.0}, charts=['D60'])
+    with pytest.raises(ValueError):
+        engine.calculate_all_divisions({'Sun': 10.0}, charts=['Navamsa'])
@@ -0,0 +1,101 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+import importlib.util
+
+import numpy as np
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import column, create_engine, insert, table
+from sqlalchemy.orm import Session
+
+from app.core.calculations.divisional_bulk import (
+    MISSING_SIGN, PLANET_COLUMNS, LongitudePage, collection_divisional_signs,
+    divisional_signs, iter_longitude_pages, stream_divisional_signs
+)
+from app.core.calculations.divisional_kernel import compute_vargas
+
+DIVISIONS = (9, 10, 60)
+MIGRATION = Path(__file__).parents[1] / "alembic" / "versions" / "26b1e8b640ca_initial_migration.py"
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    spec = importlib.util.spec_from_file_location("initial_migration", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    with engine.begin() as connection, Operations.context(MigrationContext.configure(connection)):
+        migration.upgrade()
+
+    birth_charts = table(
+        "birth_charts", column("id"), column("name"), column("birth_time"),
+        column("latitude"), column("longitude"), column("timezone")
+    )
+    positions = table(
+        "planetary_positions", column("id"), column("birth_chart_id"), column("planet_name"), column("longitude")
+    )
+    rng = np.random.default_rng(3)
+    charts, rows = [], []
+    for index in range(25):
+        chart_id = f"chart-{index:03d}"
+        charts.append(dict(
+            id=chart_id, name=chart_id, birth_time=datetime(2000, 1, 1), latitude=0.0, longitude=0.0, timezone="UTC"
+        ))
+        # The last chart has no Ketu position
+        for planet in PLANET_COLUMNS[:8] if index == 24 else PLANET_COLUMNS:
+            rows.append(dict(
+                id=f"{chart_id}-{planet}", birth_chart_id=chart_id, planet_name=planet,
+                longitude=float(rng.uniform(0, 360))
+            ))
+    with engine.begin() as connection:
+        connection.execute(insert(birth_charts), charts)
+        connection.execute(insert(positions), rows)
+    db = Session(engine)
+    yield db
+    db.close()
+
+
+def test_divisional_signs_shape_and_missing():
+    longitudes = np.array([[15.0, 200.0, np.nan], [359.5, 0.0, 45.0]])
+    signs = divisional_signs(longitudes, DIVISIONS)
+    assert signs.shape == (2, 3, 3)
+    assert signs.dtype == np.int8
+    assert (signs[0, 2] == MISSING_SIGN).all()
+    expected = compute_vargas(np.nan_to_num(longitudes), DIVISIONS, with_longitudes=False).signs
+    assert np.array_equal(signs[~np.isnan(longitudes)], expected[~np.isnan(longitudes)])
+
+
+def test_pages_read_every_chart_once(session):
+    pages = list(iter_longitude_pages(session, page_size=10))
+    assert [len(page.chart_ids) for page in pages] == [10, 10, 5]
+    chart_ids = [chart_id for page in pages for chart_id in page.chart_ids]
+    assert chart_ids == sorted(chart_ids) and len(set(chart_ids)) == 25
+    assert pages[-1].longitudes.shape == (5, 9)
+    assert np.isnan(pages[-1].longitudes[-1, 8])
+    assert not np.isnan(pages[0].longitudes).any()
+    # Full longitudes, not degrees within the sign
+    assert pages[0].longitudes.max() > 30.0
+
+
+def test_stream_with_process_pool_matches_inline():
+    rng = np.random.default_rng(5)
+    pages = [LongitudePage([f"{p}-{i}" for i in range(50)], rng.uniform(0, 360, (50, 9))) for p in range(6)]
+
+    inline = list(stream_divisional_signs(pages, DIVISIONS))
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = list(stream_divisional_signs(iter(pages), DIVISIONS, executor=executor, max_pending=2))
+
+    assert [ids for ids, _ in parallel] == [page.chart_ids for page in pages]
+    for (_, expected), (_, signs) in zip(inline, parallel):
+        assert np.array_equal(expected, signs)
+
+
+def test_collection_divisional_signs(session):
+    results = list(collection_divisional_signs(session, page_size=10, workers=0))
+    assert sum(len(ids) for ids, _ in results) == 25
+    chart_ids, signs = results[-1]
+    assert signs.shape == (5, 9, 3)
+    assert (signs[-1, 8] == MISSING_SIGN).all()
+    assert signs[:, :8].min() >= 0 and signs.max() <= 11
@@ -113,3 +113,42 @@ def test_default_location(chart_engine, test_date):
     """Test chart calculation with default location"""
     chart = chart_engine.calculate_chart(test_date, division=1)
     assert chart.location == chart_engine.default_location
+
+def test_all_vargas_match_division_methods(chart_engine):
+    """Vectorized vargas agree with the per-division calculations"""
+    longitudes = [0.0, 3.3333333333, 10.0, 14.999999, 15.0, 29.999999, 30.0,
+                  123.456789, 179.5, 200.0, 333.3333333, 359.999999]
+    positions = {f"P{i}": {'longitude': lon} for i, lon in enumerate(longitudes)}
+
+    vargas = chart_engine.calculate_all_vargas(positions)
+
+    assert sorted(vargas) == sorted(chart_engine.division_map)
+    for division, method in chart_engine.division_map.items():
+        expected = method(positions)
+        for planet, longitude in expected.items():
+            assert vargas[division][planet] == pytest.approx(longitude, abs=1e-9)
+
+def test_all_vargas_accepts_plain_longitudes(chart_engine):
+    """Positions may be given as bare longitudes and a division subset"""
+    vargas = chart_engine.calculate_all_vargas({'Sun': 45.5, 'Moon': 200.25}, divisions=[9, 3])
+    assert list(vargas) == [9, 3]
+    assert vargas[3] == {'Sun': 40.0, 'Moon': 200.0}
+
+    with pytest.raises(ValueError):
+        chart_engine.calculate_all_vargas({'Sun': 45.5}, divisions=[5])
+
+def test_one_cache_entry_per_chart(chart_engine, test_date, test_location):
+    """All divisions of a chart share a single cache entry"""
+    for division in (1, 9, 60):
+        chart_engine.calculate_chart(test_date, division=division, location=test_location)
+    assert chart_engine.cache.size() == 1
+
+def test_chart_ayanamsa_follows_engine_system(mock_swe, test_date, test_location):
+    """Charts report the ayanamsa of the engine's system, not the global sidereal mode"""
+    lahiri = DivisionalChartEngine(cache=CalculationCache()).calculate_chart(test_date, 1, test_location)
+    raman = DivisionalChartEngine(cache=CalculationCache(), ayanamsa_system='RAMAN').calculate_chart(
+        test_date, 1, test_location
+    )
+    assert 24.0 < lahiri.ayanamsa < 25.0
+    assert 23.0 < raman.ayanamsa < 23.5
+    mock_swe.get_ayanamsa_ut.assert_not_called()
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from app.core.calculations.divisional import EnhancedDivisionalChartEngine
+from app.core.calculations.divisional_charts import SUPPORTED_DIVISIONS, DivisionalChartEngine
+from app.core.calculations.divisional_kernel import VargaBatch, compute_vargas
+from app.core.calculations.varga_tables import DIVISIONAL, ENHANCED
+
+NAMES = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
+
+
+@pytest.fixture
+def longitudes():
+    return np.random.default_rng(7).uniform(0, 360, (25, len(NAMES)))
+
+
+def test_batch_shapes(longitudes):
+    batch = compute_vargas(longitudes, SUPPORTED_DIVISIONS)
+    assert isinstance(batch, VargaBatch)
+    assert batch.signs.shape == (25, 9, 16)
+    assert batch.signs.dtype == np.int8
+    assert batch.longitudes.shape == (25, 9, 16)
+    assert np.array_equal(batch.signs, np.floor(batch.longitudes / 30))
+
+
+def test_batch_matches_divisional_engine(longitudes):
+    engine = DivisionalChartEngine()
+    batch = compute_vargas(longitudes, SUPPORTED_DIVISIONS, DIVISIONAL)
+    for chart in (0, 13, 24):
+        positions = {name: {'longitude': lon} for name, lon in zip(NAMES, longitudes[chart])}
+        for division, method in engine.division_map.items():
+            expected = method(positions)
+            column = SUPPORTED_DIVISIONS.index(division)
+            assert batch.longitudes[chart, :, column] == pytest.approx(list(expected.values()), abs=1e-9)
+
+
+def test_batch_matches_enhanced_engine(longitudes):
+    engine = EnhancedDivisionalChartEngine()
+    divisions = (1, 9, 12, 30, 40)
+    batch = compute_vargas(longitudes, divisions, ENHANCED)
+    chart = dict(zip(NAMES, longitudes[3]))
+    for column, division in enumerate(divisions):
+        expected = engine.calculate_divisional_chart(chart, division)
+        assert batch.longitudes[3, :, column] == pytest.approx(list(expected.values()), abs=1e-6)
+
+
+def test_single_chart_and_signs_only():
+    batch = compute_vargas([15.0, 45.0, 75.0], (9,), ENHANCED, with_longitudes=False)
+    assert batch.longitudes is None
+    assert batch.signs[0, :, 0].tolist() == [4, 7, 10]
+    with pytest.raises(ValueError):
+        batch.to_dict(['Sun', 'Moon', 'Mars'])
+
+
+def test_to_dict():
+    batch = compute_vargas([45.5, 200.25], (3, 1))
+    assert batch.to_dict(['Sun', 'Moon']) == {
+        3: {'Sun': 40.0, 'Moon': 200.0},
+        1: {'Sun': 45.5, 'Moon': 200.25}
+    }
+
+
+def test_invalid_input():
+    with pytest.raises(ValueError):
+        compute_vargas(np.zeros((2, 3, 4)), (9,))
+    with pytest.raises(ValueError):
+        compute_vargas([10.0], (60,), ENHANCED)
+
+
+def test_varga_degrees(longitudes):
+    divisions = (1, 2, 3, 4, 7, 9, 12, 60)
+    batch = compute_vargas(longitudes, divisions, with_degrees=True)
+    expected = np.mod(longitudes[..., np.newaxis] * np.array(divisions), 30)
+    difference = np.abs(batch.degrees - expected)
+    assert np.all(np.minimum(difference, 30 - difference) < 1e-9)
+    assert compute_vargas(longitudes, divisions).degrees is None
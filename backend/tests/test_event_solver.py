@@ -0,0 +1,130 @@
+"""
+Tests for the event-time solver
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from app.core.calculations.event_solver import (
+    EventSolver,
+    EventType,
+    brent_root,
+    datetime_to_julian_day,
+    julian_day_to_datetime
+)
+from app.models.enums import Planet
+
+
+@pytest.fixture
+def solver():
+    return EventSolver()
+
+
+@pytest.fixture
+def tropical_solver():
+    return EventSolver(ayanamsa_system=None)
+
+
+def test_brent_root():
+    root = brent_root(lambda x: x * x - 2, 0.0, 2.0, -2.0, 2.0, 1e-12)
+    assert abs(root - 2 ** 0.5) < 1e-10
+
+
+def test_julian_day_round_trip():
+    date = datetime(2024, 3, 20, 3, 6, 30)
+    assert abs(julian_day_to_datetime(datetime_to_julian_day(date)) - date) < timedelta(milliseconds=1)
+
+    aware = datetime(2024, 3, 20, 8, 36, 30, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+    assert datetime_to_julian_day(aware) == pytest.approx(datetime_to_julian_day(date))
+
+
+def test_equinox_ingress(tropical_solver):
+    """Tropical Sun enters Aries at the March 2024 equinox (03:06 UTC)"""
+    events = tropical_solver.find_events(
+        datetime(2024, 3, 15),
+        datetime(2024, 3, 25),
+        event_types=[EventType.SIGN_INGRESS],
+        planets=[Planet.SUN]
+    )
+    assert len(events) == 1
+    assert events[0].from_index == 11
+    assert events[0].to_index == 0
+    assert abs(events[0].time - datetime(2024, 3, 20, 3, 6)) < timedelta(minutes=5)
+
+
+def test_mercury_station(solver):
+    """Mercury stationed direct on 2024-01-02 around 03:08 UTC"""
+    events = solver.find_events(
+        datetime(2023, 12, 25),
+        datetime(2024, 1, 10),
+        event_types=[EventType.STATION],
+        planets=[Planet.MERCURY]
+    )
+    assert len(events) == 1
+    assert events[0].from_index == -1
+    assert events[0].to_index == 1
+    assert abs(events[0].time - datetime(2024, 1, 2, 3, 8)) < timedelta(minutes=30)
+
+
+def test_tithi_boundaries_are_exact(solver):
+    events = solver.find_events(
+        datetime(2024, 1, 1),
+        datetime(2024, 2, 1),
+        event_types=[EventType.TITHI_CHANGE]
+    )
+    assert 29 <= len(events) <= 33
+
+    for previous, current in zip(events, events[1:]):
+        assert current.from_index == previous.to_index
+        assert current.to_index == (current.from_index + 1) % 30
+
+    for event in events:
+        elongation, _ = solver._elongation_state(event.jd)
+        distance = (elongation - event.to_index * 12 + 180) % 360 - 180
+        assert abs(distance) < 1e-4
+
+
+def test_retrograde_crossings_split_at_stations(solver):
+    """Every crossing of a retrograding planet chains from the previous one"""
+    events = solver.find_events(
+        datetime(2024, 3, 15),
+        datetime(2024, 5, 15),
+        event_types=[EventType.NAKSHATRA_CHANGE, EventType.STATION],
+        planets=[Planet.MERCURY]
+    )
+    stations = [e for e in events if e.event_type == EventType.STATION]
+    crossings = [e for e in events if e.event_type == EventType.NAKSHATRA_CHANGE]
+    assert len(stations) == 2
+    for previous, current in zip(crossings, crossings[1:]):
+        assert current.from_index == previous.to_index
+
+
+def test_streaming_matches_chunking(solver):
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 20)
+    kwargs = dict(
+        event_types=[EventType.SIGN_INGRESS, EventType.NAKSHATRA_CHANGE],
+        planets=[Planet.MOON]
+    )
+    coarse = list(solver.iter_events(start, end, chunk_days=30, **kwargs))
+    fine = list(solver.iter_events(start, end, chunk_days=3, **kwargs))
+
+    assert [e.jd for e in coarse] == sorted(e.jd for e in coarse)
+    assert len(coarse) == len(fine)
+    for a, b in zip(coarse, fine):
+        assert a.event_type == b.event_type
+        assert abs(a.jd - b.jd) < 1e-5
+
+
+def test_invalid_range(solver):
+    with pytest.raises(ValueError):
+        solver.find_events(datetime(2024, 2, 1), datetime(2024, 1, 1))
+
+
+def test_yearly_event_table_is_cached(solver):
+    table = solver.yearly_event_table(
+        2024, event_types=[EventType.SIGN_INGRESS], planets=[Planet.SUN]
+    )
+    assert len(table) == 12
+    assert all(event.time.year == 2024 for event in table)
+    assert solver.yearly_event_table(
+        2024, event_types=[EventType.SIGN_INGRESS], planets=[Planet.SUN]
+    ) is table
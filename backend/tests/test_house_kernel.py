@@ -0,0 +1,74 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.core.calculations.astronomical import AstronomicalCalculator
+from app.core.calculations.house_kernel import NATURAL_CUSPS, assign_houses, planet_houses, unwrap_cusps
+from app.core.calculations.houses import calculate_house_batch
+from app.models.enums import House
+
+
+def reference_house(longitude, cusps):
+    """House by walking the cusps with wrap-around branching"""
+    for i in range(12):
+        next_i = (i + 1) % 12
+        if cusps[next_i] < cusps[i]:
+            if longitude >= cusps[i] or longitude < cusps[next_i]:
+                return i + 1
+        elif cusps[i] <= longitude < cusps[next_i]:
+            return i + 1
+    return 1
+
+
+@pytest.fixture(scope="module")
+def placidus():
+    rng = np.random.default_rng(49)
+    return calculate_house_batch(
+        2460000.25 + rng.uniform(0, 365, 40), rng.uniform(-60, 60, 40), rng.uniform(-180, 180, 40), ('P',)
+    ).system_cusps('P')
+
+
+def test_natural_houses_are_signs():
+    longitudes = np.random.default_rng(1).uniform(0, 360, 500)
+    np.testing.assert_array_equal(assign_houses(longitudes), (longitudes // 30).astype(int) + 1)
+    assert assign_houses([0.0, 29.999, 30.0, 359.99]).tolist() == [1, 1, 2, 12]
+    np.testing.assert_array_equal(unwrap_cusps(NATURAL_CUSPS), NATURAL_CUSPS)
+
+
+def test_per_chart_cusps_match_loop(placidus):
+    longitudes = np.random.default_rng(2).uniform(0, 360, (40, 9))
+    houses = assign_houses(longitudes, placidus)
+    assert houses.shape == (40, 9)
+    for chart in range(40):
+        expected = [reference_house(longitude, placidus[chart]) for longitude in longitudes[chart]]
+        assert houses[chart].tolist() == expected
+        # One chart's cusps shared by many bodies take the searchsorted path
+        assert assign_houses(longitudes[chart], placidus[chart]).tolist() == expected
+
+
+def test_bodies_on_cusps_and_unwrapping(placidus):
+    cusps = placidus[0]
+    assert assign_houses(cusps, cusps).tolist() == list(range(1, 13))
+    unwrapped = unwrap_cusps(cusps)
+    assert unwrapped[0] == cusps[0]
+    assert (np.diff(unwrapped) > 0).all() and unwrapped[-1] < cusps[0] + 360
+
+
+def test_undefined_cusps_and_longitudes():
+    cusps = np.vstack([NATURAL_CUSPS, np.full(12, np.nan)])
+    houses = assign_houses([[15.0, np.nan], [15.0, 200.0]], cusps)
+    assert houses.tolist() == [[1, 0], [0, 0]]
+    with pytest.raises(ValueError):
+        assign_houses([1.0, 2.0], cusps)
+    with pytest.raises(ValueError):
+        assign_houses([1.0], np.arange(11) * 30.0)
+
+
+def test_planet_houses_and_get_house(placidus):
+    positions = {'Sun': {'longitude': 120.0}, 'Moon': 95.5, 'Mars': Decimal('359.5')}
+    assert planet_houses(positions) == {'Sun': 5, 'Moon': 4, 'Mars': 12}
+
+    calculator = AstronomicalCalculator()
+    for longitude in (0.0, 77.7, 181.2, 359.9):
+        assert calculator.get_house(longitude, list(placidus[3])) == House(reference_house(longitude, placidus[3]))
@@ -0,0 +1,172 @@
+"""
+Tests for hot-path instrumentation and on-demand profiling
+"""
+import asyncio
+import threading
+import time
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.monitoring.ayanamsa_monitor import AyanamsaMonitor
+from app.core.monitoring.instrumentation import (
+    Instrumentation,
+    LatencyHistogram,
+    ProfilingBusyError,
+    format_collapsed,
+    profile_window
+)
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.record(value / 1000)
+
+    snapshot = histogram.snapshot()
+    assert snapshot['samples'] == 100
+    assert snapshot['mean_ms'] == pytest.approx(50.5)
+    # Bucket upper bounds are within one bucket width (about 12%)
+    assert 50 <= snapshot['p50_ms'] <= 50 * 1.13
+    assert 95 <= snapshot['p95_ms'] <= 95 * 1.13
+    assert snapshot['p99_ms'] <= snapshot['max_ms'] == pytest.approx(100)
+
+
+def test_histogram_has_fixed_size():
+    histogram = LatencyHistogram()
+    buckets = len(histogram.counts)
+    for value in (1e-9, 1e-3, 1e6):
+        histogram.record(value)
+    assert len(histogram.counts) == buckets
+    assert histogram.counts[0] == 1 and histogram.counts[-1] == 1
+
+
+def test_sampled_instrumentation():
+    registry = Instrumentation(sample_every=10)
+    sampled = []
+    registry.add_sink(lambda name, seconds: sampled.append(name))
+
+    @registry.instrument("square")
+    def square(x):
+        return x * x
+
+    assert [square(x) for x in range(95)] == [x * x for x in range(95)]
+    stats = registry.get_stats()['square']
+    assert stats['calls'] == 95
+    assert stats['samples'] == 9
+    assert sampled == ['square'] * 9
+    # Reading the stats does not change the call count
+    assert registry.get_stats()['square']['calls'] == 95
+
+    registry.reset()
+    assert registry.get_stats()['square']['calls'] == 0
+
+
+def test_reads_and_errors_are_counted_on_every_call():
+    registry = Instrumentation(sample_every=10)
+
+    @registry.instrument("checked")
+    def checked(x):
+        if x < 0:
+            raise ValueError(x)
+        return x
+
+    for x in range(-5, 25):
+        try:
+            checked(x)
+        except ValueError:
+            pass
+        # Reading between calls does not move the sampling phase
+        registry.get_stats()
+    stats = registry.get_stats()['checked']
+    assert stats['calls'] == 30
+    assert stats['samples'] == 3
+    assert stats['errors'] == 5
+
+
+def test_disabled_instrumentation():
+    registry = Instrumentation(sample_every=1, enabled=False)
+    wrapped = registry.instrument("noop")(lambda: None)
+    wrapped()
+    assert registry.get_stats()['noop']['samples'] == 0
+
+
+def test_monitor_memory_is_bounded():
+    monitor = AyanamsaMonitor(sample_every=4)
+    for _ in range(1000):
+        with monitor.track_calculation():
+            pass
+
+    metrics = monitor.get_metrics()
+    assert metrics['total_calculations'] == 1000
+    assert metrics['successful_calculations'] == 1000
+    assert metrics['latency']['samples'] == 250
+    # The total is scaled up from the one calculation in four that is timed
+    assert metrics['total_duration'] == pytest.approx(4 * metrics['sampled_duration'])
+    assert not hasattr(monitor, 'metrics')
+
+
+def _busy_worker(stop):
+    while not stop.is_set():
+        sum(i * i for i in range(1000))
+
+
+def test_sampling_profiler_collapsed_stacks():
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_worker, args=(stop,))
+    worker.start()
+    try:
+        stacks = asyncio.run(profile_window(0.3, 'sample', 0.005))
+    finally:
+        stop.set()
+        worker.join()
+
+    lines = format_collapsed(stacks)
+    assert any('_busy_worker' in line for line in lines)
+    stack, weight = lines[0].rsplit(' ', 1)
+    assert ';' in stack and int(weight) > 0
+
+
+def test_cprofile_window():
+    async def run():
+        async def work():
+            for _ in range(20):
+                sum(i * i for i in range(2000))
+                await asyncio.sleep(0.005)
+        task = asyncio.create_task(work())
+        stacks = await profile_window(0.2, 'cprofile')
+        await task
+        return stacks
+
+    stacks = asyncio.run(run())
+    assert any(stack.endswith(':work') for stack in stacks)
+
+
+def test_profile_window_is_exclusive():
+    async def run():
+        first = asyncio.create_task(profile_window(0.2))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ProfilingBusyError):
+            await profile_window(0.1)
+        await first
+
+    asyncio.run(run())
+
+
+def test_latency_endpoint():
+    client.post("/api/v1/diagnostics/latency/reset")
+    response = client.get("/api/v1/diagnostics/latency")
+    assert response.status_code == 200
+    functions = response.json()['functions']
+    assert any(name.endswith('calculate_planet_position') for name in functions)
+
+
+def test_profile_endpoint():
+    response = client.get("/api/v1/diagnostics/profile", params={"duration": 0.1})
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain')
+
+    response = client.get("/api/v1/diagnostics/profile", params={"mode": "invalid"})
+    assert response.status_code == 422
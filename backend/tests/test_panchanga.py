@@ -0,0 +1,119 @@
+"""
+Tests for the precomputed Panchanga engine
+"""
+import pytest
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+
+from app.core.calculations.panchanga import (
+    PanchangaEngine,
+    PanchangaTable,
+    karana_name,
+    tithi_name
+)
+from app.models.location import Location
+
+DELHI = Location(latitude=28.6139, longitude=77.2090, altitude=216)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return PanchangaEngine(DELHI, 'Asia/Kolkata')
+
+
+@pytest.fixture(scope="module")
+def table(engine):
+    return engine.build_table(date(2024, 1, 10), date(2024, 1, 20))
+
+
+def test_names():
+    assert tithi_name(0) == "Shukla Pratipada"
+    assert tithi_name(14) == "Purnima"
+    assert tithi_name(15) == "Krishna Pratipada"
+    assert tithi_name(29) == "Amavasya"
+    assert karana_name(0) == "Kimstughna"
+    assert karana_name(1) == "Bava"
+    assert karana_name(8) == "Bava"
+    assert karana_name(57) == "Shakuni"
+    assert karana_name(59) == "Naga"
+
+
+def test_table_columns(table):
+    for element in ('tithi', 'nakshatra', 'yoga', 'karana'):
+        jds, indices = table.transitions[element]
+        assert jds.dtype == np.float64
+        assert indices.dtype == np.int16
+        assert np.all(np.diff(jds) > 0)
+    # Karanas are half tithis
+    tithi_count = len(table.transitions['tithi'][0])
+    assert abs(len(table.transitions['karana'][0]) - 2 * tithi_count) <= 2
+
+    days = (date(2024, 1, 20) - date(2024, 1, 10)).days + 1 + 2 * PanchangaEngine.MARGIN_DAYS
+    assert len(table.rise_set['sunrise']) == days
+    assert np.all(np.isfinite(table.rise_set['sunrise']))
+
+
+def test_panchanga_at(engine, table):
+    # 2024-01-15 (Monday) noon in Delhi: Shukla Panchami, Bava karana
+    result = engine.panchanga_at(datetime(2024, 1, 15, 12, 0), table)
+
+    assert result['tithi']['name'] == "Shukla Panchami"
+    assert result['karana']['name'] == "Bava"
+    assert result['vara']['name'] == "Somavara"
+    assert result['is_day'] is True
+    assert 1 <= result['muhurta'] <= 15
+
+    sunrise = result['rise_set']['sunrise']
+    assert sunrise.tzinfo is not None
+    assert sunrise.date() == date(2024, 1, 15)
+    assert abs(sunrise.replace(tzinfo=None) - datetime(2024, 1, 15, 7, 15)) < timedelta(minutes=3)
+
+    for element in ('tithi', 'nakshatra', 'yoga', 'karana'):
+        assert result[element]['start'] <= result['datetime'] < result[element]['end']
+
+
+def test_vara_changes_at_sunrise(engine, table):
+    # Before sunrise on Tuesday it is still Monday's vara
+    result = engine.panchanga_at(datetime(2024, 1, 16, 5, 0), table)
+    assert result['vara']['name'] == "Somavara"
+    assert result['is_day'] is False
+    assert 16 <= result['muhurta'] <= 30
+
+
+def test_timezone_aware_input(engine, table):
+    local = engine.panchanga_at(datetime(2024, 1, 15, 12, 0), table)
+    utc = engine.panchanga_at(datetime(2024, 1, 15, 6, 30, tzinfo=timezone.utc), table)
+    assert local['tithi'] == utc['tithi']
+    assert utc['datetime'].utcoffset() == timedelta(hours=5, minutes=30)
+
+
+def test_save_and_load(table, tmp_path):
+    path = tmp_path / "table.npz"
+    table.save(path)
+    loaded = PanchangaTable.load(path)
+
+    assert loaded.first_date == table.first_date
+    assert loaded.timezone == table.timezone
+    for element, (jds, indices) in table.transitions.items():
+        np.testing.assert_array_equal(loaded.transitions[element][0], jds)
+        np.testing.assert_array_equal(loaded.transitions[element][1], indices)
+    np.testing.assert_array_equal(loaded.rise_set['moonrise'], table.rise_set['moonrise'])
+
+
+def test_last_sunrise_skips_days_without_sunrise():
+    sunrise = 2460320.3 + np.arange(10.0)
+    sunrise[[0, 4, 5]] = np.nan  # polar night
+    table = PanchangaTable(0.0, 0.0, 0.0, 'UTC', None, date(2024, 1, 10), 2460320.0, 2460330.0)
+    table.rise_set['sunrise'] = sunrise
+    for jd in np.linspace(2460321.3, 2460330.0, 50):
+        days = np.flatnonzero(np.isfinite(sunrise) & (sunrise <= jd))
+        assert table.last_sunrise(jd) == (int(days[-1]), float(sunrise[days[-1]]))
+    assert table.last_sunrise(sunrise[6]) == (6, sunrise[6])
+    with pytest.raises(ValueError):
+        table.last_sunrise(2460321.0)
+
+
+def test_invalid_range(engine):
+    with pytest.raises(ValueError):
+        engine.build_table(date(2024, 2, 1), date(2024, 1, 1))
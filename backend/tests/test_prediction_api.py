@@ -181,6 +181,21 @@ def test_analyze_transit_period():
     assert "strength" in result
     assert "overall_effect" in result
     
+    # Test server-side transit series
+    response = client.post(
+        "/api/v1/prediction/transit/analyze",
+        json={
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(days=30)).isoformat(),
+            "planet": "moon",
+            "natal_position": 0.0,
+            "resolution_minutes": 120
+        }
+    )
+    assert response.status_code == 200
+    for aspect in response.json()["aspects"]:
+        assert {"start", "exact", "end", "type"} <= set(aspect)
+    
     # Test invalid planet
     response = client.post(
         "/api/v1/prediction/transit/analyze",
@@ -216,3 +231,67 @@ def test_analyze_transit_period():
         }
     )
     assert response.status_code == 422
+
+def test_analyze_transit_intervals():
+    start_time = datetime(2024, 1, 1)
+    
+    response = client.post(
+        "/api/v1/prediction/transit/intervals",
+        json={
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(days=30)).isoformat(),
+            "natal_positions": {"sun": 250.0, "moon": 10.0},
+            "planets": ["sun", "moon", "mars"]
+        }
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert "aspects" in result
+    assert all(a["transit_planet"] in {"sun", "moon", "mars"} for a in result["aspects"])
+    
+    # Test invalid natal position
+    response = client.post(
+        "/api/v1/prediction/transit/intervals",
+        json={
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(days=30)).isoformat(),
+            "natal_positions": {"sun": 400.0}
+        }
+    )
+    assert response.status_code == 422
+
+def test_calculate_muhurta_grid():
+    response = client.post(
+        "/api/v1/prediction/muhurta/grid",
+        json={
+            "start_time": "2024-12-27T00:00:00",
+            "end_time": "2024-12-28T00:00:00",
+            "interval_minutes": 60,
+            "activities": ["business", "travel"],
+            "planet_strengths": {
+                "sun": 0.7,
+                "moon": 0.8,
+                "mercury": 0.75,
+                "jupiter": 0.8
+            }
+        }
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["activities"] == ["business", "travel"]
+    assert len(result["times"]) == 25
+    assert len(result["scores"]) == 25
+    assert all(len(row) == 2 for row in result["suitable"])
+    assert all(len(row) == 2 for row in result["auspicious"])
+    
+    # Test invalid activity
+    response = client.post(
+        "/api/v1/prediction/muhurta/grid",
+        json={
+            "start_time": "2024-12-27T00:00:00",
+            "end_time": "2024-12-28T00:00:00",
+            "activities": ["invalid"],
+            "planet_strengths": {"sun": 0.7}
+        }
+    )
+    assert response.status_code == 422
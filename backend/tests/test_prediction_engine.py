@@ -4,6 +4,7 @@ Tests for Prediction Engine calculations
 import pytest
 from datetime import datetime, timedelta
 from decimal import Decimal
+import numpy as np
 from app.core.calculations.prediction_engine import PredictionEngine
 
 def test_calculate_muhurta():
@@ -145,6 +146,119 @@ def test_analyze_transit_period():
         assert 'angle' in aspect
         assert 'effect' in aspect
 
+def test_calculate_muhurta_grid():
+    planet_strengths = {
+        'sun': 0.7,
+        'moon': 0.8,
+        'mars': 0.6,
+        'mercury': 0.75,
+        'jupiter': 0.8,
+        'venus': 0.7,
+        'saturn': 0.5
+    }
+    start_time = datetime(2024, 12, 27, 0, 0)
+    
+    grid = PredictionEngine.calculate_muhurta_grid(
+        start_time,
+        start_time + timedelta(days=2),
+        planet_strengths
+    )
+    
+    activities = grid['activities']
+    assert activities == list(PredictionEngine.muhurta_qualities)
+    assert len(grid['times']) == 97
+    assert len(grid['scores']) == len(grid['suitable']) == len(grid['auspicious']) == 97
+    assert all(len(row) == len(activities) for row in grid['scores'])
+    
+    # Every cell matches the single-activity calculation
+    for i in (0, 17, 96):
+        time = datetime.fromisoformat(grid['times'][i])
+        positions = {'sun': 0.0, 'moon': 0.0}
+        for col, activity in enumerate(activities):
+            single = PredictionEngine.calculate_muhurta(
+                time, activity, positions, planet_strengths
+            )
+            assert grid['scores'][i][col] == pytest.approx(single['suitability_score'], abs=1e-4)
+            assert grid['suitable'][i][col] == single['is_suitable']
+            assert grid['auspicious'][i][col] == single['is_auspicious_muhurta']
+            assert grid['muhurta'][i] == single['current_muhurta']
+    
+    for tithi in grid['tithi']:
+        assert 1 <= tithi <= 30
+    
+    with pytest.raises(ValueError):
+        PredictionEngine.calculate_muhurta_grid(
+            start_time, start_time + timedelta(days=1), planet_strengths,
+            activities=['invalid']
+        )
+
+def test_find_aspect_intervals():
+    # Linear motion of 1 degree/day from 50 to 125 over natal 0
+    jds = 2460000.0 + np.arange(76)
+    longitudes = np.array([50.0 + np.arange(76)])
+    
+    columns = PredictionEngine.find_aspect_intervals(jds, longitudes, np.array([0.0]))
+    names = [PredictionEngine.transit_aspect_offsets[k][1] for k in columns['aspect']]
+    assert names == ['Sextile', 'Square', 'Trine']
+    
+    # Sextile: orb entry at 52, exact at 60, exit at 68 degrees
+    assert columns['start'][0] == pytest.approx(2460002.0)
+    assert columns['exact'][0] == pytest.approx(2460010.0)
+    assert columns['end'][0] == pytest.approx(2460018.0)
+    assert columns['passes'][0] == 1
+    
+    # Trine still in orb at the end of the series
+    assert columns['end'][2] == pytest.approx(jds[-1])
+
+def test_find_aspect_intervals_without_perfection():
+    # Retrograde station at 97 degrees never perfects the square
+    jds = 2460000.0 + np.arange(21)
+    longitudes = np.array([97.0 + 0.05 * (np.arange(21) - 10) ** 2])
+    
+    columns = PredictionEngine.find_aspect_intervals(jds, longitudes, np.array([0.0]))
+    assert len(columns['start']) == 1
+    assert columns['passes'][0] == 0
+    assert np.isnan(columns['exact'][0])
+    assert columns['closest'][0] == pytest.approx(7.0)
+    assert columns['closest_time'][0] == pytest.approx(2460010.0)
+
+def test_analyze_transit_period_generated_series():
+    start_time = datetime(2024, 1, 1)
+    end_time = datetime(2024, 3, 1)
+    
+    result = PredictionEngine.analyze_transit_period(
+        start_time,
+        end_time,
+        'moon',
+        0.0,
+        resolution=timedelta(hours=2)
+    )
+    
+    # The Moon perfects each of the eight aspect sides about twice in two months
+    exact = [aspect for aspect in result['aspects'] if aspect['exact']]
+    assert 14 <= len(exact) <= 18
+    for aspect in result['aspects']:
+        assert aspect['start'] <= aspect['time'] <= aspect['end']
+    assert isinstance(result['strength'], float)
+
+def test_analyze_transits_all_planets():
+    result = PredictionEngine.analyze_transits(
+        datetime(2024, 1, 1),
+        datetime(2024, 2, 1),
+        {'sun': 250.0, 'lagna': 10.0},
+        resolution=timedelta(hours=3)
+    )
+    
+    assert 'aspects' in result
+    assert {a['transit_planet'] for a in result['aspects']} >= {'sun', 'moon'}
+    starts = [a['start'] for a in result['aspects']]
+    assert starts == sorted(starts)
+    
+    with pytest.raises(ValueError):
+        PredictionEngine.analyze_transits(
+            datetime(2024, 2, 1), datetime(2024, 1, 1), {'sun': 0.0}
+        )
+
 def test_helper_functions():
     # Test tithi calculation
     tithi = PredictionEngine._calculate_tithi(120.0, 0.0)
@@ -0,0 +1,120 @@
+"""
+Tests for the cached sunrise/sunset service
+"""
+import pytest
+from datetime import date, datetime, timedelta
+
+from app.core.calculations.event_solver import julian_day_to_datetime
+from app.core.calculations.rise_set import RiseSetService
+from app.core.calculations.shadbala import ShadbalaSystem
+from app.core.calculations.strength import EnhancedPlanetaryStrengthEngine
+from app.models.location import Location
+
+DELHI = (28.6139, 77.2090)
+
+
+@pytest.fixture
+def service():
+    return RiseSetService()
+
+
+def test_rise_set_times(service):
+    entry = service.get_rise_set(*DELHI, date(2024, 1, 15), altitude=216)
+
+    # 07:15 and 17:46 IST
+    sunrise = julian_day_to_datetime(entry.sunrise)
+    sunset = julian_day_to_datetime(entry.sunset)
+    assert abs(sunrise - datetime(2024, 1, 15, 1, 45)) < timedelta(minutes=3)
+    assert abs(sunset - datetime(2024, 1, 15, 12, 16)) < timedelta(minutes=3)
+    assert 10 < entry.day_length < 11
+
+
+def test_cache_hits_on_quantized_location(service):
+    service.get_rise_set(*DELHI, date(2024, 1, 15))
+    service.get_rise_set(DELHI[0] + 0.001, DELHI[1] - 0.001, date(2024, 1, 15))
+
+    stats = service.get_metrics()
+    assert stats['misses'] == 1
+    assert stats['hits'] == 1
+    assert stats['hit_rate'] == pytest.approx(0.5)
+    assert stats['compute_time'] > 0
+
+
+def test_precompute_year(service):
+    entries = service.precompute_year(*DELHI, 2023)
+    assert len(entries) == 365
+    assert all(entry.is_complete for entry in entries.values())
+
+    misses = service.get_metrics()['misses']
+    service.get_rise_set(*DELHI, date(2023, 6, 21))
+    assert service.get_metrics()['misses'] == misses
+
+
+def test_latitude_band_interpolation():
+    banded = RiseSetService(latitude_band=1.0, interpolation_tolerance=0.5)
+    exact = RiseSetService()
+    for latitude in (12.3, 12.7, 12.9):
+        approx = banded.get_rise_set(latitude, 80.0, date(2024, 3, 1))
+        reference = exact.get_rise_set(latitude, 80.0, date(2024, 3, 1))
+        assert abs(approx.sunrise - reference.sunrise) * 1440 < 0.5
+        assert abs(approx.sunset - reference.sunset) * 1440 < 0.5
+    stats = banded.get_metrics()
+    assert stats['interpolated'] == 3
+    # The first lookup computed the band's edges
+    assert (stats['misses'], stats['hits'], stats['computations']) == (1, 2, 3)
+    assert stats['hit_rate'] == pytest.approx(2 / 3)
+
+
+def test_polar_day(service):
+    # Midnight sun in Svalbard
+    entry = service.get_rise_set(78.0, 15.0, date(2024, 6, 21))
+    assert not entry.is_complete
+    assert service.is_day(datetime(2024, 6, 21, 23, 0), 78.0, 15.0) is True
+    assert service.muhurta_number(datetime(2024, 6, 21, 23, 0), 78.0, 15.0) is None
+
+
+def test_is_day_and_muhurta(service):
+    assert service.is_day(datetime(2024, 1, 15, 6, 30), *DELHI) is True
+    assert service.is_day(datetime(2024, 1, 15, 20, 0), *DELHI) is False
+
+    # First muhurta right after sunrise, first night muhurta right after sunset
+    entry = service.get_rise_set(*DELHI, date(2024, 1, 15))
+    after_sunrise = julian_day_to_datetime(entry.sunrise) + timedelta(minutes=1)
+    after_sunset = julian_day_to_datetime(entry.sunset) + timedelta(minutes=1)
+    assert service.muhurta_number(after_sunrise, *DELHI) == 1
+    assert service.muhurta_number(after_sunset, *DELHI) == 16
+    # Before dawn the night belongs to the previous sunset
+    assert 16 <= service.muhurta_number(datetime(2024, 1, 15, 0, 0), *DELHI) <= 30
+
+
+def test_shadbala_derives_is_day():
+    shadbala = ShadbalaSystem()
+    location = Location(latitude=DELHI[0], longitude=DELHI[1])
+
+    day = shadbala.calculate_shadbala(
+        'Sun', 10, 1.0, [], birth_time=datetime(2024, 1, 15, 6, 30), location=location
+    )
+    night = shadbala.calculate_shadbala(
+        'Sun', 10, 1.0, [], birth_time=datetime(2024, 1, 15, 20, 0), location=location
+    )
+    assert day['kala_bala'] == 1.0
+    assert night['kala_bala'] == -1.0
+    assert day == shadbala.calculate_shadbala('Sun', 10, 1.0, [], True)
+
+    with pytest.raises(ValueError):
+        shadbala.calculate_shadbala('Sun', 10, 1.0, [])
+
+
+def test_kala_bala_uses_birth_sunrise():
+    engine = EnhancedPlanetaryStrengthEngine()
+    planet = {"name": "Sun", "longitude": 200.0, "speed": 1.0}
+    location = {"latitude": DELHI[0], "longitude": DELHI[1]}
+
+    day = engine._calculate_kala_bala(
+        planet, {"birth_time": datetime(2024, 1, 15, 6, 30), "location": location}
+    )
+    night = engine._calculate_kala_bala(
+        planet, {"birth_time": datetime(2024, 1, 15, 20, 0), "location": location}
+    )
+    assert day > night
+    assert engine._calculate_kala_bala(planet, {"is_day": True}) == day
@@ -1,6 +1,8 @@
 """
 Tests for Shadbala API endpoints
 """
+import json
+
 from fastapi.testclient import TestClient
 from app.main import app
 
@@ -209,3 +211,61 @@ def test_analyze_all_planets():
         }
     )
     assert response.status_code == 422
+
+def test_calculate_uses_client_inputs():
+    request = {
+        "planet": "mars",
+        "position": 95.0,
+        "house": 10,
+        "is_day": True,
+        "aspects": [],
+        "planet_positions": {"sun": 30.0, "mars": 95.0}
+    }
+    plain = client.post("/api/v1/shadbala/calculate", json=request).json()
+    moving = client.post(
+        "/api/v1/shadbala/calculate",
+        json={**request, "speed": 0.5, "aspects": [{"type": "trine", "angle": 120.0}]}
+    ).json()
+    
+    assert plain["components"]["sthana_bala"] == 4.0
+    assert plain["components"]["chesta_bala"] == 0.0
+    assert moving["components"]["chesta_bala"] == 28.0
+    assert moving["components"]["drik_bala"] == 0.75
+    assert moving["total_strength"] > plain["total_strength"]
+
+def test_batch_shadbala():
+    charts = [
+        {"datetime_utc": "1990-01-01T06:30:00", "latitude": 28.6, "longitude": 77.2},
+        {"datetime_utc": "1985-07-15T18:00:00", "latitude": 51.5, "longitude": -0.1, "altitude": 20},
+        {"datetime_utc": "2001-03-21T00:00:00", "latitude": -33.9, "longitude": 151.2}
+    ]
+    response = client.post(
+        "/api/v1/shadbala/batch",
+        json={"charts": charts, "chunk_size": 2}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [result["index"] for result in results] == [0, 1, 2]
+    for result in results:
+        assert len(result["planets"]) == 7
+        for planet_data in result["planets"].values():
+            assert 1 <= planet_data["house"] <= 12
+            assert set(planet_data["components"]) == {
+                "sthana_bala", "dig_bala", "kala_bala",
+                "chesta_bala", "naisargika_bala", "drik_bala"
+            }
+            assert "interpretation" in planet_data
+        assert "interpretation" in result["chart_analysis"]
+    
+    # Invalid ayanamsa system
+    response = client.post(
+        "/api/v1/shadbala/batch",
+        json={"charts": charts, "ayanamsa_system": "invalid"}
+    )
+    assert response.status_code == 422
+    
+    # Empty batch
+    response = client.post("/api/v1/shadbala/batch", json={"charts": []})
+    assert response.status_code == 422
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from app.core.calculations.rise_set import rise_set_service
+from app.core.calculations.shadbala_batch import (
+    SHADBALA_PLANETS, BirthData, ShadbalaBatchCalculator, interpret_shadbala, shadbala_components
+)
+from app.core.calculations.sidereal import SiderealPositionService
+from app.core.calculations.strength_kernel import SHADBALA_COMPONENTS, compute_strengths
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    return ShadbalaBatchCalculator()
+
+
+def births(count):
+    start = datetime(1980, 1, 1)
+    return [
+        BirthData(start + timedelta(days=37 * i, hours=5 * i), -50 + 7 * (i % 15), -170 + 23 * i % 340)
+        for i in range(count)
+    ]
+
+
+def test_components_match_strength_kernel():
+    rng = np.random.default_rng(5)
+    longitudes = rng.uniform(0, 360, (20, 7))
+    speeds = rng.uniform(-1, 13, (20, 7))
+    houses = rng.integers(1, 13, (20, 7))
+    is_day = rng.random(20) < 0.5
+
+    components = shadbala_components(SHADBALA_PLANETS, longitudes, speeds, houses, is_day)
+    expected = compute_strengths(SHADBALA_PLANETS, longitudes, speeds, houses, is_day).components
+    assert set(components) == set(SHADBALA_COMPONENTS)
+    for name in SHADBALA_COMPONENTS:
+        np.testing.assert_allclose(components[name], expected[name], atol=1e-9)
+
+
+def test_batch_derives_positions_houses_and_day(calculator):
+    sample = births(12)
+    batch = calculator.calculate(sample)
+    assert batch.longitudes.shape == (12, 7)
+
+    service = SiderealPositionService()
+    for row, birth in enumerate(sample):
+        sidereal = service.calculate(birth.moment, ['LAHIRI'])['LAHIRI']
+        for column, name in enumerate(SHADBALA_PLANETS):
+            assert batch.longitudes[row, column] == pytest.approx(sidereal['positions'][name.upper()]['longitude'])
+
+        jd = swe.julday(birth.moment.year, birth.moment.month, birth.moment.day,
+                        birth.moment.hour + birth.moment.minute / 60)
+        ascendant = swe.houses_ex(jd, birth.latitude, birth.longitude, b'W')[1][0] - sidereal['ayanamsa']
+        lagna = int(ascendant % 360 // 30)
+        for column in range(7):
+            sign = int(batch.longitudes[row, column] // 30)
+            assert batch.houses[row, column] == (sign - lagna) % 12 + 1
+        assert batch.is_day[row] == rise_set_service.is_day(birth.moment, birth.latitude, birth.longitude)
+
+
+def test_totals_and_interpretation(calculator):
+    batch = calculator.calculate(births(4))
+    analysis = batch.to_dict(2)
+    assert list(analysis['planets']) == list(SHADBALA_PLANETS)
+    for name, planet in analysis['planets'].items():
+        assert planet['total_strength'] == pytest.approx(sum(planet['components'].values()))
+        assert planet['interpretation'] == interpret_shadbala(planet['total_strength'])
+    totals = [planet['total_strength'] for planet in analysis['planets'].values()]
+    assert analysis['chart_analysis']['average_strength'] == pytest.approx(np.mean(totals))
+
+
+def test_streamed_chunks_match_single_batch(calculator):
+    sample = births(7)
+    streamed = list(calculator.iter_analyses(iter(sample), chunk_size=3))
+    whole = calculator.calculate(sample)
+    assert len(streamed) == 7
+    for row, analysis in enumerate(streamed):
+        assert analysis == whole.to_dict(row)
+
+
+def test_timezone_aware_moments(calculator):
+    naive = BirthData(datetime(2000, 6, 1, 12), 40.7, -74.0)
+    aware = BirthData(datetime(2000, 6, 1, 8, tzinfo=timezone(timedelta(hours=-4))), 40.7, -74.0)
+    batch = calculator.calculate([naive, aware])
+    np.testing.assert_allclose(batch.longitudes[0], batch.longitudes[1])
+    np.testing.assert_array_equal(batch.houses[0], batch.houses[1])
+
+
+def test_empty_batch(calculator):
+    with pytest.raises(ValueError):
+        calculator.calculate([])
@@ -0,0 +1,76 @@
+"""
+Tests for the sidereal position service
+"""
+import pickle
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import swisseph as swe
+
+from app.core.calculations.ayanamsa import EnhancedAyanamsaManager
+from app.core.calculations.sidereal import SiderealPositionService
+from app.models.enums import Planet
+
+MOMENT = datetime(2024, 1, 15, 6, 30)
+
+
+@pytest.fixture(scope="module")
+def service():
+    return SiderealPositionService()
+
+
+def test_sidereal_is_tropical_minus_ayanamsa(service):
+    jd = EnhancedAyanamsaManager._to_julian_day(MOMENT)
+    result = service.calculate(MOMENT, ['LAHIRI', 'RAMAN'], [Planet.SUN, Planet.KETU])
+
+    sun = swe.calc_ut(jd, swe.SUN, swe.FLG_SWIEPH | swe.FLG_SPEED)[0]
+    for system in ('LAHIRI', 'RAMAN'):
+        ayanamsa = service.ayanamsa_manager.ayanamsa_at(jd, system)
+        assert result[system]['ayanamsa'] == pytest.approx(ayanamsa)
+        assert result[system]['positions']['SUN']['longitude'] == pytest.approx((sun[0] - ayanamsa) % 360)
+        assert result[system]['positions']['SUN']['speed'] == pytest.approx(sun[3])
+    assert result['LAHIRI']['positions']['KETU']['is_retrograde'] is True
+
+
+def test_array_shapes(service):
+    jds = 2460000.5 + np.arange(5)
+    arrays = service.calculate_arrays(jds, ['LAHIRI', 'KRISHNAMURTI', 'RAMAN'])
+
+    assert arrays['ayanamsa'].shape == (3, 5)
+    assert arrays['tropical'].shape == (len(Planet), 5)
+    assert arrays['longitude'].shape == (3, len(Planet), 5)
+    assert np.all((arrays['longitude'] >= 0) & (arrays['longitude'] < 360))
+
+
+def test_concurrent_mixed_systems(service):
+    systems = service.ayanamsa_manager.get_available_systems()
+    expected = {system: service.calculate(MOMENT, [system]) for system in systems}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        requests = [systems[i % len(systems)] for i in range(200)]
+        results = list(executor.map(lambda system: (system, service.calculate(MOMENT, [system])), requests))
+
+    for system, result in results:
+        assert result == expected[system]
+
+
+def test_pickle_round_trip(service):
+    restored = pickle.loads(pickle.dumps(service))
+    assert isinstance(restored, SiderealPositionService)
+    assert restored.calculate(MOMENT) == service.calculate(MOMENT)
+
+
+def test_invalid_system(service):
+    with pytest.raises(ValueError):
+        service.calculate(MOMENT, ['UNKNOWN'])
+
+
+def test_compare_systems_matches_single_system():
+    manager = EnhancedAyanamsaManager()
+    comparison = manager.compare_systems(MOMENT)
+
+    assert set(comparison) == set(manager.get_available_systems())
+    for system, value in comparison.items():
+        assert value == manager.calculate_precise_ayanamsa(MOMENT, system)
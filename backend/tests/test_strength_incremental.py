@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from app.core.calculations.strength_incremental import IncrementalStrengthEvaluator
+from app.core.calculations.strength_kernel import compute_strengths
+
+PLANETS = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
+
+
+def chart(rng):
+    return {
+        name: {'longitude': rng.uniform(0, 360), 'speed': rng.uniform(-1, 13), 'house': int(rng.integers(1, 13))}
+        for name in PLANETS
+    }
+
+
+def full(planets, is_day):
+    return compute_strengths(
+        PLANETS,
+        [planets[name]['longitude'] for name in PLANETS],
+        [planets[name]['speed'] for name in PLANETS],
+        [planets[name]['house'] for name in PLANETS],
+        None if is_day is None else [is_day]
+    ).to_dict()
+
+
+def assert_same(profiles, expected):
+    for name in PLANETS:
+        for group in ('shadbala', 'vimshopaka', 'special_strength', 'component_strengths'):
+            assert profiles[name][group] == pytest.approx(expected[name][group], abs=1e-9), (name, group)
+        assert profiles[name]['total'] == pytest.approx(expected[name]['total'], abs=1e-9)
+
+
+@pytest.mark.parametrize("is_day", [None, True])
+def test_updates_match_full_evaluation(is_day):
+    rng = np.random.default_rng(4)
+    planets = chart(rng)
+    evaluator = IncrementalStrengthEvaluator(planets, is_day)
+    assert_same(evaluator.profiles(), full(planets, is_day))
+
+    for frame in range(60):
+        changes = {}
+        for name in rng.choice(PLANETS, size=int(rng.integers(1, 4)), replace=False):
+            change = {'longitude': (planets[name]['longitude'] + rng.uniform(-15, 15)) % 360}
+            if frame % 5 == 0:
+                change['speed'] = rng.uniform(-1, 13)
+            if frame % 7 == 0:
+                change['house'] = int(rng.integers(1, 13))
+            changes[name] = change
+            planets[name].update(change)
+        if is_day is not None and frame % 10 == 0:
+            is_day = not is_day
+            assert_same(evaluator.update(changes, is_day=is_day).to_dict(), full(planets, is_day))
+        else:
+            assert_same(evaluator.update(changes).to_dict(), full(planets, is_day))
+
+
+def test_moon_transit_reuses_most_components():
+    rng = np.random.default_rng(8)
+    planets = chart(rng)
+    evaluator = IncrementalStrengthEvaluator(planets, is_day=True)
+    for minute in range(120):
+        planets['Moon']['longitude'] = (planets['Moon']['longitude'] + 13 / 1440) % 360
+        batch = evaluator.update({'Moon': {'longitude': planets['Moon']['longitude']}})
+    assert_same(batch.to_dict(), full(planets, True))
+    assert evaluator.reuse_ratio > 0.8
+    assert evaluator.evaluated + evaluator.reused == 120 * 15 * len(PLANETS)
+
+
+def test_dependencies_of_single_inputs():
+    rng = np.random.default_rng(2)
+    evaluator = IncrementalStrengthEvaluator(chart(rng), is_day=False)
+
+    # A house change touches dig bala and kendradi bala of that planet only
+    evaluator.update({'Mars': {'house': 7 if evaluator._values['house'][0, 2] != 7 else 8}})
+    assert evaluator.evaluated == 2
+
+    # Day/night touches kala bala of every planet
+    evaluator.update(is_day=True)
+    assert evaluator.evaluated == 2 + len(PLANETS)
+
+    # Unchanged values are not changes
+    evaluator.update({'Sun': {'speed': float(evaluator._values['speed'][0, 0])}})
+    assert evaluator.evaluated == 2 + len(PLANETS)
+
+
+def test_earlier_frames_are_not_modified():
+    rng = np.random.default_rng(5)
+    planets = chart(rng)
+    evaluator = IncrementalStrengthEvaluator(planets)
+    first = evaluator.batch()
+    before = first.to_dict()
+    evaluator.update({'Sun': {'longitude': (planets['Sun']['longitude'] + 40) % 360, 'house': 10}})
+    assert first.to_dict() == before
+
+
+def test_unknown_planet():
+    evaluator = IncrementalStrengthEvaluator(chart(np.random.default_rng(1)))
+    with pytest.raises(ValueError):
+        evaluator.update({'Pluto': {'longitude': 10.0}})
@@ -0,0 +1,116 @@
+import random
+
+import numpy as np
+import pytest
+
+from app.core.calculations.strength import EnhancedPlanetaryStrengthEngine
+from app.core.calculations.divisional_charts import SUPPORTED_DIVISIONS
+from app.core.calculations.divisional_kernel import compute_vargas
+from app.core.calculations.strength_kernel import compute_strengths, get_planet_tables
+
+PLANETS = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
+
+
+def random_chart(rng, names=PLANETS):
+    planets = {
+        name: {
+            'name': name,
+            'longitude': rng.uniform(0, 360),
+            'speed': rng.uniform(-2, 14),
+            'house': rng.randint(1, 12)
+        }
+        for name in names
+    }
+    # Close conjunctions, aspects and oppositions to exercise every orb
+    offset = rng.choice([0.5, 2.0, 5.0, 60.0, 92.0, 119.0, 175.0])
+    planets['Moon']['longitude'] = (planets['Sun']['longitude'] + offset) % 360
+    return {'planets': planets}
+
+
+def assert_profiles_match(engine, chart, profiles):
+    for name, planet in chart['planets'].items():
+        expected = engine.calculate_complete_strengths(planet, chart)
+        for group in ('shadbala', 'vimshopaka', 'special_strength', 'component_strengths'):
+            assert profiles[name][group] == pytest.approx(expected[group], abs=1e-9), (name, group)
+        assert profiles[name]['relative_strength'] == pytest.approx(expected['relative_strength'], abs=1e-9)
+        assert profiles[name]['total'] == pytest.approx(expected['total'], abs=1e-9)
+
+
+@pytest.mark.parametrize("is_day", [None, True, False])
+def test_chart_strengths_match_engine(is_day):
+    engine = EnhancedPlanetaryStrengthEngine()
+    rng = random.Random(7)
+    for _ in range(40):
+        chart = random_chart(rng)
+        if is_day is not None:
+            chart['is_day'] = is_day
+        assert_profiles_match(engine, chart, engine.calculate_chart_strengths(chart))
+
+
+def test_sign_boundaries_match_engine():
+    engine = EnhancedPlanetaryStrengthEngine()
+    rng = random.Random(3)
+    points = [sign * 30 + offset for sign in range(12) for offset in (0.0, 3.0, 10.0, 15.0, 20.0, 29.999)]
+    for start in range(0, len(points), 7):
+        chart = random_chart(rng, PLANETS[:7])
+        for planet, longitude in zip(chart['planets'].values(), points[start:start + 7]):
+            planet['longitude'] = longitude
+        assert_profiles_match(engine, chart, engine.calculate_chart_strengths(chart))
+
+
+def test_batch_matches_single_charts():
+    rng = np.random.default_rng(11)
+    longitudes = rng.uniform(0, 360, (50, len(PLANETS)))
+    speeds = rng.uniform(-1, 13, longitudes.shape)
+    houses = rng.integers(1, 13, longitudes.shape)
+    is_day = rng.random(50) < 0.5
+
+    batch = compute_strengths(PLANETS, longitudes, speeds, houses, is_day)
+    assert batch.total.shape == (50, len(PLANETS))
+    assert set(batch.components) >= {'sthana_bala', 'aspect_strength', 'saptavargaja_bala'}
+    for chart in (0, 17, 49):
+        single = compute_strengths(PLANETS, longitudes[chart], speeds[chart], houses[chart], is_day[chart:chart + 1])
+        assert single.to_dict() == batch.to_dict(chart)
+
+
+def test_shared_vargas_match_own_derivation():
+    rng = np.random.default_rng(13)
+    longitudes = rng.uniform(0, 360, (200, len(PLANETS)))
+    speeds = rng.uniform(-1, 13, longitudes.shape)
+    houses = rng.integers(1, 13, longitudes.shape)
+    vargas = compute_vargas(longitudes, SUPPORTED_DIVISIONS, with_degrees=True)
+
+    own = compute_strengths(PLANETS, longitudes, speeds, houses)
+    shared = compute_strengths(PLANETS, longitudes, speeds, houses, vargas=vargas)
+    for name in own.components:
+        assert np.allclose(own.components[name], shared.components[name], atol=1e-9), name
+
+    with pytest.raises(ValueError):
+        compute_strengths(PLANETS, longitudes, speeds, houses, vargas=compute_vargas(longitudes, (1, 9)))
+    with pytest.raises(ValueError):
+        compute_strengths(PLANETS, longitudes, speeds, houses, vargas=compute_vargas(longitudes, (1, 9), with_degrees=True))
+
+
+def test_engine_reads_shared_vargas():
+    engine = EnhancedPlanetaryStrengthEngine()
+    rng = random.Random(21)
+    for _ in range(10):
+        chart = random_chart(rng)
+        vargas = compute_vargas(
+            [planet['longitude'] for planet in chart['planets'].values()], SUPPORTED_DIVISIONS, with_degrees=True
+        )
+        assert_profiles_match(engine, chart, engine.calculate_chart_strengths(chart, vargas=vargas))
+
+
+def test_unknown_planets_use_engine_defaults():
+    tables = get_planet_tables(('Rahu',))
+    sun = get_planet_tables(('Sun',))
+    assert np.array_equal(tables.sign_strengths, sun.sign_strengths)
+    assert tables.day_night[0] == 0
+    assert tables.natural_strengths[0] == 50
+    assert (tables.dignity_bases == 40).all()
+
+
+def test_invalid_shape():
+    with pytest.raises(ValueError):
+        compute_strengths(PLANETS, np.zeros((2, 3)), 0.0, 1)
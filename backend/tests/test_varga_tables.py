@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from app.core.calculations.divisional import EnhancedDivisionalChartEngine
+from app.core.calculations.divisional_charts import DivisionalChartEngine
+from app.core.calculations.varga_tables import (
+    DIVISIONAL, ENHANCED, ENHANCED_STANDARD, TABLES, arcsecond_signs,
+    build_arcsecond_table, get_stack, load_arcsecond_table
+)
+
+
+def cell_points(table):
+    """Start, just inside, middle and end of every (sign, segment) cell"""
+    width = (360.0 if table.zodiacal else 30.0) / table.segments
+    signs = np.arange(1 if table.zodiacal else 12)
+    starts = (signs[:, None] * 30 + np.arange(table.segments)[None, :] * width).ravel()
+    middles = starts + width / 2
+    edges = np.concatenate([starts, starts + 1e-9, starts + width - 1e-9])
+    return np.mod(edges, 360), np.mod(middles, 360)
+
+
+def reference(scheme, division, longitudes):
+    if scheme == DIVISIONAL:
+        method = DivisionalChartEngine().division_map[division]
+        positions = {i: {'longitude': float(lon)} for i, lon in enumerate(longitudes)}
+        return np.array(list(method(positions).values()))
+    # The per-planet rules calculate_divisional_chart applied before the tables
+    engine = EnhancedDivisionalChartEngine()
+    special = engine.special_divisions.get(f'D{division}') if scheme == ENHANCED else None
+    result = []
+    for longitude in map(float, longitudes):
+        if special:
+            position = special(longitude)
+        else:
+            position = (
+                engine._get_sign_from_longitude(longitude) * 30
+                + engine._calculate_division_remainder(longitude, division) * division
+            )
+        result.append(engine._normalize_longitude(position))
+    return np.array(result)
+
+
+def assert_equivalent(scheme, division):
+    table = TABLES[scheme][division]
+    edges, middles = cell_points(table)
+    samples = np.random.default_rng(division).uniform(0, 360, 500)
+    stack = get_stack(scheme, (division,))
+
+    longitudes = np.concatenate([edges, middles, samples])
+    expected = reference(scheme, division, longitudes)
+    difference = np.abs(stack.map_longitudes(longitudes)[0] - expected)
+    assert np.all(np.minimum(difference, 360 - difference) < 1e-6), f"{scheme} D{division}"
+
+    # Inside cells the target sign is the sign of the rule's output
+    inside = np.concatenate([middles, samples])
+    expected_signs = np.floor(reference(scheme, division, inside) / 30) % 12
+    assert np.array_equal(stack.map_signs(inside)[0], expected_signs), f"{scheme} D{division}"
+
+
+def test_tables_cover_every_supported_division():
+    assert sorted(TABLES[DIVISIONAL]) == sorted(DivisionalChartEngine().division_map)
+    assert sorted(TABLES[ENHANCED]) == list(range(1, 41))
+    assert sorted(TABLES[ENHANCED_STANDARD]) == list(range(1, 41))
+    for tables in TABLES.values():
+        for table in tables.values():
+            assert table.signs.shape == (12, table.segments)
+            assert table.signs.min() >= 0 and table.signs.max() <= 11
+            assert not table.signs.flags.writeable
+
+
+@pytest.mark.parametrize("division", sorted(TABLES[DIVISIONAL]))
+def test_divisional_tables_match_rules(division):
+    assert_equivalent(DIVISIONAL, division)
+
+
+@pytest.mark.parametrize("division", range(1, 41))
+def test_enhanced_tables_match_rules(division):
+    assert_equivalent(ENHANCED, division)
+    assert_equivalent(ENHANCED_STANDARD, division)
+
+
+def test_special_rule_tables():
+    # Navamsa of water signs starts from Capricorn
+    assert TABLES[ENHANCED][9].signs[3, 0] == 9
+    # Dwadasamsa counts from the sign itself
+    assert list(TABLES[ENHANCED][12].signs[5]) == [(5 + i) % 12 for i in range(12)]
+    # Trimsamsa follows the odd and even planet sequences
+    assert list(TABLES[ENHANCED][30].signs[0]) == [0, 6, 4, 2, 1, 0]
+    assert list(TABLES[ENHANCED][30].signs[1]) == [1, 2, 4, 6, 0, 0]
+
+
+def test_stack_maps_all_divisions_at_once():
+    divisions = (1, 9, 27, 60)
+    longitudes = np.random.default_rng(1).uniform(0, 360, (5, 9))
+    stack = get_stack(DIVISIONAL, divisions)
+
+    signs = stack.map_signs(longitudes)
+    assert signs.shape == (4, 5, 9)
+    for row, division in enumerate(divisions):
+        assert np.array_equal(signs[row], get_stack(DIVISIONAL, (division,)).map_signs(longitudes)[0])
+    assert np.array_equal(signs[0], np.floor(longitudes / 30))
+
+
+def test_invalid_scheme_and_division():
+    with pytest.raises(ValueError):
+        get_stack('unknown', (9,))
+    with pytest.raises(ValueError):
+        get_stack(ENHANCED, (60,))
+
+
+def test_arcsecond_table_memory_mapped(tmp_path):
+    divisions = (9, 10, 60)
+    path = tmp_path / "vargas.npy"
+    built = build_arcsecond_table(DIVISIONAL, divisions, path)
+    table = load_arcsecond_table(path)
+
+    assert isinstance(table, np.memmap)
+    assert table.shape == (360 * 3600, 3)
+    assert np.array_equal(np.asarray(table), built)
+
+    # Segment widths of these divisions are whole arc-seconds
+    longitudes = np.random.default_rng(2).uniform(0, 360, 2000)
+    assert np.array_equal(
+        arcsecond_signs(table, longitudes),
+        get_stack(DIVISIONAL, divisions).map_signs(longitudes)
+    )
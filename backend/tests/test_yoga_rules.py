@@ -0,0 +1,197 @@
+"""
+Tests for the compiled yoga rules
+"""
+import random
+
+import numpy as np
+import pytest
+
+from app.core.calculations.yoga_calculator import YogaCalculator, YogaType
+from app.core.calculations.yoga_rules import (
+    DIGNITY_CODES, DIGNITY_NAMES, AllOf, Aspects, Conjunct, HasDignity, LordOf, Placed, YogaRule,
+    YogaRuleSet, sign_dignities, yoga_strength
+)
+
+PLANETS = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
+HOUSE_LORDS = {
+    1: "Mars", 2: "Venus", 3: "Mercury", 4: "Moon", 5: "Sun", 6: "Mercury",
+    7: "Venus", 8: "Mars", 9: "Jupiter", 10: "Saturn", 11: "Saturn", 12: "Jupiter"
+}
+
+
+def reference_yogas(positions):
+    """Raj, Dhana and Mahapurusha yogas by looping over houses and planets"""
+    houses = {planet: int(position['longitude'] // 30) + 1 for planet, position in positions.items()}
+    found = []
+    for trine in (1, 5, 9):
+        lord = HOUSE_LORDS[trine]
+        if houses[lord] in (1, 4, 7, 10):
+            found.append(('raj', lord, [trine, houses[lord]], f"Lord of {trine} house in {houses[lord]} house"))
+    for house in (2, 11):
+        lord = HOUSE_LORDS[house]
+        if houses[lord] in (1, 2, 4, 5, 9, 11):
+            found.append(('dhana', lord, [house, houses[lord]], f"Lord of {house} house in {houses[lord]} house"))
+    names = {"Mars": "Ruchaka", "Mercury": "Bhadra", "Jupiter": "Hamsa", "Venus": "Malavya", "Saturn": "Sasa"}
+    for planet, name in names.items():
+        if houses[planet] in (1, 4, 7, 10) and positions[planet]['dignity'] in ('own', 'exalted'):
+            found.append(('mahapurusha', planet, [houses[planet]], f"{name} Yoga by {planet} in {houses[planet]} house"))
+    return [
+        (kind, [planet], involved, description, yoga_strength(positions[planet]['dignity'], involved[-1]))
+        for kind, planet, involved, description in found
+    ]
+
+
+def random_rules(count, seed):
+    rng = random.Random(seed)
+
+    def body():
+        return LordOf(rng.randint(1, 12)) if rng.random() < 0.5 else rng.choice(PLANETS)
+
+    def leaf():
+        kind = rng.randrange(4)
+        if kind == 0:
+            return Placed(body(), tuple(rng.sample(range(1, 13), 4)))
+        if kind == 1:
+            return Conjunct(body(), body())
+        if kind == 2:
+            return Aspects(body(), body())
+        return HasDignity(body(), tuple(rng.sample(DIGNITY_NAMES, 2)))
+
+    return [
+        YogaRule(f"Rule {index}", None, (leaf() & leaf()) | ~leaf(), body(), "{planet} in {house}", ())
+        for index in range(count)
+    ]
+
+
+def test_classical_yogas_match_reference_loops():
+    calculator = YogaCalculator()
+    rng = random.Random(50)
+    for _ in range(500):
+        positions = {
+            planet: {'longitude': rng.uniform(0, 360), 'dignity': rng.choice(DIGNITY_NAMES)} for planet in PLANETS
+        }
+        results = (
+            calculator.calculate_raj_yoga(positions, {}) + calculator.calculate_dhana_yoga(positions, {})
+            + calculator.calculate_mahapurusha_yoga(positions)
+        )
+        assert [
+            (result.yoga_type.value, result.planets_involved, result.houses_involved, result.description, result.strength)
+            for result in results
+        ] == reference_yogas(positions)
+        assert calculator.calculate_yogas(positions) == results
+
+
+def test_predicates():
+    rules = YogaRuleSet([
+        YogaRule("Mars aspects Moon", None, Aspects('Mars', 'Moon'), 'Mars', "", ()),
+        YogaRule("Saturn aspects Sun", None, Aspects('Saturn', 'Sun'), 'Saturn', "", ()),
+        YogaRule("Sun aspects Moon", None, Aspects('Sun', 'Moon'), 'Sun', "", ()),
+        YogaRule("Venus with Mercury", None, Conjunct('Venus', 'Mercury'), 'Venus', "", ()),
+        YogaRule("Lagna lord in 10th", None, Placed(LordOf(1), (10,)), LordOf(1), "", ()),
+        YogaRule("Jupiter not exalted", None, ~HasDignity('Jupiter', ('exalted',)), 'Jupiter', "", ()),
+        YogaRule("Every", None, AllOf(Placed('Sun', (1,)), Conjunct('Sun', 'Sun')), 'Sun', "", ()),
+    ])
+    positions = {
+        'Sun': {'longitude': 5.0},  # Aries
+        'Moon': 95.0,  # Cancer, 4th from Mars in Aries
+        'Mars': 10.0,
+        'Mercury': 200.0,
+        'Venus': 205.0,
+        'Jupiter': {'longitude': 100.0, 'dignity': 'exalted'},
+        'Saturn': {'longitude': 280.0},  # Capricorn; the Sun is 4th from it
+    }
+    assert rules.evaluate(rules.features(positions)) == [True, False, False, True, False, False, True]
+
+    # From a Capricorn lagna Saturn rules the 1st house and Sun is in the 4th
+    features = rules.features(positions, lagna_sign=9)
+    assert rules.evaluate(features)[4] is False
+    assert [(match.rule.name, match.planet, match.house) for match in rules.matches(features)][:2] == [
+        ("Mars aspects Moon", 'Mars', 4), ("Venus with Mercury", 'Venus', 10)
+    ]
+    # From a Cancer lagna the Moon rules the 1st house and Aries is the 10th
+    positions['Moon'] = 0.5
+    assert rules.evaluate(rules.features(positions, lagna_sign=3))[4] is True
+
+    # Missing planets are in no house
+    assert rules.evaluate(rules.features({'Sun': 5.0})) == [False, False, False, False, False, True, True]
+
+
+def test_batch_matches_single_charts():
+    rules = YogaRuleSet(random_rules(200, 1))
+    rng = np.random.default_rng(50)
+    longitudes = rng.uniform(0, 360, (60, 7))
+    dignities = rng.integers(0, len(DIGNITY_NAMES), (60, 7))
+    lagna_signs = rng.integers(0, 12, 60)
+
+    for lagnas in (None, lagna_signs):
+        features = rules.batch_features(longitudes, dignities, lagnas)
+        held = rules.evaluate(features)
+        hits = rules.find_yogas(features)
+        assert held.shape == (60, 200) and len(hits) == held.sum()
+        assert (np.diff(hits['chart']) >= 0).all()
+        for chart in range(60):
+            positions = {
+                planet: {'longitude': longitudes[chart, column], 'dignity': DIGNITY_NAMES[dignities[chart, column]]}
+                for column, planet in enumerate(PLANETS)
+            }
+            single = rules.features(positions, 0 if lagnas is None else int(lagnas[chart]))
+            assert rules.evaluate(single) == held[chart].tolist()
+            rows = hits[hits['chart'] == chart]
+            matches = rules.matches(single)
+            assert [(match.planet, match.house) for match in matches] == [
+                (PLANETS[planet], house) for planet, house in zip(rows['planet'], rows['house'])
+            ]
+            assert rows['strength'].tolist() == pytest.approx([
+                yoga_strength(positions[match.planet]['dignity'], match.house) for match in matches
+            ])
+
+
+def test_batch_strengths_match_calculator():
+    calculator = YogaCalculator()
+    rng = np.random.default_rng(51)
+    longitudes = rng.uniform(0, 360, (100, 7))
+    dignities = sign_dignities(longitudes, PLANETS)
+    hits = calculator.rules.find_yogas(calculator.rules.batch_features(longitudes, dignities))
+    for chart in range(100):
+        positions = {
+            planet: {'longitude': longitudes[chart, column], 'dignity': DIGNITY_NAMES[dignities[chart, column]]}
+            for column, planet in enumerate(PLANETS)
+        }
+        rows = hits[hits['chart'] == chart]
+        yogas = calculator.calculate_yogas(positions)
+        assert [calculator.rules.rules[rule].yoga_type for rule in rows['rule']] == [yoga.yoga_type for yoga in yogas]
+        assert rows['strength'].tolist() == [yoga.strength for yoga in yogas]
+
+
+def test_batch_and_single_dignities_agree():
+    rules = YogaRuleSet(random_rules(100, 2))
+    rng = np.random.default_rng(52)
+    longitudes = rng.uniform(0, 360, (40, 7))
+    dignities = sign_dignities(longitudes, PLANETS)
+    for given in (None, dignities):
+        held = rules.evaluate(rules.batch_features(longitudes, given))
+        for chart in range(40):
+            positions = {planet: {'longitude': longitudes[chart, column]} for column, planet in enumerate(PLANETS)}
+            if given is not None:
+                for column, planet in enumerate(PLANETS):
+                    positions[planet]['dignity'] = DIGNITY_NAMES[given[chart, column]]
+            assert rules.evaluate(rules.features(positions)) == held[chart].tolist()
+
+
+def test_sign_dignities():
+    codes = sign_dignities([[10.0, 190.0, 130.0, 100.0]], ['Sun', 'Sun', 'Sun', 'Rahu'])
+    assert codes.tolist() == [[DIGNITY_CODES['exalted'], DIGNITY_CODES['debilitated'],
+                               DIGNITY_CODES['own'], DIGNITY_CODES['neutral']]]
+
+
+def test_invalid_rules():
+    with pytest.raises(ValueError):
+        YogaRuleSet([YogaRule("Pluto", YogaType.RAJ, Placed('Pluto', (1,)), 'Pluto', "", ())])
+    with pytest.raises(ValueError):
+        LordOf(13)
+    with pytest.raises(ValueError):
+        YogaRuleSet([YogaRule("House 0", YogaType.RAJ, Placed('Sun', (0,)), 'Sun', "", ())])
+    with pytest.raises(ValueError):
+        YogaRuleSet([], planets=['Sun', 'Moon'])
+    with pytest.raises(ValueError):
+        YogaRuleSet([]).batch_features(np.zeros((3, 5)))